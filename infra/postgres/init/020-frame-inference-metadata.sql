@@ -0,0 +1,8 @@
+-- Per-frame inference metadata written by the online detection loop.
+--
+-- `inference_path` records which detector path produced the frame's
+-- detections (e.g. `cascade_first`, `cascade_full`, `cascade_safety`,
+-- or `full` for a single-pass detector). NULL for frames ingested
+-- before the column existed.
+ALTER TABLE frame_events
+    ADD COLUMN IF NOT EXISTS inference_path TEXT;
@@ -0,0 +1,8 @@
+-- Model version that produced each frame's detections.
+--
+-- The online API can hot-swap the detector model mid-mission, so the
+-- mission report groups frames into ranges by (`model_url`,
+-- `model_sha256`). NULL for frames ingested before the columns existed.
+ALTER TABLE frame_events
+    ADD COLUMN IF NOT EXISTS model_url TEXT,
+    ADD COLUMN IF NOT EXISTS model_sha256 TEXT;
@@ -0,0 +1,8 @@
+-- Network input size used for each frame.
+--
+-- The online loop steps `imgsz` down when frames overrun the frame
+-- interval and back up when there is headroom, so the mission report
+-- breaks frames down by the resolution they were detected at. NULL for
+-- frames not run through the adaptive resolution controller.
+ALTER TABLE frame_events
+    ADD COLUMN IF NOT EXISTS imgsz INTEGER;
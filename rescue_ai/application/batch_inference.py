@@ -0,0 +1,84 @@
+"""Detector invocation helpers: micro-batching, inference-path tracing, close."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Any
+
+from rescue_ai.domain.entities import Detection
+from rescue_ai.domain.ports import DetectorPort
+
+
+def detect_in_batches(
+    detector: DetectorPort,
+    image_uris: Sequence[object],
+) -> list[Sequence[Detection]]:
+    """Run *detector* over *image_uris* and return detections in input order.
+
+    Detectors implementing ``detect_batch`` get the whole sequence (they
+    split it into micro-batches themselves); any other ``DetectorPort``
+    falls back to one ``detect()`` call per frame.
+    """
+    if not image_uris:
+        return []
+    detect_batch = getattr(detector, "detect_batch", None)
+    if callable(detect_batch):
+        results = list(detect_batch(image_uris))
+        if len(results) != len(image_uris):
+            raise RuntimeError(
+                f"detect_batch returned {len(results)} results "
+                f"for {len(image_uris)} frames"
+            )
+        return results
+    detector_any: Any = detector
+    return [detector_any.detect(image_uri) for image_uri in image_uris]
+
+
+def detect_traced(
+    detector: DetectorPort,
+    image_uri: object,
+    *,
+    default_path: str = "full",
+) -> tuple[Sequence[Detection], str]:
+    """Run *detector* on one frame and report which inference path was used.
+
+    Detectors with several internal paths (e.g. a cascade) implement
+    ``detect_traced``; plain detectors are reported as *default_path*.
+    """
+    traced = getattr(detector, "detect_traced", None)
+    if callable(traced):
+        detections, path = traced(image_uri)
+        return detections, str(path)
+    detector_any: Any = detector
+    return detector_any.detect(image_uri), default_path
+
+
+def detect_traced_at(
+    detector: DetectorPort,
+    image_uri: object,
+    imgsz: int | None,
+) -> tuple[Sequence[Detection], str, int | None]:
+    """Run *detector* at input size *imgsz*; also report the size actually used.
+
+    Detectors implementing ``detect_traced_at`` may clamp *imgsz* (e.g. an
+    ONNX graph with a fixed input shape). Other detectors run at their
+    configured size, reported as ``None``.
+    """
+    traced_at = getattr(detector, "detect_traced_at", None)
+    if imgsz is not None and callable(traced_at):
+        detections, path, used = traced_at(image_uri, imgsz)
+        return detections, str(path), None if used is None else int(used)
+    detections, path = detect_traced(detector, image_uri)
+    return detections, path, None
+
+
+def close_detector(detector: object) -> None:
+    """Call ``detector.close()`` if present.
+
+    Wrappers forward ``close()`` through this so that a retired stack
+    stops the worker processes and shared memory of a detector pool.
+    """
+    detector_any: Any = detector
+    close = getattr(detector_any, "close", None)
+    if callable(close):
+        close()
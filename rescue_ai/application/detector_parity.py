@@ -0,0 +1,85 @@
+"""Compare two detector runtimes frame-by-frame on the same sample."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+
+from rescue_ai.domain.entities import Detection
+
+
+def box_iou(
+    first: tuple[float, float, float, float],
+    second: tuple[float, float, float, float],
+) -> float:
+    """Return intersection-over-union of two ``xyxy`` boxes."""
+    inter_w = max(0.0, min(first[2], second[2]) - max(first[0], second[0]))
+    inter_h = max(0.0, min(first[3], second[3]) - max(first[1], second[1]))
+    inter = inter_w * inter_h
+    area_first = max(0.0, first[2] - first[0]) * max(0.0, first[3] - first[1])
+    area_second = max(0.0, second[2] - second[0]) * max(0.0, second[3] - second[1])
+    union = area_first + area_second - inter
+    return inter / union if union > 0 else 0.0
+
+
+@dataclass
+class ParityReport:
+    """Accumulated agreement between a reference and a candidate detector."""
+
+    iou_threshold: float = 0.5
+    frames: int = 0
+    presence_agreements: int = 0
+    matched_boxes: int = 0
+    reference_only: int = 0
+    candidate_only: int = 0
+    max_score_delta: float = 0.0
+    mismatched_frames: list[str] = field(default_factory=list)
+
+    def add_frame(
+        self,
+        frame_id: str,
+        reference: Sequence[Detection],
+        candidate: Sequence[Detection],
+    ) -> None:
+        """Greedily match boxes by IoU and update the counters."""
+        self.frames += 1
+        if bool(reference) == bool(candidate):
+            self.presence_agreements += 1
+        else:
+            self.mismatched_frames.append(frame_id)
+
+        unmatched = list(candidate)
+        for ref in sorted(reference, key=lambda item: item.score, reverse=True):
+            best_idx = -1
+            best_iou = self.iou_threshold
+            for idx, cand in enumerate(unmatched):
+                iou = box_iou(ref.bbox, cand.bbox)
+                if iou >= best_iou:
+                    best_idx, best_iou = idx, iou
+            if best_idx < 0:
+                self.reference_only += 1
+                continue
+            match = unmatched.pop(best_idx)
+            self.matched_boxes += 1
+            self.max_score_delta = max(
+                self.max_score_delta, abs(ref.score - match.score)
+            )
+        self.candidate_only += len(unmatched)
+
+    @property
+    def presence_agreement(self) -> float:
+        """Share of frames where both runtimes agree on person presence."""
+        return self.presence_agreements / self.frames if self.frames else 1.0
+
+    def as_dict(self) -> dict[str, object]:
+        """Return a JSON-serializable summary."""
+        return {
+            "frames": self.frames,
+            "presence_agreement": round(self.presence_agreement, 6),
+            "matched_boxes": self.matched_boxes,
+            "reference_only": self.reference_only,
+            "candidate_only": self.candidate_only,
+            "max_score_delta": round(self.max_score_delta, 6),
+            "iou_threshold": self.iou_threshold,
+            "mismatched_frames": list(self.mismatched_frames),
+        }
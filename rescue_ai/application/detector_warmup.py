@@ -0,0 +1,136 @@
+"""Background detector warmup and readiness tracking.
+
+Model download, checksum verification, weight loading and the first
+forward pass (CUDA/cuDNN autotuning, ONNX Runtime graph optimization)
+together take seconds. Running them in a background thread at startup
+keeps that cost off the first stream frame and the first ``/predict``
+call, while the API reports ``warming`` until the detector is usable.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import Any
+
+from rescue_ai.domain.ports import DetectorPort
+
+WARMUP_UNAVAILABLE = "unavailable"
+WARMUP_WARMING = "warming"
+WARMUP_READY = "ready"
+WARMUP_FAILED = "failed"
+logger = logging.getLogger(__name__)
+
+
+class DetectorWarmup:
+    """Loads the detector and runs one dummy forward pass off the request path.
+
+    ``warmup()`` covers download and model load; the optional
+    ``warmup_inference()`` hook runs a blank frame at the configured
+    ``imgsz``. Both durations are kept as cold-start metrics.
+    """
+
+    def __init__(self, detector: DetectorPort | None) -> None:
+        self._detector = detector
+        self._lock = threading.Lock()
+        self._status = WARMUP_UNAVAILABLE if detector is None else WARMUP_WARMING
+        self._error: str | None = None
+        self._started_at: float | None = None
+        self._model_load_ms: float | None = None
+        self._first_inference_ms: float | None = None
+        self._cold_start_ms: float | None = None
+        self._thread: threading.Thread | None = None
+
+    @property
+    def status(self) -> str:
+        """Return ``warming``, ``ready``, ``failed`` or ``unavailable``."""
+        with self._lock:
+            return self._status
+
+    @property
+    def ready(self) -> bool:
+        return self.status == WARMUP_READY
+
+    def start(self) -> None:
+        """Run ``run()`` in a daemon thread; no-op without a detector."""
+        if self._detector is None or self._thread is not None:
+            return
+        self._thread = threading.Thread(
+            target=self.run, name="detector-warmup", daemon=True
+        )
+        self._thread.start()
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Block until the background warmup finishes; return readiness."""
+        if self._thread is not None:
+            self._thread.join(timeout)
+        return self.ready
+
+    def run(self) -> None:
+        """Load the model and run the dummy forward pass synchronously."""
+        detector = self._detector
+        if detector is None:
+            return
+        started_at = time.perf_counter()
+        with self._lock:
+            self._started_at = started_at
+        try:
+            detector.warmup()
+            loaded_at = time.perf_counter()
+            detector_warmup_inference(detector)
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            with self._lock:
+                self._status = WARMUP_FAILED
+                self._error = f"{type(error).__name__}: {error}"
+                self._cold_start_ms = _elapsed_ms(started_at)
+            logger.error("Detector warmup failed: %s", self._error)
+            return
+        finished_at = time.perf_counter()
+        with self._lock:
+            self._model_load_ms = (loaded_at - started_at) * 1000
+            self._first_inference_ms = (finished_at - loaded_at) * 1000
+            self._cold_start_ms = (finished_at - started_at) * 1000
+            self._status = WARMUP_READY
+        logger.info(
+            "Detector warm: cold_start=%.1f ms model_load=%.1f ms "
+            "first_inference=%.1f ms",
+            self._cold_start_ms,
+            self._model_load_ms,
+            self._first_inference_ms,
+        )
+
+    def metrics(self) -> dict[str, object]:
+        """Return status, error and cold-start latencies in milliseconds."""
+        with self._lock:
+            warming_for_ms = (
+                _elapsed_ms(self._started_at)
+                if self._status == WARMUP_WARMING and self._started_at is not None
+                else None
+            )
+            return {
+                "status": self._status,
+                "error": self._error,
+                "cold_start_ms": _rounded(self._cold_start_ms),
+                "model_load_ms": _rounded(self._model_load_ms),
+                "first_inference_ms": _rounded(self._first_inference_ms),
+                "warming_for_ms": _rounded(warming_for_ms),
+            }
+
+
+def detector_warmup_inference(detector: object) -> bool:
+    """Call ``detector.warmup_inference()`` if present; return whether it ran."""
+    detector_any: Any = detector
+    warmup_inference = getattr(detector_any, "warmup_inference", None)
+    if not callable(warmup_inference):
+        return False
+    warmup_inference()
+    return True
+
+
+def _elapsed_ms(started_at: float) -> float:
+    return (time.perf_counter() - started_at) * 1000
+
+
+def _rounded(value: float | None) -> float | None:
+    return None if value is None else round(value, 3)
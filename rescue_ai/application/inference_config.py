@@ -1,11 +1,12 @@
 """Inference runtime configuration.
 
 ``InferenceConfig`` describes adapter-level ML runtime settings
-(model URL, device, image size, NMS parameters).  It is *not* a domain
-value object because these fields are specific to the YOLO adapter
-rather than business rules.  Placed in the application layer so that
-both infrastructure adapters and application orchestrators
-(``StreamOrchestrator``) can depend on it without polluting the domain.
+(model URL, runtime backend and precision, device, image size, NMS
+parameters).  It is *not* a domain value object because these fields
+are specific to the YOLO adapter rather than business rules.  Placed in
+the application layer so that both infrastructure adapters and
+application orchestrators (``StreamOrchestrator``) can depend on it
+without polluting the domain.
 """
 
 from __future__ import annotations
@@ -13,6 +14,166 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 
+@dataclass(frozen=True)
+class CascadeConfig:
+    """Two-pass cascade: cheap low-resolution pass, full resolution on doubt.
+
+    A first-pass person candidate scoring in ``[uncertain_low,
+    uncertain_high)`` sends the frame to the full-resolution pass; every
+    ``safety_interval_frames``-th frame goes there unconditionally.
+    """
+
+    first_pass_imgsz: int = 480
+    uncertain_low: float = 0.05
+    uncertain_high: float = 0.5
+    safety_interval_frames: int = 30
+
+
+@dataclass(frozen=True)
+class ResultCacheConfig:
+    """Detection result cache: in-memory LRU in front of an on-disk tier.
+
+    ``disk_max_mb <= 0`` keeps the cache in memory only.
+    """
+
+    memory_entries: int = 1024
+    disk_dir: str = "runtime/detection_cache"
+    disk_max_mb: int = 512
+
+
+@dataclass(frozen=True)
+class WorkerPoolConfig:
+    """Run inference in ``workers`` processes, each with its own model.
+
+    ``threads_per_worker`` caps the intra-op threads of every worker so
+    the pool does not oversubscribe the CPU.
+    """
+
+    workers: int = 2
+    threads_per_worker: int = 1
+
+
+@dataclass(frozen=True)
+class MotionGateConfig:
+    """Reuse the previous detections while the stream is nearly static.
+
+    ``diff_threshold`` is the mean absolute grayscale difference (0..1)
+    between ``thumbnail_size`` thumbnails of the frame and the last
+    detected frame; at most ``max_consecutive_skips`` frames in a row
+    bypass the detector.
+    """
+
+    thumbnail_size: int = 64
+    diff_threshold: float = 0.01
+    max_consecutive_skips: int = 4
+
+
+@dataclass(frozen=True)
+class TrackerConfig:
+    """Detect every ``keyframe_interval``-th frame, track boxes in between.
+
+    Propagated scores are multiplied by ``score_decay`` per frame; a lost
+    track or a score below ``min_track_score`` triggers an early keyframe.
+    A keyframe detection continues a track when their IoU reaches
+    ``iou_match``. Optical flow runs on frames downscaled to ``flow_size``.
+    """
+
+    keyframe_interval: int = 5
+    score_decay: float = 0.95
+    min_track_score: float = 0.2
+    iou_match: float = 0.3
+    max_missed_keyframes: int = 1
+    flow_size: int = 640
+
+
+@dataclass(frozen=True)
+class RoiConfig:
+    """Re-inspect padded crops around recent positives at native resolution.
+
+    Each crop covers ``crop_size`` source pixels, grown to fit the box
+    plus ``padding`` of its size on every side, and runs through a
+    detector built with ``imgsz=crop_size``. Every
+    ``full_frame_interval``-th frame is a full-frame pass that catches new
+    entrants; at most ``max_regions`` crops are inspected per frame.
+    """
+
+    crop_size: int = 640
+    padding: float = 0.5
+    full_frame_interval: int = 5
+    max_regions: int = 4
+
+
+@dataclass(frozen=True)
+class AdaptiveImgszConfig:
+    """Step ``imgsz`` within ``[min_imgsz, max_imgsz]`` to keep up with the stream.
+
+    Load is the smoothed ratio of per-frame processing time to the frame
+    interval. ``patience`` consecutive frames above ``high_load`` step the
+    size down by ``step``; as many frames below ``low_load`` step it up.
+    """
+
+    min_imgsz: int = 640
+    max_imgsz: int = 1280
+    step: int = 160
+    high_load: float = 0.9
+    low_load: float = 0.6
+    patience: int = 5
+    smoothing: float = 0.3
+
+
+@dataclass(frozen=True)
+class PrefilterConfig:
+    """Hand only person candidates to NMS and bin the sub-threshold scores.
+
+    Person scores between ``score_floor`` and the confidence threshold are
+    counted in a ``histogram_bins``-bin histogram instead of becoming
+    detections, so threshold sweeps below the operating point stay
+    possible. ONNX bins the raw candidates before its NMS; torch runs
+    ultralytics at ``score_floor`` and bins the boxes NMS kept. Detections
+    at or above the threshold are unchanged in both runtimes.
+    """
+
+    score_floor: float = 0.05
+    histogram_bins: int = 20
+
+
+@dataclass(frozen=True)
+class SchedulerConfig:
+    """Priority scheduling of detector calls shared by streams and ``/predict``.
+
+    ``workers`` threads run queued calls, live stream frames first. A
+    stream frame still queued after ``stream_deadline_ms`` is dropped; a
+    ``/predict`` call is rejected when its queue is full or it has not
+    started within ``predict_timeout_sec``.
+    """
+
+    workers: int = 1
+    stream_queue_size: int = 8
+    predict_queue_size: int = 2
+    stream_deadline_ms: int = 1000
+    predict_timeout_sec: float = 10.0
+
+
+@dataclass(frozen=True)
+class PipelineConfig:
+    """Online streams split into capture, detection and ingest stages.
+
+    Capture for every stream runs on one asyncio event loop, with
+    blocking RTSP reads on ``capture_threads`` executor threads; a pool
+    of ``workers`` threads runs detection and ingest for all streams.
+    Stages hand work over through bounded per-stream queues. The
+    detection queue holds ``frame_queue_size`` frames and drops the
+    oldest when detection falls behind; a full ingest queue of
+    ``ingest_queue_size`` events stalls detection instead, so no
+    detected frame is lost.
+    """
+
+    frame_queue_size: int = 1
+    ingest_queue_size: int = 8
+    workers: int = 4
+    capture_threads: int = 4
+
+
 @dataclass(frozen=True)
 class InferenceConfig:
     """YOLO inference runtime settings resolved from external contract/config."""
@@ -24,3 +185,18 @@ class InferenceConfig:
     max_det: int
     confidence_threshold: float
     model_sha256: str | None = None
+    batch_size: int = 1
+    runtime: str = "torch"
+    precision: str = "fp32"
+    cascade: CascadeConfig | None = None
+    reduced_decode: bool = False
+    result_cache: ResultCacheConfig | None = None
+    worker_pool: WorkerPoolConfig | None = None
+    intra_op_threads: int | None = None
+    motion_gate: MotionGateConfig | None = None
+    tracker: TrackerConfig | None = None
+    roi: RoiConfig | None = None
+    adaptive_imgsz: AdaptiveImgszConfig | None = None
+    scheduler: SchedulerConfig | None = None
+    prefilter: PrefilterConfig | None = None
+    pipeline: PipelineConfig | None = None
@@ -0,0 +1,334 @@
+"""Priority scheduler in front of the detector shared by streams and ``/predict``.
+
+The API process owns one detector. Stream threads and FastAPI
+threadpool workers serving ``/predict`` submit their detector calls here
+as jobs; ``workers`` threads run them, live stream frames first, so the
+detector never sees more concurrent calls than there are workers.
+Queues are bounded per priority class: a full stream queue drops its
+oldest (stalest) frame, a full ``/predict`` queue rejects the request.
+Stream frames still queued past their deadline are dropped unprocessed.
+A running call is never preempted, so a stream frame waits for at most
+one in-flight ``/predict`` call per worker.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Sequence
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+from rescue_ai.application.batch_inference import (
+    close_detector,
+    detect_in_batches,
+    detect_traced,
+    detect_traced_at,
+)
+from rescue_ai.application.detector_warmup import detector_warmup_inference
+from rescue_ai.application.inference_config import SchedulerConfig
+from rescue_ai.application.inference_timing import (
+    StageTimings,
+    detector_score_histogram,
+    detector_stage_timings,
+)
+from rescue_ai.application.model_swap import ModelVersion, SwappableDetector
+from rescue_ai.domain.entities import Detection
+from rescue_ai.domain.ports import DetectorPort
+
+PRIORITY_STREAM = "stream"
+PRIORITY_PREDICT = "predict"
+# Highest priority first.
+PRIORITY_CLASSES = (PRIORITY_STREAM, PRIORITY_PREDICT)
+PATH_DROPPED = "dropped"
+
+T = TypeVar("T")
+logger = logging.getLogger(__name__)
+
+
+class InferenceRejected(RuntimeError):
+    """The job was not admitted: its queue is full or it waited too long."""
+
+
+class InferenceDropped(RuntimeError):
+    """A stream frame was dropped unprocessed because it became stale."""
+
+
+@dataclass
+class _Job:
+    call: Callable[[], Any]
+    enqueued_at: float
+    deadline: float | None
+    future: Future[Any]
+
+
+class InferenceScheduler:
+    """Bounded per-class queues drained by worker threads in priority order."""
+
+    def __init__(self, config: SchedulerConfig) -> None:
+        self._config = config
+        self._limits = {
+            PRIORITY_STREAM: config.stream_queue_size,
+            PRIORITY_PREDICT: config.predict_queue_size,
+        }
+        self._queues: dict[str, deque[_Job]] = {
+            name: deque() for name in PRIORITY_CLASSES
+        }
+        self._counters = {
+            name: dict.fromkeys(
+                ("submitted", "completed", "failed", "rejected", "dropped"), 0
+            )
+            for name in PRIORITY_CLASSES
+        }
+        self._wait = StageTimings()
+        self._run = StageTimings()
+        self._condition = threading.Condition()
+        self._workers: list[threading.Thread] = []
+        self._closed = False
+
+    def start(self) -> None:
+        """Start the worker threads."""
+        with self._condition:
+            if self._workers:
+                return
+            self._workers = [
+                threading.Thread(
+                    target=self._work, name=f"inference-scheduler-{idx}", daemon=True
+                )
+                for idx in range(max(1, self._config.workers))
+            ]
+        for worker in self._workers:
+            worker.start()
+
+    def close(self) -> None:
+        """Stop the workers; queued jobs are rejected."""
+        with self._condition:
+            self._closed = True
+            for name, queue in self._queues.items():
+                while queue:
+                    _fail(queue.popleft(), InferenceRejected("Scheduler closed"))
+                    self._counters[name]["rejected"] += 1
+            self._condition.notify_all()
+
+    def submit(self, priority: str, call: Callable[[], T]) -> Future[T]:
+        """Queue *call* in class *priority*; return its future.
+
+        Raises ``InferenceRejected`` when a ``/predict`` queue is full. A
+        full stream queue instead drops its oldest frame.
+        """
+        if priority not in self._queues:
+            raise ValueError(f"Unknown inference priority: {priority}")
+        now = time.monotonic()
+        deadline = (
+            now + self._config.stream_deadline_ms / 1000
+            if priority == PRIORITY_STREAM
+            else None
+        )
+        job = _Job(call=call, enqueued_at=now, deadline=deadline, future=Future())
+        with self._condition:
+            counters = self._counters[priority]
+            if self._closed:
+                counters["rejected"] += 1
+                raise InferenceRejected("Scheduler closed")
+            queue = self._queues[priority]
+            if len(queue) >= self._limits[priority]:
+                if priority != PRIORITY_STREAM:
+                    counters["rejected"] += 1
+                    raise InferenceRejected(
+                        f"Inference queue '{priority}' is full "
+                        f"({self._limits[priority]} jobs)"
+                    )
+                _fail(queue.popleft(), InferenceDropped("Stream queue full"))
+                counters["dropped"] += 1
+                logger.debug("Stream frame dropped: queue full")
+            queue.append(job)
+            counters["submitted"] += 1
+            self._condition.notify()
+        return job.future
+
+    def run(
+        self, priority: str, call: Callable[[], T], *, timeout: float | None = None
+    ) -> T:
+        """Submit *call* and wait for its result.
+
+        A job that has not started within *timeout* seconds is withdrawn
+        and ``InferenceRejected`` is raised.
+        """
+        future = self.submit(priority, call)
+        try:
+            return future.result(timeout)
+        except FutureTimeoutError as error:
+            if not future.cancel():
+                # Already running: the caller gets the result after all.
+                return future.result()
+            with self._condition:
+                self._counters[priority]["rejected"] += 1
+            raise InferenceRejected(
+                f"Inference queue '{priority}' did not start the job "
+                f"within {timeout:.1f}s"
+            ) from error
+
+    def stats(self) -> dict[str, object]:
+        """Return per-class queue depth, counters and wait/run latencies."""
+        with self._condition:
+            depths = {name: len(queue) for name, queue in self._queues.items()}
+            counters = {name: dict(items) for name, items in self._counters.items()}
+        wait, run = self._wait.snapshot(), self._run.snapshot()
+        return {
+            "workers": len(self._workers),
+            "classes": {
+                name: {
+                    "queue_depth": depths[name],
+                    "queue_limit": self._limits[name],
+                    **counters[name],
+                    "wait_ms": wait.get(name),
+                    "run_ms": run.get(name),
+                }
+                for name in PRIORITY_CLASSES
+            },
+        }
+
+    def _work(self) -> None:
+        while True:
+            picked = self._next_job()
+            if picked is None:
+                return
+            priority, job = picked
+            if not job.future.set_running_or_notify_cancel():
+                continue
+            started_at = time.monotonic()
+            self._wait.record(priority, (started_at - job.enqueued_at) * 1000)
+            try:
+                result = job.call()
+            except Exception as error:  # pylint: disable=broad-exception-caught
+                job.future.set_exception(error)
+                outcome = "failed"
+            else:
+                job.future.set_result(result)
+                outcome = "completed"
+            self._run.record(priority, (time.monotonic() - started_at) * 1000)
+            with self._condition:
+                self._counters[priority][outcome] += 1
+
+    def _next_job(self) -> tuple[str, _Job] | None:
+        with self._condition:
+            while not self._closed:
+                now = time.monotonic()
+                for name in PRIORITY_CLASSES:
+                    queue = self._queues[name]
+                    while queue:
+                        job = queue.popleft()
+                        if job.deadline is None or now <= job.deadline:
+                            return name, job
+                        _fail(job, InferenceDropped("Stream frame missed deadline"))
+                        self._counters[name]["dropped"] += 1
+                        logger.debug("Stream frame dropped: missed deadline")
+                self._condition.wait()
+            return None
+
+
+class ScheduledDetector:
+    """DetectorPort proxy that runs every detector call through the scheduler."""
+
+    def __init__(
+        self,
+        detector: DetectorPort,
+        scheduler: InferenceScheduler,
+        *,
+        priority: str,
+        timeout_sec: float | None = None,
+    ) -> None:
+        self._detector = detector
+        self._scheduler = scheduler
+        self._priority = priority
+        self._timeout_sec = timeout_sec
+
+    @property
+    def detector(self) -> DetectorPort:
+        """Return the wrapped detector."""
+        return self._detector
+
+    @property
+    def scheduler(self) -> InferenceScheduler:
+        return self._scheduler
+
+    def snapshot(self) -> tuple[ScheduledDetector, ModelVersion | None]:
+        """Pin the active model version of a swappable detector for one frame."""
+        if not isinstance(self._detector, SwappableDetector):
+            return self, None
+        detector, version = self._detector.snapshot()
+        pinned = ScheduledDetector(
+            detector,
+            self._scheduler,
+            priority=self._priority,
+            timeout_sec=self._timeout_sec,
+        )
+        return pinned, version
+
+    def detect(self, image_uri: object) -> Sequence[Detection]:
+        detector_any: Any = self._detector
+        return self._run(lambda: detector_any.detect(image_uri))
+
+    def detect_traced(self, image_uri: object) -> tuple[Sequence[Detection], str]:
+        """Run the wrapped detector's traced call as one scheduled job."""
+        return self._run(lambda: detect_traced(self._detector, image_uri))
+
+    def detect_traced_at(
+        self, image_uri: object, imgsz: int
+    ) -> tuple[Sequence[Detection], str, int | None]:
+        return self._run(lambda: detect_traced_at(self._detector, image_uri, imgsz))
+
+    def detect_batch(self, image_uris: Sequence[object]) -> list[Sequence[Detection]]:
+        return self._run(lambda: detect_in_batches(self._detector, image_uris))
+
+    @property
+    def detect_regions(self) -> Callable[[object, Sequence[Any]], Any] | None:
+        """Scheduled region-of-interest pass; ``None`` if the detector has none.
+
+        Callers feature-check with ``callable(getattr(..., "detect_regions"))``,
+        so the capability follows the wrapped detector.
+        """
+        detector_any: Any = self._detector
+        detect_regions = getattr(detector_any, "detect_regions", None)
+        if not callable(detect_regions):
+            return None
+        return lambda image_uri, regions: self._run(
+            lambda: detect_regions(image_uri, regions)
+        )
+
+    def warmup(self) -> None:
+        self._run(self._detector.warmup)
+
+    def warmup_inference(self) -> bool:
+        return self._run(lambda: detector_warmup_inference(self._detector))
+
+    def runtime_name(self) -> str:
+        """Return the wrapped detector's runtime name."""
+        return self._detector.runtime_name()
+
+    def stage_timings(self) -> dict[str, dict[str, object]] | None:
+        return detector_stage_timings(self._detector)
+
+    def score_histogram(self) -> dict[str, object] | None:
+        return detector_score_histogram(self._detector)
+
+    def cache_stats(self) -> dict[str, int] | None:
+        detector_any: Any = self._detector
+        cache_stats = getattr(detector_any, "cache_stats", None)
+        return cache_stats() if callable(cache_stats) else None
+
+    def close(self) -> None:
+        """Close the wrapped detector; the scheduler is closed by its owner."""
+        close_detector(self._detector)
+
+    def _run(self, call: Callable[[], T]) -> T:
+        return self._scheduler.run(self._priority, call, timeout=self._timeout_sec)
+
+
+def _fail(job: _Job, error: Exception) -> None:
+    if job.future.set_running_or_notify_cancel():
+        job.future.set_exception(error)
@@ -0,0 +1,86 @@
+"""Rolling per-stage latency histograms for detector adapters.
+
+Adapters record how long each stage of a detector call took (JPEG
+decode, pre-processing, forward pass, NMS, post-processing). Samples
+are kept in a bounded window so the summary reflects recent traffic and
+memory stays constant on long missions.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import deque
+from typing import Any
+
+TIMING_STAGES = ("decode", "preprocess", "inference", "nms", "postprocess")
+HISTOGRAM_BUCKETS_MS = (1.0, 2.0, 5.0, 10.0, 20.0, 50.0, 100.0, 200.0, 500.0, 1000.0)
+
+
+class StageTimings:
+    """Thread-safe rolling window of per-stage durations in milliseconds."""
+
+    def __init__(self, window: int = 512) -> None:
+        self._window = window
+        self._samples: dict[str, deque[float]] = {
+            stage: deque(maxlen=window) for stage in TIMING_STAGES
+        }
+        self._lock = threading.Lock()
+
+    def record(self, stage: str, elapsed_ms: float) -> None:
+        """Add one duration sample for *stage*."""
+        with self._lock:
+            samples = self._samples.get(stage)
+            if samples is None:
+                samples = self._samples[stage] = deque(maxlen=self._window)
+            samples.append(float(elapsed_ms))
+
+    def snapshot(self) -> dict[str, dict[str, object]]:
+        """Return count, mean, percentiles and histogram for every stage."""
+        with self._lock:
+            copied = {stage: list(samples) for stage, samples in self._samples.items()}
+        return {stage: _summarize(samples) for stage, samples in copied.items()}
+
+
+def detector_stage_timings(detector: object) -> dict[str, dict[str, object]] | None:
+    """Return ``detector.stage_timings()`` or ``None`` if it is not instrumented."""
+    detector_any: Any = detector
+    stage_timings = getattr(detector_any, "stage_timings", None)
+    if not callable(stage_timings):
+        return None
+    return stage_timings()
+
+
+def detector_score_histogram(detector: object) -> dict[str, object] | None:
+    """Return ``detector.score_histogram()`` or ``None`` without a prefilter."""
+    detector_any: Any = detector
+    score_histogram = getattr(detector_any, "score_histogram", None)
+    if not callable(score_histogram):
+        return None
+    return score_histogram()
+
+
+def _summarize(samples: list[float]) -> dict[str, object]:
+    histogram = {f"le_{bound:g}": 0 for bound in HISTOGRAM_BUCKETS_MS}
+    histogram["le_inf"] = 0
+    if not samples:
+        return {"count": 0, "histogram": histogram}
+    for value in samples:
+        bucket = next(
+            (f"le_{bound:g}" for bound in HISTOGRAM_BUCKETS_MS if value <= bound),
+            "le_inf",
+        )
+        histogram[bucket] += 1
+    ordered = sorted(samples)
+    return {
+        "count": len(ordered),
+        "mean_ms": round(sum(ordered) / len(ordered), 3),
+        "p50_ms": round(_percentile(ordered, 0.50), 3),
+        "p95_ms": round(_percentile(ordered, 0.95), 3),
+        "max_ms": round(ordered[-1], 3),
+        "histogram": histogram,
+    }
+
+
+def _percentile(ordered: list[float], quantile: float) -> float:
+    index = int(round(quantile * (len(ordered) - 1)))
+    return ordered[index]
@@ -0,0 +1,397 @@
+"""Hot model swap for the online detector.
+
+``SwappableDetector`` is the detector handed to the API and the stream
+controller. Every call reads the active detector once, so a frame is
+always processed end to end by one model version and a swap takes effect
+at the next frame boundary. The previous version stays loaded for
+instant rollback; a version leaving the rollback slot is closed once the
+calls still running on it have returned. ``ModelSwapService`` builds and
+warms a new version in the background before installing it, so running
+missions never wait on a model download.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, replace
+from typing import Any, TypeVar
+
+from rescue_ai.application.batch_inference import (
+    close_detector,
+    detect_in_batches,
+    detect_traced,
+    detect_traced_at,
+)
+from rescue_ai.application.detector_warmup import (
+    DetectorWarmup,
+    detector_warmup_inference,
+)
+from rescue_ai.application.inference_config import InferenceConfig
+from rescue_ai.application.inference_timing import (
+    detector_score_histogram,
+    detector_stage_timings,
+)
+from rescue_ai.domain.entities import Detection
+from rescue_ai.domain.ports import DetectorPort
+
+DetectorBuilder = Callable[[InferenceConfig], DetectorPort]
+T = TypeVar("T")
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ModelVersion:
+    """Model artifact identity recorded with every processed frame."""
+
+    model_url: str
+    model_sha256: str | None = None
+
+    @classmethod
+    def from_config(cls, config: InferenceConfig) -> ModelVersion:
+        return cls(model_url=config.model_url, model_sha256=config.model_sha256)
+
+    def as_metadata(self) -> dict[str, str]:
+        metadata = {"model_url": self.model_url}
+        if self.model_sha256:
+            metadata["model_sha256"] = self.model_sha256
+        return metadata
+
+
+class _Slot:
+    """One loaded model version and the number of calls running on it."""
+
+    def __init__(self, detector: DetectorPort, config: InferenceConfig) -> None:
+        self.detector = detector
+        self.config = config
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._retired = False
+        self._closed = False
+
+    @property
+    def version(self) -> ModelVersion:
+        return ModelVersion.from_config(self.config)
+
+    def acquire(self) -> None:
+        """Count one call; raise ``RuntimeError`` if the slot is already closed."""
+        with self._lock:
+            if self._closed:
+                raise RuntimeError(f"Model version {self.config.model_url} was retired")
+            self._in_flight += 1
+
+    def release(self) -> None:
+        with self._lock:
+            self._in_flight -= 1
+            close = self._close_if_drained()
+        if close:
+            close_detector(self.detector)
+
+    def retire(self) -> None:
+        """Close the detector now, or after the last running call returns."""
+        with self._lock:
+            self._retired = True
+            close = self._close_if_drained()
+        if close:
+            close_detector(self.detector)
+        else:
+            logger.info(
+                "Model %s retired, closing after in-flight calls",
+                self.config.model_url,
+            )
+
+    def run(self, call: Callable[[DetectorPort], T]) -> T:
+        self.acquire()
+        try:
+            return call(self.detector)
+        finally:
+            self.release()
+
+    def _close_if_drained(self) -> bool:
+        if not self._retired or self._in_flight > 0 or self._closed:
+            return False
+        self._closed = True
+        return True
+
+
+class _SlotCalls:
+    """DetectorPort calls that hold their slot open while they run.
+
+    Inference calls go through ``_run``; cheap introspection (runtime
+    name, timings, histograms, cache counters) reads ``_detector`` directly.
+    """
+
+    def detect(self, image_uri: object) -> Sequence[Detection]:
+        return self._run(lambda detector: _detect(detector, image_uri))
+
+    def detect_traced(self, image_uri: object) -> tuple[Sequence[Detection], str]:
+        """Run the detector and report its inference path."""
+        return self._run(lambda detector: detect_traced(detector, image_uri))
+
+    def detect_traced_at(
+        self, image_uri: object, imgsz: int
+    ) -> tuple[Sequence[Detection], str, int | None]:
+        """Run the detector at input size *imgsz*."""
+        return self._run(lambda detector: detect_traced_at(detector, image_uri, imgsz))
+
+    def detect_batch(self, image_uris: Sequence[object]) -> list[Sequence[Detection]]:
+        """Run every frame of the batch on the same model version."""
+        return self._run(lambda detector: detect_in_batches(detector, image_uris))
+
+    @property
+    def detect_regions(self) -> Callable[[object, Sequence[Any]], Any] | None:
+        """Region-of-interest pass; ``None`` if the detector has none."""
+        detector_any: Any = self._detector()
+        if not callable(getattr(detector_any, "detect_regions", None)):
+            return None
+        return lambda image_uri, regions: self._run(
+            lambda detector: _detect_regions(detector, image_uri, regions)
+        )
+
+    def warmup(self) -> None:
+        self._run(lambda detector: detector.warmup())
+
+    def warmup_inference(self) -> None:
+        self._run(detector_warmup_inference)
+
+    def runtime_name(self) -> str:
+        """Return the detector's runtime name."""
+        return self._detector().runtime_name()
+
+    def stage_timings(self) -> dict[str, dict[str, object]] | None:
+        """Return the detector's stage timings."""
+        return detector_stage_timings(self._detector())
+
+    def score_histogram(self) -> dict[str, object] | None:
+        """Return the detector's low-score histogram."""
+        return detector_score_histogram(self._detector())
+
+    def cache_stats(self) -> dict[str, int] | None:
+        """Return the detector's result-cache counters, if cached."""
+        return _cache_stats(self._detector())
+
+    def _detector(self) -> DetectorPort:
+        raise NotImplementedError
+
+    def _run(self, call: Callable[[DetectorPort], T]) -> T:
+        raise NotImplementedError
+
+
+class _PinnedDetector(_SlotCalls):
+    """One model version pinned by ``SwappableDetector.snapshot()``."""
+
+    def __init__(self, slot: _Slot) -> None:
+        self._slot = slot
+
+    def _detector(self) -> DetectorPort:
+        return self._slot.detector
+
+    def _run(self, call: Callable[[DetectorPort], T]) -> T:
+        return self._slot.run(call)
+
+
+class SwappableDetector(_SlotCalls):
+    """DetectorPort proxy whose target is replaced atomically between frames."""
+
+    def __init__(self, detector: DetectorPort, config: InferenceConfig) -> None:
+        self._active = _Slot(detector=detector, config=config)
+        self._previous: _Slot | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def active_config(self) -> InferenceConfig:
+        with self._lock:
+            return self._active.config
+
+    def snapshot(self) -> tuple[DetectorPort, ModelVersion]:
+        """Return the active detector and its version as one consistent pair.
+
+        The returned detector keeps using that version after a swap; it
+        is closed only once no call is running on it.
+        """
+        with self._lock:
+            slot = self._active
+        return _PinnedDetector(slot), slot.version
+
+    def versions(self) -> dict[str, object]:
+        """Return the active and rollback model versions."""
+        with self._lock:
+            active, previous = self._active, self._previous
+        return {
+            "active": active.version.as_metadata(),
+            "previous": None if previous is None else previous.version.as_metadata(),
+        }
+
+    def swap(self, detector: DetectorPort, config: InferenceConfig) -> None:
+        """Install *detector*; the current one is kept for ``rollback()``."""
+        with self._lock:
+            retired = self._previous
+            self._previous = self._active
+            self._active = _Slot(detector=detector, config=config)
+        if retired is not None:
+            retired.retire()
+
+    def rollback(self) -> ModelVersion:
+        """Swap the active and previous versions; return the now-active one."""
+        with self._lock:
+            if self._previous is None:
+                raise ValueError("No previous model version to roll back to")
+            self._active, self._previous = self._previous, self._active
+            return self._active.version
+
+    def close(self) -> None:
+        """Close the active and the rollback detector once their calls return."""
+        with self._lock:
+            slots = [self._active, self._previous]
+            self._previous = None
+        for slot in slots:
+            if slot is not None:
+                slot.retire()
+
+    def _detector(self) -> DetectorPort:
+        with self._lock:
+            return self._active.detector
+
+    def _run(self, call: Callable[[DetectorPort], T]) -> T:
+        with self._lock:
+            slot = self._active
+            # The active slot is never retired, so this cannot fail.
+            slot.acquire()
+        try:
+            return call(slot.detector)
+        finally:
+            slot.release()
+
+
+class ModelSwapService:
+    """Builds, warms and installs new model versions in the background."""
+
+    def __init__(
+        self,
+        detector: SwappableDetector,
+        *,
+        builder: DetectorBuilder,
+        on_swap: Callable[[ModelVersion], None] | None = None,
+    ) -> None:
+        self._detector = detector
+        self._builder = builder
+        self._on_swap = on_swap
+        self._lock = threading.Lock()
+        self._loading: ModelVersion | None = None
+        self._thread: threading.Thread | None = None
+        self._last_error: str | None = None
+        self._last_warmup: dict[str, object] | None = None
+
+    def request_model(self, model_url: str, model_sha256: str | None) -> bool:
+        """Swap to another model artifact, keeping the other inference settings."""
+        return self.request_swap(
+            replace(
+                self._detector.active_config,
+                model_url=model_url,
+                model_sha256=model_sha256,
+            )
+        )
+
+    def request_swap(self, config: InferenceConfig) -> bool:
+        """Start loading *config* in the background.
+
+        Returns ``False`` when *config* is already active. Raises
+        ``ValueError`` while another swap is still loading.
+        """
+        version = ModelVersion.from_config(config)
+        with self._lock:
+            if self._loading is not None:
+                raise ValueError(
+                    f"Model swap already in progress: {self._loading.model_url}"
+                )
+            if config == self._detector.active_config:
+                return False
+            self._loading = version
+            self._last_error = None
+            self._thread = threading.Thread(
+                target=self._load, args=(config,), name="model-swap", daemon=True
+            )
+            self._thread.start()
+        logger.info("Model swap requested: %s", version.as_metadata())
+        return True
+
+    def rollback(self) -> ModelVersion:
+        """Reinstall the previous model version immediately."""
+        version = self._detector.rollback()
+        logger.warning("Model rolled back to %s", version.as_metadata())
+        self._notify(version)
+        return version
+
+    def wait(self, timeout: float | None = None) -> None:
+        """Block until the background load (if any) finishes."""
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+
+    def status(self) -> dict[str, object]:
+        """Return active/previous versions and the state of the last swap."""
+        with self._lock:
+            loading = self._loading
+            payload: dict[str, object] = {
+                "loading": None if loading is None else loading.as_metadata(),
+                "last_error": self._last_error,
+                "last_warmup": self._last_warmup,
+            }
+        payload.update(self._detector.versions())
+        return payload
+
+    def _load(self, config: InferenceConfig) -> None:
+        version = ModelVersion.from_config(config)
+        try:
+            candidate = self._builder(config)
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            self._fail(version, f"{type(error).__name__}: {error}")
+            return
+        warmup = DetectorWarmup(candidate)
+        warmup.run()
+        metrics = warmup.metrics()
+        if not warmup.ready:
+            close_detector(candidate)
+            self._fail(version, str(metrics.get("error")))
+            return
+        self._detector.swap(candidate, config)
+        with self._lock:
+            self._loading = None
+            self._last_warmup = metrics
+        logger.info(
+            "Model swapped to %s (cold_start_ms=%s)",
+            version.as_metadata(),
+            metrics.get("cold_start_ms"),
+        )
+        self._notify(version)
+
+    def _fail(self, version: ModelVersion, error: str) -> None:
+        with self._lock:
+            self._loading = None
+            self._last_error = error
+        logger.error("Model swap failed for %s: %s", version.model_url, error)
+
+    def _notify(self, version: ModelVersion) -> None:
+        if self._on_swap is not None:
+            self._on_swap(version)
+
+
+def _detect(detector: DetectorPort, image_uri: object) -> Sequence[Detection]:
+    detector_any: Any = detector
+    return detector_any.detect(image_uri)
+
+
+def _detect_regions(
+    detector: DetectorPort, image_uri: object, regions: Sequence[Any]
+) -> Any:
+    detector_any: Any = detector
+    return detector_any.detect_regions(image_uri, regions)
+
+
+def _cache_stats(detector: object) -> dict[str, int] | None:
+    detector_any: Any = detector
+    cache_stats = getattr(detector_any, "cache_stats", None)
+    if not callable(cache_stats):
+        return None
+    return cache_stats()
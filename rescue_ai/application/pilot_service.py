@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
@@ -14,6 +15,8 @@ from rescue_ai.domain.entities import Alert, Detection, FrameEvent, Mission
 from rescue_ai.domain.mission_metrics import (
     MissionReportData,
     build_gt_episodes,
+    build_imgsz_histogram,
+    build_model_version_ranges,
     build_report_stats,
     episode_id_for_ts,
     split_reviewed_alerts,
@@ -41,7 +44,7 @@ class PilotServicePort(Protocol):
     def ingest_frame_event(
         self,
         frame_event: FrameEvent,
-        detections: list[Detection],
+        detections: Sequence[Detection],
     ) -> list[Alert]: ...
 
     def review_alert(self, alert_id: str, updates: AlertReviewPayload): ...
@@ -82,6 +85,16 @@ class PilotService:
         """Set reproducibility metadata attached to mission reports."""
         self._report_metadata = cast(ReportMetadataPayload, dict(metadata))
 
+    def set_model_version(self, model_url: str, model_sha256: str | None) -> None:
+        """Point report metadata at a hot-swapped model version."""
+        metadata = dict(self._report_metadata)
+        metadata["model_url"] = model_url
+        if model_sha256:
+            metadata["model_sha256"] = model_sha256
+        else:
+            metadata.pop("model_sha256", None)
+        self._report_metadata = cast(ReportMetadataPayload, metadata)
+
     def create_mission(
         self,
         source_name: str,
@@ -197,9 +210,15 @@ class PilotService:
     def ingest_frame_event(
         self,
         frame_event: FrameEvent,
-        detections: list[Detection],
+        detections: Sequence[Detection],
+        frame_content: Callable[[], bytes | None] | None = None,
     ) -> list[Alert]:
-        """Process a frame event, evaluate alert rules, and persist results."""
+        """Process a frame event, evaluate alert rules, and persist results.
+
+        *frame_content* returns the frame's JPEG bytes; it is called only
+        when the frame raises an alert, so other frames are never encoded.
+        Without it the frame is read from ``frame_event.image_uri``.
+        """
         mission = self._deps.mission_repository.get(frame_event.mission_id)
         if mission is None:
             raise ValueError("Mission not found")
@@ -220,7 +239,7 @@ class PilotService:
             stored_image_uri = self._deps.artifact_storage.store_frame(
                 mission_id=frame_event.mission_id,
                 frame_id=frame_event.frame_id,
-                source_uri=frame_event.image_uri,
+                source=_frame_source(frame_event, frame_content),
                 ds=_mission_ds(mission),
             )
         frame_event.image_uri = stored_image_uri
@@ -270,6 +289,15 @@ class PilotService:
     def reset_runtime_state(self) -> None:
         self._alert_state.clear()
 
+    def recent_detection_boxes(
+        self, mission_id: str
+    ) -> list[tuple[float, float, float, float]]:
+        """Return boxes of the positives still inside the alert window."""
+        mission_state = self._alert_state.get(mission_id)
+        if mission_state is None:
+            return []
+        return [hit.detection.bbox for hit in mission_state.recent_hits]
+
     def get_mission_report(self, mission_id: str) -> dict[str, object]:
         mission = self._deps.mission_repository.get(mission_id)
         if mission is None:
@@ -357,6 +385,8 @@ class PilotService:
             "mission_id": mission_id,
             "gt_available": gt_available,
             **report_stats,
+            "model_versions": build_model_version_ranges(report_data.frames),
+            "imgsz_frames": build_imgsz_histogram(report_data.frames),
             "generated_at": _utc_now_iso(),
         }
         report.update(self._report_metadata)
@@ -438,7 +468,7 @@ class PilotService:
     def _evaluate_alert_rules(
         self,
         frame_event: FrameEvent,
-        detections: list[Detection],
+        detections: Sequence[Detection],
     ) -> list[Alert]:
         mission_state = self._alert_state.setdefault(
             frame_event.mission_id,
@@ -548,6 +578,19 @@ def _stable_alert_id(mission_id: str, frame_id: int) -> str:
     return str(uuid5(NAMESPACE_URL, f"rescue-ai/alert/{mission_id}/{frame_id}"))
 
 
+def _frame_source(
+    frame_event: FrameEvent, frame_content: Callable[[], bytes | None] | None
+) -> str | ArtifactBlob:
+    content = frame_content() if frame_content is not None else None
+    if content is None:
+        return frame_event.image_uri
+    return ArtifactBlob(
+        content=content,
+        media_type="image/jpeg",
+        filename=_frame_filename(frame_event.image_uri, frame_event.frame_id),
+    )
+
+
 def _frame_filename(image_uri: str, frame_id: int) -> str:
     parsed = urlparse(image_uri)
     candidate = Path(parsed.path).name if parsed.path else ""
@@ -15,7 +15,7 @@ from __future__ import annotations
 import json
 from dataclasses import dataclass
 from datetime import UTC, datetime
-from typing import Protocol
+from typing import Callable, Protocol
 
 # ── Storage protocol ────────────────────────────────────────────
 
@@ -166,7 +166,9 @@ def run_evaluate_model_stage(
     store: StageStorage,
     paths: PipelinePaths,
     *,
-    detector_predict,
+    detector_predict=None,
+    detector_predict_batch=None,
+    batch_size: int = 1,
 ) -> dict[str, object]:
     """Run the deployed detector over the dataset manifest.
 
@@ -174,10 +176,14 @@ def run_evaluate_model_stage(
     over every frame to build a confusion matrix, and writes the result
     to S3 (overwrites any prior evaluation for this
     ``(ds, mission)``).
+
+    When ``detector_predict_batch`` is given, the manifest is fed to it
+    in chunks of ``batch_size`` image URIs so the detector can run one
+    forward pass per chunk instead of one per frame.
     """
     if not store.exists(paths.dataset_key):
         raise RuntimeError(f"dataset is missing: {store.uri(paths.dataset_key)}")
-    if detector_predict is None:
+    if detector_predict is None and detector_predict_batch is None:
         raise RuntimeError("detector_predict is required for evaluate_model stage")
 
     dataset = store.read_json(paths.dataset_key)
@@ -187,6 +193,8 @@ def run_evaluate_model_stage(
     counts = _evaluate(
         evaluation_manifest=evaluation_manifest,
         detector_predict=detector_predict,
+        detector_predict_batch=detector_predict_batch,
+        batch_size=batch_size,
     )
 
     payload: dict[str, object] = {
@@ -216,6 +224,66 @@ def run_evaluate_model_stage(
     return result
 
 
+@dataclass(frozen=True)
+class CandidateModel:
+    """Alternative model artifact scored next to the deployed one."""
+
+    label: str
+    predict_batch: Callable[[list[str]], list[bool]]
+    max_recall_drop: float
+    batch_size: int = 1
+
+
+def run_candidate_comparison(
+    store: StageStorage,
+    paths: PipelinePaths,
+    *,
+    candidate: CandidateModel,
+) -> dict[str, object]:
+    """Score *candidate* on the same manifest and gate its promotion.
+
+    Runs after ``run_evaluate_model_stage`` (e.g. for an INT8 artifact):
+    the candidate's confusion matrix is stored under ``candidate`` in the
+    evaluation report, side by side with the deployed model. Raises —
+    refusing promotion — when recall drops by more than
+    ``candidate.max_recall_drop``.
+    """
+    if not store.exists(paths.evaluation_key):
+        raise RuntimeError(f"evaluation is missing: {store.uri(paths.evaluation_key)}")
+
+    dataset = store.read_json(paths.dataset_key)
+    evaluation = store.read_json(paths.evaluation_key)
+    counts = _evaluate(
+        evaluation_manifest=_parse_evaluation_manifest(dataset),
+        detector_predict=None,
+        detector_predict_batch=candidate.predict_batch,
+        batch_size=candidate.batch_size,
+    )
+    reference_recall = evaluation.get("recall")
+    if not isinstance(reference_recall, (int, float)):
+        raise RuntimeError("evaluation report has no reference recall")
+    recall_drop = round(float(reference_recall) - counts.recall, 4)
+    comparison: dict[str, object] = {
+        "label": candidate.label,
+        **_counts_payload(counts),
+        "recall_drop": recall_drop,
+        "max_recall_drop": candidate.max_recall_drop,
+        "promotion_allowed": recall_drop <= candidate.max_recall_drop,
+    }
+    evaluation["candidate"] = comparison
+    store.write_json(paths.evaluation_key, evaluation)
+
+    if not comparison["promotion_allowed"]:
+        raise RuntimeError(
+            f"candidate {candidate.label} rejected: recall drop "
+            f"{recall_drop} exceeds {candidate.max_recall_drop}"
+        )
+    result = _done("evaluate_model", store.uri(paths.evaluation_key))
+    result["metrics"] = _metric_summary(evaluation)
+    result["candidate"] = comparison
+    return result
+
+
 # ── Stage 3: publish_metrics ────────────────────────────────────
 
 
@@ -327,24 +395,58 @@ def _evaluate(
     *,
     evaluation_manifest: list[dict[str, object]],
     detector_predict,
+    detector_predict_batch=None,
+    batch_size: int = 1,
 ) -> ValidationCounts:
     counts = ValidationCounts()
-    for item in evaluation_manifest:
-        image_uri = str(item.get("image_uri", ""))
-        if not image_uri:
-            raise RuntimeError("evaluation_manifest item has empty image_uri")
-        gt_present = _as_bool(
-            item.get("gt_person_present"), field_name="gt_person_present"
-        )
+    rows = [_parse_manifest_row(item) for item in evaluation_manifest]
+    step = max(1, batch_size) if detector_predict_batch is not None else 1
+    for start in range(0, len(rows), step):
+        stop = start + step
+        chunk = rows[start:stop]
+        image_uris = [image_uri for image_uri, _gt_present in chunk]
         try:
-            detected = bool(detector_predict(image_uri))
+            if detector_predict_batch is not None:
+                detected_flags = [bool(f) for f in detector_predict_batch(image_uris)]
+            else:
+                detected_flags = [bool(detector_predict(image_uris[0]))]
         except (RuntimeError, ValueError, OSError) as error:
             counts.detector_errors += 1
-            raise RuntimeError(f"detector failed on {image_uri}: {error}") from error
-        counts.add(detected=detected, gt_present=gt_present)
+            raise RuntimeError(
+                f"detector failed on {image_uris[0]}: {error}"
+            ) from error
+        if len(detected_flags) != len(chunk):
+            counts.detector_errors += 1
+            raise RuntimeError(
+                f"detector returned {len(detected_flags)} results "
+                f"for {len(chunk)} frames"
+            )
+        for row, detected in zip(chunk, detected_flags):
+            counts.add(detected=detected, gt_present=row[1])
     return counts
 
 
+def _parse_manifest_row(item: dict[str, object]) -> tuple[str, bool]:
+    image_uri = str(item.get("image_uri", ""))
+    if not image_uri:
+        raise RuntimeError("evaluation_manifest item has empty image_uri")
+    gt_present = _as_bool(item.get("gt_person_present"), field_name="gt_person_present")
+    return image_uri, gt_present
+
+
+def _counts_payload(counts: ValidationCounts) -> dict[str, object]:
+    return {
+        "tp": counts.tp,
+        "tn": counts.tn,
+        "fp": counts.fp,
+        "fn": counts.fn,
+        "detector_errors": counts.detector_errors,
+        "accuracy": counts.accuracy,
+        "precision": counts.precision,
+        "recall": counts.recall,
+    }
+
+
 def _metric_summary(payload: dict[str, object]) -> dict[str, object]:
     return {
         field: payload.get(field)
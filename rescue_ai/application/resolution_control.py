@@ -0,0 +1,72 @@
+"""Latency-driven input resolution for the online detection loop.
+
+A fixed ``imgsz`` makes the loop fall further behind ``target_fps`` on
+a busy host: the throttle can only sleep, never catch up. The
+controller compares each frame's processing time with the frame
+interval and steps ``imgsz`` down while frames overrun, and back up
+once there is headroom. Separate high and low load thresholds plus a
+``patience`` streak give hysteresis, so the size does not flap.
+"""
+
+from __future__ import annotations
+
+from rescue_ai.application.inference_config import AdaptiveImgszConfig
+
+_IMGSZ_STRIDE = 32
+
+
+class ResolutionController:
+    """Per-stream ``imgsz`` chooser driven by measured processing time."""
+
+    def __init__(self, config: AdaptiveImgszConfig, *, initial_imgsz: int) -> None:
+        self._config = config
+        self._imgsz = _clamp(initial_imgsz, config)
+        self._load: float | None = None
+        self._over = 0
+        self._under = 0
+        self.steps_down = 0
+        self.steps_up = 0
+
+    @property
+    def imgsz(self) -> int:
+        """Return the input size for the next frame."""
+        return self._imgsz
+
+    @property
+    def load(self) -> float | None:
+        """Return the smoothed processing-time / frame-interval ratio."""
+        return self._load
+
+    def observe(self, processing_sec: float, frame_interval_sec: float) -> int:
+        """Record one frame's processing time; return the next ``imgsz``."""
+        if frame_interval_sec <= 0:
+            return self._imgsz
+        ratio = processing_sec / frame_interval_sec
+        alpha = self._config.smoothing
+        self._load = (
+            ratio if self._load is None else alpha * ratio + (1 - alpha) * self._load
+        )
+        self._over = self._over + 1 if self._load > self._config.high_load else 0
+        self._under = self._under + 1 if self._load < self._config.low_load else 0
+        if self._over >= self._config.patience:
+            self._step(-self._config.step)
+        elif self._under >= self._config.patience:
+            self._step(self._config.step)
+        return self._imgsz
+
+    def _step(self, delta: int) -> None:
+        imgsz = _clamp(self._imgsz + delta, self._config)
+        if imgsz < self._imgsz:
+            self.steps_down += 1
+        elif imgsz > self._imgsz:
+            self.steps_up += 1
+        self._imgsz = imgsz
+        # Restart both streaks so the next step needs fresh evidence.
+        self._over = 0
+        self._under = 0
+        self._load = None
+
+
+def _clamp(imgsz: int, config: AdaptiveImgszConfig) -> int:
+    imgsz = max(config.min_imgsz, min(config.max_imgsz, imgsz))
+    return max(_IMGSZ_STRIDE, imgsz - imgsz % _IMGSZ_STRIDE)
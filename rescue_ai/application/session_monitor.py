@@ -0,0 +1,156 @@
+"""Background polling of RPi stream sessions for the control plane.
+
+Frame loops and status endpoints used to ask the Pi for session stats
+themselves: the loop stalled whenever the Pi was slow, and every open
+UI tab cost one request per status poll. ``SessionMonitor`` polls every
+watched session from one background thread on its own cadence and
+caches the latest stats with their timestamp. Readers only look at the
+cache; the end of a stream is signalled through a per-session
+``threading.Event``.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, replace
+from datetime import datetime, timezone
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class SessionSnapshot:
+    """Latest cached view of one session.
+
+    ``updated_at`` is the UTC time of the last successful poll; ``error``
+    describes the last failed poll and is cleared by the next success.
+    """
+
+    stats: dict[str, object] | None = None
+    updated_at: str | None = None
+    error: str | None = None
+    finished: bool = False
+
+
+@dataclass
+class _Watch:
+    finished: threading.Event
+    snapshot: SessionSnapshot
+    due: float
+
+
+class SessionMonitor:
+    """One thread polling ``fetch(session_id)`` for every watched session."""
+
+    def __init__(
+        self,
+        fetch: Callable[[str], dict[str, object]],
+        *,
+        interval_sec: float,
+    ) -> None:
+        self._fetch = fetch
+        self._interval_sec = interval_sec
+        self._watches: dict[str, _Watch] = {}
+        self._condition = threading.Condition()
+        self._thread: threading.Thread | None = None
+        self._closed = False
+
+    def watch(self, session_id: str) -> threading.Event:
+        """Start polling *session_id* now; return its end-of-stream event."""
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("SessionMonitor is closed")
+            watch = self._watches.get(session_id)
+            if watch is None:
+                watch = _Watch(
+                    finished=threading.Event(),
+                    snapshot=SessionSnapshot(),
+                    due=time.monotonic(),
+                )
+                self._watches[session_id] = watch
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="rpi-session-monitor", daemon=True
+                )
+                self._thread.start()
+            self._condition.notify()
+            return watch.finished
+
+    def unwatch(self, session_id: str) -> None:
+        """Stop polling *session_id* and forget its cached stats."""
+        with self._condition:
+            self._watches.pop(session_id, None)
+
+    def snapshot(self, session_id: str) -> SessionSnapshot | None:
+        """Return the cached stats of *session_id*; never blocks on the Pi."""
+        with self._condition:
+            watch = self._watches.get(session_id)
+            return None if watch is None else watch.snapshot
+
+    def poll_soon(self, session_id: str) -> None:
+        """Poll *session_id* without waiting for its next turn."""
+        with self._condition:
+            watch = self._watches.get(session_id)
+            if watch is not None:
+                watch.due = time.monotonic()
+                self._condition.notify()
+
+    def close(self) -> None:
+        """Stop the polling thread."""
+        with self._condition:
+            self._closed = True
+            self._watches.clear()
+            self._condition.notify_all()
+
+    def _run(self) -> None:
+        while True:
+            session_id = self._next_due()
+            if session_id is None:
+                return
+            try:
+                stats, error = self._fetch(session_id), None
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                # Transport errors included: the Pi may be briefly unreachable.
+                stats, error = None, f"{type(exc).__name__}: {exc}"
+                logger.debug("Session stats poll failed %s: %s", session_id, error)
+            self._record(session_id, stats, error)
+
+    def _next_due(self) -> str | None:
+        with self._condition:
+            while not self._closed:
+                now = time.monotonic()
+                due = min(
+                    self._watches.items(),
+                    key=lambda item: item[1].due,
+                    default=None,
+                )
+                if due is not None and due[1].due <= now:
+                    session_id, watch = due
+                    watch.due = now + self._interval_sec
+                    return session_id
+                self._condition.wait(None if due is None else due[1].due - now)
+            return None
+
+    def _record(
+        self,
+        session_id: str,
+        stats: dict[str, object] | None,
+        error: str | None,
+    ) -> None:
+        with self._condition:
+            watch = self._watches.get(session_id)
+            if watch is None:
+                return
+            if stats is None:
+                watch.snapshot = replace(watch.snapshot, error=error)
+                return
+            if stats.get("stop", False):
+                watch.finished.set()
+            watch.snapshot = SessionSnapshot(
+                stats=stats,
+                updated_at=datetime.now(timezone.utc).isoformat(),
+                finished=watch.finished.is_set(),
+            )
@@ -0,0 +1,100 @@
+"""Bounded hand-off queue between the stages of the online stream pipeline.
+
+Capture, detection and ingest run in their own threads and pass work
+through ``StageQueue``s. A queue either applies back-pressure (``put``
+blocks while it is full) or, with ``drop_oldest``, keeps the newest
+items and discards the stalest one: a live stream wants the latest
+frame, not a backlog. ``close`` ends the hand-off; consumers still
+drain what is queued before ``get`` returns ``None``. Schedulers that
+must not block use ``poll`` instead of ``get``.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import deque
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class StageQueue(Generic[T]):
+    """Thread-safe bounded FIFO with depth and drop counters."""
+
+    def __init__(self, name: str, *, capacity: int, drop_oldest: bool) -> None:
+        if capacity < 1:
+            raise ValueError("StageQueue capacity must be >= 1")
+        self.name = name
+        self._capacity = capacity
+        self._drop_oldest = drop_oldest
+        self._items: deque[T] = deque()
+        self._condition = threading.Condition()
+        self._closed = False
+        self._enqueued = 0
+        self._dropped = 0
+        self._max_depth = 0
+
+    def __len__(self) -> int:
+        with self._condition:
+            return len(self._items)
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    def put(self, item: T) -> bool:
+        """Queue *item*; return ``False`` if the queue was closed instead."""
+        with self._condition:
+            while (
+                not self._closed
+                and not self._drop_oldest
+                and len(self._items) >= self._capacity
+            ):
+                self._condition.wait()
+            if self._closed:
+                return False
+            if len(self._items) >= self._capacity:
+                self._items.popleft()
+                self._dropped += 1
+            self._items.append(item)
+            self._enqueued += 1
+            self._max_depth = max(self._max_depth, len(self._items))
+            self._condition.notify_all()
+            return True
+
+    def get(self) -> T | None:
+        """Return the next item, or ``None`` once closed and drained."""
+        with self._condition:
+            while not self._items and not self._closed:
+                self._condition.wait()
+            if not self._items:
+                return None
+            item = self._items.popleft()
+            self._condition.notify_all()
+            return item
+
+    def poll(self) -> T | None:
+        """Return the next item without waiting, or ``None`` if empty."""
+        with self._condition:
+            if not self._items:
+                return None
+            item = self._items.popleft()
+            self._condition.notify_all()
+            return item
+
+    def close(self) -> None:
+        """Refuse further items and wake blocked producers and consumers."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+
+    def stats(self) -> dict[str, int]:
+        """Return current depth, capacity, high-water mark and counters."""
+        with self._condition:
+            return {
+                "depth": len(self._items),
+                "capacity": self._capacity,
+                "max_depth": self._max_depth,
+                "enqueued": self._enqueued,
+                "dropped": self._dropped,
+            }
@@ -0,0 +1,216 @@
+"""Detection and ingest workers shared by every live stream.
+
+Each stream owns a ``StreamLane``: a latest-frames queue in front of its
+detect stage and a bounded queue of detected frames in front of its
+ingest stage. ``workers`` threads serve the stages of all lanes
+round-robin, so the thread count does not grow with the number of
+streams. A lane runs at most one detect and one ingest at a time: its
+frames keep their order and per-stream state needs no locking, while
+detection of one frame still overlaps ingest of the previous one.
+Detection is only scheduled while the lane's ingest queue has room, so
+back-pressure stalls that lane, never a worker.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future
+from dataclasses import dataclass
+from functools import partial
+from typing import Any, Generic, TypeVar
+
+from rescue_ai.application.inference_config import PipelineConfig
+from rescue_ai.application.stage_queue import StageQueue
+
+logger = logging.getLogger(__name__)
+
+F = TypeVar("F")
+E = TypeVar("E")
+
+STAGE_DETECT = "detect"
+STAGE_INGEST = "ingest"
+
+
+@dataclass(frozen=True)
+class LaneStages(Generic[F, E]):
+    """Stage callables of one stream, run by the shared workers."""
+
+    detect: Callable[[F], E]
+    ingest: Callable[[E], None]
+    on_error: Callable[[Exception], None]
+
+
+class StreamLane(Generic[F, E]):
+    """One stream's queues and stage state inside a ``StreamWorkerPool``.
+
+    ``done`` resolves once the lane is closed and its queued work has
+    drained, or once a stage failed and the running stage returned.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        stages: LaneStages[F, E],
+        config: PipelineConfig,
+        condition: threading.Condition,
+    ) -> None:
+        self.name = name
+        self.frames: StageQueue[F] = StageQueue(
+            STAGE_DETECT, capacity=config.frame_queue_size, drop_oldest=True
+        )
+        self.events: StageQueue[E] = StageQueue(
+            STAGE_INGEST, capacity=config.ingest_queue_size, drop_oldest=False
+        )
+        self.done: Future[None] = Future()
+        self._stages = stages
+        # The pool's condition: guards the fields below and wakes workers.
+        self._condition = condition
+        self._busy: set[str] = set()
+        self._closing = False
+        self._failed = False
+
+    def submit(self, frame: F) -> bool:
+        """Queue a captured frame; return ``False`` once the lane is closed."""
+        if not self.frames.put(frame):
+            return False
+        with self._condition:
+            self._condition.notify()
+        return True
+
+    def close(self) -> None:
+        """Accept no more frames; queued frames are still detected and ingested."""
+        self.frames.close()
+        with self._condition:
+            self._closing = True
+            self._condition.notify_all()
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        """Return the stats of the detect and ingest queues."""
+        return {queue.name: queue.stats() for queue in (self.frames, self.events)}
+
+    def _claim(self) -> tuple[str, Callable[[], None]] | None:
+        """Take the next runnable stage of this lane; caller holds the lock."""
+        if self._failed:
+            return None
+        if STAGE_INGEST not in self._busy:
+            event = self.events.poll()
+            if event is not None:
+                self._busy.add(STAGE_INGEST)
+                return STAGE_INGEST, partial(self._stages.ingest, event)
+        if STAGE_DETECT not in self._busy and len(self.events) < self.events.capacity:
+            frame = self.frames.poll()
+            if frame is not None:
+                self._busy.add(STAGE_DETECT)
+                return STAGE_DETECT, partial(self._detect, frame)
+        return None
+
+    def _detect(self, frame: F) -> None:
+        # Never blocks: detection is claimed only while the queue has room.
+        self.events.put(self._stages.detect(frame))
+
+    def _release(self, stage: str, error: Exception | None) -> None:
+        """Mark *stage* idle again; caller holds the lock."""
+        self._busy.discard(stage)
+        if error is not None:
+            self._failed = True
+            # Refuses further frames, which stops the stream's capture.
+            self.frames.close()
+            self.events.close()
+
+    def _finished(self) -> bool:
+        if self._busy or not (self._closing or self._failed):
+            return False
+        return self._failed or (not self.frames and not self.events)
+
+    def _fail(self, error: Exception) -> None:
+        self._stages.on_error(error)
+
+
+class StreamWorkerPool:
+    """Worker threads running the detect and ingest stages of every stream."""
+
+    def __init__(self, config: PipelineConfig) -> None:
+        self._config = config
+        self._lanes: list[StreamLane[Any, Any]] = []
+        self._cursor = 0
+        self._condition = threading.Condition()
+        self._workers: list[threading.Thread] = []
+        self._closed = False
+
+    def start(self) -> None:
+        """Start the worker threads."""
+        with self._condition:
+            if self._workers:
+                return
+            self._workers = [
+                threading.Thread(
+                    target=self._work, name=f"stream-worker-{idx}", daemon=True
+                )
+                for idx in range(max(1, self._config.workers))
+            ]
+        for worker in self._workers:
+            worker.start()
+
+    def close(self) -> None:
+        """Stop the workers; open lanes are resolved without draining."""
+        with self._condition:
+            self._closed = True
+            for lane in self._lanes:
+                lane.frames.close()
+                lane.events.close()
+                lane.done.set_result(None)
+            self._lanes.clear()
+            self._condition.notify_all()
+
+    def open_lane(self, name: str, stages: LaneStages[F, E]) -> StreamLane[F, E]:
+        """Register a stream and return the lane its capture submits frames to."""
+        lane = StreamLane(name, stages, self._config, self._condition)
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("StreamWorkerPool is closed")
+            self._lanes.append(lane)
+        return lane
+
+    def _work(self) -> None:
+        while True:
+            picked = self._next_task()
+            if picked is None:
+                return
+            lane, stage, task = picked
+            error: Exception | None = None
+            try:
+                task()
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                # One stream's failure must not take down a shared worker.
+                logger.exception("Stream %s stage %s failed", lane.name, stage)
+                lane._fail(exc)
+                error = exc
+            with self._condition:
+                lane._release(stage, error)
+                self._condition.notify_all()
+
+    def _next_task(
+        self,
+    ) -> tuple[StreamLane[Any, Any], str, Callable[[], None]] | None:
+        with self._condition:
+            while not self._closed:
+                self._retire_finished()
+                count = len(self._lanes)
+                for offset in range(count):
+                    index = (self._cursor + offset) % count
+                    lane = self._lanes[index]
+                    claimed = lane._claim()
+                    if claimed is not None:
+                        # Start the next scan after this lane: fair across streams.
+                        self._cursor = index + 1
+                        return lane, *claimed
+                self._condition.wait()
+            return None
+
+    def _retire_finished(self) -> None:
+        finished = [lane for lane in self._lanes if lane._finished()]
+        for lane in finished:
+            self._lanes.remove(lane)
+            lane.done.set_result(None)
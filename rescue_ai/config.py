@@ -64,6 +64,12 @@ class RpiSettings(BaseEnvSettings):
     rtsp_port: int = Field(default=0, alias="RPI_RTSP_PORT")
     rtsp_path_prefix: str = Field(default="live", alias="RPI_RTSP_PATH_PREFIX")
     timeout_sec: float = Field(default=10.0, alias="RPI_TIMEOUT_SEC")
+    connect_timeout_sec: float = Field(default=3.0, alias="RPI_CONNECT_TIMEOUT_SEC")
+    max_retries: int = Field(default=2, alias="RPI_MAX_RETRIES")
+    retry_backoff_sec: float = Field(default=0.25, alias="RPI_RETRY_BACKOFF_SEC")
+    annotations_cache_dir: str = Field(
+        default="runtime/annotations", alias="RPI_ANNOTATIONS_CACHE_DIR"
+    )
 
 
 class DetectionSettings(BaseEnvSettings):
@@ -72,6 +78,12 @@ class DetectionSettings(BaseEnvSettings):
     http_timeout_sec: float = Field(default=1.0, alias="DETECTION_HTTP_TIMEOUT_SEC")
 
 
+class ModelSettings(BaseEnvSettings):
+    """Model artifact locations for offline deployments."""
+
+    preload_dir: str = Field(default="", alias="MODEL_PRELOAD_DIR")
+
+
 class Settings(BaseSettings):
     """Aggregated application settings."""
 
@@ -81,6 +93,7 @@ class Settings(BaseSettings):
     storage: StorageSettings
     rpi: RpiSettings
     detection: DetectionSettings
+    models: ModelSettings = Field(default_factory=ModelSettings)
 
 
 @lru_cache(maxsize=1)
@@ -92,4 +105,5 @@ def get_settings() -> Settings:
         storage=StorageSettings(),
         rpi=RpiSettings(),
         detection=DetectionSettings(),
+        models=ModelSettings(),
     )
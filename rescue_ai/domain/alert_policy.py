@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import dataclass, field
+from typing import Any
 
 from rescue_ai.domain.entities import Detection, FrameEvent
 from rescue_ai.domain.value_objects import AlertRuleConfig
@@ -24,6 +26,7 @@ class MissionAlertState:
     recent_hits: list[DetectionHit] = field(default_factory=list)
     last_alert_ts: float | None = None
     last_positive_ts: float | None = None
+    alerted_track_ids: set[int] = field(default_factory=set)
 
 
 @dataclass(frozen=True)
@@ -38,7 +41,7 @@ class AlertEvaluation:
 
 def evaluate_alert(
     frame_event: FrameEvent,
-    detections: list[Detection],
+    detections: Sequence[Detection],
     mission_state: MissionAlertState,
     rules: AlertRuleConfig,
 ) -> AlertEvaluation:
@@ -50,11 +53,9 @@ def evaluate_alert(
         window_sec=rules.window_sec,
     )
 
-    positives = [
-        item
-        for item in detections
-        if item.score >= rules.score_threshold and item.label == "person"
-    ]
+    positives = list(
+        select_detections(detections, min_score=rules.score_threshold, label="person")
+    )
     if not positives:
         _drop_hits_after_gap(
             mission_state=mission_state, current_ts=current_ts, rules=rules
@@ -103,7 +104,20 @@ def evaluate_alert(
             people_detected=len(positives),
         )
 
+    track_ids = {item.track_id for item in positives}
+    if None not in track_ids and track_ids <= mission_state.alerted_track_ids:
+        # Every visible person is a tracked one that already raised an alert.
+        return AlertEvaluation(
+            positives=positives,
+            best_detection=best_detection,
+            should_create_alert=False,
+            people_detected=len(positives),
+        )
+
     mission_state.last_alert_ts = current_ts
+    mission_state.alerted_track_ids.update(
+        item.track_id for item in positives if item.track_id is not None
+    )
     return AlertEvaluation(
         positives=positives,
         best_detection=best_detection,
@@ -112,6 +126,28 @@ def evaluate_alert(
     )
 
 
+def select_detections(
+    detections: Sequence[Detection],
+    *,
+    min_score: float,
+    label: str | None = None,
+) -> Sequence[Detection]:
+    """Return detections scoring at least *min_score* (and matching *label*).
+
+    Array-backed detector outputs expose a vectorized ``select`` so only
+    the surviving boxes are materialized as ``Detection`` objects.
+    """
+    detections_any: Any = detections
+    select = getattr(detections_any, "select", None)
+    if callable(select):
+        return select(min_score=min_score, label=label)
+    return [
+        item
+        for item in detections
+        if item.score >= min_score and (label is None or item.label == label)
+    ]
+
+
 def drop_expired_hits(
     mission_state: MissionAlertState,
     current_ts: float,
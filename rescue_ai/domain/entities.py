@@ -31,6 +31,10 @@ class FrameEvent:
     image_uri: str
     gt_person_present: bool
     gt_episode_id: str | None
+    inference_path: str | None = None
+    model_url: str | None = None
+    model_sha256: str | None = None
+    imgsz: int | None = None
 
 
 @dataclass(frozen=True)
@@ -42,6 +46,7 @@ class Detection:
     label: str
     model_name: str
     explanation: str | None = None
+    track_id: int | None = None
 
 
 @dataclass
@@ -70,6 +70,47 @@ def build_report_stats(
     }
 
 
+def build_model_version_ranges(frames: list[FrameEvent]) -> list[dict[str, object]]:
+    """Group consecutive frames by the model version that processed them.
+
+    Frames without a recorded version (ingested before hot swapping
+    existed) are skipped.
+    """
+    groups: list[tuple[tuple[str, str | None], int, int, int]] = []
+    for frame in sorted(frames, key=lambda item: item.frame_id):
+        if frame.model_url is None:
+            continue
+        key = (frame.model_url, frame.model_sha256)
+        if groups and groups[-1][0] == key:
+            _key, first_frame_id, _last, count = groups[-1]
+            groups[-1] = (key, first_frame_id, frame.frame_id, count + 1)
+        else:
+            groups.append((key, frame.frame_id, frame.frame_id, 1))
+    return [
+        {
+            "model_url": model_url,
+            "model_sha256": model_sha256,
+            "first_frame_id": first_frame_id,
+            "last_frame_id": last_frame_id,
+            "frames": count,
+        }
+        for (model_url, model_sha256), first_frame_id, last_frame_id, count in groups
+    ]
+
+
+def build_imgsz_histogram(frames: list[FrameEvent]) -> dict[str, int]:
+    """Count processed frames per detector input size, smallest size first.
+
+    Frames that did not run the detector at a recorded size (reused,
+    tracked or ingested without adaptive ``imgsz``) are skipped.
+    """
+    counts: dict[int, int] = {}
+    for frame in frames:
+        if frame.imgsz is not None:
+            counts[frame.imgsz] = counts.get(frame.imgsz, 0) + 1
+    return {str(imgsz): counts[imgsz] for imgsz in sorted(counts)}
+
+
 def build_gt_episodes(
     frames: list[FrameEvent],
     gt_gap_end_sec: float,
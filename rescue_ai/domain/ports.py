@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Mapping
+from collections.abc import Mapping, Sequence
 from typing import Protocol, TypedDict
 
 from rescue_ai.domain.entities import Alert, Detection, FrameEvent, Mission
@@ -121,7 +121,7 @@ class ArtifactStorage(Protocol):
     """
 
     def store_frame(
-        self, mission_id: str, frame_id: int, source_uri: str, ds: str
+        self, mission_id: str, frame_id: int, source: str | ArtifactBlob, ds: str
     ) -> str: ...
 
     def load_frame(self, image_uri: str) -> ArtifactBlob | None: ...
@@ -142,11 +142,18 @@ class ArtifactStorage(Protocol):
 class DetectorPort(Protocol):
     """Port for ML detector used by both online and batch services."""
 
-    def detect(self, image_uri: str) -> list[Detection]: ...
+    def detect(self, image_uri: str) -> Sequence[Detection]: ...
     def warmup(self) -> None: ...
     def runtime_name(self) -> str: ...
 
 
+class BatchDetectorPort(DetectorPort, Protocol):
+    """Detector that can run several frames through one forward pass."""
+
+    def detect_batch(self, image_uris: Sequence[object]) -> list[Sequence[Detection]]:
+        """Return per-frame detections in the same order as *image_uris*."""
+
+
 class FramePublisherPort(Protocol):
     """Port for publishing frame payload into mission API."""
 
@@ -91,31 +91,34 @@ class S3ArtifactStorage:
         )
 
     def store_frame(
-        self, mission_id: str, frame_id: int, source_uri: str, ds: str
+        self, mission_id: str, frame_id: int, source: str | ArtifactBlob, ds: str
     ) -> str:
-        source_path = _local_path_from_uri(source_uri)
-        if source_path is None or not source_path.exists() or not source_path.is_file():
-            return source_uri
+        """Upload a frame given as in-memory bytes or a local file URI.
 
+        A URI that is not a readable local file is returned unchanged.
+        """
         _ = frame_id
-        filename = source_path.name or "frame.bin"
+        blob = source if isinstance(source, ArtifactBlob) else _read_local(source)
+        if blob is None:
+            return str(source)
+
         key = self._key_for_mission_file(
             mission_id=mission_id,
             ds=ds,
-            leaf=f"frames/{filename}",
+            leaf=f"frames/{blob.filename}",
         )
         s3_uri = f"s3://{self._settings.bucket}/{key}"
 
         with self._lock:
-            self._pending_frames[key] = PendingFrameUpload(source_uri=source_uri)
+            self._pending_frames[key] = PendingFrameUpload(
+                source_uri=source if isinstance(source, str) else blob.filename
+            )
 
-        media_type, _ = mimetypes.guess_type(source_path.name)
-        payload = source_path.read_bytes()
         self._uploads.submit(
             self._upload_frame,
             key,
-            payload,
-            media_type or "application/octet-stream",
+            blob.content,
+            blob.media_type,
         )
         return s3_uri
 
@@ -282,6 +285,18 @@ class S3ArtifactStorage:
                 self._pending_frames.pop(key, None)
 
 
+def _read_local(uri: str) -> ArtifactBlob | None:
+    source_path = _local_path_from_uri(uri)
+    if source_path is None or not source_path.exists() or not source_path.is_file():
+        return None
+    media_type, _ = mimetypes.guess_type(source_path.name)
+    return ArtifactBlob(
+        content=source_path.read_bytes(),
+        media_type=media_type or "application/octet-stream",
+        filename=source_path.name or "frame.bin",
+    )
+
+
 def _local_path_from_uri(uri: str) -> Path | None:
     parsed = urlparse(uri)
     if parsed.scheme == "file":
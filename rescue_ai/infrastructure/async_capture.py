@@ -0,0 +1,227 @@
+"""Capture of every live stream on one asyncio event loop.
+
+``CaptureHub`` runs an event loop in a single thread. HTTP streams are
+read through one shared ``httpx.AsyncClient``: MJPEG responses are
+parsed incrementally as chunks arrive, other endpoints are polled one
+JPEG at a time. Blocking backends, OpenCV RTSP in practice, keep their
+reader but run it on a small executor that all streams share with the
+other blocking calls of their capture sessions. Dozens of streams thus
+cost the loop thread plus ``io_threads`` executor threads instead of a
+thread each.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+from collections.abc import AsyncIterator, Callable, Coroutine
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import suppress
+from typing import Any, Protocol, TypeVar
+
+import httpx
+
+from rescue_ai.infrastructure.mjpeg_parser import MjpegParser
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_CHUNK_SIZE = 16384
+
+
+class AsyncFrameSource(Protocol):
+    """Frame source read from the hub's event loop."""
+
+    backend: str
+
+    async def read_frame(self) -> object | None: ...
+
+    async def close(self) -> None: ...
+
+
+class BlockingCapture(Protocol):
+    """Blocking frame reader, such as an OpenCV ``VideoCapture`` wrapper."""
+
+    def read_frame(self) -> object | None: ...
+
+    def release(self) -> None: ...
+
+
+class CaptureHub:
+    """One event loop thread and one small executor for all capture sessions."""
+
+    def __init__(self, *, io_threads: int = 4) -> None:
+        self._io_threads = max(1, io_threads)
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._executor: ThreadPoolExecutor | None = None
+        self._client: httpx.AsyncClient | None = None
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        """Start the event loop thread."""
+        with self._lock:
+            if self._loop is not None:
+                return
+            loop = asyncio.new_event_loop()
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._io_threads, thread_name_prefix="capture-io"
+            )
+            self._thread = threading.Thread(
+                target=loop.run_forever, name="capture-hub", daemon=True
+            )
+            self._loop = loop
+        self._thread.start()
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Cancel running sessions, then stop the loop and the executor."""
+        with self._lock:
+            loop, thread, executor = self._loop, self._thread, self._executor
+            self._loop = None
+        if loop is None or thread is None or executor is None:
+            return
+        with suppress(TimeoutError):
+            asyncio.run_coroutine_threadsafe(self._shutdown(), loop).result(timeout)
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout)
+        if not thread.is_alive():
+            loop.close()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def submit(self, coro: Coroutine[Any, Any, T]) -> Future[T]:
+        """Run *coro* on the loop; return a future for its result."""
+        loop = self._loop
+        if loop is None:
+            coro.close()
+            raise RuntimeError("CaptureHub is not running")
+        return asyncio.run_coroutine_threadsafe(coro, loop)
+
+    def call_soon(self, callback: Callable[[], object]) -> None:
+        """Schedule *callback* on the loop from any thread."""
+        loop = self._loop
+        if loop is not None:
+            loop.call_soon_threadsafe(callback)
+
+    async def run_blocking(self, func: Callable[[], T]) -> T:
+        """Run blocking *func* on the executor; await from the loop only."""
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func)
+
+    def http_client(self) -> httpx.AsyncClient:
+        """Return the HTTP client shared by all streams; call from the loop only."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(timeout=10.0)
+        return self._client
+
+    async def _shutdown(self) -> None:
+        current = asyncio.current_task()
+        tasks = [task for task in asyncio.all_tasks() if task is not current]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+class AsyncHttpFrameSource:
+    """Frames from an RPi HTTP endpoint (MJPEG or JPEG-per-request)."""
+
+    backend = "http"
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        response: httpx.Response | None = None,
+    ) -> None:
+        self._client = client
+        self._url = url
+        self._response = response
+        self._chunks: AsyncIterator[bytes] | None = None
+        self._parser = MjpegParser()
+        if response is not None:
+            self._chunks = response.aiter_bytes(chunk_size=_CHUNK_SIZE)
+            self._parser = MjpegParser.from_content_type(
+                response.headers.get("content-type", "")
+            )
+
+    @classmethod
+    async def open(
+        cls, client: httpx.AsyncClient, url: str
+    ) -> AsyncHttpFrameSource | None:
+        """Connect to *url*; return ``None`` if the endpoint is unreachable."""
+        try:
+            response = await client.send(
+                client.build_request("GET", url),
+                stream=True,
+            )
+        except (httpx.HTTPError, RuntimeError, ValueError) as err:
+            logger.warning("HTTP stream connect failed: %s", type(err).__name__)
+            return None
+        content_type = response.headers.get("content-type", "")
+        if "multipart" in content_type or "image" in content_type:
+            return cls(client, url, response)
+        # Not a stream — poll frame by frame.
+        await response.aclose()
+        return cls(client, url)
+
+    async def read_frame(self) -> bytes | None:
+        """Read one JPEG frame; ``None`` on errors or end of stream."""
+        try:
+            if self._chunks is not None:
+                return await self._read_mjpeg_frame(self._chunks)
+            return await self._read_single_frame()
+        except (httpx.HTTPError, RuntimeError, ValueError) as err:
+            logger.warning("HTTP frame read error: %s", type(err).__name__)
+            return None
+
+    async def close(self) -> None:
+        # The client is shared by all streams and stays open.
+        if self._response is not None:
+            with suppress(Exception):
+                await self._response.aclose()
+
+    async def _read_mjpeg_frame(self, chunks: AsyncIterator[bytes]) -> bytes | None:
+        while True:
+            # One chunk may carry several frames: drain them first.
+            frame = self._parser.next_frame()
+            if frame is not None:
+                return frame
+            try:
+                chunk = await anext(chunks)
+            except StopAsyncIteration:
+                return None
+            self._parser.feed(chunk)
+
+    async def _read_single_frame(self) -> bytes | None:
+        resp = await self._client.get(self._url, timeout=2.0)
+        if resp.status_code == 200 and resp.content:
+            return resp.content
+        return None
+
+
+class ExecutorFrameSource:
+    """Blocking capture whose reads run on the hub's executor."""
+
+    def __init__(self, capture: BlockingCapture, hub: CaptureHub, backend: str) -> None:
+        self.backend = backend
+        self._capture = capture
+        self._hub = hub
+        # A cancelled read keeps running in its thread: release waits for it.
+        self._lock = threading.Lock()
+
+    async def read_frame(self) -> object | None:
+        return await self._hub.run_blocking(self._read)
+
+    async def close(self) -> None:
+        await self._hub.run_blocking(self._release)
+
+    def _read(self) -> object | None:
+        with self._lock:
+            return self._capture.read_frame()
+
+    def _release(self) -> None:
+        with self._lock:
+            self._capture.release()
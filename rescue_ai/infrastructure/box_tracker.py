@@ -0,0 +1,244 @@
+"""Keyframe detection with optical-flow box propagation in between.
+
+Full detection runs on every ``keyframe_interval``-th frame. On the
+frames in between each tracked person box is shifted by the median
+Lucas-Kanade optical flow of corner features inside it, smoothed by a
+constant-velocity alpha-beta filter (a steady-state Kalman filter).
+Scores decay on every propagated frame; a lost track or a decayed score
+below ``min_track_score`` forces an early keyframe. Keyframe detections
+join existing tracks by greedy IoU matching, so ``Detection.track_id``
+stays stable for the same person and alert logic can suppress duplicate
+alerts. Track IDs come from one process-wide counter: a tracker built
+for a restarted stream never reuses an ID the mission already alerted on.
+"""
+
+from __future__ import annotations
+
+import itertools
+from collections.abc import Sequence
+from dataclasses import dataclass, replace
+from typing import Any
+
+from rescue_ai.application.detector_parity import box_iou
+from rescue_ai.application.inference_config import TrackerConfig
+from rescue_ai.domain.entities import Detection
+from rescue_ai.infrastructure.frame_decode import jpeg_dimensions, reduced_decode_factor
+
+PATH_TRACKED = "tracked"
+_MIN_FLOW_POINTS = 3
+_MAX_CORNERS = 24
+_VELOCITY_GAIN = 0.6
+# Shared by every tracker; ``next()`` on it is atomic under the GIL.
+_TRACK_IDS = itertools.count(1)
+
+
+@dataclass
+class _Track:
+    track_id: int
+    detection: Detection
+    velocity: tuple[float, float] = (0.0, 0.0)
+    missed: int = 0
+
+
+@dataclass(frozen=True)
+class _GrayFrame:
+    image: Any
+    scale: float
+
+
+class KeyframeTracker:
+    """Per-stream tracker that stands in for the detector between keyframes."""
+
+    def __init__(self, config: TrackerConfig) -> None:
+        self._config = config
+        self._tracks: list[_Track] = []
+        self._previous: _GrayFrame | None = None
+        self._since_keyframe = 0
+
+    def propagate(self, frame: object) -> list[Detection] | None:
+        """Return the tracked boxes moved onto *frame*, or ``None``.
+
+        ``None`` means the frame needs a full detection: a keyframe is
+        due, a track was lost or a score decayed below the floor. The
+        caller then runs the detector and passes the result to
+        ``update()``.
+        """
+        previous = self._previous
+        if (
+            previous is None
+            or self._since_keyframe + 1 >= self._config.keyframe_interval
+        ):
+            return None
+        current = _gray_frame(frame, self._config.flow_size)
+        if current is None or current.image.shape != previous.image.shape:
+            return None
+        moved: list[tuple[_Track, Detection, tuple[float, float]]] = []
+        for track in self._tracks:
+            if track.missed:
+                continue
+            flow = _flow_shift(previous, current, track.detection.bbox)
+            if flow is None:
+                return None
+            velocity = _smooth(track.velocity, flow)
+            score = track.detection.score * self._config.score_decay
+            if score < self._config.min_track_score:
+                return None
+            detection = replace(
+                track.detection,
+                bbox=_shift_bbox(track.detection.bbox, velocity),
+                score=score,
+            )
+            moved.append((track, detection, velocity))
+        for track, detection, velocity in moved:
+            track.detection = detection
+            track.velocity = velocity
+        self._previous = current
+        self._since_keyframe += 1
+        return [detection for _track, detection, _velocity in moved]
+
+    def update(self, frame: object, detections: Sequence[Detection]) -> list[Detection]:
+        """Associate keyframe *detections* with tracks and attach track IDs."""
+        candidates = list(detections)
+        matches = _associate(
+            [track.detection.bbox for track in self._tracks],
+            [item.bbox for item in candidates],
+            iou_threshold=self._config.iou_match,
+        )
+        matched_tracks = set(matches.values())
+        tracks: list[_Track] = []
+        tracked: list[Detection] = []
+        for det_idx, detection in enumerate(candidates):
+            track_idx = matches.get(det_idx)
+            if track_idx is None:
+                track = _Track(track_id=next(_TRACK_IDS), detection=detection)
+            else:
+                track = self._tracks[track_idx]
+                track.missed = 0
+            track.detection = replace(detection, track_id=track.track_id)
+            tracks.append(track)
+            tracked.append(track.detection)
+        for track_idx, track in enumerate(self._tracks):
+            if track_idx in matched_tracks:
+                continue
+            track.missed += 1
+            if track.missed <= self._config.max_missed_keyframes:
+                tracks.append(track)
+        self._tracks = tracks
+        self._previous = _gray_frame(frame, self._config.flow_size)
+        self._since_keyframe = 0
+        return tracked
+
+    def reset(self) -> None:
+        """Drop all tracks; the next frame becomes a keyframe."""
+        self._tracks = []
+        self._previous = None
+        self._since_keyframe = 0
+
+
+def _gray_frame(frame: object, flow_size: int) -> _GrayFrame | None:
+    import cv2
+    import numpy as np
+
+    if isinstance(frame, bytes):
+        dimensions = jpeg_dimensions(frame)
+        factor = reduced_decode_factor(*dimensions, flow_size) if dimensions else 1
+        flag = getattr(cv2, f"IMREAD_REDUCED_GRAYSCALE_{factor}", cv2.IMREAD_GRAYSCALE)
+        image = cv2.imdecode(np.frombuffer(frame, dtype=np.uint8), flag)
+        if image is None or dimensions is None:
+            return None
+        return _GrayFrame(image=image, scale=dimensions[0] / image.shape[1])
+    if not isinstance(frame, np.ndarray) or frame.size == 0:
+        return None
+    image = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY) if frame.ndim == 3 else frame
+    long_side = max(image.shape[:2])
+    if long_side <= flow_size:
+        return _GrayFrame(image=image, scale=1.0)
+    ratio = flow_size / long_side
+    resized = cv2.resize(image, None, fx=ratio, fy=ratio, interpolation=cv2.INTER_AREA)
+    return _GrayFrame(image=resized, scale=image.shape[1] / resized.shape[1])
+
+
+def _flow_shift(
+    previous: _GrayFrame,
+    current: _GrayFrame,
+    bbox: tuple[float, float, float, float],
+) -> tuple[float, float] | None:
+    """Median optical-flow displacement of the box content, in source pixels."""
+    import cv2
+    import numpy as np
+
+    points = _box_features(previous, bbox)
+    if points is None:
+        return None
+    moved, status, _error = cv2.calcOpticalFlowPyrLK(
+        previous.image, current.image, points, points.copy()
+    )
+    found = status.reshape(-1) == 1
+    if int(found.sum()) < _MIN_FLOW_POINTS:
+        return None
+    delta = np.median((moved - points).reshape(-1, 2)[found], axis=0)
+    return float(delta[0]) * previous.scale, float(delta[1]) * previous.scale
+
+
+def _box_features(
+    frame: _GrayFrame, bbox: tuple[float, float, float, float]
+) -> Any | None:
+    """Corner features inside *bbox* worth following with optical flow."""
+    import cv2
+    import numpy as np
+
+    height, width = frame.image.shape[:2]
+    x1, y1, x2, y2 = (int(round(value / frame.scale)) for value in bbox)
+    x1, x2 = max(0, x1), min(width, x2)
+    y1, y2 = max(0, y1), min(height, y2)
+    if x2 - x1 < 2 or y2 - y1 < 2:
+        return None
+    mask = np.zeros_like(frame.image)
+    mask[y1:y2, x1:x2] = 255
+    points = cv2.goodFeaturesToTrack(frame.image, _MAX_CORNERS, 0.01, 2, mask=mask)
+    if points is None or len(points) < _MIN_FLOW_POINTS:
+        return None
+    return points
+
+
+def _smooth(
+    velocity: tuple[float, float], flow: tuple[float, float]
+) -> tuple[float, float]:
+    return (
+        velocity[0] + _VELOCITY_GAIN * (flow[0] - velocity[0]),
+        velocity[1] + _VELOCITY_GAIN * (flow[1] - velocity[1]),
+    )
+
+
+def _shift_bbox(
+    bbox: tuple[float, float, float, float], shift: tuple[float, float]
+) -> tuple[float, float, float, float]:
+    dx, dy = shift
+    return bbox[0] + dx, bbox[1] + dy, bbox[2] + dx, bbox[3] + dy
+
+
+def _associate(
+    track_boxes: list[tuple[float, float, float, float]],
+    detection_boxes: list[tuple[float, float, float, float]],
+    *,
+    iou_threshold: float,
+) -> dict[int, int]:
+    """Greedy highest-IoU-first matching; returns ``{detection: track}``."""
+    pairs = sorted(
+        (
+            (box_iou(track_box, det_box), track_idx, det_idx)
+            for track_idx, track_box in enumerate(track_boxes)
+            for det_idx, det_box in enumerate(detection_boxes)
+        ),
+        reverse=True,
+    )
+    matches: dict[int, int] = {}
+    used_tracks: set[int] = set()
+    for iou, track_idx, det_idx in pairs:
+        if iou < iou_threshold:
+            break
+        if track_idx in used_tracks or det_idx in matches:
+            continue
+        matches[det_idx] = track_idx
+        used_tracks.add(track_idx)
+    return matches
@@ -0,0 +1,142 @@
+"""Two-pass cascade detector: low-resolution screen, full-resolution on doubt.
+
+Most mission frames contain nobody, so a small ``imgsz`` pass is enough
+to clear them. Only frames where the first pass sees an uncertain person
+candidate — or every N-th frame as a safety net — pay for the
+full-resolution forward pass.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Sequence
+
+from rescue_ai.application.batch_inference import close_detector, detect_in_batches
+from rescue_ai.application.detector_warmup import detector_warmup_inference
+from rescue_ai.application.inference_config import CascadeConfig
+from rescue_ai.application.inference_timing import detector_stage_timings
+from rescue_ai.domain.alert_policy import select_detections
+from rescue_ai.domain.entities import Detection
+from rescue_ai.domain.ports import DetectorPort
+from rescue_ai.infrastructure.detection_batch import DetectionBatch
+
+PATH_FIRST = "cascade_first"
+PATH_FULL = "cascade_full"
+PATH_SAFETY = "cascade_safety"
+
+
+class CascadeDetector:
+    """DetectorPort that escalates uncertain frames to a full-resolution pass."""
+
+    def __init__(
+        self,
+        *,
+        first_pass: DetectorPort,
+        full_pass: DetectorPort,
+        config: CascadeConfig,
+        confidence_threshold: float,
+    ) -> None:
+        self._first_pass = first_pass
+        self._full_pass = full_pass
+        self._config = config
+        self._confidence_threshold = confidence_threshold
+        self._lock = threading.Lock()
+        self._frames_seen = 0
+        self._path_counts = {PATH_FIRST: 0, PATH_FULL: 0, PATH_SAFETY: 0}
+
+    def detect(self, image_uri: object) -> Sequence[Detection]:
+        """Run the cascade on a single frame and return detections."""
+        return self.detect_traced(image_uri)[0]
+
+    def detect_traced(self, image_uri: object) -> tuple[Sequence[Detection], str]:
+        """Return detections together with the cascade path that produced them."""
+        return self.detect_batch_traced([image_uri])[0]
+
+    def detect_batch(self, image_uris: Sequence[object]) -> list[Sequence[Detection]]:
+        """Run the cascade on several frames, batching each pass."""
+        return [
+            detections for detections, _path in self.detect_batch_traced(image_uris)
+        ]
+
+    def detect_batch_traced(
+        self, image_uris: Sequence[object]
+    ) -> list[tuple[Sequence[Detection], str]]:
+        """Batched cascade; returns ``(detections, path)`` per input frame."""
+        safety = [self._next_frame_is_safety() for _ in image_uris]
+        screen_idx = [idx for idx, forced in enumerate(safety) if not forced]
+        screened = detect_in_batches(
+            self._first_pass, [image_uris[idx] for idx in screen_idx]
+        )
+
+        outputs: list[tuple[Sequence[Detection], str] | None] = [None] * len(image_uris)
+        escalate: list[int] = [idx for idx, forced in enumerate(safety) if forced]
+        for idx, candidates in zip(screen_idx, screened):
+            if self._is_uncertain(candidates):
+                escalate.append(idx)
+            else:
+                outputs[idx] = (self._confident(candidates), PATH_FIRST)
+
+        escalate.sort()
+        full = detect_in_batches(self._full_pass, [image_uris[i] for i in escalate])
+        for idx, detections in zip(escalate, full):
+            outputs[idx] = (detections, PATH_SAFETY if safety[idx] else PATH_FULL)
+
+        results = [item for item in outputs if item is not None]
+        with self._lock:
+            for _detections, path in results:
+                self._path_counts[path] += 1
+        return results
+
+    def warmup(self) -> None:
+        self._first_pass.warmup()
+        self._full_pass.warmup()
+
+    def warmup_inference(self) -> None:
+        """Run the dummy forward pass of both detectors."""
+        detector_warmup_inference(self._first_pass)
+        detector_warmup_inference(self._full_pass)
+
+    def runtime_name(self) -> str:
+        """Return human-readable runtime name."""
+        return f"cascade({self._full_pass.runtime_name()})"
+
+    def path_counts(self) -> dict[str, int]:
+        """Return how many frames each cascade path has handled so far."""
+        with self._lock:
+            return dict(self._path_counts)
+
+    def stage_timings(self) -> dict[str, dict[str, object]]:
+        """Return stage timings of both passes, keyed ``<pass>.<stage>``."""
+        merged: dict[str, dict[str, object]] = {}
+        for prefix, detector in (
+            ("first_pass", self._first_pass),
+            ("full_pass", self._full_pass),
+        ):
+            for stage, summary in (detector_stage_timings(detector) or {}).items():
+                merged[f"{prefix}.{stage}"] = summary
+        return merged
+
+    def close(self) -> None:
+        """Close both passes."""
+        close_detector(self._first_pass)
+        close_detector(self._full_pass)
+
+    def _next_frame_is_safety(self) -> bool:
+        interval = self._config.safety_interval_frames
+        with self._lock:
+            self._frames_seen += 1
+            return interval > 0 and self._frames_seen % interval == 0
+
+    def _is_uncertain(self, candidates: Sequence[Detection]) -> bool:
+        scores = (
+            candidates.scores.tolist()
+            if isinstance(candidates, DetectionBatch)
+            else [item.score for item in candidates]
+        )
+        return any(
+            self._config.uncertain_low <= score < self._config.uncertain_high
+            for score in scores
+        )
+
+    def _confident(self, candidates: Sequence[Detection]) -> Sequence[Detection]:
+        return select_detections(candidates, min_score=self._confidence_threshold)
@@ -8,7 +8,19 @@ from pathlib import Path
 
 import yaml
 
-from rescue_ai.application.inference_config import InferenceConfig
+from rescue_ai.application.inference_config import (
+    AdaptiveImgszConfig,
+    CascadeConfig,
+    InferenceConfig,
+    MotionGateConfig,
+    PipelineConfig,
+    PrefilterConfig,
+    ResultCacheConfig,
+    RoiConfig,
+    SchedulerConfig,
+    TrackerConfig,
+    WorkerPoolConfig,
+)
 from rescue_ai.domain.ports import ReportMetadataPayload
 from rescue_ai.domain.value_objects import AlertRuleConfig
 
@@ -19,6 +31,9 @@ DEFAULT_MODEL_URL = (
     "yolov8n_baseline_multiscale/v1/"
     "yolov8n_baseline_multiscale.pt"
 )
+SUPPORTED_RUNTIMES = ("torch", "onnx")
+SUPPORTED_PRECISIONS = ("fp32", "int8")
+DEFAULT_MAX_RECALL_DROP = 0.02
 
 
 def _require_mapping(payload: object) -> dict[str, object]:
@@ -68,6 +83,20 @@ def _build_inference_config(
     if not isinstance(infer, dict):
         infer = {}
     model_sha256_raw = payload.get("model_sha256")
+    runtime = str(payload.get("runtime", "torch")).strip().lower()
+    if runtime not in SUPPORTED_RUNTIMES:
+        raise ValueError(
+            f"Unsupported inference runtime {runtime!r}, "
+            f"expected one of {SUPPORTED_RUNTIMES}"
+        )
+    precision = str(payload.get("precision", "fp32")).strip().lower()
+    if precision not in SUPPORTED_PRECISIONS:
+        raise ValueError(
+            f"Unsupported model precision {precision!r}, "
+            f"expected one of {SUPPORTED_PRECISIONS}"
+        )
+    if precision == "int8" and runtime != "onnx":
+        raise ValueError("precision int8 requires runtime onnx")
     return InferenceConfig(
         model_url=str(payload.get("model_url", DEFAULT_MODEL_URL)),
         device=str(payload.get("device", "cpu")),
@@ -78,9 +107,218 @@ def _build_inference_config(
         model_sha256=(
             str(model_sha256_raw).strip().lower() if model_sha256_raw else None
         ),
+        batch_size=max(1, int(infer.get("batch_size", 1))),
+        runtime=runtime,
+        precision=precision,
+        cascade=_build_cascade_config(infer),
+        reduced_decode=bool(infer.get("reduced_decode", False)),
+        result_cache=_build_result_cache_config(infer),
+        worker_pool=_build_worker_pool_config(infer),
+        motion_gate=_build_motion_gate_config(infer),
+        tracker=_build_tracker_config(infer),
+        roi=_build_roi_config(infer),
+        adaptive_imgsz=_build_adaptive_imgsz_config(infer),
+        scheduler=_build_scheduler_config(infer),
+        prefilter=_build_prefilter_config(infer),
+        pipeline=_build_pipeline_config(infer),
+    )
+
+
+def _build_cascade_config(infer: dict[str, object]) -> CascadeConfig | None:
+    cascade = infer.get("cascade", {})
+    if not isinstance(cascade, dict) or not cascade.get("enabled", False):
+        return None
+    config = CascadeConfig(
+        first_pass_imgsz=int(cascade.get("first_pass_imgsz", 480)),
+        uncertain_low=float(cascade.get("uncertain_low", 0.05)),
+        uncertain_high=float(cascade.get("uncertain_high", 0.5)),
+        safety_interval_frames=max(0, int(cascade.get("safety_interval_frames", 30))),
+    )
+    if not 0.0 <= config.uncertain_low <= config.uncertain_high <= 1.0:
+        raise ValueError("cascade requires 0 <= uncertain_low <= uncertain_high <= 1")
+    return config
+
+
+def _build_result_cache_config(infer: dict[str, object]) -> ResultCacheConfig | None:
+    result_cache = infer.get("result_cache", {})
+    if not isinstance(result_cache, dict) or not result_cache.get("enabled", False):
+        return None
+    defaults = ResultCacheConfig()
+    return ResultCacheConfig(
+        memory_entries=max(
+            0, int(result_cache.get("memory_entries", defaults.memory_entries))
+        ),
+        disk_dir=str(result_cache.get("disk_dir", defaults.disk_dir)),
+        disk_max_mb=int(result_cache.get("disk_max_mb", defaults.disk_max_mb)),
+    )
+
+
+def _build_worker_pool_config(infer: dict[str, object]) -> WorkerPoolConfig | None:
+    worker_pool = infer.get("worker_pool", {})
+    if not isinstance(worker_pool, dict) or not worker_pool.get("enabled", False):
+        return None
+    defaults = WorkerPoolConfig()
+    return WorkerPoolConfig(
+        workers=max(1, int(worker_pool.get("workers", defaults.workers))),
+        threads_per_worker=max(
+            1,
+            int(worker_pool.get("threads_per_worker", defaults.threads_per_worker)),
+        ),
+    )
+
+
+def _build_motion_gate_config(infer: dict[str, object]) -> MotionGateConfig | None:
+    motion_gate = infer.get("motion_gate", {})
+    if not isinstance(motion_gate, dict) or not motion_gate.get("enabled", False):
+        return None
+    defaults = MotionGateConfig()
+    config = MotionGateConfig(
+        thumbnail_size=max(
+            8, int(motion_gate.get("thumbnail_size", defaults.thumbnail_size))
+        ),
+        diff_threshold=float(
+            motion_gate.get("diff_threshold", defaults.diff_threshold)
+        ),
+        max_consecutive_skips=max(
+            0,
+            int(
+                motion_gate.get("max_consecutive_skips", defaults.max_consecutive_skips)
+            ),
+        ),
+    )
+    if not 0.0 <= config.diff_threshold <= 1.0:
+        raise ValueError("motion_gate requires 0 <= diff_threshold <= 1")
+    return config
+
+
+def _build_tracker_config(infer: dict[str, object]) -> TrackerConfig | None:
+    tracker = infer.get("tracker", {})
+    if not isinstance(tracker, dict) or not tracker.get("enabled", False):
+        return None
+    defaults = TrackerConfig()
+    config = TrackerConfig(
+        keyframe_interval=max(
+            1, int(tracker.get("keyframe_interval", defaults.keyframe_interval))
+        ),
+        score_decay=float(tracker.get("score_decay", defaults.score_decay)),
+        min_track_score=float(tracker.get("min_track_score", defaults.min_track_score)),
+        iou_match=float(tracker.get("iou_match", defaults.iou_match)),
+        max_missed_keyframes=max(
+            0,
+            int(tracker.get("max_missed_keyframes", defaults.max_missed_keyframes)),
+        ),
+        flow_size=max(64, int(tracker.get("flow_size", defaults.flow_size))),
+    )
+    if not 0.0 < config.score_decay <= 1.0:
+        raise ValueError("tracker requires 0 < score_decay <= 1")
+    return config
+
+
+def _build_roi_config(infer: dict[str, object]) -> RoiConfig | None:
+    roi = infer.get("roi", {})
+    if not isinstance(roi, dict) or not roi.get("enabled", False):
+        return None
+    defaults = RoiConfig()
+    return RoiConfig(
+        crop_size=max(32, int(roi.get("crop_size", defaults.crop_size))),
+        padding=max(0.0, float(roi.get("padding", defaults.padding))),
+        full_frame_interval=max(
+            1, int(roi.get("full_frame_interval", defaults.full_frame_interval))
+        ),
+        max_regions=max(1, int(roi.get("max_regions", defaults.max_regions))),
     )
 
 
+def _build_adaptive_imgsz_config(
+    infer: dict[str, object],
+) -> AdaptiveImgszConfig | None:
+    adaptive = infer.get("adaptive_imgsz", {})
+    if not isinstance(adaptive, dict) or not adaptive.get("enabled", False):
+        return None
+    defaults = AdaptiveImgszConfig()
+    config = AdaptiveImgszConfig(
+        min_imgsz=int(adaptive.get("min_imgsz", defaults.min_imgsz)),
+        max_imgsz=int(adaptive.get("max_imgsz", defaults.max_imgsz)),
+        step=max(32, int(adaptive.get("step", defaults.step))),
+        high_load=float(adaptive.get("high_load", defaults.high_load)),
+        low_load=float(adaptive.get("low_load", defaults.low_load)),
+        patience=max(1, int(adaptive.get("patience", defaults.patience))),
+        smoothing=float(adaptive.get("smoothing", defaults.smoothing)),
+    )
+    if not 32 <= config.min_imgsz <= config.max_imgsz:
+        raise ValueError("adaptive_imgsz requires 32 <= min_imgsz <= max_imgsz")
+    if not 0.0 < config.low_load < config.high_load:
+        raise ValueError("adaptive_imgsz requires 0 < low_load < high_load")
+    if not 0.0 < config.smoothing <= 1.0:
+        raise ValueError("adaptive_imgsz requires 0 < smoothing <= 1")
+    return config
+
+
+def _build_scheduler_config(infer: dict[str, object]) -> SchedulerConfig | None:
+    scheduler = infer.get("scheduler", {})
+    if not isinstance(scheduler, dict) or not scheduler.get("enabled", False):
+        return None
+    defaults = SchedulerConfig()
+    return SchedulerConfig(
+        workers=max(1, int(scheduler.get("workers", defaults.workers))),
+        stream_queue_size=max(
+            1, int(scheduler.get("stream_queue_size", defaults.stream_queue_size))
+        ),
+        predict_queue_size=max(
+            1, int(scheduler.get("predict_queue_size", defaults.predict_queue_size))
+        ),
+        stream_deadline_ms=max(
+            1, int(scheduler.get("stream_deadline_ms", defaults.stream_deadline_ms))
+        ),
+        predict_timeout_sec=max(
+            0.1,
+            float(scheduler.get("predict_timeout_sec", defaults.predict_timeout_sec)),
+        ),
+    )
+
+
+def _build_prefilter_config(infer: dict[str, object]) -> PrefilterConfig | None:
+    prefilter = infer.get("prefilter", {})
+    if not isinstance(prefilter, dict) or not prefilter.get("enabled", False):
+        return None
+    defaults = PrefilterConfig()
+    config = PrefilterConfig(
+        score_floor=float(prefilter.get("score_floor", defaults.score_floor)),
+        histogram_bins=max(
+            1, int(prefilter.get("histogram_bins", defaults.histogram_bins))
+        ),
+    )
+    if not 0.0 <= config.score_floor < 1.0:
+        raise ValueError("prefilter requires 0 <= score_floor < 1")
+    return config
+
+
+def _build_pipeline_config(infer: dict[str, object]) -> PipelineConfig | None:
+    pipeline = infer.get("pipeline", {})
+    if not isinstance(pipeline, dict) or not pipeline.get("enabled", False):
+        return None
+    defaults = PipelineConfig()
+    return PipelineConfig(
+        frame_queue_size=max(
+            1, int(pipeline.get("frame_queue_size", defaults.frame_queue_size))
+        ),
+        ingest_queue_size=max(
+            1, int(pipeline.get("ingest_queue_size", defaults.ingest_queue_size))
+        ),
+        workers=max(1, int(pipeline.get("workers", defaults.workers))),
+        capture_threads=max(
+            1, int(pipeline.get("capture_threads", defaults.capture_threads))
+        ),
+    )
+
+
+def _resolve_max_recall_drop(payload: dict[str, object]) -> float:
+    eval_cfg = payload.get("eval", {})
+    if not isinstance(eval_cfg, dict):
+        return DEFAULT_MAX_RECALL_DROP
+    return float(eval_cfg.get("max_recall_drop", DEFAULT_MAX_RECALL_DROP))
+
+
 @dataclass(frozen=True)
 class StreamContract:
     """Resolved runtime contract (infrastructure-level, not a domain entity)."""
@@ -93,6 +331,7 @@ class StreamContract:
     config_hash: str
     config_path: str
     service_version: str
+    max_recall_drop: float = DEFAULT_MAX_RECALL_DROP
 
 
 def load_stream_contract(service_version: str = "dev") -> StreamContract:
@@ -118,6 +357,7 @@ def load_stream_contract(service_version: str = "dev") -> StreamContract:
         config_hash=config_hash,
         config_path=contract_path.as_posix(),
         service_version=service_version,
+        max_recall_drop=_resolve_max_recall_drop(payload),
     )
 
 
@@ -0,0 +1,115 @@
+"""Array-backed detector output with lazy ``Detection`` materialization.
+
+Detector adapters keep boxes and scores as numpy arrays and filter them
+with vectorized masks. ``Detection`` dataclasses are only built for the
+boxes a caller actually reads, typically the alert positives that reach
+``evaluate_alert`` and persistence.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Sequence
+from typing import Any, overload
+
+from rescue_ai.domain.entities import Detection
+
+
+class DetectionBatch(Sequence[Detection]):
+    """Immutable ``Sequence[Detection]`` over ``(N, 4)`` boxes and ``(N,)`` scores."""
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __init__(
+        self,
+        boxes: Any,
+        scores: Any,
+        *,
+        model_name: str,
+        label: str = "person",
+    ) -> None:
+        import numpy as np
+
+        self.boxes = np.asarray(boxes, dtype=np.float64).reshape(-1, 4)
+        self.scores = np.asarray(scores, dtype=np.float64).reshape(-1)
+        if len(self.boxes) != len(self.scores):
+            raise ValueError(
+                f"DetectionBatch got {len(self.boxes)} boxes "
+                f"and {len(self.scores)} scores"
+            )
+        self.model_name = model_name
+        self.label = label
+        self._materialized: dict[int, Detection] = {}
+
+    def select(self, *, min_score: float, label: str | None = None) -> DetectionBatch:
+        """Return the boxes with ``score >= min_score`` (and matching *label*)."""
+        if label is not None and label != self.label:
+            return DetectionBatch(
+                self.boxes[:0], self.scores[:0], model_name=self.model_name
+            )
+        keep = self.scores >= min_score
+        return DetectionBatch(
+            self.boxes[keep],
+            self.scores[keep],
+            model_name=self.model_name,
+            label=self.label,
+        )
+
+    def rescaled(self, scale_x: float, scale_y: float) -> DetectionBatch:
+        """Return a copy with x/y box coordinates multiplied by the factors."""
+        if scale_x == 1.0 and scale_y == 1.0:
+            return self
+        factors = (scale_x, scale_y, scale_x, scale_y)
+        return DetectionBatch(
+            self.boxes * factors,
+            self.scores,
+            model_name=self.model_name,
+            label=self.label,
+        )
+
+    def max_score(self) -> float:
+        """Return the highest score, ``0.0`` for an empty batch."""
+        return float(self.scores.max()) if len(self.scores) else 0.0
+
+    def __len__(self) -> int:
+        return len(self.scores)
+
+    @overload
+    def __getitem__(self, index: int) -> Detection: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> DetectionBatch: ...
+
+    def __getitem__(self, index: int | slice) -> Detection | DetectionBatch:
+        if isinstance(index, slice):
+            return DetectionBatch(
+                self.boxes[index],
+                self.scores[index],
+                model_name=self.model_name,
+                label=self.label,
+            )
+        position = range(len(self))[index]
+        detection = self._materialized.get(position)
+        if detection is None:
+            box = self.boxes[position]
+            detection = Detection(
+                bbox=(float(box[0]), float(box[1]), float(box[2]), float(box[3])),
+                score=float(self.scores[position]),
+                label=self.label,
+                model_name=self.model_name,
+            )
+            self._materialized[position] = detection
+        return detection
+
+    def __iter__(self) -> Iterator[Detection]:
+        return (self[idx] for idx in range(len(self)))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Sequence) or isinstance(other, (str, bytes)):
+            return NotImplemented
+        return list(self) == list(other)
+
+    def __repr__(self) -> str:
+        return (
+            f"DetectionBatch(n={len(self)}, label={self.label!r}, "
+            f"model_name={self.model_name!r})"
+        )
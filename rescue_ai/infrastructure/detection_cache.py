@@ -0,0 +1,392 @@
+"""Content-addressed cache of detector results.
+
+Frames are keyed by the hash of their bytes together with a fingerprint
+of everything that changes the detector output (sha256 of the model
+file the runtime loads, runtime, precision, ``imgsz``, NMS and confidence
+settings). The same S3 frame scored by ``/predict``, the online loop and
+every ``evaluate_model`` rerun is therefore run through the network only
+once. A model file rebuilt in place (``export_onnx``, ``quantize``) gets
+a new digest and therefore a fresh key space.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any
+
+from rescue_ai.application.batch_inference import (
+    close_detector,
+    detect_in_batches,
+    detect_traced,
+    detect_traced_at,
+)
+from rescue_ai.application.detector_warmup import detector_warmup_inference
+from rescue_ai.application.inference_config import InferenceConfig
+from rescue_ai.application.inference_timing import (
+    detector_score_histogram,
+    detector_stage_timings,
+)
+from rescue_ai.domain.entities import Detection
+from rescue_ai.domain.ports import DetectorPort
+from rescue_ai.infrastructure.model_cache import (
+    MODEL_CACHE_DIR,
+    fetch_model,
+    file_sha256,
+)
+
+PATH_CACHE = "cache"
+_DISK_EVICT_RATIO = 0.9
+logger = logging.getLogger(__name__)
+
+
+def model_file_sha256(config: InferenceConfig) -> str:
+    """Return the sha256 of the model file the contract's runtime loads.
+
+    Raises ``RuntimeError`` or ``OSError`` when the file cannot be
+    resolved, e.g. an ONNX export that has not been produced yet.
+    """
+    if config.runtime == "onnx":
+        from rescue_ai.infrastructure.onnx_detector import resolve_onnx_model_path
+
+        return file_sha256(resolve_onnx_model_path(config))
+    return file_sha256(
+        fetch_model(
+            config.model_url,
+            cache_dir=MODEL_CACHE_DIR,
+            expected_sha256=config.model_sha256,
+        )
+    )
+
+
+def model_fingerprint(config: InferenceConfig, *, model_sha256: str) -> str:
+    """Return a digest of every inference setting that affects detections.
+
+    *model_sha256* is the digest of the loaded model file (see
+    ``model_file_sha256``), never the URL: the same path may hold a
+    rebuilt artifact.
+    """
+    payload = {
+        "model": model_sha256,
+        "runtime": config.runtime,
+        "precision": config.precision,
+        "imgsz": config.imgsz,
+        "nms_iou": config.nms_iou,
+        "max_det": config.max_det,
+        "conf": config.confidence_threshold,
+        "cascade": asdict(config.cascade) if config.cascade is not None else None,
+        "reduced_decode": config.reduced_decode,
+        "prefilter": (
+            asdict(config.prefilter) if config.prefilter is not None else None
+        ),
+    }
+    encoded = json.dumps(payload, sort_keys=True).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def frame_digest(image_source: object) -> str | None:
+    """Return the content hash of a frame, or ``None`` if it is not hashable.
+
+    Local paths are hashed by file content, so a frame re-downloaded to a
+    fresh temp directory still hits the cache.
+    """
+    if isinstance(image_source, bytes):
+        return hashlib.sha256(image_source).hexdigest()
+    if isinstance(image_source, (str, Path)):
+        path = Path(image_source)
+        if not path.is_file():
+            return None
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    array: Any = image_source
+    shape = getattr(array, "shape", None)
+    if shape is None or not callable(getattr(array, "tobytes", None)):
+        return None
+    digest = hashlib.sha256(f"{shape}|{array.dtype}|".encode())
+    digest.update(array.tobytes())
+    return digest.hexdigest()
+
+
+class DetectionCache:
+    """Two-tier store: in-memory LRU backed by a size-bounded JSON directory."""
+
+    def __init__(
+        self,
+        *,
+        memory_entries: int,
+        disk_dir: Path | None,
+        disk_max_bytes: int,
+    ) -> None:
+        self._memory: OrderedDict[str, Sequence[Detection]] = OrderedDict()
+        self._memory_entries = memory_entries
+        self._disk_dir = disk_dir if disk_max_bytes > 0 else None
+        self._disk_max_bytes = disk_max_bytes
+        self._disk_bytes: int | None = None
+        self._lock = threading.Lock()
+        self._counters = {"memory_hits": 0, "disk_hits": 0, "misses": 0}
+
+    def get(self, key: str) -> Sequence[Detection] | None:
+        """Return cached detections for *key*, promoting disk hits to memory."""
+        with self._lock:
+            cached = self._memory.get(key)
+            if cached is not None:
+                self._memory.move_to_end(key)
+                self._counters["memory_hits"] += 1
+                return cached
+
+        cached = self._read_disk(key)
+        with self._lock:
+            if cached is None:
+                self._counters["misses"] += 1
+                return None
+            self._counters["disk_hits"] += 1
+            self._remember(key, cached)
+        return cached
+
+    def put(self, key: str, detections: Sequence[Detection]) -> None:
+        """Store *detections* (treated as immutable) in both tiers."""
+        with self._lock:
+            self._remember(key, detections)
+        self._write_disk(key, detections)
+
+    def stats(self) -> dict[str, int]:
+        """Return hit/miss counters and current tier sizes."""
+        with self._lock:
+            return {
+                **self._counters,
+                "memory_entries": len(self._memory),
+                "disk_bytes": self._disk_bytes or 0,
+            }
+
+    def _remember(self, key: str, detections: Sequence[Detection]) -> None:
+        if self._memory_entries <= 0:
+            return
+        self._memory[key] = detections
+        self._memory.move_to_end(key)
+        while len(self._memory) > self._memory_entries:
+            self._memory.popitem(last=False)
+
+    def _disk_path(self, key: str) -> Path | None:
+        if self._disk_dir is None:
+            return None
+        return self._disk_dir / key[:2] / f"{key}.json"
+
+    def _read_disk(self, key: str) -> list[Detection] | None:
+        path = self._disk_path(key)
+        if path is None:
+            return None
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(payload, list):
+            return None
+        try:
+            return [_detection_from_payload(item) for item in payload]
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def _write_disk(self, key: str, detections: Sequence[Detection]) -> None:
+        path = self._disk_path(key)
+        if path is None:
+            return
+        encoded = json.dumps([asdict(item) for item in detections]).encode("utf-8")
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            replaced = path.stat().st_size if path.exists() else 0
+            tmp_path.write_bytes(encoded)
+            os.replace(tmp_path, path)
+        except OSError as error:
+            logger.warning("Detection cache write failed: %s: %s", path, error)
+            return
+        with self._lock:
+            if self._disk_bytes is None:
+                self._disk_bytes = sum(size for _, size, _ in self._scan_disk())
+            else:
+                # An overwritten entry only changes the total by the difference.
+                self._disk_bytes += len(encoded) - replaced
+            over_budget = self._disk_bytes > self._disk_max_bytes
+        if over_budget:
+            self._evict_disk()
+
+    def _scan_disk(self) -> list[tuple[float, int, Path]]:
+        if self._disk_dir is None or not self._disk_dir.exists():
+            return []
+        entries: list[tuple[float, int, Path]] = []
+        for path in self._disk_dir.glob("*/*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def _evict_disk(self) -> None:
+        entries = sorted(self._scan_disk())
+        total = sum(size for _, size, _ in entries)
+        target = int(self._disk_max_bytes * _DISK_EVICT_RATIO)
+        removed = 0
+        for _mtime, size, path in entries:
+            if total <= target:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+        with self._lock:
+            self._disk_bytes = total
+        logger.info("Detection cache evicted %d entries, disk_bytes=%d", removed, total)
+
+
+class CachedDetector:
+    """DetectorPort wrapper that serves repeated frames from a ``DetectionCache``.
+
+    *fingerprint* is resolved on first use, so building the detector
+    stays lazy. If it fails (no model file to hash), the cache stays
+    disabled and every call goes to the wrapped detector.
+    """
+
+    def __init__(
+        self,
+        detector: DetectorPort,
+        *,
+        cache: DetectionCache,
+        fingerprint: Callable[[], str],
+    ) -> None:
+        self._detector = detector
+        self._cache = cache
+        self._resolve_fingerprint: Callable[[], str] | None = fingerprint
+        self._fingerprint: str | None = None
+        self._fingerprint_lock = threading.Lock()
+
+    def detect(self, image_uri: object) -> Sequence[Detection]:
+        """Return cached detections for the frame or run the wrapped detector."""
+        return self.detect_traced(image_uri)[0]
+
+    def detect_traced(self, image_uri: object) -> tuple[Sequence[Detection], str]:
+        """Like ``detect`` but also reports the inference path (``cache`` on hit)."""
+        key = self._key(image_uri)
+        if key is not None:
+            cached = self._cache.get(key)
+            if cached is not None:
+                return cached, PATH_CACHE
+        detections, path = detect_traced(self._detector, image_uri)
+        if key is not None:
+            self._cache.put(key, detections)
+        return detections, path
+
+    def detect_traced_at(
+        self, image_uri: object, imgsz: int
+    ) -> tuple[Sequence[Detection], str, int | None]:
+        """Like ``detect_traced`` at input size *imgsz*, cached per size."""
+        detector_any: Any = self._detector
+        if not callable(getattr(detector_any, "detect_traced_at", None)):
+            detections, path = self.detect_traced(image_uri)
+            return detections, path, None
+        key = self._key(image_uri, imgsz)
+        if key is not None:
+            cached = self._cache.get(key)
+            if cached is not None:
+                return cached, PATH_CACHE, imgsz
+        detections, path, used = detect_traced_at(self._detector, image_uri, imgsz)
+        # Only results at the requested size are cached, so hits report it.
+        if key is not None and used == imgsz:
+            self._cache.put(key, detections)
+        return detections, path, used
+
+    def detect_batch(self, image_uris: Sequence[object]) -> list[Sequence[Detection]]:
+        """Serve hits from the cache and batch only the missing frames."""
+        keys = [self._key(item) for item in image_uris]
+        outputs: list[Sequence[Detection] | None] = [
+            None if key is None else self._cache.get(key) for key in keys
+        ]
+        missing = [idx for idx, item in enumerate(outputs) if item is None]
+        computed = detect_in_batches(
+            self._detector, [image_uris[idx] for idx in missing]
+        )
+        for idx, detections in zip(missing, computed):
+            outputs[idx] = detections
+            key = keys[idx]
+            if key is not None:
+                self._cache.put(key, detections)
+        return [item if item is not None else [] for item in outputs]
+
+    def cache_stats(self) -> dict[str, int]:
+        """Return hit/miss counters of the underlying cache."""
+        return self._cache.stats()
+
+    def stage_timings(self) -> dict[str, dict[str, object]] | None:
+        """Return the wrapped detector's stage timings (cache hits are not timed)."""
+        return detector_stage_timings(self._detector)
+
+    def score_histogram(self) -> dict[str, object] | None:
+        """Return the wrapped detector's low-score histogram (cache hits excluded)."""
+        return detector_score_histogram(self._detector)
+
+    def warmup(self) -> None:
+        detector_any: Any = self._detector
+        warmup = getattr(detector_any, "warmup", None)
+        if callable(warmup):
+            warmup()
+
+    def warmup_inference(self) -> None:
+        """Run the wrapped detector's dummy forward pass (bypasses the cache)."""
+        detector_warmup_inference(self._detector)
+
+    def runtime_name(self) -> str:
+        """Return the wrapped detector's runtime name."""
+        detector_any: Any = self._detector
+        runtime_name = getattr(detector_any, "runtime_name", None)
+        return str(runtime_name()) if callable(runtime_name) else "unknown"
+
+    def close(self) -> None:
+        """Close the wrapped detector."""
+        close_detector(self._detector)
+
+    def _key(self, image_uri: object, imgsz: int | None = None) -> str | None:
+        fingerprint = self._model_key()
+        if fingerprint is None:
+            return None
+        digest = frame_digest(image_uri)
+        if digest is None:
+            return None
+        # The configured size is part of the fingerprint already.
+        suffix = "" if imgsz is None else f":{imgsz}"
+        return hashlib.sha256(f"{fingerprint}:{digest}{suffix}".encode()).hexdigest()
+
+    def _model_key(self) -> str | None:
+        with self._fingerprint_lock:
+            resolve = self._resolve_fingerprint
+            if resolve is None:
+                return self._fingerprint
+            self._resolve_fingerprint = None
+            try:
+                self._fingerprint = resolve()
+            except (OSError, RuntimeError) as error:
+                logger.warning(
+                    "Detection cache disabled: model file digest unavailable: %s",
+                    error,
+                )
+            return self._fingerprint
+
+
+def _detection_from_payload(item: Any) -> Detection:
+    x1, y1, x2, y2 = (float(value) for value in item["bbox"])
+    explanation = item.get("explanation")
+    return Detection(
+        bbox=(x1, y1, x2, y2),
+        score=float(item["score"]),
+        label=str(item["label"]),
+        model_name=str(item["model_name"]),
+        explanation=None if explanation is None else str(explanation),
+    )
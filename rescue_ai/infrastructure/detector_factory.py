@@ -0,0 +1,113 @@
+"""Build the detector adapter selected by the inference contract."""
+
+from __future__ import annotations
+
+from dataclasses import replace
+from pathlib import Path
+
+from rescue_ai.application.inference_config import InferenceConfig
+from rescue_ai.domain.ports import DetectorPort
+
+
+def build_detector(config: InferenceConfig) -> DetectorPort:
+    """Return a lazily-loaded detector for ``config.runtime``.
+
+    Adapters are imported on demand so that the API process never
+    imports torch when the contract selects the ONNX runtime. With
+    ``config.cascade`` set, two adapters of the same runtime are wrapped
+    in a ``CascadeDetector``; ``config.worker_pool`` moves that pipeline
+    into a ``ProcessPoolDetector``; with ``config.result_cache`` set, the
+    result is served through a content-hash ``CachedDetector`` keyed on
+    the sha256 of the model file the runtime loads.
+    ``config.roi`` adds a ``RoiDetector`` with a crop-sized runtime on top.
+    """
+    detector = _build_cached_detector(config)
+    roi = config.roi
+    if roi is None:
+        return detector
+
+    from rescue_ai.infrastructure.roi_detector import RoiDetector
+
+    crop_config = replace(
+        config,
+        imgsz=roi.crop_size,
+        cascade=None,
+        result_cache=None,
+        worker_pool=None,
+        roi=None,
+    )
+    return RoiDetector(
+        full_frame=detector,
+        crops=_build_runtime_detector(crop_config),
+        config=roi,
+    )
+
+
+def _build_cached_detector(config: InferenceConfig) -> DetectorPort:
+    detector = _build_pooled_detector(config)
+    result_cache = config.result_cache
+    if result_cache is None:
+        return detector
+
+    from rescue_ai.infrastructure.detection_cache import (
+        CachedDetector,
+        DetectionCache,
+        model_file_sha256,
+        model_fingerprint,
+    )
+
+    cache = DetectionCache(
+        memory_entries=result_cache.memory_entries,
+        disk_dir=Path(result_cache.disk_dir),
+        disk_max_bytes=result_cache.disk_max_mb * 1024 * 1024,
+    )
+
+    def fingerprint() -> str:
+        return model_fingerprint(config, model_sha256=model_file_sha256(config))
+
+    return CachedDetector(detector, cache=cache, fingerprint=fingerprint)
+
+
+def _build_pooled_detector(config: InferenceConfig) -> DetectorPort:
+    if config.worker_pool is None:
+        return _build_pipeline_detector(config)
+
+    from rescue_ai.infrastructure.detector_pool import ProcessPoolDetector
+
+    # Workers rebuild the pipeline from the pool-free config they receive.
+    return ProcessPoolDetector(config, pool=config.worker_pool, builder=build_detector)
+
+
+def _build_pipeline_detector(config: InferenceConfig) -> DetectorPort:
+    cascade = config.cascade
+    if cascade is None:
+        return _build_runtime_detector(config)
+
+    from rescue_ai.infrastructure.cascade_detector import CascadeDetector
+
+    full_config = replace(config, cascade=None, result_cache=None)
+    first_config = replace(
+        full_config,
+        imgsz=cascade.first_pass_imgsz,
+        confidence_threshold=min(cascade.uncertain_low, config.confidence_threshold),
+    )
+    return CascadeDetector(
+        first_pass=_build_runtime_detector(first_config),
+        full_pass=_build_runtime_detector(full_config),
+        config=cascade,
+        confidence_threshold=config.confidence_threshold,
+    )
+
+
+def _build_runtime_detector(config: InferenceConfig) -> DetectorPort:
+    if config.runtime == "torch":
+        from rescue_ai.infrastructure.yolo_detector import YoloDetector
+
+        return YoloDetector(config=config)
+    if config.runtime == "onnx":
+        from rescue_ai.infrastructure.onnx_detector import OnnxDetector
+
+        if config.precision == "int8":
+            return OnnxDetector(config=config, model_version="yolo8n-onnx-int8")
+        return OnnxDetector(config=config)
+    raise ValueError(f"Unsupported inference runtime: {config.runtime}")
@@ -0,0 +1,410 @@
+"""Multi-process detector pool with shared-memory frame transfer.
+
+Each worker process builds its own detector from the inference contract
+and keeps the model loaded. In-memory frames (JPEG bytes or decoded
+ndarrays) are copied into ``multiprocessing.shared_memory`` blocks and
+only their names cross the process boundary; file paths are sent as-is.
+Every worker talks to the parent over its own duplex pipe, so a crashing
+worker cannot leave a shared queue lock held. A worker that dies is
+restarted and its in-flight micro-batches are resubmitted once.
+"""
+
+from __future__ import annotations
+
+import itertools
+import logging
+import multiprocessing
+import os
+import threading
+from collections.abc import Callable, Sequence
+from concurrent.futures import Future
+from dataclasses import dataclass, field, replace
+from multiprocessing import shared_memory
+from multiprocessing.connection import wait
+from pathlib import Path
+from typing import Any
+
+from rescue_ai.application.batch_inference import detect_in_batches
+from rescue_ai.application.detector_warmup import detector_warmup_inference
+from rescue_ai.application.inference_config import InferenceConfig, WorkerPoolConfig
+from rescue_ai.application.inference_timing import detector_stage_timings
+from rescue_ai.domain.entities import Detection
+from rescue_ai.domain.ports import DetectorPort
+
+DetectorBuilder = Callable[[InferenceConfig], DetectorPort]
+TASK_DETECT = "detect"
+TASK_WARMUP = "warmup"
+TASK_WARMUP_INFERENCE = "warmup_inference"
+TASK_TIMINGS = "timings"
+_POLL_INTERVAL_SEC = 0.2
+_MAX_ATTEMPTS = 2
+_THREAD_ENV_VARS = ("OMP_NUM_THREADS", "MKL_NUM_THREADS", "OPENBLAS_NUM_THREADS")
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _Task:
+    task_id: int
+    kind: str
+    descriptors: list[tuple[object, ...]]
+    future: Future
+    blocks: list[shared_memory.SharedMemory] = field(default_factory=list)
+    attempts: int = 0
+
+
+@dataclass
+class _Worker:
+    index: int
+    process: Any
+    connection: Any
+    in_flight: dict[int, _Task] = field(default_factory=dict)
+
+
+class ProcessPoolDetector:
+    """DetectorPort that spreads micro-batches over N detector processes."""
+
+    def __init__(
+        self,
+        config: InferenceConfig,
+        *,
+        pool: WorkerPoolConfig,
+        builder: DetectorBuilder,
+    ) -> None:
+        self._config = replace(
+            config,
+            worker_pool=None,
+            result_cache=None,
+            roi=None,
+            intra_op_threads=pool.threads_per_worker,
+        )
+        self._pool = pool
+        self._builder = builder
+        self._context = multiprocessing.get_context("spawn")
+        self._workers: list[_Worker] = []
+        self._task_ids = itertools.count()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._collector: threading.Thread | None = None
+        self._restarts = 0
+
+    def detect(self, image_uri: object) -> Sequence[Detection]:
+        """Run detection on one frame in a worker process."""
+        return self.detect_traced(image_uri)[0]
+
+    def detect_traced(self, image_uri: object) -> tuple[Sequence[Detection], str]:
+        """Like ``detect`` but also returns the worker-side inference path."""
+        return self._submit(TASK_DETECT, [image_uri]).result()[0]
+
+    def detect_batch(self, image_uris: Sequence[object]) -> list[Sequence[Detection]]:
+        """Split frames into micro-batches and run them on all workers."""
+        batch_size = max(1, self._config.batch_size)
+        futures = []
+        for start in range(0, len(image_uris), batch_size):
+            stop = start + batch_size
+            futures.append(self._submit(TASK_DETECT, image_uris[start:stop]))
+        return [
+            detections for future in futures for detections, _path in future.result()
+        ]
+
+    def warmup(self) -> None:
+        """Load the model in every worker process."""
+        for future in self._broadcast(TASK_WARMUP):
+            future.result()
+
+    def warmup_inference(self) -> None:
+        """Run the dummy forward pass in every worker process."""
+        for future in self._broadcast(TASK_WARMUP_INFERENCE):
+            future.result()
+
+    def runtime_name(self) -> str:
+        """Return human-readable runtime name."""
+        return f"pool[{self._pool.workers}]({self._config.runtime})"
+
+    def stage_timings(self) -> dict[str, dict[str, object]]:
+        """Return stage timings of every worker, keyed ``worker<N>.<stage>``."""
+        merged: dict[str, dict[str, object]] = {}
+        for index, future in enumerate(self._broadcast(TASK_TIMINGS)):
+            for stage, summary in (future.result() or {}).items():
+                merged[f"worker{index}.{stage}"] = summary
+        return merged
+
+    def close(self) -> None:
+        """Stop worker processes and release shared memory."""
+        self._stop.set()
+        with self._lock:
+            workers, self._workers = self._workers, []
+        for worker in workers:
+            try:
+                worker.connection.send(None)
+            except OSError:
+                pass
+        for worker in workers:
+            worker.process.join(timeout=5.0)
+            if worker.process.is_alive():
+                worker.process.terminate()
+        if self._collector is not None:
+            self._collector.join(timeout=1.0)
+            self._collector = None
+        for worker in workers:
+            worker.connection.close()
+            for task in worker.in_flight.values():
+                _release(task)
+                _fail(task, "Detector pool closed")
+
+    # ── Dispatch ──────────────────────────────────────────────────
+
+    def _submit(self, kind: str, sources: Sequence[object]) -> Future:
+        self._ensure_started()
+        task = _Task(
+            task_id=next(self._task_ids),
+            kind=kind,
+            descriptors=[],
+            future=Future(),
+        )
+        try:
+            for source in sources:
+                task.descriptors.append(_describe(source, task.blocks))
+        except BaseException:
+            _release(task)
+            raise
+        with self._lock:
+            worker = min(self._workers, key=lambda item: len(item.in_flight))
+            self._dispatch(worker, task)
+        return task.future
+
+    def _broadcast(self, kind: str) -> list[Future]:
+        self._ensure_started()
+        futures: list[Future] = []
+        with self._lock:
+            for worker in self._workers:
+                task = _Task(
+                    task_id=next(self._task_ids),
+                    kind=kind,
+                    descriptors=[],
+                    future=Future(),
+                )
+                self._dispatch(worker, task)
+                futures.append(task.future)
+        return futures
+
+    def _dispatch(self, worker: _Worker, task: _Task) -> None:
+        worker.in_flight[task.task_id] = task
+        try:
+            worker.connection.send((task.task_id, task.kind, task.descriptors))
+        except OSError:
+            # The worker is gone; the supervisor resubmits its in-flight tasks.
+            return
+        task.attempts += 1
+
+    def _ensure_started(self) -> None:
+        with self._lock:
+            if self._workers:
+                return
+            if self._stop.is_set():
+                raise RuntimeError("Detector pool closed")
+            self._workers = [self._spawn(index) for index in range(self._pool.workers)]
+            self._collector = threading.Thread(
+                target=self._collect, name="detector-pool-collector", daemon=True
+            )
+            self._collector.start()
+        logger.info(
+            "Detector pool started: workers=%d threads_per_worker=%d runtime=%s",
+            self._pool.workers,
+            self._pool.threads_per_worker,
+            self._config.runtime,
+        )
+
+    def _spawn(self, index: int) -> _Worker:
+        connection, child_connection = self._context.Pipe()
+        process = self._context.Process(
+            target=_worker_main,
+            args=(
+                self._config,
+                self._pool.threads_per_worker,
+                self._builder,
+                child_connection,
+            ),
+            name=f"detector-worker-{index}",
+            daemon=True,
+        )
+        process.start()
+        child_connection.close()
+        return _Worker(index=index, process=process, connection=connection)
+
+    # ── Results and supervision ───────────────────────────────────
+
+    def _collect(self) -> None:
+        while not self._stop.is_set():
+            self._restart_dead_workers()
+            with self._lock:
+                workers = {worker.connection: worker for worker in self._workers}
+            ready: list[Any] = wait(list(workers), timeout=_POLL_INTERVAL_SEC)
+            for connection in ready:
+                try:
+                    task_id, ok, payload = connection.recv()
+                except (EOFError, OSError):
+                    # Closed pipe: let the process exit before the next check.
+                    workers[connection].process.join(timeout=_POLL_INTERVAL_SEC)
+                    continue
+                self._complete(task_id, ok, payload)
+
+    def _complete(self, task_id: int, ok: bool, payload: object) -> None:
+        with self._lock:
+            task = None
+            for worker in self._workers:
+                task = worker.in_flight.pop(task_id, None)
+                if task is not None:
+                    break
+        if task is None:
+            return
+        _release(task)
+        if ok:
+            _resolve(task, payload)
+        else:
+            _fail(task, f"Detector worker: {payload}")
+
+    def _restart_dead_workers(self) -> None:
+        with self._lock:
+            for position, worker in enumerate(self._workers):
+                if worker.process.is_alive() or self._stop.is_set():
+                    continue
+                self._restarts += 1
+                logger.warning(
+                    "Detector worker %d died (exitcode=%s), restarting; "
+                    "in_flight=%d restarts=%d",
+                    worker.index,
+                    worker.process.exitcode,
+                    len(worker.in_flight),
+                    self._restarts,
+                )
+                worker.connection.close()
+                replacement = self._spawn(worker.index)
+                self._workers[position] = replacement
+                for task in worker.in_flight.values():
+                    if task.attempts >= _MAX_ATTEMPTS:
+                        _release(task)
+                        _fail(task, "Detector worker crashed twice on a batch")
+                        continue
+                    self._dispatch(replacement, task)
+
+
+def _describe(
+    source: object, blocks: list[shared_memory.SharedMemory]
+) -> tuple[object, ...]:
+    if isinstance(source, Path):
+        return ("path", str(source))
+    if isinstance(source, str):
+        return ("path", source)
+    if isinstance(source, bytes):
+        block = shared_memory.SharedMemory(create=True, size=max(1, len(source)))
+        blocks.append(block)
+        block.buf[: len(source)] = source
+        return ("bytes", block.name, len(source))
+    array: Any = source
+    if hasattr(array, "shape") and hasattr(array, "dtype"):
+        import numpy as np
+
+        block = shared_memory.SharedMemory(create=True, size=max(1, array.nbytes))
+        blocks.append(block)
+        view = np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)
+        view[...] = array
+        return ("array", block.name, tuple(array.shape), str(array.dtype))
+    raise TypeError(f"Unsupported image source type: {type(source)!r}")
+
+
+def _resolve(task: _Task, payload: object) -> None:
+    if not task.future.done():
+        task.future.set_result(payload)
+
+
+def _fail(task: _Task, message: str) -> None:
+    if not task.future.done():
+        task.future.set_exception(RuntimeError(message))
+
+
+def _release(task: _Task) -> None:
+    for block in task.blocks:
+        try:
+            block.close()
+            block.unlink()
+        except FileNotFoundError:
+            continue
+    task.blocks.clear()
+
+
+# ── Worker process ────────────────────────────────────────────────
+
+
+def _worker_main(
+    config: InferenceConfig,
+    threads: int,
+    builder: DetectorBuilder,
+    connection: Any,
+) -> None:
+    _limit_threads(threads)
+    detector: DetectorPort | None = None
+    while True:
+        try:
+            item = connection.recv()
+        except EOFError:
+            return
+        if item is None:
+            return
+        task_id, kind, descriptors = item
+        try:
+            if detector is None:
+                detector = builder(config)
+            payload = _run_task(detector, kind, descriptors)
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            connection.send((task_id, False, f"{type(error).__name__}: {error}"))
+            continue
+        connection.send((task_id, True, payload))
+
+
+def _run_task(
+    detector: DetectorPort, kind: str, descriptors: list[tuple[object, ...]]
+) -> object:
+    if kind == TASK_WARMUP:
+        detector.warmup()
+        return None
+    if kind == TASK_WARMUP_INFERENCE:
+        return detector_warmup_inference(detector)
+    if kind == TASK_TIMINGS:
+        return detector_stage_timings(detector)
+    frames = [_read_frame(descriptor) for descriptor in descriptors]
+    detector_any: Any = detector
+    traced = getattr(detector_any, "detect_batch_traced", None)
+    if callable(traced):
+        return list(traced(frames))
+    return [(detections, "full") for detections in detect_in_batches(detector, frames)]
+
+
+def _read_frame(descriptor: tuple[object, ...]) -> object:
+    kind = descriptor[0]
+    if kind == "path":
+        return descriptor[1]
+    block = shared_memory.SharedMemory(name=str(descriptor[1]))
+    try:
+        if kind == "bytes":
+            size = int(str(descriptor[2]))
+            return bytes(block.buf[:size])
+        import numpy as np
+
+        shape: Any = descriptor[2]
+        view = np.ndarray(shape, dtype=np.dtype(str(descriptor[3])), buffer=block.buf)
+        frame = view.copy()
+        del view
+        return frame
+    finally:
+        block.close()
+
+
+def _limit_threads(threads: int) -> None:
+    for name in _THREAD_ENV_VARS:
+        os.environ[name] = str(threads)
+    try:
+        import cv2
+
+        cv2.setNumThreads(threads)
+    except ImportError:
+        pass
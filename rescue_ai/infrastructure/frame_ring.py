@@ -0,0 +1,50 @@
+"""Fixed-size in-memory buffer of recent stream frames.
+
+Frames stay in memory as captured, JPEG bytes from the HTTP stream or
+BGR arrays from RTSP, keyed by frame id. Nothing touches the disk per
+frame; ``jpeg`` encodes a frame only when it has to be stored, which in
+practice means only frames that raise an alert. The oldest frame is
+evicted once ``capacity`` frames are held.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+
+from rescue_ai.infrastructure.frame_decode import encode_jpeg
+
+
+class FrameRingBuffer:
+    """Thread-safe ring of the last ``capacity`` frames by frame id."""
+
+    def __init__(self, capacity: int) -> None:
+        if capacity < 1:
+            raise ValueError("FrameRingBuffer capacity must be >= 1")
+        self._capacity = capacity
+        self._frames: OrderedDict[int, object] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._frames)
+
+    def put(self, frame_id: int, frame: object) -> None:
+        """Keep *frame*, evicting the oldest frame when the ring is full."""
+        with self._lock:
+            self._frames[frame_id] = frame
+            self._frames.move_to_end(frame_id)
+            while len(self._frames) > self._capacity:
+                self._frames.popitem(last=False)
+
+    def get(self, frame_id: int) -> object | None:
+        """Return the frame as captured, or ``None`` if it was evicted."""
+        with self._lock:
+            return self._frames.get(frame_id)
+
+    def jpeg(self, frame_id: int) -> bytes | None:
+        """Return the frame as JPEG bytes, encoding arrays on demand."""
+        frame = self.get(frame_id)
+        if frame is None or isinstance(frame, bytes):
+            return frame
+        return encode_jpeg(frame)
@@ -0,0 +1,298 @@
+"""COCO annotations of RPi missions: one parse, cached across starts.
+
+``parse_mission_annotations`` walks the image rows of a COCO payload
+once and derives everything a stream needs from them: the per-frame
+ground-truth person presence as a ``GtBitset`` (one bit per frame) and
+the source filename order. ``AnnotationCache`` keeps the raw JSON on
+disk keyed by its RPi path together with the ``ETag``/``Last-Modified``
+validators, so a restarted mission sends a conditional GET and reuses
+the cached file on ``304``. Recently parsed annotations stay in memory
+until their validators change.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import overload
+
+logger = logging.getLogger(__name__)
+
+_MEMORY_ENTRIES = 8
+
+
+class GtBitset(Sequence[bool]):
+    """Fixed-size sequence of booleans packed eight per byte."""
+
+    def __init__(self, size: int, positives: Iterable[int] = ()) -> None:
+        self._size = size
+        self._bits = bytearray((size + 7) // 8)
+        for index in positives:
+            if 0 <= index < size:
+                self._bits[index >> 3] |= 1 << (index & 7)
+
+    def __len__(self) -> int:
+        return self._size
+
+    @overload
+    def __getitem__(self, index: int) -> bool: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[bool]: ...
+
+    def __getitem__(self, index: int | slice) -> bool | list[bool]:
+        if isinstance(index, slice):
+            return [self[idx] for idx in range(*index.indices(self._size))]
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("GtBitset index out of range")
+        return bool(self._bits[index >> 3] >> (index & 7) & 1)
+
+
+@dataclass(frozen=True)
+class MissionAnnotations:
+    """Parsed annotations of one mission."""
+
+    payload: dict[str, object]
+    gt_sequence: GtBitset | None
+    source_filenames: list[str] | None
+
+
+@dataclass(frozen=True)
+class _ImageRow:
+    image_id: int | None
+    file_name: str
+    basename: str
+    frame_num: int | None
+
+
+def parse_mission_annotations(payload: object) -> MissionAnnotations | None:
+    """Derive GT presence and filename order from a COCO *payload*."""
+    if not isinstance(payload, dict):
+        return None
+    images_raw = payload.get("images")
+    rows = (
+        [_image_row(item) for item in images_raw if isinstance(item, dict)]
+        if isinstance(images_raw, list)
+        else []
+    )
+    return MissionAnnotations(
+        payload=payload,
+        gt_sequence=_gt_sequence(payload, rows),
+        source_filenames=_source_filenames(rows),
+    )
+
+
+def _image_row(row: dict[object, object]) -> _ImageRow:
+    file_name_raw = row.get("file_name")
+    file_name = file_name_raw.strip() if isinstance(file_name_raw, str) else ""
+    basename = file_name.rsplit("/", 1)[-1]
+    match = re.search(r"(\d+)$", basename.rsplit(".", 1)[0])
+    return _ImageRow(
+        image_id=_to_int(row.get("id")),
+        file_name=file_name,
+        basename=basename,
+        frame_num=int(match.group(1)) if match else None,
+    )
+
+
+def _gt_sequence(payload: dict[str, object], rows: list[_ImageRow]) -> GtBitset | None:
+    annotations_raw = payload.get("annotations")
+    if not rows or not isinstance(annotations_raw, list):
+        return None
+    positive_image_ids = _extract_positive_image_ids(
+        annotations_raw,
+        _extract_person_category_ids(payload.get("categories")),
+    )
+    numbered = [row for row in rows if row.image_id is not None]
+    if numbered and all(row.frame_num is not None for row in numbered):
+        frame_nums = {row.image_id: row.frame_num or 0 for row in numbered}
+        first = min(frame_nums.values())
+        return GtBitset(
+            max(frame_nums.values()) - first + 1,
+            (
+                frame_nums[image_id] - first
+                for image_id in positive_image_ids
+                if image_id in frame_nums
+            ),
+        )
+    # Not every frame is numbered: fall back to file name order.
+    ordered = sorted(rows, key=lambda row: (row.file_name, row.image_id or 0))
+    return GtBitset(
+        len(ordered),
+        (
+            index
+            for index, row in enumerate(ordered)
+            if row.image_id in positive_image_ids
+        ),
+    )
+
+
+def _source_filenames(rows: list[_ImageRow]) -> list[str] | None:
+    named = [row for row in rows if row.basename]
+    if not named:
+        return None
+    if all(row.frame_num is not None for row in named):
+        named.sort(key=lambda row: (row.frame_num or 0, row.image_id or 0))
+    else:
+        named.sort(key=lambda row: (row.basename, row.image_id or 0))
+    return [row.basename for row in named]
+
+
+def _extract_person_category_ids(category_rows: object) -> set[int]:
+    if not isinstance(category_rows, list):
+        return set()
+    person_category_ids: set[int] = set()
+    for item in category_rows:
+        if not isinstance(item, dict):
+            continue
+        name = str(item.get("name", "")).strip().lower()
+        if name != "person":
+            continue
+        category_id = _to_int(item.get("id"))
+        if category_id is not None:
+            person_category_ids.add(category_id)
+    return person_category_ids
+
+
+def _extract_positive_image_ids(
+    annotations_raw: list[object],
+    person_category_ids: set[int],
+) -> set[int]:
+    positive_image_ids: set[int] = set()
+    for item in annotations_raw:
+        if not isinstance(item, dict):
+            continue
+        image_id = _to_int(item.get("image_id"))
+        if image_id is None:
+            continue
+        if person_category_ids:
+            category_id = _to_int(item.get("category_id"))
+            if category_id not in person_category_ids:
+                continue
+        positive_image_ids.add(image_id)
+    return positive_image_ids
+
+
+def _to_int(value: object) -> int | None:
+    if isinstance(value, bool):
+        return int(value)
+    if isinstance(value, int):
+        return value
+    if isinstance(value, float):
+        return int(value)
+    if isinstance(value, (str, bytes, bytearray)):
+        try:
+            return int(value)
+        except ValueError:
+            return None
+    return None
+
+
+class AnnotationCache:
+    """Annotation files from the Pi kept on disk with their HTTP validators."""
+
+    def __init__(self, cache_dir: Path) -> None:
+        self._cache_dir = cache_dir
+        self._memory: dict[str, tuple[dict[str, str], MissionAnnotations]] = {}
+        self._lock = threading.Lock()
+
+    def conditional_headers(self, path: str) -> dict[str, str]:
+        """Return ``If-None-Match``/``If-Modified-Since`` for the cached *path*."""
+        validators = self._read_validators(path)
+        if validators is None or not self._body_path(path).is_file():
+            return {}
+        headers: dict[str, str] = {}
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+        return headers
+
+    def load(self, path: str) -> MissionAnnotations | None:
+        """Return the cached annotations of *path*; ``None`` if unusable."""
+        validators = self._read_validators(path)
+        if validators is None:
+            return None
+        with self._lock:
+            cached = self._memory.get(path)
+        if cached is not None and cached[0] == validators:
+            return cached[1]
+        try:
+            annotations = parse_mission_annotations(
+                json.loads(self._body_path(path).read_bytes())
+            )
+        except (OSError, ValueError) as error:
+            logger.warning("Dropping unreadable annotation cache %s: %s", path, error)
+            return None
+        if annotations is not None:
+            self._remember(path, validators, annotations)
+        return annotations
+
+    def store(
+        self,
+        path: str,
+        body: bytes,
+        *,
+        validators: dict[str, str],
+        annotations: MissionAnnotations,
+    ) -> None:
+        """Cache *body* of *path* when the Pi sent validators for it."""
+        if not validators:
+            return
+        try:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            # Body first: a stamp never points at a missing or partial file.
+            _write_atomic(self._body_path(path), body)
+            meta = json.dumps({"path": path, **validators}).encode()
+            _write_atomic(self._meta_path(path), meta)
+        except OSError as error:
+            logger.warning("Cannot cache annotations %s: %s", path, error)
+            return
+        self._remember(path, validators, annotations)
+
+    def _remember(
+        self,
+        path: str,
+        validators: dict[str, str],
+        annotations: MissionAnnotations,
+    ) -> None:
+        with self._lock:
+            self._memory.pop(path, None)
+            self._memory[path] = (validators, annotations)
+            while len(self._memory) > _MEMORY_ENTRIES:
+                del self._memory[next(iter(self._memory))]
+
+    def _read_validators(self, path: str) -> dict[str, str] | None:
+        try:
+            meta = json.loads(self._meta_path(path).read_bytes())
+        except (OSError, ValueError):
+            return None
+        if not isinstance(meta, dict) or meta.get("path") != path:
+            return None
+        return {
+            key: str(meta[key]) for key in ("etag", "last_modified") if meta.get(key)
+        }
+
+    def _key(self, path: str) -> str:
+        return hashlib.sha256(path.encode()).hexdigest()[:32]
+
+    def _body_path(self, path: str) -> Path:
+        return self._cache_dir / f"{self._key(path)}.json"
+
+    def _meta_path(self, path: str) -> Path:
+        return self._cache_dir / f"{self._key(path)}.meta.json"
+
+
+def _write_atomic(target: Path, data: bytes) -> None:
+    tmp = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, target)
@@ -0,0 +1,154 @@
+"""Incremental parser for ``multipart/x-mixed-replace`` MJPEG streams.
+
+Chunks are appended to one ``bytearray`` and every scan resumes where
+the previous one stopped, so parsing a frame costs time linear in its
+size however it is chunked. Each part is framed by the boundary from
+the stream's ``Content-Type`` and, when the server sends one, by its
+``Content-Length`` header: the body is then taken by length and is never
+scanned, so JPEG payloads with embedded EOI markers (EXIF thumbnails)
+come out whole. Without a boundary the parser falls back to SOI/EOI
+markers. A frame is copied exactly once, out of the buffer through a
+``memoryview``.
+"""
+
+from __future__ import annotations
+
+import re
+
+_SOI = b"\xff\xd8"
+_EOI = b"\xff\xd9"
+_HEADER_END = b"\r\n\r\n"
+_BOUNDARY_RE = re.compile(r'boundary="?([^";,\s]+)"?', re.IGNORECASE)
+_MAX_HEADER_BYTES = 8192
+
+
+class MjpegParser:
+    """Split an MJPEG byte stream into JPEG frames, one ``feed`` at a time."""
+
+    def __init__(self, boundary: str | None = None) -> None:
+        self._marker = boundary.encode("latin-1") if boundary else None
+        self._buffer = bytearray()
+        # Offset where the next scan resumes; bytes before it were searched.
+        self._scan = 0
+        # Body length of the current part: None while reading its headers,
+        # -1 when the part has no Content-Length header.
+        self._body_length: int | None = None
+
+    @classmethod
+    def from_content_type(cls, content_type: str) -> MjpegParser:
+        """Build a parser for the boundary declared in *content_type*."""
+        match = _BOUNDARY_RE.search(content_type)
+        return cls(match.group(1) if match else None)
+
+    @property
+    def buffered(self) -> int:
+        """Return the number of bytes received but not yet handed out."""
+        return len(self._buffer)
+
+    def feed(self, chunk: bytes) -> None:
+        self._buffer += chunk
+
+    def next_frame(self) -> bytes | None:
+        """Return the next complete frame, or ``None`` until more is fed.
+
+        Raises ``ValueError`` when part headers exceed a sane size; the
+        malformed data is dropped so that parsing resyncs on the next part.
+        """
+        if self._marker is None:
+            return self._next_marked_frame()
+        while True:
+            if self._body_length is None:
+                if not self._read_part_headers():
+                    return None
+                continue
+            frame = (
+                self._take_sized_body(self._body_length)
+                if self._body_length >= 0
+                else self._take_delimited_body()
+            )
+            if frame != b"":
+                return frame
+
+    def _read_part_headers(self) -> bool:
+        """Consume one boundary line and header block; ``False`` if incomplete."""
+        marker = self._marker or b""
+        if self._buffer.startswith(marker):
+            # Waiting for the rest of these headers: resume that scan.
+            start, header_scan = 0, max(len(marker), self._scan)
+        else:
+            start = self._buffer.find(marker, self._scan)
+            header_scan = start + len(marker)
+        if start < 0:
+            # Preamble or garbage before the boundary; keep a possible prefix.
+            self._discard(max(0, len(self._buffer) - len(marker) + 1))
+            self._scan = 0
+            return False
+        end = self._buffer.find(_HEADER_END, header_scan)
+        if end < 0:
+            if len(self._buffer) - start > _MAX_HEADER_BYTES:
+                self._discard(len(self._buffer))
+                raise ValueError("MJPEG part headers exceed size limit")
+            self._discard(start)
+            self._scan = max(0, len(self._buffer) - len(_HEADER_END) + 1)
+            return False
+        headers = bytes(self._buffer[start:end]).decode("latin-1")
+        self._discard(end + len(_HEADER_END))
+        self._body_length = _content_length(headers)
+        return True
+
+    def _take_sized_body(self, length: int) -> bytes | None:
+        if len(self._buffer) < length:
+            return None
+        frame = self._take(0, length)
+        self._body_length = None
+        return frame
+
+    def _take_delimited_body(self) -> bytes | None:
+        marker = self._marker or b""
+        pos = self._buffer.find(marker, self._scan)
+        if pos < 0:
+            self._scan = max(0, len(self._buffer) - len(marker) + 1)
+            return None
+        # Strip the CRLF and dashes that open the next delimiter line.
+        end = pos
+        while end > 0 and self._buffer[end - 1] in b"\r\n-":
+            end -= 1
+        frame = self._take(0, end, consume=pos)
+        self._body_length = None
+        return frame
+
+    def _next_marked_frame(self) -> bytes | None:
+        start = self._buffer.find(_SOI)
+        if start < 0:
+            # Keep a trailing 0xFF that may begin the next SOI.
+            self._discard(max(0, len(self._buffer) - 1))
+            return None
+        if start > 0:
+            self._discard(start)
+        end = self._buffer.find(_EOI, max(len(_SOI), self._scan))
+        if end < 0:
+            self._scan = max(len(_SOI), len(self._buffer) - 1)
+            return None
+        return self._take(0, end + len(_EOI))
+
+    def _take(self, start: int, end: int, *, consume: int | None = None) -> bytes:
+        with memoryview(self._buffer) as view:
+            frame = bytes(view[start:end])
+        self._discard(end if consume is None else consume)
+        return frame
+
+    def _discard(self, count: int) -> None:
+        if count:
+            del self._buffer[:count]
+        self._scan = 0
+
+
+def _content_length(headers: str) -> int:
+    for line in headers.split("\r\n"):
+        name, sep, value = line.partition(":")
+        if sep and name.strip().lower() == "content-length":
+            try:
+                return max(0, int(value.strip()))
+            except ValueError:
+                return -1
+    return -1
@@ -0,0 +1,257 @@
+"""Local cache for model artifacts referenced by the inference contract.
+
+Downloads stream into ``<name>.part`` under a cross-process file lock and
+are hashed as the bytes arrive. An interrupted download resumes with an
+HTTP ``Range`` request, and the file is renamed into place only once it is
+complete and matches ``model_sha256``. A ``<name>.verified.json`` stamp
+(path, size, mtime, sha256) lets later starts trust the file without
+re-hashing it. The preloaded model directory of the offline profile
+(``MODEL_PRELOAD_DIR``, ADR-0007) is checked before the cache and network.
+"""
+
+from __future__ import annotations
+
+import fcntl
+import hashlib
+import json
+import logging
+import os
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from urllib.error import HTTPError
+from urllib.parse import urlparse
+from urllib.request import Request, urlopen
+
+from rescue_ai.config import ModelSettings
+
+MODEL_CACHE_DIR = Path("runtime/models")
+_CHUNK_BYTES = 1 << 20
+_HTTP_PARTIAL_CONTENT = 206
+_HTTP_RANGE_NOT_SATISFIABLE = 416
+logger = logging.getLogger(__name__)
+
+
+def fetch_model(
+    model_url: str,
+    *,
+    cache_dir: Path,
+    expected_sha256: str | None,
+    preload_dir: Path | None = None,
+) -> Path:
+    """Return a verified local copy of *model_url*, downloading it at most once.
+
+    *preload_dir* defaults to ``MODEL_PRELOAD_DIR``; a file with the same
+    name there is used in place and never copied into *cache_dir*.
+    """
+    expected = _normalize_sha256(expected_sha256)
+    model_path = resolve_model_cache_path(model_url, cache_dir=cache_dir)
+    if preload_dir is None:
+        preload_dir = default_preload_dir()
+    if preload_dir is not None and (preload_dir / model_path.name).is_file():
+        preloaded = preload_dir / model_path.name
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        _ensure_verified(preloaded, expected, stamp_dir=cache_dir)
+        logger.info("Model preloaded: %s", preloaded)
+        return preloaded
+
+    if model_path.is_file() and _stamp_matches(
+        model_path, expected, stamp_dir=cache_dir
+    ):
+        logger.info("Model cache hit: %s", model_path)
+        return model_path
+
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    with _file_lock(cache_dir / f"{model_path.name}.lock"):
+        # Another process may have finished the download while we waited.
+        if not model_path.is_file():
+            _download(model_url, model_path, expected)
+        try:
+            _ensure_verified(model_path, expected, stamp_dir=cache_dir)
+        except RuntimeError:
+            model_path.unlink(missing_ok=True)
+            raise
+    return model_path
+
+
+def default_preload_dir() -> Path | None:
+    """Return ``MODEL_PRELOAD_DIR`` as a path, or ``None`` when unset."""
+    value = str(ModelSettings().preload_dir).strip()
+    return Path(value) if value else None
+
+
+def resolve_model_cache_path(model_url: str, *, cache_dir: Path) -> Path:
+    """Return the cache location for the artifact behind *model_url*."""
+    parsed = urlparse(model_url)
+    filename = Path(parsed.path).name or "model.pt"
+    return cache_dir / filename
+
+
+def exported_model_path(model_url: str, *, cache_dir: Path, suffix: str) -> Path:
+    """Return where an artifact derived from *model_url* is cached.
+
+    ``suffix`` replaces the source extension, e.g. ``.onnx`` turns
+    ``yolov8n.pt`` into ``yolov8n.onnx`` next to the downloaded weights.
+    """
+    source_path = resolve_model_cache_path(model_url, cache_dir=cache_dir)
+    return source_path.with_name(source_path.stem + suffix)
+
+
+def manifest_path_for(model_path: Path) -> Path:
+    """Return the JSON manifest location that describes *model_path*."""
+    return model_path.with_name(model_path.name + ".json")
+
+
+def write_model_manifest(model_path: Path, payload: dict[str, object]) -> Path:
+    """Write the manifest for a derived model artifact next to it."""
+    target = manifest_path_for(model_path)
+    target.write_text(
+        json.dumps(payload, ensure_ascii=False, indent=2),
+        encoding="utf-8",
+    )
+    return target
+
+
+def read_model_manifest(model_path: Path) -> dict[str, object] | None:
+    """Return the manifest for *model_path*, or ``None`` if absent/invalid."""
+    target = manifest_path_for(model_path)
+    if not target.exists():
+        return None
+    try:
+        payload = json.loads(target.read_text(encoding="utf-8"))
+    except (UnicodeDecodeError, json.JSONDecodeError):
+        return None
+    return payload if isinstance(payload, dict) else None
+
+
+def verify_model_integrity(model_path: Path, expected_sha256: str | None) -> None:
+    """Raise ``RuntimeError`` if *model_path* does not match *expected_sha256*."""
+    normalized = _normalize_sha256(expected_sha256)
+    if normalized is None:
+        return
+    _check_digest(model_path, file_sha256(model_path), normalized)
+
+
+def file_sha256(path: Path) -> str:
+    """Return the hex sha256 digest of a file, read in 1 MiB chunks."""
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        while chunk := handle.read(_CHUNK_BYTES):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+# ── Download ──────────────────────────────────────────────────────
+
+
+def _download(model_url: str, model_path: Path, expected: str | None) -> None:
+    part_path = model_path.with_name(model_path.name + ".part")
+    digest = hashlib.sha256()
+    offset = 0
+    if part_path.is_file():
+        with part_path.open("rb") as handle:
+            while chunk := handle.read(_CHUNK_BYTES):
+                digest.update(chunk)
+                offset += len(chunk)
+    request = Request(model_url)
+    if offset:
+        request.add_header("Range", f"bytes={offset}-")
+    logger.info(
+        "Downloading model: %s → %s (resume_from=%d)", model_url, model_path, offset
+    )
+    try:
+        with urlopen(request) as response:
+            if offset and getattr(response, "status", None) != _HTTP_PARTIAL_CONTENT:
+                logger.info("Model server ignored Range, restarting download")
+                digest = hashlib.sha256()
+                offset = 0
+            with part_path.open("ab" if offset else "wb") as handle:
+                while chunk := response.read(_CHUNK_BYTES):
+                    handle.write(chunk)
+                    digest.update(chunk)
+                handle.flush()
+                os.fsync(handle.fileno())
+    except HTTPError as error:
+        # 416: the partial file already holds every byte of the artifact.
+        if not offset or error.code != _HTTP_RANGE_NOT_SATISFIABLE:
+            raise
+    actual = digest.hexdigest()
+    if expected is not None and actual != expected:
+        part_path.unlink(missing_ok=True)
+    _check_digest(model_path, actual, expected)
+    os.replace(part_path, model_path)
+    _write_stamp(model_path, actual, stamp_dir=model_path.parent)
+    logger.info("Model downloaded: %s sha256=%s", model_path, actual)
+
+
+@contextmanager
+def _file_lock(lock_path: Path) -> Iterator[None]:
+    with lock_path.open("a+b") as handle:
+        fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+
+# ── Verification stamps ───────────────────────────────────────────
+
+
+def _ensure_verified(path: Path, expected: str | None, *, stamp_dir: Path) -> None:
+    if expected is None or _stamp_matches(path, expected, stamp_dir=stamp_dir):
+        return
+    actual = file_sha256(path)
+    _check_digest(path, actual, expected)
+    _write_stamp(path, actual, stamp_dir=stamp_dir)
+
+
+def _stamp_path(path: Path, stamp_dir: Path) -> Path:
+    return stamp_dir / f"{path.name}.verified.json"
+
+
+def _stamp_matches(path: Path, expected: str | None, *, stamp_dir: Path) -> bool:
+    if expected is None:
+        return True
+    try:
+        payload = json.loads(_stamp_path(path, stamp_dir).read_text(encoding="utf-8"))
+        stat = path.stat()
+    except (OSError, ValueError):
+        return False
+    return isinstance(payload, dict) and payload == _stamp_payload(path, stat, expected)
+
+
+def _write_stamp(path: Path, sha256: str, *, stamp_dir: Path) -> None:
+    payload = _stamp_payload(path, path.stat(), sha256)
+    target = _stamp_path(path, stamp_dir)
+    tmp_path = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+    try:
+        tmp_path.write_text(json.dumps(payload), encoding="utf-8")
+        os.replace(tmp_path, target)
+    except OSError as error:
+        logger.warning("Model stamp write failed: %s: %s", target, error)
+
+
+def _stamp_payload(path: Path, stat: os.stat_result, sha256: str) -> dict[str, object]:
+    return {
+        "path": str(path.resolve()),
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "sha256": sha256,
+    }
+
+
+def _normalize_sha256(expected_sha256: str | None) -> str | None:
+    if not expected_sha256:
+        return None
+    normalized = expected_sha256.strip().lower()
+    if len(normalized) != 64 or not all(ch in "0123456789abcdef" for ch in normalized):
+        raise RuntimeError("Invalid model_sha256 format in runtime config")
+    return normalized
+
+
+def _check_digest(path: Path, actual: str, expected: str | None) -> None:
+    if expected is not None and actual != expected:
+        raise RuntimeError(
+            f"Model checksum mismatch for {path.name}: "
+            f"expected {expected}, got {actual}"
+        )
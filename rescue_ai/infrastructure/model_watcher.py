@@ -0,0 +1,94 @@
+"""Stream contract watcher that triggers hot model swaps.
+
+The watcher polls the contract file's mtime. When the file changes it
+re-reads the ``infer`` block and hands the new ``InferenceConfig`` to the
+swap callback. A half-written or invalid contract is logged and retried
+on the next poll instead of being applied.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections.abc import Callable
+from pathlib import Path
+
+import yaml
+
+from rescue_ai.application.inference_config import InferenceConfig
+
+_POLL_INTERVAL_SEC = 5.0
+logger = logging.getLogger(__name__)
+
+
+class ContractModelWatcher:
+    """Polls the stream contract and requests a model swap when it changes."""
+
+    def __init__(
+        self,
+        *,
+        contract_path: Path,
+        load_inference: Callable[[], InferenceConfig],
+        on_change: Callable[[InferenceConfig], bool],
+        interval_sec: float = _POLL_INTERVAL_SEC,
+    ) -> None:
+        self._contract_path = contract_path
+        self._load_inference = load_inference
+        self._on_change = on_change
+        self._interval_sec = interval_sec
+        self._mtime_ns = self._read_mtime_ns()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        """Poll in a daemon thread until ``stop()``."""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(
+            target=self._run, name="contract-model-watcher", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self._interval_sec + 1.0)
+            self._thread = None
+
+    def poll_once(self) -> bool:
+        """Check the contract once; return whether a swap was requested."""
+        mtime_ns = self._read_mtime_ns()
+        if mtime_ns is None or mtime_ns == self._mtime_ns:
+            return False
+        try:
+            config = self._load_inference()
+        except (OSError, ValueError, TypeError, yaml.YAMLError) as error:
+            logger.warning(
+                "Contract changed but cannot be loaded, retrying: %s: %s",
+                type(error).__name__,
+                error,
+            )
+            return False
+        try:
+            requested = self._on_change(config)
+        except ValueError as error:
+            logger.warning("Contract model swap deferred: %s", error)
+            return False
+        self._mtime_ns = mtime_ns
+        logger.info(
+            "Contract change detected: path=%s model_url=%s swap_requested=%s",
+            self._contract_path,
+            config.model_url,
+            requested,
+        )
+        return requested
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._interval_sec):
+            self.poll_once()
+
+    def _read_mtime_ns(self) -> int | None:
+        try:
+            return self._contract_path.stat().st_mtime_ns
+        except OSError:
+            return None
@@ -0,0 +1,408 @@
+"""ONNX Runtime detector backend for exported YOLOv8 models.
+
+The adapter never imports torch or ultralytics: pre-processing
+(letterbox), NMS and box rescaling are reimplemented with numpy/OpenCV
+so that CPU-only ground stations only need ``onnxruntime``.
+"""
+
+from __future__ import annotations
+
+import ast
+import importlib
+import logging
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from rescue_ai.application.inference_config import InferenceConfig
+from rescue_ai.domain.entities import Detection
+from rescue_ai.infrastructure.detection_batch import DetectionBatch
+from rescue_ai.infrastructure.frame_decode import DecodedFrame, decode_jpeg
+from rescue_ai.infrastructure.model_cache import (
+    MODEL_CACHE_DIR,
+    exported_model_path,
+    fetch_model,
+    file_sha256,
+    read_model_manifest,
+)
+from rescue_ai.infrastructure.score_histogram import ScoreHistogram
+
+ONNX_SUFFIX = ".onnx"
+INT8_SUFFIX = ".int8.onnx"
+_LETTERBOX_FILL = 114
+_MAX_WH = 7680.0
+logger = logging.getLogger(__name__)
+
+
+def _load_onnxruntime():
+    return importlib.import_module("onnxruntime")
+
+
+def resolve_onnx_model_path(config: InferenceConfig) -> Path:
+    """Return the local ``.onnx`` file for the contract's ``model_url``.
+
+    An FP32 ``model_url`` that already points at an ``.onnx`` file is
+    downloaded and checksummed like the PyTorch weights. Otherwise the
+    artifact produced by ``rescue_ai.interfaces.cli.export_onnx`` (FP32)
+    or ``rescue_ai.interfaces.cli.quantize`` (INT8) is expected next to
+    the cached source model.
+    """
+    is_onnx_url = config.model_url.lower().endswith(ONNX_SUFFIX)
+    if config.precision == "fp32" and is_onnx_url:
+        return fetch_model(
+            config.model_url,
+            cache_dir=MODEL_CACHE_DIR,
+            expected_sha256=config.model_sha256,
+        )
+    suffix = INT8_SUFFIX if config.precision == "int8" else ONNX_SUFFIX
+    model_path = exported_model_path(
+        config.model_url, cache_dir=MODEL_CACHE_DIR, suffix=suffix
+    )
+    if not model_path.exists():
+        command = "quantize" if config.precision == "int8" else "export_onnx"
+        raise RuntimeError(
+            f"ONNX model not found at {model_path}.\n"
+            f"Export it first: python -m rescue_ai.interfaces.cli.{command}"
+        )
+    manifest = read_model_manifest(model_path)
+    expected = manifest.get("sha256") if manifest is not None else None
+    if isinstance(expected, str) and expected != file_sha256(model_path):
+        raise RuntimeError(
+            f"ONNX model {model_path.name} does not match its export manifest"
+        )
+    return model_path
+
+
+@dataclass(frozen=True)
+class Letterboxed:
+    """Network input tensor plus the geometry needed to undo the letterbox."""
+
+    tensor: Any
+    gain: float
+    pad_x: float
+    pad_y: float
+    width: int
+    height: int
+
+
+class OnnxDetector:
+    """YOLOv8 detector running an exported ONNX graph on onnxruntime."""
+
+    def __init__(
+        self, config: InferenceConfig, model_version: str = "yolo8n-onnx"
+    ) -> None:
+        self._config = config
+        self._model_version = model_version
+        self._session: Any | None = None
+        self._input_name = ""
+        self._input_size = config.imgsz
+        self._dynamic_batch = True
+        self._dynamic_size = True
+        self._person_ids: set[int] = {0}
+        self._histogram = (
+            None
+            if config.prefilter is None
+            else ScoreHistogram(
+                floor=config.prefilter.score_floor,
+                ceiling=config.confidence_threshold,
+                bins=config.prefilter.histogram_bins,
+                source="pre_nms",
+            )
+        )
+
+    def detect(self, image_uri: object) -> Sequence[Detection]:
+        """Run detection on a single frame and return normalized detections."""
+        return self.detect_batch([image_uri])[0]
+
+    def detect_traced_at(
+        self, image_uri: object, imgsz: int
+    ) -> tuple[Sequence[Detection], str, int]:
+        """Run at input size *imgsz* when the graph's spatial axes are dynamic.
+
+        A graph exported with a fixed input shape always runs at that size,
+        which is what gets reported back.
+        """
+        self._ensure_session()
+        size = imgsz if self._dynamic_size else self._input_size
+        return self._detect_batch_at([image_uri], size)[0], "full", size
+
+    def detect_batch(self, image_uris: Sequence[object]) -> list[Sequence[Detection]]:
+        """Run detection on several frames, one session call per micro-batch."""
+        self._ensure_session()
+        return self._detect_batch_at(image_uris, self._input_size)
+
+    def _detect_batch_at(
+        self, image_uris: Sequence[object], size: int
+    ) -> list[Sequence[Detection]]:
+        session = self._ensure_session()
+        batch_size = max(1, self._config.batch_size) if self._dynamic_batch else 1
+        outputs: list[Sequence[Detection]] = []
+        for start in range(0, len(image_uris), batch_size):
+            stop = start + batch_size
+            frames = [self._load(item, size) for item in image_uris[start:stop]]
+            t0 = time.perf_counter()
+            batches = self._infer(session, [frame.image for frame in frames], size)
+            outputs.extend(
+                batch.rescaled(frame.scale_x, frame.scale_y)
+                for batch, frame in zip(batches, frames)
+            )
+            elapsed_ms = (time.perf_counter() - t0) * 1000
+            logger.debug(
+                "ONNX inference: frames=%d elapsed=%.1f ms (%.1f ms/frame)",
+                len(frames),
+                elapsed_ms,
+                elapsed_ms / len(frames),
+            )
+        return outputs
+
+    def warmup(self) -> None:
+        self._ensure_session()
+
+    def warmup_inference(self) -> None:
+        """Run one session call on a blank frame at the model input size."""
+        import numpy as np
+
+        session = self._ensure_session()
+        size = self._input_size
+        self._infer(session, [np.zeros((size, size, 3), dtype=np.uint8)], size)
+
+    def runtime_name(self) -> str:
+        """Return human-readable runtime name."""
+        return "onnx"
+
+    def score_histogram(self) -> dict[str, object] | None:
+        """Return the histogram of sub-threshold person scores (prefilter only).
+
+        Candidates are filtered by class and score before NMS here anyway,
+        so the prefilter only adds the histogram of raw candidate scores.
+        """
+        return None if self._histogram is None else self._histogram.snapshot()
+
+    def _load(self, image_source: object, size: int) -> DecodedFrame:
+        if isinstance(image_source, bytes) and self._config.reduced_decode:
+            return decode_jpeg(image_source, target_size=size)
+        return DecodedFrame(image=load_frame(image_source))
+
+    def _infer(
+        self, session: Any, frames: list[Any], size: int
+    ) -> list[DetectionBatch]:
+        import numpy as np
+
+        letterboxed = [letterbox(frame, size) for frame in frames]
+        batch = np.stack([item.tensor for item in letterboxed])
+        raw = session.run(None, {self._input_name: batch})[0]
+        return [
+            self._postprocess(raw[idx], geometry)
+            for idx, geometry in enumerate(letterboxed)
+        ]
+
+    def _postprocess(self, prediction: Any, geometry: Letterboxed) -> DetectionBatch:
+        import numpy as np
+
+        candidates = prediction.T
+        class_scores = candidates[:, 4:]
+        if class_scores.shape[1] == 0:
+            return DetectionBatch([], [], model_name=self._model_version)
+        cls_ids = class_scores.argmax(axis=1)
+        scores = class_scores[np.arange(len(cls_ids)), cls_ids]
+        person = (
+            np.isin(cls_ids, list(self._person_ids))
+            if self._person_ids
+            else np.ones(len(cls_ids), dtype=bool)
+        )
+        keep = person & (scores > self._config.confidence_threshold)
+        if self._histogram is not None:
+            self._histogram.add(scores[person & ~keep])
+        if not keep.any():
+            return DetectionBatch([], [], model_name=self._model_version)
+
+        boxes = _xywh_to_xyxy(candidates[keep, :4])
+        scores = scores[keep]
+        cls_ids = cls_ids[keep]
+        order = _nms(
+            boxes + (cls_ids[:, None] * _MAX_WH),
+            scores,
+            iou_threshold=self._config.nms_iou,
+        )[: self._config.max_det]
+
+        return DetectionBatch(
+            _scale_boxes(boxes[order], geometry),
+            scores[order],
+            model_name=self._model_version,
+        )
+
+    def _ensure_session(self):
+        if self._session is not None:
+            return self._session
+
+        try:
+            ort = _load_onnxruntime()
+        except ImportError as error:
+            raise RuntimeError(
+                "onnxruntime is not installed.\n"
+                "Install: uv sync --extra onnx --extra dev"
+            ) from error
+
+        model_path = resolve_onnx_model_path(self._config)
+        options = ort.SessionOptions()
+        if self._config.intra_op_threads:
+            options.intra_op_num_threads = self._config.intra_op_threads
+        session = ort.InferenceSession(
+            str(model_path),
+            sess_options=options,
+            providers=["CPUExecutionProvider"],
+        )
+        model_input = session.get_inputs()[0]
+        self._input_name = model_input.name
+        shape = list(model_input.shape)
+        self._dynamic_batch = not isinstance(shape[0], int) or shape[0] > 1
+        if len(shape) == 4 and isinstance(shape[2], int):
+            self._input_size = shape[2]
+            self._dynamic_size = False
+        names = _read_class_names(session)
+        if names:
+            self._person_ids = {
+                idx for idx, name in names.items() if name.lower() == "person"
+            }
+        logger.info(
+            "ONNX model loaded: path=%s input=%s dynamic_batch=%s",
+            model_path,
+            shape,
+            self._dynamic_batch,
+        )
+        self._session = session
+        return self._session
+
+
+def _read_class_names(session: Any) -> dict[int, str]:
+    metadata = getattr(session.get_modelmeta(), "custom_metadata_map", {}) or {}
+    raw_names = metadata.get("names")
+    if not raw_names:
+        return {}
+    try:
+        parsed = ast.literal_eval(raw_names)
+    except (ValueError, SyntaxError):
+        return {}
+    if not isinstance(parsed, dict):
+        return {}
+    return {int(idx): str(name) for idx, name in parsed.items()}
+
+
+def load_frame(image_source: object) -> Any:
+    import numpy as np
+
+    if isinstance(image_source, np.ndarray):
+        return image_source
+
+    try:
+        import cv2
+    except ImportError as exc:
+        raise TypeError("opencv-python is required for ONNX detection") from exc
+
+    if isinstance(image_source, bytes):
+        return decode_jpeg(image_source).image
+    if isinstance(image_source, (str, Path)):
+        frame = cv2.imread(str(image_source), cv2.IMREAD_COLOR)
+        if frame is None:
+            raise ValueError(f"Failed to read image for detection: {image_source}")
+        return frame
+
+    raise TypeError(f"Unsupported image source type: {type(image_source)!r}")
+
+
+def letterbox(frame: Any, size: int) -> Letterboxed:
+    """Resize keeping aspect ratio and pad to ``size``×``size`` like ultralytics."""
+    import cv2
+    import numpy as np
+
+    height, width = frame.shape[:2]
+    gain = min(size / height, size / width)
+    new_w, new_h = int(round(width * gain)), int(round(height * gain))
+    if (new_w, new_h) != (width, height):
+        frame = cv2.resize(frame, (new_w, new_h), interpolation=cv2.INTER_LINEAR)
+    top, bottom = _split_padding(size - new_h)
+    left, right = _split_padding(size - new_w)
+    padded = cv2.copyMakeBorder(
+        frame,
+        top,
+        bottom,
+        left,
+        right,
+        cv2.BORDER_CONSTANT,
+        value=(_LETTERBOX_FILL,) * 3,
+    )
+    tensor = np.ascontiguousarray(
+        padded[:, :, ::-1].transpose(2, 0, 1), dtype=np.float32
+    )
+    tensor /= 255.0
+    return Letterboxed(
+        tensor=tensor,
+        gain=gain,
+        pad_x=float(left),
+        pad_y=float(top),
+        width=width,
+        height=height,
+    )
+
+
+def _split_padding(total: int) -> tuple[int, int]:
+    half = total / 2
+    return int(round(half - 0.1)), int(round(half + 0.1))
+
+
+def _xywh_to_xyxy(boxes: Any) -> Any:
+    import numpy as np
+
+    half_w = boxes[:, 2] / 2
+    half_h = boxes[:, 3] / 2
+    return np.stack(
+        [
+            boxes[:, 0] - half_w,
+            boxes[:, 1] - half_h,
+            boxes[:, 0] + half_w,
+            boxes[:, 1] + half_h,
+        ],
+        axis=1,
+    )
+
+
+def _nms(boxes: Any, scores: Any, iou_threshold: float) -> Any:
+    """Greedy non-maximum suppression; returns kept indices by score."""
+    import numpy as np
+
+    areas = (boxes[:, 2] - boxes[:, 0]) * (boxes[:, 3] - boxes[:, 1])
+    order = scores.argsort()[::-1]
+    keep: list[int] = []
+    while order.size:
+        best = int(order[0])
+        keep.append(best)
+        rest = order[1:]
+        inter_w = np.clip(
+            np.minimum(boxes[best, 2], boxes[rest, 2])
+            - np.maximum(boxes[best, 0], boxes[rest, 0]),
+            0,
+            None,
+        )
+        inter_h = np.clip(
+            np.minimum(boxes[best, 3], boxes[rest, 3])
+            - np.maximum(boxes[best, 1], boxes[rest, 1]),
+            0,
+            None,
+        )
+        inter = inter_w * inter_h
+        iou = inter / (areas[best] + areas[rest] - inter + 1e-9)
+        order = rest[iou <= iou_threshold]
+    return np.asarray(keep, dtype=int)
+
+
+def _scale_boxes(boxes: Any, geometry: Letterboxed) -> Any:
+    import numpy as np
+
+    scaled = boxes.copy()
+    scaled[:, [0, 2]] = (scaled[:, [0, 2]] - geometry.pad_x) / geometry.gain
+    scaled[:, [1, 3]] = (scaled[:, [1, 3]] - geometry.pad_y) / geometry.gain
+    scaled[:, [0, 2]] = np.clip(scaled[:, [0, 2]], 0, geometry.width)
+    scaled[:, [1, 3]] = np.clip(scaled[:, [1, 3]], 0, geometry.height)
+    return scaled
@@ -0,0 +1,88 @@
+"""Static INT8 post-training quantization of exported ONNX detectors."""
+
+from __future__ import annotations
+
+import importlib
+import logging
+from collections.abc import Iterator, Sequence
+from pathlib import Path
+from typing import Any
+
+from rescue_ai.infrastructure.onnx_detector import letterbox, load_frame
+
+logger = logging.getLogger(__name__)
+
+
+def _load_quantization():
+    return importlib.import_module("onnxruntime.quantization")
+
+
+class FrameCalibrationReader:
+    """Feeds letterboxed mission frames to the ORT calibrator one by one."""
+
+    def __init__(
+        self, frame_paths: Sequence[Path], *, input_name: str, input_size: int
+    ) -> None:
+        self._frame_paths = list(frame_paths)
+        self._input_name = input_name
+        self._input_size = input_size
+        self._iterator: Iterator[Path] = iter(self._frame_paths)
+
+    def get_next(self) -> dict[str, Any] | None:
+        """Return the next calibration feed, or ``None`` when exhausted."""
+        frame_path = next(self._iterator, None)
+        if frame_path is None:
+            return None
+        tensor = letterbox(load_frame(frame_path), self._input_size).tensor
+        return {self._input_name: tensor[None]}
+
+    def rewind(self) -> None:
+        self._iterator = iter(self._frame_paths)
+
+
+def quantize_onnx_int8(
+    *,
+    fp32_path: Path,
+    output_path: Path,
+    calibration_frames: Sequence[Path],
+    input_size: int,
+) -> Path:
+    """Write a QDQ INT8 copy of *fp32_path* calibrated on mission frames.
+
+    Weights are quantized per channel to int8, activations to uint8
+    using MinMax ranges collected over *calibration_frames*.
+    """
+    if not calibration_frames:
+        raise ValueError("INT8 calibration needs at least one frame")
+    try:
+        quantization = _load_quantization()
+        ort = importlib.import_module("onnxruntime")
+    except ImportError as error:
+        raise RuntimeError(
+            "onnxruntime is not installed.\n"
+            "Install: uv sync --extra onnx --extra dev"
+        ) from error
+
+    session = ort.InferenceSession(str(fp32_path), providers=["CPUExecutionProvider"])
+    reader = FrameCalibrationReader(
+        calibration_frames,
+        input_name=session.get_inputs()[0].name,
+        input_size=input_size,
+    )
+    logger.info(
+        "Calibrating INT8 model: source=%s frames=%d",
+        fp32_path,
+        len(calibration_frames),
+    )
+    quantization.quantize_static(
+        model_input=str(fp32_path),
+        model_output=str(output_path),
+        calibration_data_reader=reader,
+        quant_format=quantization.QuantFormat.QDQ,
+        activation_type=quantization.QuantType.QUInt8,
+        weight_type=quantization.QuantType.QInt8,
+        per_channel=True,
+        calibrate_method=quantization.CalibrationMethod.MinMax,
+    )
+    logger.info("INT8 model written: %s", output_path)
+    return output_path
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
+
 from rescue_ai.application.pilot_service import PilotServicePort
 from rescue_ai.domain.entities import Alert, Detection, FrameEvent
 from rescue_ai.domain.ports import AlertReviewPayload, ReportMetadataPayload
@@ -36,7 +38,7 @@ class PilotMissionEngine:
         self,
         mission_id: str,
         frame_event: FrameEvent,
-        detections: list[Detection],
+        detections: Sequence[Detection],
     ) -> list[Alert]:
         if frame_event.mission_id != mission_id:
             raise ValueError("Mission id mismatch")
@@ -49,7 +49,11 @@ frame_id,
 ts_sec,
 image_uri,
 gt_person_present,
-gt_episode_id
+gt_episode_id,
+inference_path,
+model_url,
+model_sha256,
+imgsz
 """
 
 
@@ -526,15 +530,23 @@ class PostgresFrameEventRepository:
                         ts_sec,
                         image_uri,
                         gt_person_present,
-                        gt_episode_id
+                        gt_episode_id,
+                        inference_path,
+                        model_url,
+                        model_sha256,
+                        imgsz
                     )
-                    VALUES (%s, %s, %s, %s, %s, %s)
+                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
                     ON CONFLICT (mission_id, frame_id)
                     DO UPDATE SET
                         ts_sec = EXCLUDED.ts_sec,
                         image_uri = EXCLUDED.image_uri,
                         gt_person_present = EXCLUDED.gt_person_present,
-                        gt_episode_id = EXCLUDED.gt_episode_id
+                        gt_episode_id = EXCLUDED.gt_episode_id,
+                        inference_path = EXCLUDED.inference_path,
+                        model_url = EXCLUDED.model_url,
+                        model_sha256 = EXCLUDED.model_sha256,
+                        imgsz = EXCLUDED.imgsz
                     """,
                     (
                         frame_event.mission_id,
@@ -543,6 +555,10 @@ class PostgresFrameEventRepository:
                         frame_event.image_uri,
                         frame_event.gt_person_present,
                         frame_event.gt_episode_id,
+                        frame_event.inference_path,
+                        frame_event.model_url,
+                        frame_event.model_sha256,
+                        frame_event.imgsz,
                     ),
                 )
                 if self._episodes is not None:
@@ -621,6 +637,10 @@ def _frame_event_from_row(row: Sequence[Any]) -> FrameEvent:
         image_uri=str(row[3]),
         gt_person_present=bool(row[4]),
         gt_episode_id=None if row[5] is None else str(row[5]),
+        inference_path=None if len(row) < 7 or row[6] is None else str(row[6]),
+        model_url=None if len(row) < 8 or row[7] is None else str(row[7]),
+        model_sha256=None if len(row) < 9 or row[8] is None else str(row[8]),
+        imgsz=None if len(row) < 10 or row[9] is None else int(row[9]),
     )
 
 
@@ -631,6 +651,7 @@ def _serialize_detection(detection: Detection) -> dict[str, object]:
         "label": detection.label,
         "model_name": detection.model_name,
         "explanation": detection.explanation,
+        "track_id": detection.track_id,
     }
 
 
@@ -645,6 +666,9 @@ def _detection_from_payload(payload: dict[str, Any]) -> Detection:
             if payload.get("explanation") is None
             else str(payload.get("explanation"))
         ),
+        track_id=(
+            None if payload.get("track_id") is None else int(payload["track_id"])
+        ),
     )
 
 
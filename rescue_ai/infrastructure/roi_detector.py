@@ -0,0 +1,208 @@
+"""Region-of-interest inference around recent person detections.
+
+A 4K drone frame letterboxed to a 960-pixel network shrinks a distant
+person to a handful of pixels. Once someone has been seen, the next
+frames only need a close look near that spot: ``detect_regions`` cuts
+padded crops around the given boxes, runs them as one batch through a
+detector built at ``imgsz=crop_size`` (so crops keep their native
+resolution) and maps the boxes back to frame coordinates. Full-frame
+calls go to the regular detector pipeline.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import replace
+from pathlib import Path
+from typing import Any
+
+from rescue_ai.application.batch_inference import (
+    close_detector,
+    detect_in_batches,
+    detect_traced,
+    detect_traced_at,
+)
+from rescue_ai.application.detector_parity import box_iou
+from rescue_ai.application.detector_warmup import detector_warmup_inference
+from rescue_ai.application.inference_config import RoiConfig
+from rescue_ai.application.inference_timing import (
+    detector_score_histogram,
+    detector_stage_timings,
+)
+from rescue_ai.domain.entities import Detection
+from rescue_ai.domain.ports import DetectorPort
+from rescue_ai.infrastructure.frame_decode import decode_jpeg
+
+PATH_ROI = "roi"
+_MERGE_IOU = 0.5
+
+Box = tuple[float, float, float, float]
+
+
+class RoiDetector:
+    """DetectorPort whose ``detect_regions`` inspects crops at native resolution."""
+
+    def __init__(
+        self,
+        *,
+        full_frame: DetectorPort,
+        crops: DetectorPort,
+        config: RoiConfig,
+    ) -> None:
+        self._full_frame = full_frame
+        self._crops = crops
+        self._config = config
+
+    def detect(self, image_uri: object) -> Sequence[Detection]:
+        detector_any: Any = self._full_frame
+        return detector_any.detect(image_uri)
+
+    def detect_traced(self, image_uri: object) -> tuple[Sequence[Detection], str]:
+        """Run the full-frame pipeline and report its inference path."""
+        return detect_traced(self._full_frame, image_uri)
+
+    def detect_traced_at(
+        self, image_uri: object, imgsz: int
+    ) -> tuple[Sequence[Detection], str, int | None]:
+        """Run the full-frame pipeline at input size *imgsz*."""
+        return detect_traced_at(self._full_frame, image_uri, imgsz)
+
+    def detect_batch(self, image_uris: Sequence[object]) -> list[Sequence[Detection]]:
+        return detect_in_batches(self._full_frame, image_uris)
+
+    def detect_regions(
+        self, image_uri: object, regions: Sequence[Box]
+    ) -> list[Detection]:
+        """Detect inside padded crops around *regions*; boxes in frame pixels."""
+        image = _load_image(image_uri)
+        height, width = image.shape[:2]
+        windows = crop_windows(
+            regions,
+            frame_size=(width, height),
+            config=self._config,
+        )
+        crops = [image[y1:y2, x1:x2] for x1, y1, x2, y2 in windows]
+        detections: list[Detection] = []
+        for (x1, y1, _x2, _y2), found in zip(
+            windows, detect_in_batches(self._crops, crops)
+        ):
+            detections.extend(
+                replace(item, bbox=_offset(item.bbox, x1, y1)) for item in found
+            )
+        return merge_overlapping(detections, iou_threshold=_MERGE_IOU)
+
+    def warmup(self) -> None:
+        self._full_frame.warmup()
+        self._crops.warmup()
+
+    def warmup_inference(self) -> None:
+        """Run the dummy forward pass of the full-frame and crop detectors."""
+        detector_warmup_inference(self._full_frame)
+        detector_warmup_inference(self._crops)
+
+    def runtime_name(self) -> str:
+        """Return human-readable runtime name."""
+        return f"roi({self._full_frame.runtime_name()})"
+
+    def stage_timings(self) -> dict[str, dict[str, object]]:
+        """Return stage timings of both detectors, keyed ``<detector>.<stage>``."""
+        merged: dict[str, dict[str, object]] = {}
+        for prefix, detector in (
+            ("full_frame", self._full_frame),
+            ("roi", self._crops),
+        ):
+            for stage, summary in (detector_stage_timings(detector) or {}).items():
+                merged[f"{prefix}.{stage}"] = summary
+        return merged
+
+    def score_histogram(self) -> dict[str, object] | None:
+        """Return the full-frame detector's low-score histogram."""
+        return detector_score_histogram(self._full_frame)
+
+    def cache_stats(self) -> dict[str, int] | None:
+        """Return the full-frame result-cache counters, if cached."""
+        detector_any: Any = self._full_frame
+        stats = getattr(detector_any, "cache_stats", None)
+        if not callable(stats):
+            return None
+        return stats()
+
+    def close(self) -> None:
+        """Close the full-frame and crop detectors."""
+        close_detector(self._full_frame)
+        close_detector(self._crops)
+
+
+def crop_windows(
+    regions: Sequence[Box],
+    *,
+    frame_size: tuple[int, int],
+    config: RoiConfig,
+) -> list[tuple[int, int, int, int]]:
+    """Return integer crop windows around *regions*, clamped to the frame.
+
+    A window is ``crop_size`` square, or larger when the padded box does
+    not fit. The most recent regions come first; regions already inside a
+    window get no window of their own, and at most ``max_regions`` are cut.
+    """
+    windows: list[tuple[int, int, int, int]] = []
+    for region in reversed(regions):
+        if len(windows) >= config.max_regions:
+            break
+        if not any(_contains(window, region) for window in windows):
+            windows.append(_window_around(region, frame_size, config))
+    return windows
+
+
+def merge_overlapping(
+    detections: Sequence[Detection], *, iou_threshold: float
+) -> list[Detection]:
+    """Keep the best-scoring box among duplicates from overlapping crops."""
+    kept: list[Detection] = []
+    for item in sorted(detections, key=lambda det: det.score, reverse=True):
+        if all(box_iou(item.bbox, other.bbox) <= iou_threshold for other in kept):
+            kept.append(item)
+    return kept
+
+
+def _window_around(
+    region: Box, frame_size: tuple[int, int], config: RoiConfig
+) -> tuple[int, int, int, int]:
+    width, height = frame_size
+    grow = 1 + 2 * config.padding
+    side_w = min(width, max(config.crop_size, int((region[2] - region[0]) * grow)))
+    side_h = min(height, max(config.crop_size, int((region[3] - region[1]) * grow)))
+    center_x, center_y = (region[0] + region[2]) / 2, (region[1] + region[3]) / 2
+    x1 = int(min(max(0.0, center_x - side_w / 2), width - side_w))
+    y1 = int(min(max(0.0, center_y - side_h / 2), height - side_h))
+    return x1, y1, x1 + side_w, y1 + side_h
+
+
+def _contains(window: tuple[int, int, int, int], box: Box) -> bool:
+    return (
+        window[0] <= box[0]
+        and window[1] <= box[1]
+        and box[2] <= window[2]
+        and box[3] <= window[3]
+    )
+
+
+def _offset(bbox: Box, dx: int, dy: int) -> Box:
+    return bbox[0] + dx, bbox[1] + dy, bbox[2] + dx, bbox[3] + dy
+
+
+def _load_image(image_source: object) -> Any:
+    import numpy as np
+
+    if isinstance(image_source, np.ndarray):
+        return image_source
+    if isinstance(image_source, bytes):
+        return decode_jpeg(image_source).image
+    if isinstance(image_source, (str, Path)):
+        import cv2
+
+        image = cv2.imread(str(image_source), cv2.IMREAD_COLOR)
+        if image is None:
+            raise ValueError(f"Failed to read image for detection: {image_source}")
+        return image
+    raise TypeError(f"Unsupported image source type: {type(image_source)!r}")
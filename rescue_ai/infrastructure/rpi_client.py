@@ -1,14 +1,39 @@
-"""HTTP client for Raspberry Pi frame source service."""
+"""HTTP client for Raspberry Pi frame source service.
+
+One ``RpiClient`` is meant to live as long as the API process: its
+pooled ``httpx.Client`` keeps connections to the Pi alive, so a status
+poll over a lossy field link costs a request rather than a TCP (and
+TLS) handshake plus a request. HTTP/2 is negotiated when the optional
+``h2`` package is installed. Connection setup has its own short
+timeout, and failed requests are retried with exponential backoff:
+GETs on any transport error or gateway status, POSTs only when the
+connection was never established, so a stream is never started twice.
+Mission annotations are fetched once per start, with a conditional GET
+against the on-disk ``AnnotationCache`` when one is configured.
+"""
 
 from __future__ import annotations
 
-import re
+import importlib.util
+import logging
+import time
 from dataclasses import dataclass
-from pathlib import PurePosixPath
+from pathlib import Path, PurePosixPath
+from typing import Any
 
 import httpx
 
 from rescue_ai.config import RpiSettings
+from rescue_ai.infrastructure.mission_annotations import (
+    AnnotationCache,
+    MissionAnnotations,
+    parse_mission_annotations,
+)
+
+logger = logging.getLogger(__name__)
+
+_RETRY_STATUSES = frozenset({502, 503, 504})
+_HTTP_NOT_MODIFIED = 304
 
 
 @dataclass(frozen=True)
@@ -40,27 +65,43 @@ class RpiStreamSession:
 class RpiClient:
     """Communicates with the RPi source service over HTTP."""
 
-    def __init__(self, settings: RpiSettings) -> None:
+    def __init__(
+        self,
+        settings: RpiSettings,
+        transport: httpx.BaseTransport | None = None,
+    ) -> None:
         self._base_url = settings.base_url.rstrip("/")
         self._missions_dir = settings.missions_dir.strip()
         self._rtsp_port = settings.rtsp_port
         self._rtsp_path_prefix = settings.rtsp_path_prefix
+        self._connect_timeout_sec = settings.connect_timeout_sec
+        self._max_retries = max(0, settings.max_retries)
+        self._retry_backoff_sec = settings.retry_backoff_sec
+        cache_dir = settings.annotations_cache_dir.strip()
+        self._annotation_cache = AnnotationCache(Path(cache_dir)) if cache_dir else None
+        self._http = httpx.Client(
+            transport=transport,
+            http2=_http2_available(),
+            limits=httpx.Limits(
+                max_connections=16,
+                max_keepalive_connections=8,
+                keepalive_expiry=60.0,
+            ),
+        )
+
+    def close(self) -> None:
+        """Close pooled connections to the Pi."""
+        self._http.close()
 
     def health(self, timeout_sec: float = 5.0) -> dict[str, object]:
         """Check RPi service health. Raises on connection failure."""
-        response = httpx.get(
-            f"{self._base_url}/health",
-            timeout=timeout_sec,
-        )
+        response = self._request("GET", "/health", timeout_sec=timeout_sec)
         response.raise_for_status()
         return response.json()
 
     def catalog(self, timeout_sec: float = 10.0) -> RpiCatalog:
         """Fetch the mission catalog from RPi."""
-        response = httpx.get(
-            f"{self._base_url}/mission/catalog",
-            timeout=timeout_sec,
-        )
+        response = self._request("GET", "/mission/catalog", timeout_sec=timeout_sec)
         response.raise_for_status()
         data = response.json()
         missions = [
@@ -83,8 +124,10 @@ class RpiClient:
     ) -> RpiStreamSession:
         """Start a streaming session on the RPi."""
         mission_path = self._resolve_mission_path(mission_id=mission_id)
-        response = httpx.post(
-            f"{self._base_url}/source/start",
+        response = self._request(
+            "POST",
+            "/source/start",
+            timeout_sec=timeout_sec,
             json={
                 "mode": "frames",
                 "source": mission_path,
@@ -93,7 +136,6 @@ class RpiClient:
                 "loop": False,
                 "target_fps": target_fps,
             },
-            timeout=timeout_sec,
         )
         if response.status_code == 404:
             raise ValueError(f"RPi mission not found: {mission_id}")
@@ -134,9 +176,8 @@ class RpiClient:
         self, session_id: str, timeout_sec: float = 10.0
     ) -> dict[str, object]:
         """Stop an active streaming session."""
-        response = httpx.post(
-            f"{self._base_url}/source/stop/{session_id}",
-            timeout=timeout_sec,
+        response = self._request(
+            "POST", f"/source/stop/{session_id}", timeout_sec=timeout_sec
         )
         response.raise_for_status()
         return response.json()
@@ -145,33 +186,18 @@ class RpiClient:
         self, session_id: str, timeout_sec: float = 5.0
     ) -> dict[str, object]:
         """Get statistics for an active session."""
-        response = httpx.get(
-            f"{self._base_url}/source/session/{session_id}",
-            timeout=timeout_sec,
+        response = self._request(
+            "GET", f"/source/session/{session_id}", timeout_sec=timeout_sec
         )
         response.raise_for_status()
         return response.json()
 
-    def load_gt_sequence(
+    def load_mission_annotations(
         self,
         mission_id: str,
         timeout_sec: float = 15.0,
-    ) -> list[bool] | None:
-        """Load per-frame GT person presence sequence from mission COCO annotations."""
-        payload = self.load_annotations_payload(
-            mission_id,
-            timeout_sec=timeout_sec,
-        )
-        if not isinstance(payload, dict):
-            return None
-        return _build_gt_sequence_from_coco(payload)
-
-    def load_annotations_payload(
-        self,
-        mission_id: str,
-        timeout_sec: float = 15.0,
-    ) -> dict[str, object] | None:
-        """Load raw COCO annotations JSON for a mission."""
+    ) -> MissionAnnotations | None:
+        """Fetch and parse the COCO annotations of a mission in one request."""
         catalog = self.catalog(timeout_sec=timeout_sec)
         mission = next(
             (item for item in catalog.missions if item.mission_id == mission_id),
@@ -180,149 +206,92 @@ class RpiClient:
         if mission is None or not mission.annotations_json:
             return None
 
-        response = httpx.get(
-            f"{self._base_url}/source/raw_file",
-            params={"path": mission.annotations_json},
-            timeout=timeout_sec,
+        path = mission.annotations_json
+        cache = self._annotation_cache
+        headers = cache.conditional_headers(path) if cache is not None else {}
+        response = self._request(
+            "GET",
+            "/source/raw_file",
+            timeout_sec=timeout_sec,
+            params={"path": path},
+            headers=headers,
         )
+        if response.status_code == _HTTP_NOT_MODIFIED and cache is not None:
+            cached = cache.load(path)
+            if cached is not None:
+                return cached
+            # The cached copy went missing since the headers were built.
+            response = self._request(
+                "GET",
+                "/source/raw_file",
+                timeout_sec=timeout_sec,
+                params={"path": path},
+            )
         response.raise_for_status()
-        payload = response.json()
-        return payload if isinstance(payload, dict) else None
+        annotations = parse_mission_annotations(response.json())
+        if annotations is not None and cache is not None:
+            cache.store(
+                path,
+                response.content,
+                validators=_validators(response),
+                annotations=annotations,
+            )
+        return annotations
 
     @property
     def base_url(self) -> str:
         return self._base_url
 
-
-def _build_gt_sequence_from_coco(
-    payload: dict[str, object],
-) -> list[bool] | None:
-    images_raw = payload.get("images")
-    annotations_raw = payload.get("annotations")
-    if not isinstance(images_raw, list) or not isinstance(annotations_raw, list):
-        return None
-
-    image_rows = [item for item in images_raw if isinstance(item, dict)]
-    if not image_rows:
-        return None
-
-    person_category_ids = _extract_person_category_ids(payload.get("categories"))
-    positive_image_ids = _extract_positive_image_ids(
-        annotations_raw,
-        person_category_ids,
-    )
-    numbered_sequence = _build_numbered_sequence(image_rows, positive_image_ids)
-    if numbered_sequence is not None:
-        return numbered_sequence
-    return _build_sorted_sequence(image_rows, positive_image_ids)
-
-
-def _extract_person_category_ids(category_rows: object) -> set[int]:
-    if not isinstance(category_rows, list):
-        return set()
-    person_category_ids: set[int] = set()
-    for item in category_rows:
-        if not isinstance(item, dict):
-            continue
-        name = str(item.get("name", "")).strip().lower()
-        if name != "person":
-            continue
-        category_id = _to_int(item.get("id"))
-        if category_id is not None:
-            person_category_ids.add(category_id)
-    return person_category_ids
-
-
-def _extract_positive_image_ids(
-    annotations_raw: list[object],
-    person_category_ids: set[int],
-) -> set[int]:
-    positive_image_ids: set[int] = set()
-    for item in annotations_raw:
-        if not isinstance(item, dict):
-            continue
-        image_id = _to_int(item.get("image_id"))
-        if image_id is None:
-            continue
-        if person_category_ids:
-            category_id = _to_int(item.get("category_id"))
-            if category_id not in person_category_ids:
-                continue
-        positive_image_ids.add(image_id)
-    return positive_image_ids
-
-
-def _build_numbered_sequence(
-    image_rows: list[dict[object, object]],
-    positive_image_ids: set[int],
-) -> list[bool] | None:
-    image_id_to_frame_num: dict[int, int] = {}
-    for row in image_rows:
-        image_id = _to_int(row.get("id"))
-        if image_id is None:
-            continue
-        frame_num = _extract_frame_num(row)
-        if frame_num is None:
-            return None
-        image_id_to_frame_num[image_id] = frame_num
-
-    if not image_id_to_frame_num:
-        return None
-    min_num = min(image_id_to_frame_num.values())
-    max_num = max(image_id_to_frame_num.values())
-    if max_num < min_num:
-        return None
-    size = max_num - min_num + 1
-    sequence = [False] * size
-    for image_id in positive_image_ids:
-        frame_num = image_id_to_frame_num.get(image_id)
-        if frame_num is None:
-            continue
-        idx = frame_num - min_num
-        if 0 <= idx < size:
-            sequence[idx] = True
-    return sequence
-
-
-def _extract_frame_num(row: dict[object, object]) -> int | None:
-    name = str(row.get("file_name", ""))
-    stem = name.rsplit("/", 1)[-1].rsplit(".", 1)[0]
-    match = re.search(r"(\d+)$", stem)
-    if match is None:
-        return None
-    return int(match.group(1))
-
-
-def _build_sorted_sequence(
-    image_rows: list[dict[object, object]],
-    positive_image_ids: set[int],
-) -> list[bool]:
-    sorted_images = sorted(
-        image_rows,
-        key=lambda row: (
-            str(row.get("file_name", "")),
-            _to_int(row.get("id")) or 0,
-        ),
-    )
-    sequence: list[bool] = []
-    for row in sorted_images:
-        image_id = _to_int(row.get("id"))
-        sequence.append(
-            image_id in positive_image_ids if image_id is not None else False
+    def _request(
+        self, method: str, path: str, *, timeout_sec: float, **kwargs: Any
+    ) -> httpx.Response:
+        """Send one request over the pool, retrying with exponential backoff."""
+        timeout = httpx.Timeout(
+            timeout_sec, connect=min(timeout_sec, self._connect_timeout_sec)
         )
-    return sequence
-
-
-def _to_int(value: object) -> int | None:
-    if isinstance(value, bool):
-        return int(value)
-    if isinstance(value, int):
-        return value
-    if isinstance(value, float):
-        return int(value)
-    if isinstance(value, (str, bytes, bytearray)):
-        try:
-            return int(value)
-        except ValueError:
-            return None
-    return None
+        attempt = 0
+        while True:
+            try:
+                response = self._http.request(
+                    method, f"{self._base_url}{path}", timeout=timeout, **kwargs
+                )
+            except httpx.TransportError as error:
+                if not self._should_retry(method, attempt, error=error):
+                    raise
+                logger.debug("RPi %s %s failed: %s", method, path, error)
+            else:
+                if not self._should_retry(method, attempt, status=response.status_code):
+                    return response
+                response.close()
+                logger.debug(
+                    "RPi %s %s returned %d", method, path, response.status_code
+                )
+            time.sleep(self._retry_backoff_sec * 2**attempt)
+            attempt += 1
+
+    def _should_retry(
+        self,
+        method: str,
+        attempt: int,
+        *,
+        error: httpx.TransportError | None = None,
+        status: int | None = None,
+    ) -> bool:
+        if attempt >= self._max_retries:
+            return False
+        if method == "GET":
+            return error is not None or status in _RETRY_STATUSES
+        # Not idempotent: only retry when the request never reached the Pi.
+        return isinstance(error, (httpx.ConnectError, httpx.ConnectTimeout))
+
+
+def _http2_available() -> bool:
+    return importlib.util.find_spec("h2") is not None
+
+
+def _validators(response: httpx.Response) -> dict[str, str]:
+    validators = {
+        "etag": response.headers.get("etag", ""),
+        "last_modified": response.headers.get("last-modified", ""),
+    }
+    return {key: value for key, value in validators.items() if value}
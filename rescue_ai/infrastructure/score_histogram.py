@@ -0,0 +1,68 @@
+"""Compact histogram of sub-threshold candidate scores.
+
+With the prefilter on, person candidates scoring between
+``score_floor`` and the confidence threshold never become ``Detection``
+objects. Their scores are binned here instead (one vectorized
+``bincount`` per frame), which keeps the information a threshold sweep
+below the operating point needs at a fixed memory cost.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Any
+
+
+class ScoreHistogram:
+    """Thread-safe running counts of scores in ``[floor, ceiling)``."""
+
+    def __init__(self, *, floor: float, ceiling: float, bins: int, source: str) -> None:
+        self._floor = floor
+        self._ceiling = max(floor, ceiling)
+        self._bins = max(1, bins)
+        self._source = source
+        self._counts = [0] * self._bins
+        self._frames = 0
+        self._lock = threading.Lock()
+
+    def add(self, scores: Any) -> None:
+        """Count one frame's candidate scores; out-of-range scores are ignored."""
+        import numpy as np
+
+        values = np.asarray(scores, dtype=np.float64).reshape(-1)
+        values = values[(values >= self._floor) & (values < self._ceiling)]
+        width = (self._ceiling - self._floor) / self._bins
+        counts = (
+            np.bincount(
+                np.minimum(
+                    ((values - self._floor) / width).astype(int), self._bins - 1
+                ),
+                minlength=self._bins,
+            )
+            if len(values) and width > 0
+            else None
+        )
+        with self._lock:
+            self._frames += 1
+            if counts is not None:
+                self._counts = [
+                    total + int(added) for total, added in zip(self._counts, counts)
+                ]
+
+    def snapshot(self) -> dict[str, object]:
+        """Return bin edges, per-bin counts and the number of frames seen.
+
+        ``source`` tells where the scores were taken: ``pre_nms`` for raw
+        candidates (ONNX), ``post_nms`` for boxes NMS kept (torch).
+        """
+        width = (self._ceiling - self._floor) / self._bins
+        with self._lock:
+            counts, frames = list(self._counts), self._frames
+        return {
+            "source": self._source,
+            "bin_edges": [
+                round(self._floor + idx * width, 4) for idx in range(self._bins + 1)
+            ],
+            "counts": counts,
+            "frames": frames,
+        }
@@ -2,20 +2,35 @@
 
 from __future__ import annotations
 
-import hashlib
 import importlib
 import logging
+import shutil
 import time
+from collections.abc import Sequence
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
-from urllib.parse import urlparse
-from urllib.request import urlretrieve
 
 from rescue_ai.application.inference_config import InferenceConfig
+from rescue_ai.application.inference_timing import StageTimings
 from rescue_ai.domain.entities import Detection
+from rescue_ai.infrastructure.detection_batch import DetectionBatch
+from rescue_ai.infrastructure.frame_decode import DecodedFrame, decode_jpeg
+from rescue_ai.infrastructure.model_cache import (
+    MODEL_CACHE_DIR,
+    exported_model_path,
+    fetch_model,
+    file_sha256,
+    write_model_manifest,
+)
+from rescue_ai.infrastructure.score_histogram import ScoreHistogram
 
-MODEL_CACHE_DIR = Path("runtime/models")
 logger = logging.getLogger(__name__)
+_ULTRALYTICS_SPEED_STAGES = (
+    ("preprocess", "preprocess"),
+    ("inference", "inference"),
+    ("nms", "postprocess"),
+)
 
 
 def _load_yolo_class():
@@ -29,22 +44,41 @@ class YoloDetector:
         self._config = config
         self._model_version = model_version
         self._model: Any | None = None
+        self._timings = StageTimings()
+        self._person_classes: list[int] | None = None
+        self._histogram = (
+            None
+            if config.prefilter is None
+            else ScoreHistogram(
+                floor=config.prefilter.score_floor,
+                ceiling=config.confidence_threshold,
+                bins=config.prefilter.histogram_bins,
+                source="post_nms",
+            )
+        )
 
-    def detect(self, image_uri: object) -> list[Detection]:
+    def detect(self, image_uri: object) -> Sequence[Detection]:
         """Run detection on a single frame and return normalized detections."""
+        return self._detect_at(image_uri, self._config.imgsz)
+
+    def detect_traced_at(
+        self, image_uri: object, imgsz: int
+    ) -> tuple[Sequence[Detection], str, int]:
+        """Run detection at input size *imgsz* instead of the configured one."""
+        return self._detect_at(image_uri, imgsz), "full", imgsz
+
+    def _detect_at(self, image_uri: object, imgsz: int) -> Sequence[Detection]:
         t0 = time.perf_counter()
-        results = self._predict_raw(image_uri)
+        frame = self._decode(image_uri, imgsz)
+        results = self._predict_raw(frame.image, imgsz)
         elapsed_ms = (time.perf_counter() - t0) * 1000
 
         if not results:
             logger.debug("YOLO inference: no results (%.1f ms)", elapsed_ms)
             return []
 
-        result = results[0]
-        detections = _extract_detections(
-            result=result,
-            confidence_threshold=self._config.confidence_threshold,
-            model_name=self._model_version,
+        detections = self._postprocess(results[0]).rescaled(
+            frame.scale_x, frame.scale_y
         )
         logger.debug(
             "YOLO inference: detections=%d elapsed=%.1f ms conf_threshold=%.3f",
@@ -54,28 +88,121 @@ class YoloDetector:
         )
         return detections
 
+    def detect_batch(self, image_uris: Sequence[object]) -> list[Sequence[Detection]]:
+        """Run detection on several frames, one forward pass per micro-batch.
+
+        Sources may mix file paths, JPEG bytes and decoded ndarrays. The
+        micro-batch size is capped by ``InferenceConfig.batch_size``.
+        """
+        batch_size = max(1, self._config.batch_size)
+        outputs: list[Sequence[Detection]] = []
+        for start in range(0, len(image_uris), batch_size):
+            stop = start + batch_size
+            chunk = image_uris[start:stop]
+            t0 = time.perf_counter()
+            frames = [self._decode(item, self._config.imgsz) for item in chunk]
+            results = list(self._predict_raw_batch([item.image for item in frames]))
+            elapsed_ms = (time.perf_counter() - t0) * 1000
+            if len(results) != len(chunk):
+                raise RuntimeError(
+                    f"YOLO returned {len(results)} results for {len(chunk)} frames"
+                )
+            outputs.extend(
+                self._postprocess(result).rescaled(frame.scale_x, frame.scale_y)
+                for result, frame in zip(results, frames)
+            )
+            logger.debug(
+                "YOLO batch inference: frames=%d elapsed=%.1f ms (%.1f ms/frame)",
+                len(chunk),
+                elapsed_ms,
+                elapsed_ms / len(chunk),
+            )
+        return outputs
+
     def runtime_name(self) -> str:
         """Return human-readable runtime name."""
         return "yolo"
 
-    def _predict_raw(self, image_source: object):
+    def stage_timings(self) -> dict[str, dict[str, object]]:
+        """Return rolling decode/preprocess/inference/NMS/postprocess timings.
+
+        Pre-processing, forward pass and NMS come from ultralytics'
+        per-image ``result.speed``; decode covers in-memory JPEG sources
+        only, since file paths are read inside ultralytics. With
+        ``reduced_decode`` oversized JPEGs are decoded at 1/2–1/8 scale
+        and boxes are mapped back to source pixels.
+        """
+        return self._timings.snapshot()
+
+    def score_histogram(self) -> dict[str, object] | None:
+        """Return the histogram of sub-threshold person scores (prefilter only).
+
+        Ultralytics does not expose its pre-NMS scores, so the model runs
+        at ``score_floor`` and the boxes surviving NMS are split at the
+        confidence threshold. Boxes at or above it are the same as
+        without the prefilter, since NMS keeps the higher-scoring box.
+        """
+        return None if self._histogram is None else self._histogram.snapshot()
+
+    def _postprocess(self, result) -> DetectionBatch:
+        for stage, key in _ULTRALYTICS_SPEED_STAGES:
+            value = (getattr(result, "speed", None) or {}).get(key)
+            if value is not None:
+                self._timings.record(stage, float(value))
+        t0 = time.perf_counter()
+        detections = _extract_detections(
+            result=result,
+            confidence_threshold=self._config.confidence_threshold,
+            model_name=self._model_version,
+            histogram=self._histogram,
+        )
+        self._timings.record("postprocess", (time.perf_counter() - t0) * 1000)
+        return detections
+
+    def _decode(self, image_source: object, imgsz: int) -> DecodedFrame:
+        t0 = time.perf_counter()
+        frame = self._resolve_predict_source(image_source, imgsz)
+        if isinstance(image_source, bytes):
+            self._timings.record("decode", (time.perf_counter() - t0) * 1000)
+        return frame
+
+    def _predict_raw(self, image_source: object, imgsz: int | None = None):
+        model = self._ensure_model()
+        return model.predict(source=image_source, **self._predict_kwargs(imgsz))
+
+    def _predict_raw_batch(self, image_sources: Sequence[object]):
         model = self._ensure_model()
-        source = self._resolve_predict_source(image_source)
+        sources = list(image_sources)
         return model.predict(
-            source=source,
-            conf=self._config.confidence_threshold,
-            iou=self._config.nms_iou,
-            imgsz=self._config.imgsz,
-            max_det=self._config.max_det,
-            device=self._config.device,
-            verbose=False,
+            source=sources,
+            batch=len(sources),
+            **self._predict_kwargs(),
         )
 
-    def _resolve_predict_source(self, image_source: object) -> object:
+    def _predict_kwargs(self, imgsz: int | None = None) -> dict[str, object]:
+        prefilter = self._config.prefilter
+        kwargs: dict[str, object] = {
+            "conf": (
+                self._config.confidence_threshold
+                if prefilter is None
+                else min(prefilter.score_floor, self._config.confidence_threshold)
+            ),
+            "iou": self._config.nms_iou,
+            "imgsz": self._config.imgsz if imgsz is None else imgsz,
+            "max_det": self._config.max_det,
+            "device": self._config.device,
+            "verbose": False,
+        }
+        if prefilter is not None and self._person_classes:
+            # Ultralytics drops other classes before its NMS.
+            kwargs["classes"] = self._person_classes
+        return kwargs
+
+    def _resolve_predict_source(self, image_source: object, imgsz: int) -> DecodedFrame:
         if isinstance(image_source, Path):
-            return str(image_source)
+            return DecodedFrame(image=str(image_source))
         if isinstance(image_source, str):
-            return image_source
+            return DecodedFrame(image=image_source)
 
         try:
             import numpy as np
@@ -83,27 +210,72 @@ class YoloDetector:
             raise TypeError("numpy is required for in-memory detection source") from exc
 
         if isinstance(image_source, np.ndarray):
-            return image_source
+            return DecodedFrame(image=image_source)
 
         if isinstance(image_source, bytes):
             try:
-                import cv2
+                return decode_jpeg(
+                    image_source,
+                    target_size=imgsz if self._config.reduced_decode else None,
+                )
             except ImportError as exc:
                 raise TypeError(
                     "opencv-python is required for bytes detection source"
                 ) from exc
-            frame = cv2.imdecode(
-                np.frombuffer(image_source, dtype=np.uint8), cv2.IMREAD_COLOR
-            )
-            if frame is None:
-                raise ValueError("Failed to decode JPEG bytes for detection")
-            return frame
 
         raise TypeError(f"Unsupported image source type: {type(image_source)!r}")
 
     def warmup(self) -> None:
         self._ensure_model()
 
+    def warmup_inference(self) -> None:
+        """Run one forward pass on a blank frame at the configured ``imgsz``."""
+        import numpy as np
+
+        size = self._config.imgsz
+        self._predict_raw(np.zeros((size, size, 3), dtype=np.uint8))
+
+    def export_onnx(self, *, opset: int = 12) -> Path:
+        """Export the contract model to ONNX next to the cached weights.
+
+        The graph keeps a dynamic batch axis so ``OnnxDetector`` can run
+        micro-batches. A JSON manifest records the source checksum.
+        """
+        model = self._ensure_model()
+        exported = Path(
+            model.export(
+                format="onnx",
+                imgsz=self._config.imgsz,
+                dynamic=True,
+                opset=opset,
+                device=self._config.device,
+            )
+        )
+        target = exported_model_path(
+            self._config.model_url, cache_dir=MODEL_CACHE_DIR, suffix=".onnx"
+        )
+        if exported.resolve() != target.resolve():
+            shutil.move(str(exported), target)
+        source_path = fetch_model(
+            self._config.model_url,
+            cache_dir=MODEL_CACHE_DIR,
+            expected_sha256=self._config.model_sha256,
+        )
+        write_model_manifest(
+            target,
+            {
+                "source_model_url": self._config.model_url,
+                "source_sha256": file_sha256(source_path),
+                "sha256": file_sha256(target),
+                "runtime": "onnx",
+                "imgsz": self._config.imgsz,
+                "opset": opset,
+                "exported_at": datetime.now(timezone.utc).isoformat(),
+            },
+        )
+        logger.info("ONNX model exported: %s", target)
+        return target
+
     def _ensure_model(self):
         if self._model is not None:
             return self._model
@@ -116,85 +288,47 @@ class YoloDetector:
                 "Install: uv sync --extra inference --extra dev"
             ) from error
 
-        model_path = _resolve_model_cache_path(self._config.model_url)
-        MODEL_CACHE_DIR.mkdir(parents=True, exist_ok=True)
-
-        if not model_path.exists():
-            logger.info(
-                "Downloading model: %s → %s", self._config.model_url, model_path
-            )
-            urlretrieve(self._config.model_url, model_path)
-            logger.info("Model downloaded: %s", model_path)
-        else:
-            logger.info("Model cache hit: %s", model_path)
-
-        _verify_model_integrity(
-            model_path=model_path,
+        model_path = fetch_model(
+            self._config.model_url,
+            cache_dir=MODEL_CACHE_DIR,
             expected_sha256=self._config.model_sha256,
         )
         checksum_status = "verified" if self._config.model_sha256 else "skipped"
         logger.info("Model loaded: path=%s checksum=%s", model_path, checksum_status)
+        if self._config.intra_op_threads:
+            importlib.import_module("torch").set_num_threads(
+                self._config.intra_op_threads
+            )
         self._model = yolo_cls(str(model_path))
-        return self._model
-
-
-def _resolve_model_cache_path(model_url: str) -> Path:
-    parsed = urlparse(model_url)
-    filename = Path(parsed.path).name or "model.pt"
-    return MODEL_CACHE_DIR / filename
-
-
-def _verify_model_integrity(model_path: Path, expected_sha256: str | None) -> None:
-    if not expected_sha256:
-        return
-    normalized = expected_sha256.strip().lower()
-    if len(normalized) != 64 or not all(ch in "0123456789abcdef" for ch in normalized):
-        raise RuntimeError("Invalid model_sha256 format in runtime config")
-    actual = hashlib.sha256(model_path.read_bytes()).hexdigest()
-    if actual != normalized:
-        message = (
-            f"Model checksum mismatch for {model_path.name}: "
-            f"expected {normalized}, got {actual}"
+        self._person_classes = sorted(
+            _resolve_person_ids(getattr(self._model, "names", None) or {})
         )
-        raise RuntimeError(message)
+        return self._model
 
 
 def _extract_detections(
-    result, confidence_threshold: float, model_name: str = "yolo8n"
-) -> list[Detection]:
+    result,
+    confidence_threshold: float,
+    model_name: str = "yolo8n",
+    histogram: ScoreHistogram | None = None,
+) -> DetectionBatch:
     boxes = result.boxes
-    names = result.names
-
     if boxes is None:
-        return []
+        return DetectionBatch([], [], model_name=model_name)
 
-    person_ids = _resolve_person_ids(names)
-    cls_ids = boxes.cls.cpu().numpy().astype(int)
-    scores = boxes.conf.cpu().numpy()
-    coords = boxes.xyxy.cpu().numpy()
-
-    detections: list[Detection] = []
-    for box, score, cls_id in zip(coords, scores, cls_ids):
-        if person_ids and cls_id not in person_ids:
-            continue
-        if float(score) < confidence_threshold:
-            continue
-
-        detections.append(
-            Detection(
-                bbox=(
-                    float(box[0]),
-                    float(box[1]),
-                    float(box[2]),
-                    float(box[3]),
-                ),
-                score=float(score),
-                label="person",
-                model_name=model_name,
-            )
-        )
+    import numpy as np
 
-    return detections
+    scores = boxes.conf.cpu().numpy()
+    person = np.ones(len(scores), dtype=bool)
+    person_ids = _resolve_person_ids(result.names)
+    if person_ids:
+        person = np.isin(boxes.cls.cpu().numpy().astype(int), list(person_ids))
+    keep = person & (scores >= confidence_threshold)
+    if histogram is not None:
+        histogram.add(scores[person & ~keep])
+    return DetectionBatch(
+        boxes.xyxy.cpu().numpy()[keep], scores[keep], model_name=model_name
+    )
 
 
 def _resolve_person_ids(names: dict[int, str] | list[str]) -> set[int]:
@@ -1,11 +1,24 @@
 """FastAPI application factory."""
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.responses import Response
 from yaml import safe_dump
 
+from rescue_ai.interfaces.api.dependencies import close_runtime
+from rescue_ai.interfaces.api.detector_routes import router as detector_router
+from rescue_ai.interfaces.api.health_routes import router as health_router
 from rescue_ai.interfaces.api.routes import router
 
+
+@asynccontextmanager
+async def _lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    yield
+    close_runtime()
+
+
 app = FastAPI(
     title="Rescue-AI",
     description=(
@@ -16,8 +29,11 @@ app = FastAPI(
     version="0.1.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    lifespan=_lifespan,
 )
+app.include_router(health_router)
 app.include_router(router)
+app.include_router(detector_router)
 
 
 @app.get("/openapi.yaml", include_in_schema=False)
@@ -8,9 +8,14 @@ initialized as a fallback for local tests.
 from __future__ import annotations
 
 import importlib
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from typing import Callable, Protocol
 
+from rescue_ai.application.batch_inference import close_detector
+from rescue_ai.application.detector_warmup import DetectorWarmup
+from rescue_ai.application.inference_scheduler import InferenceScheduler
+from rescue_ai.application.model_swap import ModelSwapService
 from rescue_ai.application.pilot_service import PilotService
 from rescue_ai.domain.entities import Detection
 from rescue_ai.domain.ports import ArtifactStorage
@@ -39,7 +44,7 @@ class StreamControllerPort(Protocol):
 class DetectorPort(Protocol):
     """Single-frame detector contract consumed by /predict endpoint."""
 
-    def detect(self, image_uri: str) -> list[Detection]: ...
+    def detect(self, image_uri: str) -> Sequence[Detection]: ...
 
 
 class StreamStopState(Protocol):
@@ -59,6 +64,9 @@ class ApiRuntime:
     reset_hook: Callable[[], None]
     detector: DetectorPort | None = field(default=None)
     artifact_storage: ArtifactStorage | None = field(default=None)
+    detector_warmup: DetectorWarmup | None = field(default=None)
+    model_swap: ModelSwapService | None = field(default=None)
+    inference_scheduler: InferenceScheduler | None = field(default=None)
 
 
 @dataclass
@@ -124,6 +132,45 @@ def get_artifact_storage() -> ArtifactStorage | None:
     return _ensure_runtime().artifact_storage
 
 
+def get_detector_warmup() -> DetectorWarmup | None:
+    """Return the startup warmup tracker without bootstrapping the runtime.
+
+    ``None`` means no background warmup was started (lazy local runtime);
+    the detector then loads on its first call.
+    """
+    runtime = _STATE.runtime
+    return None if runtime is None else runtime.detector_warmup
+
+
+def get_model_swap() -> ModelSwapService | None:
+    """Return the hot model swap service without bootstrapping the runtime."""
+    runtime = _STATE.runtime
+    return None if runtime is None else runtime.model_swap
+
+
+def get_inference_scheduler() -> InferenceScheduler | None:
+    """Return the detector call scheduler without bootstrapping the runtime."""
+    runtime = _STATE.runtime
+    return None if runtime is None else runtime.inference_scheduler
+
+
+def close_runtime() -> None:
+    """Release streams, the detector scheduler and the detector stack.
+
+    Called on API shutdown so that detector pool processes and their
+    shared memory do not outlive the server.
+    """
+    runtime = _STATE.runtime
+    if runtime is None:
+        return
+    close_streams = getattr(runtime.stream_controller, "close", None)
+    if callable(close_streams):
+        close_streams()
+    if runtime.inference_scheduler is not None:
+        runtime.inference_scheduler.close()
+    close_detector(runtime.detector)
+
+
 def reset_state() -> None:
     """Reset mutable runtime state used by tests and local sessions."""
     if _STATE.runtime is None:
@@ -137,9 +184,13 @@ __all__ = [
     "ApiRuntime",
     "DetectorPort",
     "StreamControllerPort",
+    "close_runtime",
     "get_artifact_storage",
     "get_container",
     "get_detector",
+    "get_detector_warmup",
+    "get_inference_scheduler",
+    "get_model_swap",
     "get_pilot_service",
     "get_stream_controller",
     "reset_state",
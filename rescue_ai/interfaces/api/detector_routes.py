@@ -0,0 +1,145 @@
+"""FastAPI route handlers for detector runtime introspection."""
+
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from fastapi import APIRouter, HTTPException
+from pydantic import BaseModel
+
+from rescue_ai.application.inference_timing import (
+    detector_score_histogram,
+    detector_stage_timings,
+)
+from rescue_ai.application.model_swap import ModelSwapService
+from rescue_ai.interfaces.api.dependencies import (
+    get_detector,
+    get_detector_warmup,
+    get_inference_scheduler,
+    get_model_swap,
+)
+
+logger = logging.getLogger(__name__)
+router = APIRouter()
+
+
+class ModelSwapRequest(BaseModel):
+    """Model artifact to load in place of the active one."""
+
+    model_url: str
+    model_sha256: str | None = None
+
+
+@router.get(
+    "/detector/stats",
+    tags=["system"],
+    summary="Detector runtime statistics",
+    responses={503: {"description": "Detector not available"}},
+)
+def detector_stats() -> dict[str, object]:
+    """Returns the detector runtime, per-stage latency histograms,
+    result-cache hit/miss counters, the prefilter's low-score histogram
+    and cold-start warmup latencies."""
+    detector = get_detector()
+    if detector is None:
+        raise HTTPException(
+            status_code=503,
+            detail="Detector not available (model not loaded)",
+        )
+    warmup = get_detector_warmup()
+    detector_any: Any = detector
+    runtime_name = getattr(detector_any, "runtime_name", None)
+    cache_stats = getattr(detector_any, "cache_stats", None)
+    payload: dict[str, object] = {
+        "runtime": str(runtime_name()) if callable(runtime_name) else "unknown",
+        "result_cache": cache_stats() if callable(cache_stats) else None,
+        "stage_timings": detector_stage_timings(detector),
+        "low_score_histogram": detector_score_histogram(detector),
+        "warmup": None if warmup is None else warmup.metrics(),
+    }
+    logger.info(
+        "Endpoint detector_stats: runtime=%s result_cache=%s",
+        payload["runtime"],
+        payload["result_cache"],
+    )
+    return payload
+
+
+@router.get(
+    "/detector/scheduler",
+    tags=["system"],
+    summary="Inference scheduler queues",
+    responses={503: {"description": "Inference scheduler not enabled"}},
+)
+def scheduler_stats() -> dict[str, object]:
+    """Returns queue depth, admission counters and queue-wait / run latency
+    histograms for every priority class (live stream, ``/predict``)."""
+    scheduler = get_inference_scheduler()
+    if scheduler is None:
+        raise HTTPException(status_code=503, detail="Inference scheduler not enabled")
+    return scheduler.stats()
+
+
+@router.get(
+    "/admin/model",
+    tags=["system"],
+    summary="Active, previous and loading model versions",
+    responses={503: {"description": "Model hot swap not enabled"}},
+)
+def model_status() -> dict[str, object]:
+    """Returns the active and rollback model versions and the last swap state."""
+    return _require_model_swap().status()
+
+
+@router.post(
+    "/admin/model/swap",
+    tags=["system"],
+    summary="Load a new model version in the background",
+    status_code=202,
+    responses={
+        409: {"description": "Another swap is still loading"},
+        503: {"description": "Model hot swap not enabled"},
+    },
+)
+def swap_model(request: ModelSwapRequest) -> dict[str, object]:
+    """Downloads, verifies and warms the model, then switches to it at the
+    next frame boundary. Running missions keep streaming meanwhile."""
+    model_swap = _require_model_swap()
+    try:
+        requested = model_swap.request_model(request.model_url, request.model_sha256)
+    except ValueError as error:
+        raise HTTPException(status_code=409, detail=str(error)) from error
+    logger.info(
+        "Endpoint swap_model: model_url=%s requested=%s",
+        request.model_url,
+        requested,
+    )
+    return {"requested": requested, **model_swap.status()}
+
+
+@router.post(
+    "/admin/model/rollback",
+    tags=["system"],
+    summary="Switch back to the previous model version",
+    responses={
+        409: {"description": "No previous model version"},
+        503: {"description": "Model hot swap not enabled"},
+    },
+)
+def rollback_model() -> dict[str, object]:
+    """Reinstalls the previously active model; it is still loaded in memory."""
+    model_swap = _require_model_swap()
+    try:
+        version = model_swap.rollback()
+    except ValueError as error:
+        raise HTTPException(status_code=409, detail=str(error)) from error
+    logger.info("Endpoint rollback_model: active=%s", version.model_url)
+    return model_swap.status()
+
+
+def _require_model_swap() -> ModelSwapService:
+    model_swap = get_model_swap()
+    if model_swap is None:
+        raise HTTPException(status_code=503, detail="Model hot swap not enabled")
+    return model_swap
@@ -0,0 +1,88 @@
+"""FastAPI route handlers for liveness and readiness probes."""
+
+from __future__ import annotations
+
+import logging
+
+from fastapi import APIRouter, HTTPException
+from pydantic import BaseModel, Field
+
+from rescue_ai.config import get_settings
+from rescue_ai.interfaces.api.dependencies import get_detector_warmup
+
+logger = logging.getLogger(__name__)
+router = APIRouter()
+
+
+class HealthResponse(BaseModel):
+    """Liveness probe response."""
+
+    status: str = Field(description="Service status", examples=["ok"])
+
+
+class ReadyResponse(BaseModel):
+    """Readiness probe response with per-subsystem checks."""
+
+    status: str = Field(description="Overall readiness", examples=["ready"])
+    checks: dict[str, bool] = Field(
+        description="Per-subsystem configuration checks " "(database, storage, rpi)",
+    )
+    detector: str = Field(
+        default="cold",
+        description=(
+            "Detector warmup state: warming, ready, failed, unavailable, "
+            "or cold when no startup warmup was run"
+        ),
+        examples=["ready"],
+    )
+
+
+@router.get(
+    "/health",
+    tags=["system"],
+    summary="Liveness check",
+    response_model=HealthResponse,
+)
+def health() -> dict[str, str]:
+    """Returns 200 if the service process is running."""
+    logger.info("Endpoint health: status=ok")
+    return {"status": "ok"}
+
+
+@router.get(
+    "/ready",
+    tags=["system"],
+    summary="Readiness check",
+    response_model=ReadyResponse,
+    responses={503: {"description": "One or more subsystems not configured"}},
+)
+def ready() -> dict[str, object]:
+    """Checks that all required integrations (database, S3, RPi) are configured.
+
+    Returns 503 with a per-subsystem breakdown if any check fails.
+    ``detector`` reports the background model warmup state."""
+    settings = get_settings()
+    checks = {
+        "database": bool(settings.database.dsn.strip()),
+        "storage": bool(
+            settings.storage.s3_bucket.strip()
+            and settings.storage.s3_access_key_id.strip()
+        ),
+        "rpi": bool(settings.rpi.base_url.strip() and settings.rpi.rtsp_port > 0),
+    }
+    warmup = get_detector_warmup()
+    detector_status = "cold" if warmup is None else warmup.status
+    if not all(checks.values()):
+        logger.warning("Endpoint ready: status=not_ready checks=%s", checks)
+        raise HTTPException(
+            status_code=503,
+            detail={
+                "status": "not_ready",
+                "checks": checks,
+                "detector": detector_status,
+            },
+        )
+    logger.info(
+        "Endpoint ready: status=ready checks=%s detector=%s", checks, detector_status
+    )
+    return {"status": "ready", "checks": checks, "detector": detector_status}
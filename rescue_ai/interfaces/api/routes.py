@@ -11,12 +11,15 @@ from fastapi import APIRouter, HTTPException
 from fastapi.responses import HTMLResponse, Response
 from pydantic import BaseModel, Field
 
+from rescue_ai.application.detector_warmup import WARMUP_FAILED, WARMUP_WARMING
+from rescue_ai.application.inference_scheduler import InferenceRejected
 from rescue_ai.config import get_settings
 from rescue_ai.domain.entities import Alert, Detection
 from rescue_ai.domain.ports import AlertReviewPayload
 from rescue_ai.interfaces.api.dependencies import (
     get_artifact_storage,
     get_detector,
+    get_detector_warmup,
     get_pilot_service,
     get_stream_controller,
 )
@@ -100,21 +103,6 @@ class ForceCompleteRequest(BaseModel):
     )
 
 
-class HealthResponse(BaseModel):
-    """Liveness probe response."""
-
-    status: str = Field(description="Service status", examples=["ok"])
-
-
-class ReadyResponse(BaseModel):
-    """Readiness probe response with per-subsystem checks."""
-
-    status: str = Field(description="Overall readiness", examples=["ready"])
-    checks: dict[str, bool] = Field(
-        description="Per-subsystem configuration checks " "(database, storage, rpi)",
-    )
-
-
 class RpiStatusResponse(BaseModel):
     """RPi device connectivity status."""
 
@@ -245,48 +233,6 @@ def _resolve_queued_alerts_for_force_complete(
 # ── System endpoints ───────────────────────────────────────────────
 
 
-@router.get(
-    "/health",
-    tags=["system"],
-    summary="Liveness check",
-    response_model=HealthResponse,
-)
-def health() -> dict[str, str]:
-    """Returns 200 if the service process is running."""
-    logger.info("Endpoint health: status=ok")
-    return {"status": "ok"}
-
-
-@router.get(
-    "/ready",
-    tags=["system"],
-    summary="Readiness check",
-    response_model=ReadyResponse,
-    responses={503: {"description": "One or more subsystems not configured"}},
-)
-def ready() -> dict[str, object]:
-    """Checks that all required integrations (database, S3, RPi) are configured.
-
-    Returns 503 with a per-subsystem breakdown if any check fails."""
-    settings = get_settings()
-    checks = {
-        "database": bool(settings.database.dsn.strip()),
-        "storage": bool(
-            settings.storage.s3_bucket.strip()
-            and settings.storage.s3_access_key_id.strip()
-        ),
-        "rpi": bool(settings.rpi.base_url.strip() and settings.rpi.rtsp_port > 0),
-    }
-    if not all(checks.values()):
-        logger.warning("Endpoint ready: status=not_ready checks=%s", checks)
-        raise HTTPException(
-            status_code=503,
-            detail={"status": "not_ready", "checks": checks},
-        )
-    logger.info("Endpoint ready: status=ready checks=%s", checks)
-    return {"status": "ready", "checks": checks}
-
-
 @router.get(
     "/rpi/status",
     tags=["system"],
@@ -362,7 +308,7 @@ def pilot_ui() -> str:
     responses={
         404: {"description": "RPi mission not found"},
         409: {"description": "Another mission is already running"},
-        503: {"description": "Detector or RPi stream unavailable"},
+        503: {"description": "Detector warming up or RPi stream unavailable"},
     },
 )
 def start_mission(payload: MissionStartRequest) -> dict[str, object]:
@@ -381,6 +327,14 @@ def start_mission(payload: MissionStartRequest) -> dict[str, object]:
             status_code=503,
             detail="Detector not available (model not loaded)",
         )
+    warmup = get_detector_warmup()
+    if warmup is not None and warmup.status in (WARMUP_WARMING, WARMUP_FAILED):
+        logger.warning("Endpoint start_mission rejected: detector=%s", warmup.status)
+        raise HTTPException(
+            status_code=503,
+            detail=f"Detector is {warmup.status}; retry when /ready reports ready",
+            headers={"Retry-After": "5"},
+        )
     active_mission = service.get_active_mission()
     if active_mission is not None:
         raise HTTPException(
@@ -954,6 +908,7 @@ def reject_alert(
     summary="Single-frame detection",
     responses={
         404: {"description": "Frame not found in S3"},
+        429: {"description": "Detector overloaded, retry later"},
         502: {"description": "Detection failed"},
         503: {"description": "Detector or storage not available"},
     },
@@ -1014,7 +969,18 @@ def predict(payload: PredictRequest) -> PredictResponse:
     t0 = time.monotonic()
     try:
         detector_any: Any = detector
-        detections: list[Detection] = detector_any.detect(detect_source)
+        detections: list[Detection] = list(detector_any.detect(detect_source))
+    except InferenceRejected as error:
+        logger.warning(
+            "Endpoint predict rejected: source_id_hash=%s reason=%s",
+            source_id_hash,
+            error,
+        )
+        raise HTTPException(
+            status_code=429,
+            detail="Detector overloaded, retry later",
+            headers={"Retry-After": "1"},
+        ) from error
     except Exception as error:
         logger.error(
             "Endpoint predict failed: source_scheme=%s source_path_tail=%s "
@@ -1082,6 +1048,7 @@ def _alert_to_dict(alert: Alert, service: Any) -> dict[str, object]:
         "label": alert.primary_detection.label,
         "model_name": alert.primary_detection.model_name,
         "explanation": alert.primary_detection.explanation,
+        "track_id": alert.primary_detection.track_id,
         "status": alert.status,
         "reviewed_by": alert.reviewed_by,
     }
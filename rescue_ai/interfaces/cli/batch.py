@@ -8,14 +8,20 @@ Invoked one stage at a time by the Airflow DAG.
 from __future__ import annotations
 
 import argparse
+import functools
 import os
 import tempfile
+from dataclasses import replace
 from pathlib import Path
 from typing import Any, Callable
 
+from rescue_ai.application.batch_inference import detect_in_batches
+from rescue_ai.application.inference_timing import detector_score_histogram
 from rescue_ai.application.pipeline_stages import (
+    CandidateModel,
     PipelinePaths,
     print_result,
+    run_candidate_comparison,
     run_evaluate_model_stage,
     run_prepare_dataset_stage,
     run_publish_metrics_stage,
@@ -27,10 +33,10 @@ from rescue_ai.infrastructure.batch_metrics_repository import (
     PostgresBatchMetricsRepository,
 )
 from rescue_ai.infrastructure.contract_loader import load_stream_contract
+from rescue_ai.infrastructure.detector_factory import build_detector
 from rescue_ai.infrastructure.postgres_connection import PostgresDatabase
 from rescue_ai.infrastructure.s3_mission_source import S3MissionSource
 from rescue_ai.infrastructure.stage_store import S3StageStore
-from rescue_ai.infrastructure.yolo_detector import YoloDetector
 
 STAGES = ("prepare_dataset", "evaluate_model", "publish_metrics")
 DEFAULT_BATCH_OUTPUT_SUFFIX = "batch"
@@ -107,6 +113,21 @@ def parse_args() -> argparse.Namespace:
             "(fallback: BATCH_MISSION_IDS_CSV env var)"
         ),
     )
+    parser.add_argument(
+        "--compare-precision",
+        default=None,
+        choices=("int8",),
+        help=(
+            "evaluate_model only: also score the quantized ONNX artifact and "
+            "fail if its recall drops beyond the contract threshold"
+        ),
+    )
+    parser.add_argument(
+        "--max-recall-drop",
+        type=float,
+        default=None,
+        help="Override eval.max_recall_drop from the contract",
+    )
     return parser.parse_args()
 
 
@@ -295,38 +316,78 @@ def _run_evaluate_model(
     store: S3StageStore,
     paths: PipelinePaths,
 ) -> dict[str, object]:
-    _ = (settings, args)
+    _ = settings
     contract = load_stream_contract()
-    detector = YoloDetector(config=contract.inference)
+    detector = build_detector(contract.inference)
     val_tmp = Path(tempfile.mkdtemp(prefix="rescue_ai_eval_"))
-    s3_settings = _build_s3_settings()
-
-    def _detector_predict(image_uri: str) -> bool:
-        if image_uri.startswith("s3://"):
-            import boto3
-
-            path_part = image_uri[5:]
-            bucket, _, key = path_part.partition("/")
-            local_path = val_tmp / Path(key).name
-            if not local_path.exists():
-                client = boto3.client(
-                    "s3",
-                    endpoint_url=s3_settings.endpoint,
-                    region_name=s3_settings.region,
-                    aws_access_key_id=s3_settings.access_key_id,
-                    aws_secret_access_key=s3_settings.secret_access_key,
-                )
-                client.download_file(bucket, key, str(local_path))
-            return bool(detector.detect(str(local_path)))
-        return bool(detector.detect(image_uri))
-
-    return run_evaluate_model_stage(
+    s3_client = functools.cache(_build_s3_client)
+
+    def _resolve_local_source(image_uri: str) -> str:
+        if not image_uri.startswith("s3://"):
+            return image_uri
+        path_part = image_uri[5:]
+        bucket, _, key = path_part.partition("/")
+        local_path = val_tmp / Path(key).name
+        if not local_path.exists():
+            s3_client().download_file(bucket, key, str(local_path))
+        return str(local_path)
+
+    def _predict_batch_with(active_detector) -> Callable[[list[str]], list[bool]]:
+        def _predict(image_uris: list[str]) -> list[bool]:
+            local_sources = [_resolve_local_source(uri) for uri in image_uris]
+            return [
+                bool(items)
+                for items in detect_in_batches(active_detector, local_sources)
+            ]
+
+        return _predict
+
+    result = run_evaluate_model_stage(
+        store,
+        paths,
+        detector_predict_batch=_predict_batch_with(detector),
+        batch_size=contract.inference.batch_size,
+    )
+    result = _with_score_histogram(_with_cache_stats(result, detector), detector)
+    compare_precision = getattr(args, "compare_precision", None)
+    if not compare_precision:
+        return result
+
+    max_recall_drop = getattr(args, "max_recall_drop", None)
+    candidate_detector = build_detector(
+        replace(contract.inference, runtime="onnx", precision=compare_precision)
+    )
+    return run_candidate_comparison(
         store,
         paths,
-        detector_predict=_detector_predict,
+        candidate=CandidateModel(
+            label=f"onnx-{compare_precision}",
+            predict_batch=_predict_batch_with(candidate_detector),
+            max_recall_drop=(
+                contract.max_recall_drop
+                if max_recall_drop is None
+                else float(max_recall_drop)
+            ),
+            batch_size=contract.inference.batch_size,
+        ),
     )
 
 
+def _with_cache_stats(result: dict[str, object], detector) -> dict[str, object]:
+    detector_any: Any = detector
+    cache_stats = getattr(detector_any, "cache_stats", None)
+    if not callable(cache_stats):
+        return result
+    return {**result, "detection_cache": cache_stats()}
+
+
+def _with_score_histogram(result: dict[str, object], detector) -> dict[str, object]:
+    histogram = detector_score_histogram(detector)
+    if histogram is None:
+        return result
+    return {**result, "low_score_histogram": histogram}
+
+
 def _run_publish_metrics(
     _args: argparse.Namespace,
     *,
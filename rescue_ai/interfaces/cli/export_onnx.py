@@ -0,0 +1,100 @@
+"""CLI: export the contract model to ONNX and check parity with PyTorch.
+
+Exports the ``.pt`` weights referenced by ``model_url`` in the stream
+contract, then runs both runtimes over a sample mission (a local frames
+directory or an S3 mission/day) and fails if they disagree on person
+presence more often than ``--min-agreement`` allows.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from dataclasses import replace
+from pathlib import Path
+
+from rescue_ai.application.batch_inference import detect_in_batches
+from rescue_ai.application.detector_parity import ParityReport
+from rescue_ai.application.frame_source import FrameSourceService
+from rescue_ai.infrastructure.contract_loader import load_stream_contract
+from rescue_ai.infrastructure.onnx_detector import OnnxDetector
+from rescue_ai.infrastructure.yolo_detector import YoloDetector
+
+DEFAULT_MAX_FRAMES = 200
+DEFAULT_MIN_AGREEMENT = 0.98
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse exporter CLI arguments."""
+    parser = argparse.ArgumentParser(
+        description="Export the contract YOLO model to ONNX and verify parity"
+    )
+    parser.add_argument("--opset", type=int, default=12)
+    parser.add_argument(
+        "--frames-dir",
+        type=Path,
+        default=None,
+        help="Local directory with sample mission frames",
+    )
+    parser.add_argument(
+        "--mission-id",
+        default=None,
+        help="S3 mission ID to use as parity sample (requires --ds)",
+    )
+    parser.add_argument("--ds", default=None, help="S3 partition date YYYY-MM-DD")
+    parser.add_argument("--max-frames", type=int, default=DEFAULT_MAX_FRAMES)
+    parser.add_argument(
+        "--min-agreement",
+        type=float,
+        default=DEFAULT_MIN_AGREEMENT,
+        help="Minimum share of frames with identical person presence",
+    )
+    parser.add_argument("--skip-parity", action="store_true")
+    return parser.parse_args()
+
+
+def _sample_frames(args: argparse.Namespace) -> list[Path]:
+    if args.frames_dir is not None:
+        frames = FrameSourceService().list_frame_files(args.frames_dir)
+    elif args.mission_id and args.ds:
+        from rescue_ai.interfaces.cli.batch import build_source
+
+        mission = build_source().load(mission_id=args.mission_id, ds=args.ds)
+        frames = [
+            frame.frame_path for frame in mission.frames if not frame.is_corrupted
+        ]
+    else:
+        raise ValueError("Parity check needs --frames-dir or --mission-id with --ds")
+    if not frames:
+        raise ValueError("Parity sample contains no frames")
+    return frames[: max(1, args.max_frames)]
+
+
+def main() -> None:
+    """Export the model and compare ONNX against the PyTorch reference."""
+    args = parse_args()
+    inference = load_stream_contract().inference
+    reference = YoloDetector(config=replace(inference, runtime="torch"))
+    onnx_path = reference.export_onnx(opset=args.opset)
+    summary: dict[str, object] = {"onnx_path": str(onnx_path)}
+
+    if not args.skip_parity:
+        frames = _sample_frames(args)
+        candidate = OnnxDetector(config=replace(inference, runtime="onnx"))
+        report = ParityReport()
+        for frame, ref_dets, cand_dets in zip(
+            frames,
+            detect_in_batches(reference, frames),
+            detect_in_batches(candidate, frames),
+        ):
+            report.add_frame(frame.name, ref_dets, cand_dets)
+        summary["parity"] = report.as_dict()
+        summary["parity_passed"] = report.presence_agreement >= args.min_agreement
+
+    print(json.dumps(summary, ensure_ascii=False, indent=2))
+    if summary.get("parity_passed") is False:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
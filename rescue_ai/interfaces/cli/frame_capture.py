@@ -0,0 +1,143 @@
+"""Blocking frame capture from the RPi: RTSP via OpenCV, or HTTP MJPEG/JPEG."""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import Iterator
+from contextlib import suppress
+
+import httpx
+
+from rescue_ai.infrastructure.mjpeg_parser import MjpegParser
+
+logger = logging.getLogger(__name__)
+
+
+class FrameCapture:
+    """Base interface for frame capture backends."""
+
+    def read_frame(self) -> object | None:
+        raise NotImplementedError
+
+    def is_open(self) -> bool:
+        raise NotImplementedError
+
+    def release(self) -> None:
+        pass
+
+
+class HttpFrameCapture(FrameCapture):
+    """Capture frames via RPi HTTP streaming endpoint (MJPEG or JPEG-per-request)."""
+
+    def __init__(self, stream_url: str) -> None:
+        self._url = stream_url
+        self._client: httpx.Client | None = None
+        self._response: httpx.Response | None = None
+        self._stream_iter: Iterator[bytes] | None = None
+        self._parser = MjpegParser()
+        self._ok = False
+        try:
+            # Try to connect with streaming to detect MJPEG
+            self._client = httpx.Client(timeout=10.0)
+            resp = self._client.send(
+                self._client.build_request("GET", self._url),
+                stream=True,
+            )
+            content_type = resp.headers.get("content-type", "")
+            if "multipart" in content_type or "image" in content_type:
+                self._response = resp
+                self._content_type = content_type
+                self._parser = MjpegParser.from_content_type(content_type)
+                self._ok = True
+                self._stream_iter = resp.iter_bytes(chunk_size=16384)
+            else:
+                # Not a stream — try frame-by-frame polling
+                resp.close()
+                self._response = None
+                self._content_type = ""
+                self._ok = True
+                self._stream_iter = None
+        except (httpx.HTTPError, RuntimeError, ValueError) as err:
+            logger.warning("HTTP stream connect failed: %s", type(err).__name__)
+            self._ok = False
+
+    def is_open(self) -> bool:
+        return self._ok
+
+    def read_frame(self) -> bytes | None:
+        """Read one JPEG frame from the HTTP stream."""
+        try:
+            if self._stream_iter is not None:
+                return self._read_mjpeg_frame()
+            return self._read_single_frame()
+        except (httpx.HTTPError, RuntimeError, ValueError) as err:
+            logger.warning("HTTP frame read error: %s", type(err).__name__)
+            return None
+
+    def _read_mjpeg_frame(self) -> bytes | None:
+        """Parse JPEG frames from multipart MJPEG stream."""
+        stream_iter = self._stream_iter
+        if stream_iter is None:
+            return None
+        while True:
+            # One chunk may carry several frames: drain them first.
+            frame = self._parser.next_frame()
+            if frame is not None:
+                return frame
+            try:
+                chunk = next(stream_iter)
+            except StopIteration:
+                return None
+            self._parser.feed(chunk)
+
+    def _read_single_frame(self) -> bytes | None:
+        """Poll a single JPEG frame from the HTTP endpoint."""
+        if self._client is None:
+            return None
+        resp = self._client.get(self._url, timeout=2.0)
+        if resp.status_code == 200 and resp.content:
+            return resp.content
+        return None
+
+    def release(self) -> None:
+        if self._response is not None:
+            with suppress(Exception):
+                self._response.close()
+        if self._client is not None:
+            with suppress(Exception):
+                self._client.close()
+
+
+class RtspFrameCapture(FrameCapture):
+    """Capture frames via RTSP using OpenCV."""
+
+    def __init__(self, rtsp_url: str) -> None:
+        import os
+
+        self._cap = None
+        self._cv2 = None
+        os.environ["OPENCV_FFMPEG_CAPTURE_OPTIONS"] = "rtsp_transport;tcp"
+        try:
+            import cv2
+
+            self._cv2 = cv2
+            self._cap = cv2.VideoCapture(rtsp_url, cv2.CAP_FFMPEG)
+            if not self._cap.isOpened():
+                time.sleep(2.0)
+                self._cap = cv2.VideoCapture(rtsp_url, cv2.CAP_FFMPEG)
+        except ImportError:
+            pass
+
+    def is_open(self) -> bool:
+        return self._cap is not None and self._cap.isOpened()
+
+    def read_frame(self) -> object | None:
+        if self._cap is None:
+            return None
+        ret, frame = self._cap.read()
+        return frame if ret else None
+
+    def release(self) -> None:
+        if self._cap is not None:
+            self._cap.release()
@@ -1,7 +1,5 @@
 """Online API server entry point."""
 
-# pylint: disable=too-many-lines
-
 from __future__ import annotations
 
 import logging
@@ -9,12 +7,11 @@ import re
 import tempfile
 import threading
 import time
-from collections.abc import Callable, Iterator
+from collections.abc import Callable
 from contextlib import suppress
 from copy import deepcopy
-from dataclasses import asdict, dataclass
+from dataclasses import asdict
 from datetime import datetime, timezone
-from importlib import import_module
 from pathlib import Path
 from typing import Any
 
@@ -22,9 +19,21 @@ import httpx
 import uvicorn
 from uvicorn.config import LOGGING_CONFIG as UVICORN_LOGGING_CONFIG
 
+from rescue_ai.application.batch_inference import close_detector
+from rescue_ai.application.detector_warmup import DetectorWarmup
+from rescue_ai.application.inference_config import InferenceConfig, PipelineConfig
+from rescue_ai.application.inference_scheduler import (
+    PRIORITY_PREDICT,
+    PRIORITY_STREAM,
+    InferenceScheduler,
+    ScheduledDetector,
+)
+from rescue_ai.application.inference_timing import detector_stage_timings
+from rescue_ai.application.model_swap import ModelSwapService, SwappableDetector
 from rescue_ai.application.pilot_service import PilotService
+from rescue_ai.application.resolution_control import ResolutionController
+from rescue_ai.application.session_monitor import SessionMonitor, SessionSnapshot
 from rescue_ai.config import Settings, get_settings
-from rescue_ai.domain.entities import Detection, FrameEvent
 from rescue_ai.domain.ports import AlertRepository, ArtifactStorage
 from rescue_ai.domain.ports import DetectorPort as DomainDetectorPort
 from rescue_ai.domain.ports import (
@@ -33,10 +42,32 @@ from rescue_ai.domain.ports import (
     ReportMetadataPayload,
 )
 from rescue_ai.infrastructure.artifact_storage import build_s3_storage
+from rescue_ai.infrastructure.box_tracker import KeyframeTracker
 from rescue_ai.infrastructure.contract_loader import load_stream_contract
+from rescue_ai.infrastructure.frame_ring import FrameRingBuffer
+from rescue_ai.infrastructure.mission_annotations import MissionAnnotations
+from rescue_ai.infrastructure.motion_gate import MotionGate
 from rescue_ai.infrastructure.postgres_connection import wait_for_postgres
 from rescue_ai.infrastructure.rpi_client import RpiClient
 from rescue_ai.interfaces.api.dependencies import ApiRuntime, set_runtime
+from rescue_ai.interfaces.cli.frame_capture import (
+    FrameCapture,
+    HttpFrameCapture,
+    RtspFrameCapture,
+)
+from rescue_ai.interfaces.cli.stream_pipeline import (
+    FrameStages,
+    SharedStreamPipeline,
+    StreamHooks,
+)
+from rescue_ai.interfaces.cli.stream_state import (
+    GtTracker,
+    LoopContext,
+    RpiStreamState,
+    StreamInputs,
+    frame_ring_capacity,
+    log_pipeline_started,
+)
 
 logger = logging.getLogger(__name__)
 _URL_RE = re.compile(r"\b(?:https?|rtsp)://[^\s\"')]+", re.IGNORECASE)
@@ -54,6 +85,7 @@ _STREAM_STATS_PUBLIC_FIELDS = {
     "backend",
     "publisher_running",
 }
+_RPI_CHECK_INTERVAL_SEC = 3.0
 
 
 def _sanitize_text(text: str) -> str:
@@ -70,216 +102,20 @@ def _sanitize_public_payload(value: Any) -> Any:
     return value
 
 
-@dataclass
-class RpiStreamState:
-    """RPi streaming session state bound to one mission."""
-
-    mission_id: str
-    rpi_mission_id: str
-    session_id: str
-    rtsp_url: str
-    stream_url: str
-    target_fps: float
-    running: bool
-    started_at: str
-    processed_frames: int = 0
-    alerts_created: int = 0
-    ingest_failures: int = 0
-    detection_failures: int = 0
-    capture_backend: str | None = None
-    gt_sequence_total: int | None = None
-    source_frames_total: int | None = None
-    read_failures: int = 0
-    end_reason: str | None = None
-    last_stats: dict[str, object] | None = None
-    error: str | None = None
-
-
-@dataclass
-class _GtTracker:
-    sequence: list[bool] | None
-    episode_id: int = 0
-    prev_present: bool = False
-
-    def evaluate(self, frame_id: int) -> tuple[bool, str | None]:
-        gt_present = bool(
-            self.sequence is not None
-            and frame_id < len(self.sequence)
-            and self.sequence[frame_id]
-        )
-        if gt_present and not self.prev_present:
-            self.episode_id += 1
-        self.prev_present = gt_present
-        return gt_present, (f"ep-{self.episode_id}" if gt_present else None)
-
-
-@dataclass
-class _LoopContext:
-    mission_id: str
-    state: RpiStreamState
-    stop_event: threading.Event
-    target_fps: float
-    frame_interval: float
-    gt_tracker: _GtTracker
-    source_filenames: list[str] | None
-    capture: _FrameCapture
-    tmp_dir: Path
-    frame_id: int = 0
-    consecutive_read_failures: int = 0
-    last_rpi_check: float = 0.0
-
-
-class _FrameCapture:
-    """Base interface for frame capture backends."""
-
-    def read_frame(self) -> object | None:
-        raise NotImplementedError
-
-    def is_open(self) -> bool:
-        raise NotImplementedError
-
-    def release(self) -> None:
-        pass
-
-
-class _HttpFrameCapture(_FrameCapture):
-    """Capture frames via RPi HTTP streaming endpoint (MJPEG or JPEG-per-request)."""
-
-    def __init__(self, stream_url: str) -> None:
-        self._url = stream_url
-        self._client: httpx.Client | None = None
-        self._response: httpx.Response | None = None
-        self._stream_iter: Iterator[bytes] | None = None
-        self._buffer = b""
-        self._ok = False
-        try:
-            # Try to connect with streaming to detect MJPEG
-            self._client = httpx.Client(timeout=10.0)
-            resp = self._client.send(
-                self._client.build_request("GET", self._url),
-                stream=True,
-            )
-            content_type = resp.headers.get("content-type", "")
-            if "multipart" in content_type or "image" in content_type:
-                self._response = resp
-                self._content_type = content_type
-                self._ok = True
-                self._stream_iter = resp.iter_bytes(chunk_size=16384)
-            else:
-                # Not a stream — try frame-by-frame polling
-                resp.close()
-                self._response = None
-                self._content_type = ""
-                self._ok = True
-                self._stream_iter = None
-        except (httpx.HTTPError, RuntimeError, ValueError) as err:
-            logger.warning("HTTP stream connect failed: %s", type(err).__name__)
-            self._ok = False
-
-    def is_open(self) -> bool:
-        return self._ok
-
-    def read_frame(self) -> bytes | None:
-        """Read one JPEG frame from the HTTP stream."""
-        try:
-            if self._stream_iter is not None:
-                return self._read_mjpeg_frame()
-            return self._read_single_frame()
-        except (httpx.HTTPError, RuntimeError, ValueError) as err:
-            logger.warning("HTTP frame read error: %s", type(err).__name__)
-            return None
-
-    def _read_mjpeg_frame(self) -> bytes | None:
-        """Parse JPEG frames from multipart MJPEG stream."""
-        stream_iter = self._stream_iter
-        if stream_iter is None:
-            return None
-        while True:
-            try:
-                chunk = next(stream_iter)
-            except StopIteration:
-                return None
-            self._buffer += chunk
-
-            # Find JPEG boundaries
-            start = self._buffer.find(b"\xff\xd8")
-            if start == -1:
-                # No JPEG start yet, keep only last 2 bytes
-                self._buffer = self._buffer[-2:]
-                continue
-            end = self._buffer.find(b"\xff\xd9", start + 2)
-            if end == -1:
-                continue
-
-            # Extract complete JPEG
-            end_idx = end + 2
-            jpeg = self._buffer[start:end_idx]
-            self._buffer = self._buffer[end_idx:]
-            return jpeg
-
-    def _read_single_frame(self) -> bytes | None:
-        """Poll a single JPEG frame from the HTTP endpoint."""
-        if self._client is None:
-            return None
-        resp = self._client.get(self._url, timeout=2.0)
-        if resp.status_code == 200 and resp.content:
-            return resp.content
-        return None
-
-    def release(self) -> None:
-        if self._response is not None:
-            with suppress(Exception):
-                self._response.close()
-        if self._client is not None:
-            with suppress(Exception):
-                self._client.close()
-
-
-class _RtspFrameCapture(_FrameCapture):
-    """Capture frames via RTSP using OpenCV."""
-
-    def __init__(self, rtsp_url: str) -> None:
-        import os
-
-        self._cap = None
-        self._cv2 = None
-        os.environ["OPENCV_FFMPEG_CAPTURE_OPTIONS"] = "rtsp_transport;tcp"
-        try:
-            import cv2
-
-            self._cv2 = cv2
-            self._cap = cv2.VideoCapture(rtsp_url, cv2.CAP_FFMPEG)
-            if not self._cap.isOpened():
-                time.sleep(2.0)
-                self._cap = cv2.VideoCapture(rtsp_url, cv2.CAP_FFMPEG)
-        except ImportError:
-            pass
-
-    def is_open(self) -> bool:
-        return self._cap is not None and self._cap.isOpened()
-
-    def read_frame(self) -> object | None:
-        if self._cap is None:
-            return None
-        ret, frame = self._cap.read()
-        return frame if ret else None
-
-    def release(self) -> None:
-        if self._cap is not None:
-            self._cap.release()
-
-
 class DetectionStreamController:
     """Controls RPi streaming + server-side YOLO detection pipeline.
 
     On ``start()`` the controller:
     1. Tells RPi to begin an RTSP stream for the chosen mission.
-    2. Spawns a background thread that captures frames from the RTSP URL
-       via OpenCV, runs YoloDetector on each frame, and calls
-       ``PilotService.ingest_frame_event`` which creates alerts.
-
-    On ``stop()`` it signals the background thread to exit and tells RPi
-    to stop the stream.
+    2. Captures frames from the RTSP (or HTTP) URL, runs the detector on
+       each frame, and calls ``PilotService.ingest_frame_event`` which
+       creates alerts. With ``infer.pipeline`` enabled, capture runs on
+       the shared asyncio ``CaptureHub`` and detection and ingest on the
+       shared ``StreamWorkerPool``; otherwise each stream gets a
+       background thread running the serial loop.
+
+    On ``stop()`` it cancels the capture, waits for the stream to finish
+    and tells RPi to stop the stream.
     """
 
     def __init__(
@@ -287,13 +123,22 @@ class DetectionStreamController:
         settings: Settings,
         pilot_service: PilotService | None = None,
         detector: DomainDetectorPort | None = None,
+        inference: InferenceConfig | None = None,
     ) -> None:
         self._rpi_settings = settings.rpi
         self._sessions: dict[str, RpiStreamState] = {}
         self._stop_events: dict[str, threading.Event] = {}
         self._threads: dict[str, threading.Thread] = {}
+        self._pipeline: SharedStreamPipeline | None = None
+        self._shared_lock = threading.Lock()
+        self._rpi_client: RpiClient | None = None
+        self._monitor: SessionMonitor | None = None
         self._pilot_service = pilot_service
         self._detector = detector
+        self._inference = inference
+        self._stages = FrameStages(
+            pilot_service=pilot_service, detector=detector, inference=inference
+        )
 
     def start(
         self,
@@ -322,6 +167,7 @@ class DetectionStreamController:
             started_at=datetime.now(timezone.utc).isoformat(),
         )
         self._sessions[mission_id] = state
+        self._session_monitor().watch(state.session_id)
         logger.info(
             "Stream started: mission=%s rpi_mission=%s fps=%.1f",
             mission_id[:8],
@@ -340,6 +186,10 @@ class DetectionStreamController:
         # Launch background detection pipeline
         stop_event = threading.Event()
         self._stop_events[mission_id] = stop_event
+        pipeline = self._inference.pipeline if self._inference is not None else None
+        if pipeline is not None:
+            self._shared_pipeline(pipeline).start(state, stop_event)
+            return state
         thread = threading.Thread(
             target=self._detection_loop,
             args=(mission_id, state, stop_event),
@@ -363,10 +213,12 @@ class DetectionStreamController:
                 state.end_reason = "stop_requested"
             stop_event.set()
 
-        # Wait for thread to finish (with timeout)
+        # Wait for the stream to finish (with timeout)
         thread = self._threads.get(mission_id)
         if thread is not None and thread.is_alive():
             thread.join(timeout=5.0)
+        if self._pipeline is not None:
+            self._pipeline.stop(mission_id, timeout_sec=5.0)
 
         if state.running:
             try:
@@ -377,6 +229,7 @@ class DetectionStreamController:
                 state.error = f"{type(error).__name__}: {error}"
 
         state.running = False
+        self._session_monitor().unwatch(state.session_id)
         if state.end_reason is None:
             state.end_reason = "stop_requested"
         logger.info(
@@ -397,22 +250,19 @@ class DetectionStreamController:
         if not state.running:
             return state
 
-        try:
-            stats = self._client().session_stats(
-                state.session_id, timeout_sec=self._rpi_settings.timeout_sec
-            )
-            state.last_stats = stats
-            total_source_frames = stats.get("total_source_frames")
-            if isinstance(total_source_frames, int) and total_source_frames > 0:
-                state.source_frames_total = total_source_frames
-        except (ValueError, RuntimeError, OSError) as error:
-            state.error = f"{type(error).__name__}: {error}"
+        # Status polls read the monitor's cache and never call the Pi.
+        snapshot = self._session_monitor().snapshot(state.session_id)
+        if snapshot is not None:
+            self._apply_session_snapshot(state, snapshot)
+            if snapshot.error is not None:
+                state.error = snapshot.error
         return state
 
     def as_payload(self, mission_id: str) -> dict[str, object] | None:
         state = self.get_state(mission_id)
         if state is None:
             return None
+        state.stage_timings = detector_stage_timings(self._detector)
         payload = asdict(state)
         payload.pop("session_id", None)
         payload.pop("rtsp_url", None)
@@ -436,8 +286,68 @@ class DetectionStreamController:
             for mission in catalog.missions
         ]
 
+    def close(self) -> None:
+        """Shut down streams, the detector stack and its scheduler, then RPi I/O."""
+        with self._shared_lock:
+            pipeline, self._pipeline = self._pipeline, None
+            monitor, self._monitor = self._monitor, None
+            rpi_client, self._rpi_client = self._rpi_client, None
+        if pipeline is not None:
+            pipeline.close()
+        # Stops detector pool processes; closing twice is harmless.
+        if isinstance(self._detector, ScheduledDetector):
+            self._detector.scheduler.close()
+        close_detector(self._detector)
+        if monitor is not None:
+            monitor.close()
+        if rpi_client is not None:
+            rpi_client.close()
+
     def _client(self) -> RpiClient:
-        return RpiClient(self._rpi_settings)
+        """Return the keep-alive client shared by streams and API routes."""
+        with self._shared_lock:
+            if self._rpi_client is None:
+                self._rpi_client = RpiClient(self._rpi_settings)
+            return self._rpi_client
+
+    def _session_monitor(self) -> SessionMonitor:
+        """Return the monitor polling session stats for loops and status routes."""
+        with self._shared_lock:
+            if self._monitor is None:
+                self._monitor = SessionMonitor(
+                    self._fetch_session_stats, interval_sec=_RPI_CHECK_INTERVAL_SEC
+                )
+            return self._monitor
+
+    def _fetch_session_stats(self, session_id: str) -> dict[str, object]:
+        return self._client().session_stats(
+            session_id, timeout_sec=self._rpi_settings.timeout_sec
+        )
+
+    def _shared_pipeline(self, config: PipelineConfig) -> SharedStreamPipeline:
+        """Start the capture loop and stream workers on first use."""
+        with self._shared_lock:
+            if self._pipeline is None:
+                self._pipeline = SharedStreamPipeline(
+                    config,
+                    stages=self._stages,
+                    hooks=StreamHooks(
+                        load_inputs=self._load_stream_inputs,
+                        new_context=lambda state, stop_event, inputs: (
+                            self._new_loop_context(
+                                state=state,
+                                stop_event=stop_event,
+                                target_fps=state.target_fps,
+                                inputs=inputs,
+                            )
+                        ),
+                        capture_open_failed=self._mark_capture_open_failed,
+                        should_stop=self._should_stop_before_read,
+                        source_finished=self._source_finished_after_read_failures,
+                        finish=self._finish_detection,
+                    ),
+                )
+            return self._pipeline
 
     # ── Background RTSP → YOLO → ingest pipeline ──────────────────
 
@@ -464,16 +374,7 @@ class DetectionStreamController:
         if ctx is None:
             return
 
-        logger.info(
-            "Detection pipeline started: mission=%s rpi_mission=%s "
-            "backend=%s target_fps=%.1f gt_frames=%s",
-            mission_id[:8],
-            state.rpi_mission_id,
-            state.capture_backend,
-            state.target_fps,
-            state.gt_sequence_total,
-        )
-
+        log_pipeline_started(ctx)
         try:
             while not stop_event.is_set():
                 if not self._run_detection_iteration(ctx):
@@ -484,23 +385,12 @@ class DetectionStreamController:
             state.end_reason = "loop_exception"
             logger.exception("Detection loop crashed: %s", loop_err)
         finally:
-            with suppress(Exception):
-                ctx.capture.release()
-            state.running = False
-            if state.end_reason is None and state.error is None:
-                state.end_reason = "source_finished"
-            self._finalize_mission_after_stream_end(ctx)
-            for f in ctx.tmp_dir.glob("*.jpg"):
-                f.unlink(missing_ok=True)
-            ctx.tmp_dir.rmdir()
-            logger.info(
-                "Detection loop finished: mission=%s frames=%d alerts=%d",
-                mission_id,
-                ctx.frame_id,
-                state.alerts_created,
-            )
+            if ctx.capture is not None:
+                with suppress(Exception):
+                    ctx.capture.release()
+            self._finish_detection(ctx)
 
-    def _run_detection_iteration(self, ctx: _LoopContext) -> bool:
+    def _run_detection_iteration(self, ctx: LoopContext) -> bool:
         if self._should_stop_before_read(ctx):
             return False
 
@@ -511,49 +401,60 @@ class DetectionStreamController:
         if frame is None:
             return True
 
+        ctx.state.captured_frames += 1
+        processing_started_at = time.monotonic()
         self._process_frame(ctx, frame)
-        self._cleanup_previous_frame(ctx)
+        FrameStages.adapt_resolution(ctx, time.monotonic() - processing_started_at)
         self._throttle_after_processing(ctx, started_at)
         return True
 
-    def _should_stop_before_read(self, ctx: _LoopContext) -> bool:
-        now = time.monotonic()
-        if now - ctx.last_rpi_check >= 3.0:
-            ctx.last_rpi_check = now
-            if self._stream_finished_on_rpi(ctx.state):
-                ctx.state.end_reason = "source_finished"
-                return True
+    def _finish_detection(self, ctx: LoopContext) -> None:
+        """Record how the stream ended, finalize the mission, clean up."""
+        state = ctx.state
+        state.running = False
+        self._session_monitor().unwatch(state.session_id)
+        if state.end_reason is None and state.error is None:
+            state.end_reason = "source_finished"
+        self._finalize_mission_after_stream_end(ctx)
+        for f in ctx.tmp_dir.glob("*.jpg"):
+            f.unlink(missing_ok=True)
+        ctx.tmp_dir.rmdir()
+        logger.info(
+            "Detection loop finished: mission=%s frames=%d alerts=%d",
+            ctx.mission_id,
+            state.processed_frames,
+            state.alerts_created,
+        )
 
-        total = ctx.state.source_frames_total
-        if total is not None and ctx.frame_id >= total:
+    def _should_stop_before_read(self, ctx: LoopContext) -> bool:
+        # A cache read: the session monitor talks to the Pi.
+        if self._stream_finished_on_rpi(ctx.state):
             ctx.state.end_reason = "source_finished"
             return True
-        return False
+        return self._source_exhausted(ctx)
 
     @staticmethod
-    def _cleanup_previous_frame(ctx: _LoopContext) -> None:
-        # Keep only the latest processed frame to reduce disk churn.
-        if ctx.frame_id <= 1:
-            return
-        prev = ctx.tmp_dir / f"frame_{ctx.frame_id - 2:06d}.jpg"
-        prev.unlink(missing_ok=True)
+    def _source_exhausted(ctx: LoopContext) -> bool:
+        total = ctx.state.source_frames_total
+        if total is not None and ctx.state.captured_frames >= total:
+            ctx.state.end_reason = "source_finished"
+            return True
+        return False
 
     @staticmethod
-    def _throttle_after_processing(ctx: _LoopContext, started_at: float) -> None:
+    def _throttle_after_processing(ctx: LoopContext, started_at: float) -> None:
         elapsed = time.monotonic() - started_at
         sleep_time = ctx.frame_interval - elapsed
         if sleep_time > 0:
             ctx.stop_event.wait(timeout=sleep_time)
 
-    def _finalize_mission_after_stream_end(self, ctx: _LoopContext) -> None:
+    def _finalize_mission_after_stream_end(self, ctx: LoopContext) -> None:
         """Try to auto-complete mission when source naturally finished."""
         if self._pilot_service is None:
             return
         if ctx.state.end_reason != "source_finished":
             return
-        completed_frame_id: int | None = (
-            ctx.state.processed_frames - 1 if ctx.state.processed_frames > 0 else None
-        )
+        completed_frame_id = ctx.last_frame_id
         try:
             self._pilot_service.complete_mission(
                 mission_id=ctx.mission_id,
@@ -590,17 +491,36 @@ class DetectionStreamController:
         state: RpiStreamState,
         stop_event: threading.Event,
         target_fps: float,
-    ) -> _LoopContext | None:
-        frame_interval = 1.0 / target_fps if target_fps > 0 else 0.5
-        gt_sequence = self._load_gt_sequence(state.rpi_mission_id)
+    ) -> LoopContext | None:
+        inputs = self._load_stream_inputs(mission_id, state)
+        capture = self._open_capture(state)
+        if capture is None:
+            self._mark_capture_open_failed(state)
+            return None
+        state.capture_backend = (
+            "rtsp" if isinstance(capture, RtspFrameCapture) else "http"
+        )
+        ctx = self._new_loop_context(
+            state=state, stop_event=stop_event, target_fps=target_fps, inputs=inputs
+        )
+        ctx.capture = capture
+        return ctx
+
+    def _load_stream_inputs(
+        self, mission_id: str, state: RpiStreamState
+    ) -> StreamInputs:
+        """Load GT and annotations from the RPi; persist the annotations."""
+        annotations = self._load_mission_annotations(state.rpi_mission_id)
+        if annotations is None:
+            state.gt_sequence_total = None
+            return StreamInputs(gt_sequence=None, source_filenames=None)
+        gt_sequence = annotations.gt_sequence
         state.gt_sequence_total = len(gt_sequence) if gt_sequence is not None else None
-        annotations_payload = self._load_annotations_payload(state.rpi_mission_id)
-        source_filenames = self._extract_source_filenames(annotations_payload)
-        if annotations_payload and self._pilot_service is not None:
+        if annotations.payload and self._pilot_service is not None:
             try:
                 self._pilot_service.save_mission_annotations(
                     mission_id=mission_id,
-                    payload=annotations_payload,
+                    payload=annotations.payload,
                 )
             except (ValueError, RuntimeError, OSError, TypeError) as error:
                 logger.warning(
@@ -609,32 +529,73 @@ class DetectionStreamController:
                     type(error).__name__,
                     error,
                 )
-        capture = self._open_capture(state)
-        if capture is None:
-            state.error = "Cannot open stream (tried HTTP and RTSP)"
-            state.end_reason = "capture_open_failed"
-            state.running = False
-            return None
-        state.capture_backend = (
-            "rtsp" if isinstance(capture, _RtspFrameCapture) else "http"
+        return StreamInputs(
+            gt_sequence=gt_sequence,
+            source_filenames=annotations.source_filenames,
         )
-        return _LoopContext(
-            mission_id=mission_id,
+
+    def _mark_capture_open_failed(self, state: RpiStreamState) -> None:
+        state.error = "Cannot open stream (tried HTTP and RTSP)"
+        state.end_reason = "capture_open_failed"
+        state.running = False
+        # _finish_detection never runs for this session, so unwatch it here.
+        self._session_monitor().unwatch(state.session_id)
+
+    def _new_loop_context(
+        self,
+        *,
+        state: RpiStreamState,
+        stop_event: threading.Event,
+        target_fps: float,
+        inputs: StreamInputs,
+    ) -> LoopContext:
+        motion_gate, tracker = self._build_frame_gates()
+        pipeline = self._inference.pipeline if self._inference is not None else None
+        return LoopContext(
+            mission_id=state.mission_id,
             state=state,
             stop_event=stop_event,
             target_fps=target_fps,
-            frame_interval=frame_interval,
-            gt_tracker=_GtTracker(sequence=gt_sequence),
-            source_filenames=source_filenames,
-            capture=capture,
+            frame_interval=1.0 / target_fps if target_fps > 0 else 0.5,
+            gt_tracker=GtTracker(sequence=inputs.gt_sequence),
+            source_filenames=inputs.source_filenames,
+            # Only used by detectors that cannot read in-memory frames.
             tmp_dir=Path(tempfile.mkdtemp(prefix="rescue_frames_")),
+            rpi_finished=self._session_monitor().watch(state.session_id),
+            motion_gate=motion_gate,
+            tracker=tracker,
+            resolution=self._build_resolution_controller(state),
+            frames=FrameRingBuffer(frame_ring_capacity(pipeline)),
+        )
+
+    def _build_frame_gates(self) -> tuple[MotionGate | None, KeyframeTracker | None]:
+        """Create the per-stream motion gate and tracker enabled in the contract."""
+        inference = self._inference
+        if inference is None:
+            return None, None
+        return (
+            MotionGate(inference.motion_gate) if inference.motion_gate else None,
+            KeyframeTracker(inference.tracker) if inference.tracker else None,
         )
 
+    def _build_resolution_controller(
+        self, state: RpiStreamState
+    ) -> ResolutionController | None:
+        """Create the per-stream ``imgsz`` controller enabled in the contract."""
+        inference = self._inference
+        adaptive = inference.adaptive_imgsz if inference is not None else None
+        if inference is None or adaptive is None:
+            return None
+        resolution = ResolutionController(adaptive, initial_imgsz=inference.imgsz)
+        state.imgsz = resolution.imgsz
+        return resolution
+
     def _read_frame_with_recovery(
         self,
-        ctx: _LoopContext,
+        ctx: LoopContext,
     ) -> tuple[object | None, bool]:
-        frame = ctx.capture.read_frame()
+        capture = ctx.capture
+        frame = capture.read_frame() if capture is not None else None
         if frame is not None:
             ctx.state.read_failures = 0
             ctx.consecutive_read_failures = 0
@@ -650,22 +611,17 @@ class DetectionStreamController:
             switched = self._try_switch_to_http(ctx)
             if switched:
                 return None, False
-            if self._stream_finished_on_rpi(ctx.state):
-                ctx.state.end_reason = "source_finished"
-                logger.info(
-                    "RPi stream finished mission=%s after %d read failures",
-                    ctx.mission_id,
-                    ctx.consecutive_read_failures,
-                )
+            if self._source_finished_after_read_failures(ctx):
                 return None, True
 
-        retry_delay = 0.15 if isinstance(ctx.capture, _HttpFrameCapture) else 1.0
+        retry_delay = 0.15 if isinstance(ctx.capture, HttpFrameCapture) else 1.0
         logger.warning("Frame read failed, retrying in %.2fs...", retry_delay)
-        time.sleep(retry_delay)
+        # Cut short when the monitor sees the Pi finish the stream.
+        ctx.rpi_finished.wait(timeout=retry_delay)
         return None, False
 
-    def _try_switch_to_http(self, ctx: _LoopContext) -> bool:
-        if not isinstance(ctx.capture, _RtspFrameCapture):
+    def _try_switch_to_http(self, ctx: LoopContext) -> bool:
+        if not isinstance(ctx.capture, RtspFrameCapture):
             return False
         switched = self._switch_capture_to_http(
             current_capture=ctx.capture,
@@ -678,193 +634,60 @@ class DetectionStreamController:
         ctx.state.read_failures = 0
         return True
 
-    def _process_frame(self, ctx: _LoopContext, frame: object) -> None:
-        frame_path = ctx.tmp_dir / self._resolve_frame_filename(ctx)
-        self._save_frame(frame, frame_path)
-        ts_sec = (
-            ctx.frame_id / ctx.target_fps if ctx.target_fps > 0 else ctx.frame_id * 0.5
-        )
-        gt_present, gt_episode_id = ctx.gt_tracker.evaluate(ctx.frame_id)
-
-        t0 = time.monotonic()
-        detections = self._detect_frame_or_empty(
-            frame=frame,
-            frame_path=frame_path,
-            frame_id=ctx.frame_id,
-            state=ctx.state,
-        )
-        inference_ms = (time.monotonic() - t0) * 1000
-
-        frame_event = FrameEvent(
-            mission_id=ctx.mission_id,
-            frame_id=ctx.frame_id,
-            ts_sec=ts_sec,
-            image_uri=str(frame_path),
-            gt_person_present=gt_present,
-            gt_episode_id=gt_episode_id,
-        )
-        alerts_before = ctx.state.alerts_created
-        self._ingest_event(ctx=ctx, frame_event=frame_event, detections=detections)
-        alerts_new = ctx.state.alerts_created - alerts_before
+    def _process_frame(self, ctx: LoopContext, frame: object) -> None:
+        self._stages.ingest(ctx, self._stages.detect(ctx, frame))
+        ctx.frame_id += 1
 
-        top_score = max((d.score for d in detections), default=0.0)
+    def _source_finished_after_read_failures(self, ctx: LoopContext) -> bool:
+        """Poll the Pi now; ``True`` if it ended the stream that stopped reading."""
+        self._session_monitor().poll_soon(ctx.state.session_id)
+        if not self._stream_finished_on_rpi(ctx.state):
+            return False
+        ctx.state.end_reason = "source_finished"
         logger.info(
-            "Frame processed: mission=%s frame=%d/%s ts=%.2fs "
-            "detections=%d top_score=%.3f inference_ms=%.1f alerts_created=%d",
-            ctx.mission_id[:8],
-            ctx.frame_id,
-            ctx.state.source_frames_total or "?",
-            ts_sec,
-            len(detections),
-            top_score,
-            inference_ms,
-            alerts_new,
+            "RPi stream finished mission=%s after %d read failures",
+            ctx.mission_id,
+            ctx.consecutive_read_failures,
         )
-        for d in detections:
-            logger.info(
-                "  Detected: label=%s score=%.3f "
-                "bbox=[%.1f,%.1f,%.1f,%.1f] model=%s",
-                d.label,
-                d.score,
-                *d.bbox,
-                d.model_name,
-            )
-        ctx.frame_id += 1
-        ctx.state.processed_frames = ctx.frame_id
+        return True
 
-    @staticmethod
-    def _resolve_frame_filename(ctx: _LoopContext) -> str:
-        source_filenames = ctx.source_filenames
-        if (
-            source_filenames is not None
-            and 0 <= ctx.frame_id < len(source_filenames)
-            and source_filenames[ctx.frame_id]
-        ):
-            return source_filenames[ctx.frame_id]
-        return f"frame_{ctx.frame_id:06d}.jpg"
+    def _stream_finished_on_rpi(self, state: RpiStreamState) -> bool:
+        """Apply the monitor's cached stats; ``True`` once the Pi ended the stream."""
+        snapshot = self._session_monitor().snapshot(state.session_id)
+        if snapshot is None:
+            return False
+        self._apply_session_snapshot(state, snapshot)
+        return snapshot.finished
 
     @staticmethod
-    def _extract_source_filenames(
-        payload: dict[str, object] | None,
-    ) -> list[str] | None:
-        if not isinstance(payload, dict):
-            return None
-        images_raw = payload.get("images")
-        if not isinstance(images_raw, list):
-            return None
-
-        images: list[dict[str, object]] = [
-            item for item in images_raw if isinstance(item, dict)
-        ]
-        if not images:
-            return None
-
-        parsed_rows: list[tuple[int | None, str, int]] = []
-        for row in images:
-            file_name_raw = row.get("file_name")
-            if not isinstance(file_name_raw, str) or not file_name_raw.strip():
-                continue
-            basename = Path(file_name_raw).name
-            if not basename:
-                continue
-            image_id_raw = row.get("id")
-            image_id = image_id_raw if isinstance(image_id_raw, int) else 0
-            frame_num_match = re.search(r"(\d+)$", Path(basename).stem)
-            frame_num = int(frame_num_match.group(1)) if frame_num_match else None
-            parsed_rows.append((frame_num, basename, image_id))
-
-        if not parsed_rows:
-            return None
-
-        if all(frame_num is not None for frame_num, _name, _image_id in parsed_rows):
-            parsed_rows.sort(key=lambda item: (item[0] or 0, item[2]))
-        else:
-            parsed_rows.sort(key=lambda item: (item[1], item[2]))
-        return [name for _frame_num, name, _image_id in parsed_rows]
-
-    def _detect_frame_or_empty(
-        self,
-        *,
-        frame: object,
-        frame_path: Path,
-        frame_id: int,
-        state: RpiStreamState,
-    ) -> list[Detection]:
-        try:
-            return self._detect_frame(frame=frame, fallback_path=frame_path)
-        except (RuntimeError, ValueError, TypeError, OSError) as det_err:
-            logger.warning("Detection error frame=%d: %s", frame_id, det_err)
-            state.detection_failures += 1
-            return []
-
-    def _ingest_event(
-        self,
-        *,
-        ctx: _LoopContext,
-        frame_event: FrameEvent,
-        detections: list[Detection],
+    def _apply_session_snapshot(
+        state: RpiStreamState, snapshot: SessionSnapshot
     ) -> None:
-        if self._pilot_service is None:
-            raise RuntimeError("PilotService is not configured")
-        try:
-            alerts = self._pilot_service.ingest_frame_event(
-                frame_event=frame_event,
-                detections=detections,
-            )
-            ctx.state.alerts_created += len(alerts)
-            for alert in alerts:
-                if not hasattr(alert, "alert_id"):
-                    continue
-                logger.info(
-                    "Alert triggered: alert_id=%s mission=%s frame=%d "
-                    "people=%d score=%.3f bbox=[%.0f,%.0f,%.0f,%.0f]",
-                    alert.alert_id[:8],
-                    alert.mission_id[:8],
-                    alert.frame_id,
-                    alert.people_detected,
-                    alert.primary_detection.score,
-                    *alert.primary_detection.bbox,
-                )
-        except (RuntimeError, ValueError, TypeError, OSError) as ingest_err:
-            logger.warning(
-                "Ingest error: mission=%s frame=%d error=%s",
-                ctx.mission_id[:8],
-                ctx.frame_id,
-                type(ingest_err).__name__,
-            )
-            ctx.state.ingest_failures += 1
-            ctx.state.error = f"{type(ingest_err).__name__}: {ingest_err}"
-
-    def _stream_finished_on_rpi(self, state: RpiStreamState) -> bool:
-        try:
-            stats = self._client().session_stats(
-                state.session_id,
-                timeout_sec=self._rpi_settings.timeout_sec,
-            )
-        except (httpx.HTTPError, ValueError, RuntimeError, OSError):
-            return False
+        stats = snapshot.stats
+        if stats is None:
+            return
         state.last_stats = stats
+        state.stats_updated_at = snapshot.updated_at
         total_source_frames = stats.get("total_source_frames")
         if isinstance(total_source_frames, int) and total_source_frames > 0:
             state.source_frames_total = total_source_frames
         publisher_error = str(stats.get("publisher_error", "")).strip()
         if publisher_error:
             state.error = publisher_error
-        return bool(stats.get("stop", False))
 
     def _switch_capture_to_http(
         self,
         *,
-        current_capture: _FrameCapture,
+        current_capture: FrameCapture,
         state: RpiStreamState,
-    ) -> _FrameCapture | None:
+    ) -> FrameCapture | None:
         if not state.stream_url:
             return None
         logger.warning(
             "Switching capture backend mission=%s rtsp->http after read failures",
             state.mission_id,
         )
-        http_capture = _HttpFrameCapture(state.stream_url)
+        http_capture = HttpFrameCapture(state.stream_url)
         if not http_capture.is_open():
             return None
         with suppress(Exception):
@@ -872,75 +695,29 @@ class DetectionStreamController:
         state.capture_backend = "http"
         return http_capture
 
-    def _load_gt_sequence(self, rpi_mission_id: str) -> list[bool] | None:
-        try:
-            return self._client().load_gt_sequence(
-                rpi_mission_id,
-                timeout_sec=self._rpi_settings.timeout_sec,
-            )
-        except (httpx.HTTPError, ValueError, RuntimeError, OSError) as error:
-            logger.warning(
-                "Cannot load GT sequence mission=%s: %s: %s",
-                rpi_mission_id,
-                type(error).__name__,
-                error,
-            )
-            return None
-
-    def _load_annotations_payload(
+    def _load_mission_annotations(
         self, rpi_mission_id: str
-    ) -> dict[str, object] | None:
+    ) -> MissionAnnotations | None:
         try:
-            return self._client().load_annotations_payload(
+            return self._client().load_mission_annotations(
                 rpi_mission_id,
                 timeout_sec=self._rpi_settings.timeout_sec,
             )
         except (httpx.HTTPError, ValueError, RuntimeError, OSError) as error:
             logger.warning(
-                "Cannot load annotations payload mission=%s: %s: %s",
+                "Cannot load mission annotations mission=%s: %s: %s",
                 rpi_mission_id,
                 type(error).__name__,
                 error,
             )
             return None
 
-    def _detect_frame(
-        self,
-        *,
-        frame: object,
-        fallback_path: Path,
-    ) -> list[Detection]:
-        detector = self._detector
-        if detector is None:
-            raise RuntimeError("Detector is not configured")
-        detector_any: Any = detector
-        try:
-            return detector_any.detect(frame)
-        except TypeError:
-            return detector_any.detect(str(fallback_path))
-
-    @staticmethod
-    def _save_frame(frame: object, path: Path) -> None:
-        """Save a numpy frame (from cv2) or raw bytes (from HTTP) to JPEG."""
-        if isinstance(frame, bytes):
-            path.write_bytes(frame)
-            return
-
-        import numpy as np
-
-        if isinstance(frame, np.ndarray):
-            cv2 = import_module("cv2")
-
-            cv2.imwrite(str(path), frame)
-            return
-        raise TypeError(f"Unexpected frame type: {type(frame)}")
-
-    def _open_capture(self, state: RpiStreamState) -> _FrameCapture | None:
+    def _open_capture(self, state: RpiStreamState) -> FrameCapture | None:
         """Try RTSP first (low-latency), then HTTP as fallback."""
         # 1. RTSP primary path
         if state.rtsp_url:
             logger.info("Trying RTSP stream")
-            rtsp_capture: _FrameCapture = _RtspFrameCapture(state.rtsp_url)
+            rtsp_capture: FrameCapture = RtspFrameCapture(state.rtsp_url)
             if rtsp_capture.is_open():
                 logger.info("RTSP stream opened successfully")
                 return rtsp_capture
@@ -949,7 +726,7 @@ class DetectionStreamController:
         # 2. HTTP fallback (MJPEG or polling endpoint)
         if state.stream_url:
             logger.info("Trying HTTP stream")
-            http_capture: _FrameCapture = _HttpFrameCapture(state.stream_url)
+            http_capture: FrameCapture = HttpFrameCapture(state.stream_url)
             if http_capture.is_open():
                 logger.info("HTTP stream opened successfully")
                 return http_capture
@@ -959,23 +736,25 @@ class DetectionStreamController:
 
 
 def _build_detector() -> DomainDetectorPort | None:
-    """Create YoloDetector from stream contract config (lazy, optional)."""
+    """Create the contract-selected detector (lazy, optional)."""
     try:
-        from rescue_ai.infrastructure.yolo_detector import YoloDetector
+        from rescue_ai.infrastructure.detector_factory import build_detector
 
         settings = get_settings()
         contract = load_stream_contract(
             service_version=settings.app.service_version,
         )
-        detector = YoloDetector(config=contract.inference)
+        detector = SwappableDetector(
+            build_detector(contract.inference), contract.inference
+        )
         logger.info(
-            "YoloDetector initialized (model_url=%s)", contract.inference.model_url
+            "Detector initialized (runtime=%s, model_url=%s)",
+            contract.inference.runtime,
+            contract.inference.model_url,
         )
         return detector
     except (ImportError, RuntimeError, ValueError, TypeError, OSError) as error:
-        logger.warning(
-            "YoloDetector not available: %s: %s", type(error).__name__, error
-        )
+        logger.warning("Detector not available: %s: %s", type(error).__name__, error)
         return None
 
 
@@ -1020,14 +799,46 @@ def build_api_runtime() -> tuple[
     )
     pilot_service.set_report_metadata(report_metadata)
 
-    detector = _build_detector()
+    stream_detector, predict_detector = _schedule_detector(
+        _build_detector(), contract.inference
+    )
 
     stream_controller = DetectionStreamController(
         settings=settings,
         pilot_service=pilot_service,
-        detector=detector,
+        detector=stream_detector,
+        inference=contract.inference,
+    )
+    return (
+        pilot_service,
+        stream_controller,
+        reset_hook,
+        predict_detector,
+        artifact_storage,
+    )
+
+
+def _schedule_detector(
+    detector: DomainDetectorPort | None, inference: InferenceConfig
+) -> tuple[DomainDetectorPort | None, DomainDetectorPort | None]:
+    """Route stream and ``/predict`` calls through one priority scheduler.
+
+    Returns the detectors for the stream controller and for the API.
+    """
+    config = inference.scheduler
+    if detector is None or config is None:
+        return detector, detector
+    scheduler = InferenceScheduler(config)
+    scheduler.start()
+    return (
+        ScheduledDetector(detector, scheduler, priority=PRIORITY_STREAM),
+        ScheduledDetector(
+            detector,
+            scheduler,
+            priority=PRIORITY_PREDICT,
+            timeout_sec=config.predict_timeout_sec,
+        ),
     )
-    return pilot_service, stream_controller, reset_hook, detector, artifact_storage
 
 
 def main() -> None:
@@ -1051,6 +862,10 @@ def main() -> None:
     pilot_service, stream_controller, reset_hook, detector, artifact_storage = (
         build_api_runtime()
     )
+    # Model download, load and first forward pass run while uvicorn boots.
+    detector_warmup = DetectorWarmup(detector)
+    detector_warmup.start()
+    model_swap = _start_model_swap(detector, pilot_service)
     set_runtime(
         ApiRuntime(
             pilot_service=pilot_service,
@@ -1058,16 +873,54 @@ def main() -> None:
             reset_hook=reset_hook,
             detector=detector,
             artifact_storage=artifact_storage,
+            detector_warmup=detector_warmup,
+            model_swap=model_swap,
+            inference_scheduler=(
+                detector.scheduler if isinstance(detector, ScheduledDetector) else None
+            ),
         )
     )
-    uvicorn.run(
-        "rescue_ai.interfaces.api.app:app",
-        host=settings.api.host,
-        port=settings.api.port,
-        log_level=settings.app.log_level.lower(),
-        access_log=True,
-        log_config=_build_uvicorn_log_config(),
+    try:
+        uvicorn.run(
+            "rescue_ai.interfaces.api.app:app",
+            host=settings.api.host,
+            port=settings.api.port,
+            log_level=settings.app.log_level.lower(),
+            access_log=True,
+            log_config=_build_uvicorn_log_config(),
+        )
+    finally:
+        stream_controller.close()
+
+
+def _start_model_swap(
+    detector: DomainDetectorPort | None, pilot_service: PilotService
+) -> ModelSwapService | None:
+    """Enable hot model swaps via the admin API and stream contract edits."""
+    if isinstance(detector, ScheduledDetector):
+        detector = detector.detector
+    if not isinstance(detector, SwappableDetector):
+        return None
+    from rescue_ai.infrastructure.detector_factory import build_detector
+    from rescue_ai.infrastructure.model_watcher import ContractModelWatcher
+
+    settings = get_settings()
+    model_swap = ModelSwapService(
+        detector,
+        builder=build_detector,
+        on_swap=lambda version: pilot_service.set_model_version(
+            version.model_url, version.model_sha256
+        ),
     )
+    contract = load_stream_contract(service_version=settings.app.service_version)
+    ContractModelWatcher(
+        contract_path=Path(contract.config_path),
+        load_inference=lambda: load_stream_contract(
+            service_version=settings.app.service_version
+        ).inference,
+        on_change=model_swap.request_swap,
+    ).start()
+    return model_swap
 
 
 def _prepare_postgres_backend() -> None:
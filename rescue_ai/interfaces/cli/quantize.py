@@ -0,0 +1,110 @@
+"""CLI: calibrate and quantize the contract model to INT8 ONNX.
+
+Calibration frames come from one mission/day stored in S3 and are read
+through ``S3MissionSource``. The FP32 ONNX export is produced first if
+it is not cached yet. The INT8 artifact is written next to it together
+with a JSON manifest; promote it by setting ``runtime: onnx`` and
+``precision: int8`` in the contract once ``evaluate_model
+--compare-precision int8`` passes the recall gate.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from dataclasses import replace
+from datetime import UTC, datetime
+from pathlib import Path
+
+from rescue_ai.infrastructure.contract_loader import load_stream_contract
+from rescue_ai.infrastructure.model_cache import (
+    MODEL_CACHE_DIR,
+    exported_model_path,
+    file_sha256,
+    write_model_manifest,
+)
+from rescue_ai.infrastructure.onnx_detector import INT8_SUFFIX, resolve_onnx_model_path
+from rescue_ai.infrastructure.onnx_quantizer import quantize_onnx_int8
+from rescue_ai.interfaces.cli.batch import build_source
+
+DEFAULT_CALIBRATION_FRAMES = 200
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse quantization CLI arguments."""
+    parser = argparse.ArgumentParser(
+        description="Quantize the contract YOLO model to INT8 ONNX"
+    )
+    parser.add_argument("--mission-id", required=True, help="Calibration mission")
+    parser.add_argument("--ds", required=True, help="S3 partition date YYYY-MM-DD")
+    parser.add_argument(
+        "--max-frames",
+        type=int,
+        default=DEFAULT_CALIBRATION_FRAMES,
+        help="Calibration frames, sampled evenly across the mission",
+    )
+    parser.add_argument("--opset", type=int, default=13)
+    return parser.parse_args()
+
+
+def _sample_evenly(items: list[Path], limit: int) -> list[Path]:
+    if limit <= 0 or len(items) <= limit:
+        return items
+    step = len(items) / limit
+    return [items[int(idx * step)] for idx in range(limit)]
+
+
+def _ensure_fp32_onnx(inference, *, opset: int) -> Path:
+    fp32_config = replace(inference, runtime="onnx", precision="fp32")
+    try:
+        return resolve_onnx_model_path(fp32_config)
+    except RuntimeError:
+        from rescue_ai.infrastructure.yolo_detector import YoloDetector
+
+        return YoloDetector(config=replace(inference, runtime="torch")).export_onnx(
+            opset=opset
+        )
+
+
+def main() -> None:
+    """Calibrate on one S3 mission and write the INT8 artifact + manifest."""
+    args = parse_args()
+    inference = load_stream_contract().inference
+    fp32_path = _ensure_fp32_onnx(inference, opset=args.opset)
+
+    mission = build_source().load(mission_id=args.mission_id, ds=args.ds)
+    frames = _sample_evenly(
+        [frame.frame_path for frame in mission.frames if not frame.is_corrupted],
+        args.max_frames,
+    )
+    output_path = exported_model_path(
+        inference.model_url, cache_dir=MODEL_CACHE_DIR, suffix=INT8_SUFFIX
+    )
+    quantize_onnx_int8(
+        fp32_path=fp32_path,
+        output_path=output_path,
+        calibration_frames=frames,
+        input_size=inference.imgsz,
+    )
+    manifest = {
+        "source_model_url": inference.model_url,
+        "source_onnx_sha256": file_sha256(fp32_path),
+        "sha256": file_sha256(output_path),
+        "runtime": "onnx",
+        "precision": "int8",
+        "quant_format": "QDQ",
+        "imgsz": inference.imgsz,
+        "calibration": {
+            "source_uri": mission.source_uri,
+            "mission_id": args.mission_id,
+            "ds": args.ds,
+            "frames": len(frames),
+        },
+        "created_at": datetime.now(UTC).isoformat(),
+    }
+    write_model_manifest(output_path, manifest)
+    print(json.dumps({"int8_path": str(output_path)} | manifest, indent=2))
+
+
+if __name__ == "__main__":
+    main()
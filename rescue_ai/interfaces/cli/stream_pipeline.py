@@ -0,0 +1,614 @@
+"""Frame stages and the shared asyncio stream pipeline.
+
+``FrameStages`` is the detect and ingest work done on every frame,
+shared by the serial per-stream loop and the pipeline lanes. With
+``infer.pipeline`` enabled, ``SharedStreamPipeline`` captures every
+stream on one asyncio ``CaptureHub`` and hands its frames to a lane of
+the shared ``StreamWorkerPool``, which runs those stages. Per-stream
+setup and teardown stay with the stream controller and reach the
+pipeline as ``StreamHooks``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import Future
+from concurrent.futures import wait as wait_futures
+from contextlib import suppress
+from dataclasses import dataclass
+from functools import partial
+from importlib import import_module
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from rescue_ai.application.batch_inference import detect_traced_at
+from rescue_ai.application.inference_config import InferenceConfig, PipelineConfig
+from rescue_ai.application.inference_scheduler import (
+    PATH_DROPPED,
+    InferenceDropped,
+    ScheduledDetector,
+)
+from rescue_ai.application.model_swap import ModelVersion, SwappableDetector
+from rescue_ai.application.pilot_service import PilotService
+from rescue_ai.application.stream_workers import (
+    LaneStages,
+    StreamLane,
+    StreamWorkerPool,
+)
+from rescue_ai.domain.entities import Detection, FrameEvent
+from rescue_ai.domain.ports import DetectorPort as DomainDetectorPort
+from rescue_ai.infrastructure.async_capture import (
+    AsyncFrameSource,
+    AsyncHttpFrameSource,
+    CaptureHub,
+    ExecutorFrameSource,
+)
+from rescue_ai.infrastructure.box_tracker import PATH_TRACKED
+from rescue_ai.infrastructure.motion_gate import PATH_MOTION_SKIP
+from rescue_ai.infrastructure.roi_detector import PATH_ROI
+from rescue_ai.interfaces.cli.frame_capture import RtspFrameCapture
+from rescue_ai.interfaces.cli.stream_state import (
+    CapturedFrame,
+    DetectedFrame,
+    LoopContext,
+    RpiStreamState,
+    StreamInputs,
+    log_pipeline_started,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class FrameStages:
+    """Detect and ingest stages of one frame."""
+
+    def __init__(
+        self,
+        *,
+        pilot_service: PilotService | None,
+        detector: DomainDetectorPort | None,
+        inference: InferenceConfig | None,
+    ) -> None:
+        self._pilot_service = pilot_service
+        self._detector = detector
+        self._inference = inference
+
+    def detect(self, ctx: LoopContext, frame: object) -> DetectedFrame:
+        """Detect stage: reuse, propagate or run the detector on *frame*."""
+        frame_path = ctx.tmp_dir / self._resolve_frame_filename(ctx)
+        ctx.frames.put(ctx.frame_id, frame)
+        # One model version handles the whole frame; hot swaps land between frames.
+        detector, model_version = self._snapshot_detector()
+
+        t0 = time.monotonic()
+        ctx.frame_imgsz = None
+        detections, inference_path = self._detect_or_reuse(
+            frame=frame,
+            frame_path=frame_path,
+            ctx=ctx,
+            detector=detector,
+        )
+        inference_ms = (time.monotonic() - t0) * 1000
+        ctx.state.record_inference_path(inference_path)
+
+        frame_event = self._build_frame_event(
+            ctx,
+            image_uri=str(frame_path),
+            inference_path=inference_path,
+            model_version=model_version,
+        )
+        return DetectedFrame(
+            frame_event=frame_event,
+            detections=detections,
+            inference_ms=inference_ms,
+        )
+
+    def ingest(self, ctx: LoopContext, detected: DetectedFrame) -> None:
+        """Ingest stage: hand the detections to the pilot service."""
+        frame_event = detected.frame_event
+        alerts_before = ctx.state.alerts_created
+        self._ingest_event(
+            ctx=ctx, frame_event=frame_event, detections=detected.detections
+        )
+        self._log_processed_frame(
+            ctx,
+            frame_event=frame_event,
+            detections=detected.detections,
+            inference_ms=detected.inference_ms,
+            alerts_new=ctx.state.alerts_created - alerts_before,
+        )
+        ctx.state.processed_frames += 1
+        ctx.last_frame_id = frame_event.frame_id
+
+    @staticmethod
+    def _build_frame_event(
+        ctx: LoopContext,
+        *,
+        image_uri: str,
+        inference_path: str,
+        model_version: ModelVersion | None,
+    ) -> FrameEvent:
+        ts_sec = (
+            ctx.frame_id / ctx.target_fps if ctx.target_fps > 0 else ctx.frame_id * 0.5
+        )
+        gt_present, gt_episode_id = ctx.gt_tracker.evaluate(ctx.frame_id)
+        return FrameEvent(
+            mission_id=ctx.mission_id,
+            frame_id=ctx.frame_id,
+            ts_sec=ts_sec,
+            image_uri=image_uri,
+            gt_person_present=gt_present,
+            gt_episode_id=gt_episode_id,
+            inference_path=inference_path,
+            model_url=None if model_version is None else model_version.model_url,
+            model_sha256=None if model_version is None else model_version.model_sha256,
+            imgsz=ctx.frame_imgsz,
+        )
+
+    def _snapshot_detector(
+        self,
+    ) -> tuple[DomainDetectorPort | None, ModelVersion | None]:
+        detector = self._detector
+        if isinstance(detector, (ScheduledDetector, SwappableDetector)):
+            return detector.snapshot()
+        return detector, None
+
+    @staticmethod
+    def _log_processed_frame(
+        ctx: LoopContext,
+        *,
+        frame_event: FrameEvent,
+        detections: Sequence[Detection],
+        inference_ms: float,
+        alerts_new: int,
+    ) -> None:
+        top_score = max((d.score for d in detections), default=0.0)
+        logger.info(
+            "Frame processed: mission=%s frame=%d/%s ts=%.2fs "
+            "detections=%d top_score=%.3f inference_ms=%.1f path=%s "
+            "alerts_created=%d",
+            ctx.mission_id[:8],
+            frame_event.frame_id,
+            ctx.state.source_frames_total or "?",
+            frame_event.ts_sec,
+            len(detections),
+            top_score,
+            inference_ms,
+            frame_event.inference_path,
+            alerts_new,
+        )
+        for d in detections:
+            logger.info(
+                "  Detected: label=%s score=%.3f "
+                "bbox=[%.1f,%.1f,%.1f,%.1f] model=%s",
+                d.label,
+                d.score,
+                *d.bbox,
+                d.model_name,
+            )
+
+    @staticmethod
+    def _resolve_frame_filename(ctx: LoopContext) -> str:
+        source_filenames = ctx.source_filenames
+        if (
+            source_filenames is not None
+            and 0 <= ctx.frame_id < len(source_filenames)
+            and source_filenames[ctx.frame_id]
+        ):
+            return source_filenames[ctx.frame_id]
+        return f"frame_{ctx.frame_id:06d}.jpg"
+
+    def _detect_or_reuse(
+        self,
+        *,
+        frame: object,
+        frame_path: Path,
+        ctx: LoopContext,
+        detector: DomainDetectorPort | None = None,
+    ) -> tuple[Sequence[Detection], str]:
+        """Reuse or propagate the last detections when possible, else detect.
+
+        Near-duplicate frames reuse the previous detections (motion gate);
+        between keyframes tracked boxes are moved by optical flow.
+        """
+        gate, tracker = ctx.motion_gate, ctx.tracker
+        reused = gate.reuse(frame) if gate is not None else None
+        if reused is not None:
+            ctx.state.motion_skipped_frames += 1
+            return reused, PATH_MOTION_SKIP
+        propagated = tracker.propagate(frame) if tracker is not None else None
+        if propagated is not None:
+            ctx.state.tracked_frames += 1
+            return propagated, PATH_TRACKED
+        detections, inference_path = self._detect_frame_or_empty(
+            frame=frame, frame_path=frame_path, ctx=ctx, detector=detector
+        )
+        detected = inference_path not in ("failed", PATH_DROPPED)
+        if tracker is not None:
+            if not detected:
+                tracker.reset()
+            else:
+                detections = tracker.update(frame, detections)
+        if gate is not None:
+            if not detected:
+                gate.reset()
+            else:
+                gate.record(detections)
+        return detections, inference_path
+
+    def _detect_frame_or_empty(
+        self,
+        *,
+        frame: object,
+        frame_path: Path,
+        ctx: LoopContext,
+        detector: DomainDetectorPort | None = None,
+    ) -> tuple[Sequence[Detection], str]:
+        try:
+            regions = self._roi_regions(ctx, detector or self._detector)
+            if regions:
+                ctx.frames_since_full_frame += 1
+                ctx.state.roi_frames += 1
+                return regions(frame), PATH_ROI
+            ctx.frames_since_full_frame = 0
+            detections, path, ctx.frame_imgsz = self._detect_frame_at(
+                frame=frame,
+                fallback_path=frame_path,
+                detector=detector,
+                imgsz=None if ctx.resolution is None else ctx.resolution.imgsz,
+            )
+            return detections, path
+        except InferenceDropped as dropped:
+            # The scheduler gave the detector to fresher work; not a failure.
+            logger.debug("Frame dropped frame=%d: %s", ctx.frame_id, dropped)
+            ctx.state.dropped_frames += 1
+            return [], PATH_DROPPED
+        except (RuntimeError, ValueError, TypeError, OSError) as det_err:
+            logger.warning("Detection error frame=%d: %s", ctx.frame_id, det_err)
+            ctx.state.detection_failures += 1
+            return [], "failed"
+
+    def _roi_regions(
+        self, ctx: LoopContext, detector: DomainDetectorPort | None
+    ) -> Callable[[object], Sequence[Detection]] | None:
+        """Return an ROI pass around recent positives, or ``None`` for full frame.
+
+        Every ``full_frame_interval``-th frame and frames without a recent
+        positive go through the full-frame detector.
+        """
+        roi = self._inference.roi if self._inference is not None else None
+        detector_any: Any = detector
+        detect_regions = getattr(detector_any, "detect_regions", None)
+        if (
+            roi is None
+            or self._pilot_service is None
+            or not callable(detect_regions)
+            or ctx.frames_since_full_frame + 1 >= roi.full_frame_interval
+        ):
+            return None
+        boxes = self._pilot_service.recent_detection_boxes(ctx.mission_id)
+        if not boxes:
+            return None
+        return lambda frame: detect_regions(frame, boxes)
+
+    def _ingest_event(
+        self,
+        *,
+        ctx: LoopContext,
+        frame_event: FrameEvent,
+        detections: Sequence[Detection],
+    ) -> None:
+        if self._pilot_service is None:
+            raise RuntimeError("PilotService is not configured")
+        try:
+            alerts = self._pilot_service.ingest_frame_event(
+                frame_event=frame_event,
+                detections=detections,
+                # Encoded only if the frame raises an alert.
+                frame_content=partial(ctx.frames.jpeg, frame_event.frame_id),
+            )
+            ctx.state.alerts_created += len(alerts)
+            for alert in alerts:
+                if not hasattr(alert, "alert_id"):
+                    continue
+                logger.info(
+                    "Alert triggered: alert_id=%s mission=%s frame=%d "
+                    "people=%d score=%.3f bbox=[%.0f,%.0f,%.0f,%.0f]",
+                    alert.alert_id[:8],
+                    alert.mission_id[:8],
+                    alert.frame_id,
+                    alert.people_detected,
+                    alert.primary_detection.score,
+                    *alert.primary_detection.bbox,
+                )
+        except (RuntimeError, ValueError, TypeError, OSError) as ingest_err:
+            logger.warning(
+                "Ingest error: mission=%s frame=%d error=%s",
+                ctx.mission_id[:8],
+                frame_event.frame_id,
+                type(ingest_err).__name__,
+            )
+            ctx.state.ingest_failures += 1
+            ctx.state.error = f"{type(ingest_err).__name__}: {ingest_err}"
+
+    def _detect_frame_at(
+        self,
+        *,
+        frame: object,
+        fallback_path: Path,
+        detector: DomainDetectorPort | None = None,
+        imgsz: int | None = None,
+    ) -> tuple[Sequence[Detection], str, int | None]:
+        """Detect at input size *imgsz*; also return the size actually used."""
+        detector = detector or self._detector
+        if detector is None:
+            raise RuntimeError("Detector is not configured")
+        try:
+            return detect_traced_at(detector, frame, imgsz)
+        except TypeError:
+            # The detector only reads files: spill this one frame to disk.
+            self._save_frame(frame, fallback_path)
+            try:
+                return detect_traced_at(detector, str(fallback_path), imgsz)
+            finally:
+                fallback_path.unlink(missing_ok=True)
+
+    @staticmethod
+    def _save_frame(frame: object, path: Path) -> None:
+        """Save a numpy frame (from cv2) or raw bytes (from HTTP) to JPEG."""
+        if isinstance(frame, bytes):
+            path.write_bytes(frame)
+            return
+
+        import numpy as np
+
+        if isinstance(frame, np.ndarray):
+            cv2 = import_module("cv2")
+
+            cv2.imwrite(str(path), frame)
+            return
+        raise TypeError(f"Unexpected frame type: {type(frame)}")
+
+    @staticmethod
+    def adapt_resolution(ctx: LoopContext, processing_sec: float) -> None:
+        """Feed the frame's processing time to the adaptive ``imgsz`` controller."""
+        resolution = ctx.resolution
+        if resolution is None:
+            return
+        previous = resolution.imgsz
+        imgsz = resolution.observe(processing_sec, ctx.frame_interval)
+        ctx.state.imgsz = imgsz
+        if imgsz != previous:
+            ctx.state.imgsz_steps += 1
+            logger.info(
+                "Adaptive imgsz: mission=%s %d -> %d (load=%.2f)",
+                ctx.mission_id,
+                previous,
+                imgsz,
+                processing_sec / ctx.frame_interval,
+            )
+
+
+@dataclass(frozen=True)
+class StreamHooks:
+    """Per-stream setup and teardown supplied by the stream controller."""
+
+    load_inputs: Callable[[str, RpiStreamState], StreamInputs]
+    new_context: Callable[[RpiStreamState, threading.Event, StreamInputs], LoopContext]
+    capture_open_failed: Callable[[RpiStreamState], None]
+    should_stop: Callable[[LoopContext], bool]
+    source_finished: Callable[[LoopContext], bool]
+    finish: Callable[[LoopContext], None]
+
+
+class SharedStreamPipeline:
+    """Asyncio capture of every stream feeding the shared worker lanes."""
+
+    def __init__(
+        self, config: PipelineConfig, *, stages: FrameStages, hooks: StreamHooks
+    ) -> None:
+        self._hub = CaptureHub(io_threads=config.capture_threads)
+        self._workers = StreamWorkerPool(config)
+        self._stages = stages
+        self._hooks = hooks
+        self._stream_futures: dict[str, Future[None]] = {}
+        self._capture_tasks: dict[str, asyncio.Task[None]] = {}
+        self._hub.start()
+        self._workers.start()
+
+    def start(self, state: RpiStreamState, stop_event: threading.Event) -> Future[None]:
+        """Run the stream of *state* on the hub; the future resolves when it ends."""
+        future = self._hub.submit(self._stream_session(state, stop_event))
+        self._stream_futures[state.mission_id] = future
+        return future
+
+    def stop(self, mission_id: str, *, timeout_sec: float) -> None:
+        """Cancel the capture of *mission_id* and wait for its stream to end."""
+        future = self._stream_futures.get(mission_id)
+        if future is None:
+            return
+        # Interrupts a read blocked on the network.
+        self._hub.call_soon(partial(self._cancel_capture, mission_id))
+        wait_futures([future], timeout=timeout_sec)
+
+    def close(self) -> None:
+        """Stop the stream workers, then the capture loop."""
+        self._workers.close()
+        self._hub.close()
+
+    def _cancel_capture(self, mission_id: str) -> None:
+        task = self._capture_tasks.get(mission_id)
+        if task is not None:
+            task.cancel()
+
+    async def _stream_session(
+        self, state: RpiStreamState, stop_event: threading.Event
+    ) -> None:
+        """Capture one stream on the hub's loop; shared workers do the rest.
+
+        When detection falls behind, the lane keeps only the latest
+        frames; its ingest queue applies back-pressure so no detected
+        frame is lost.
+        """
+        ctx = await self._open_context(state, stop_event)
+        if ctx is None:
+            return
+        log_pipeline_started(ctx)
+        lane = self._workers.open_lane(
+            ctx.mission_id,
+            LaneStages(
+                detect=partial(self._detect_lane_frame, ctx),
+                ingest=partial(self._stages.ingest, ctx),
+                on_error=partial(self._on_stage_error, ctx),
+            ),
+        )
+        state.stage_queues = lane.stats()
+        capture = asyncio.create_task(self._capture_frames(ctx, lane))
+        self._capture_tasks[ctx.mission_id] = capture
+        try:
+            await capture
+        except asyncio.CancelledError:
+            if state.end_reason is None:
+                state.end_reason = "stop_requested"
+        except (httpx.HTTPError, RuntimeError, ValueError, TypeError, OSError) as err:
+            self._on_stage_error(ctx, err)
+        finally:
+            self._capture_tasks.pop(ctx.mission_id, None)
+            lane.close()
+        # Frames already captured are detected and ingested before finalizing.
+        await asyncio.wrap_future(lane.done)
+        state.stage_queues = lane.stats()
+        if ctx.source is not None:
+            await ctx.source.close()
+        await self._hub.run_blocking(partial(self._hooks.finish, ctx))
+
+    async def _open_context(
+        self, state: RpiStreamState, stop_event: threading.Event
+    ) -> LoopContext | None:
+        inputs = await self._hub.run_blocking(
+            partial(self._hooks.load_inputs, state.mission_id, state)
+        )
+        source = await _open_source(self._hub, state)
+        if source is None:
+            self._hooks.capture_open_failed(state)
+            return None
+        state.capture_backend = source.backend
+        ctx = self._hooks.new_context(state, stop_event, inputs)
+        ctx.source = source
+        return ctx
+
+    async def _capture_frames(
+        self,
+        ctx: LoopContext,
+        lane: StreamLane[CapturedFrame, DetectedFrame],
+    ) -> None:
+        while not ctx.stop_event.is_set() and not self._hooks.should_stop(ctx):
+            started_at = time.monotonic()
+            frame, should_stop = await self._read_source_with_recovery(ctx)
+            if should_stop:
+                return
+            if frame is None:
+                continue
+            captured = CapturedFrame(frame_id=ctx.state.captured_frames, frame=frame)
+            ctx.state.captured_frames += 1
+            if not lane.submit(captured):
+                return
+            ctx.state.stage_queues = lane.stats()
+            await asyncio.sleep(
+                max(0.0, ctx.frame_interval - (time.monotonic() - started_at))
+            )
+
+    async def _read_source_with_recovery(
+        self, ctx: LoopContext
+    ) -> tuple[object | None, bool]:
+        source = ctx.source
+        frame = await source.read_frame() if source is not None else None
+        if frame is not None:
+            ctx.state.read_failures = 0
+            ctx.consecutive_read_failures = 0
+            return frame, False
+
+        ctx.consecutive_read_failures += 1
+        ctx.state.read_failures = ctx.consecutive_read_failures
+        if ctx.stop_event.is_set():
+            ctx.state.end_reason = "stop_requested"
+            return None, True
+
+        if ctx.consecutive_read_failures >= 8:
+            if await self._switch_source_to_http(ctx):
+                return None, False
+            if self._hooks.source_finished(ctx):
+                return None, True
+
+        retry_delay = 0.15 if source is None or source.backend == "http" else 1.0
+        logger.warning("Frame read failed, retrying in %.2fs...", retry_delay)
+        await asyncio.sleep(retry_delay)
+        return None, False
+
+    async def _switch_source_to_http(self, ctx: LoopContext) -> bool:
+        current = ctx.source
+        if current is None or current.backend != "rtsp" or not ctx.state.stream_url:
+            return False
+        logger.warning(
+            "Switching capture backend mission=%s rtsp->http after read failures",
+            ctx.mission_id,
+        )
+        switched = await AsyncHttpFrameSource.open(
+            self._hub.http_client(), ctx.state.stream_url
+        )
+        if switched is None:
+            return False
+        with suppress(Exception):
+            await current.close()
+        ctx.source = switched
+        ctx.state.capture_backend = switched.backend
+        ctx.consecutive_read_failures = 0
+        ctx.state.read_failures = 0
+        return True
+
+    def _detect_lane_frame(
+        self, ctx: LoopContext, captured: CapturedFrame
+    ) -> DetectedFrame:
+        # Frames dropped by the lane leave gaps, keeping ids and
+        # timestamps aligned with the source.
+        ctx.frame_id = captured.frame_id
+        started_at = time.monotonic()
+        detected = self._stages.detect(ctx, captured.frame)
+        FrameStages.adapt_resolution(ctx, time.monotonic() - started_at)
+        return detected
+
+    @staticmethod
+    def _on_stage_error(ctx: LoopContext, error: Exception) -> None:
+        ctx.state.error = f"{type(error).__name__}: {error}"
+        ctx.state.end_reason = "loop_exception"
+        logger.error("Detection pipeline stage crashed: %s", ctx.state.error)
+
+
+async def _open_source(
+    hub: CaptureHub, state: RpiStreamState
+) -> AsyncFrameSource | None:
+    """Try RTSP first (low-latency), then HTTP as fallback."""
+    if state.rtsp_url:
+        logger.info("Trying RTSP stream")
+        rtsp_capture = await hub.run_blocking(partial(RtspFrameCapture, state.rtsp_url))
+        if rtsp_capture.is_open():
+            logger.info("RTSP stream opened successfully")
+            return ExecutorFrameSource(rtsp_capture, hub, "rtsp")
+        logger.warning("RTSP stream failed, trying HTTP fallback...")
+
+    if state.stream_url:
+        logger.info("Trying HTTP stream")
+        http_source = await AsyncHttpFrameSource.open(
+            hub.http_client(), state.stream_url
+        )
+        if http_source is not None:
+            logger.info("HTTP stream opened successfully")
+            return http_source
+        logger.warning("HTTP stream also failed")
+    return None
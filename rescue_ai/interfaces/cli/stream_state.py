@@ -0,0 +1,157 @@
+"""Per-stream state shared by the serial detection loop and the shared pipeline."""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from rescue_ai.application.inference_config import PipelineConfig
+from rescue_ai.application.resolution_control import ResolutionController
+from rescue_ai.domain.entities import Detection, FrameEvent
+from rescue_ai.infrastructure.async_capture import AsyncFrameSource
+from rescue_ai.infrastructure.box_tracker import KeyframeTracker
+from rescue_ai.infrastructure.frame_ring import FrameRingBuffer
+from rescue_ai.infrastructure.motion_gate import MotionGate
+from rescue_ai.interfaces.cli.frame_capture import FrameCapture
+
+logger = logging.getLogger(__name__)
+# Frames held by the serial loop: the one being processed plus one spare.
+SERIAL_FRAME_RING = 2
+
+
+@dataclass
+class RpiStreamState:
+    """RPi streaming session state bound to one mission."""
+
+    mission_id: str
+    rpi_mission_id: str
+    session_id: str
+    rtsp_url: str
+    stream_url: str
+    target_fps: float
+    running: bool
+    started_at: str
+    captured_frames: int = 0
+    processed_frames: int = 0
+    alerts_created: int = 0
+    ingest_failures: int = 0
+    detection_failures: int = 0
+    motion_skipped_frames: int = 0
+    tracked_frames: int = 0
+    roi_frames: int = 0
+    dropped_frames: int = 0
+    imgsz: int | None = None
+    imgsz_steps: int = 0
+    capture_backend: str | None = None
+    gt_sequence_total: int | None = None
+    source_frames_total: int | None = None
+    read_failures: int = 0
+    end_reason: str | None = None
+    last_stats: dict[str, object] | None = None
+    stats_updated_at: str | None = None
+    error: str | None = None
+    inference_paths: dict[str, int] = field(default_factory=dict)
+    stage_timings: dict[str, dict[str, object]] | None = None
+    stage_queues: dict[str, dict[str, int]] = field(default_factory=dict)
+
+    def record_inference_path(self, path: str) -> None:
+        """Count one processed frame for the detector path that handled it."""
+        self.inference_paths[path] = self.inference_paths.get(path, 0) + 1
+
+
+@dataclass
+class GtTracker:
+    """Ground-truth presence and episode ids along the frame sequence."""
+
+    sequence: Sequence[bool] | None
+    episode_id: int = 0
+    prev_present: bool = False
+
+    def evaluate(self, frame_id: int) -> tuple[bool, str | None]:
+        gt_present = bool(
+            self.sequence is not None
+            and frame_id < len(self.sequence)
+            and self.sequence[frame_id]
+        )
+        if gt_present and not self.prev_present:
+            self.episode_id += 1
+        self.prev_present = gt_present
+        return gt_present, (f"ep-{self.episode_id}" if gt_present else None)
+
+
+@dataclass
+class LoopContext:
+    """Everything one stream carries from capture through ingest."""
+
+    mission_id: str
+    state: RpiStreamState
+    stop_event: threading.Event
+    target_fps: float
+    frame_interval: float
+    gt_tracker: GtTracker
+    source_filenames: list[str] | None
+    tmp_dir: Path
+    # Serial loop: blocking capture; shared pipeline: async source.
+    capture: FrameCapture | None = None
+    source: AsyncFrameSource | None = None
+    frame_id: int = 0
+    consecutive_read_failures: int = 0
+    # Set by the session monitor once the Pi reports the stream finished.
+    rpi_finished: threading.Event = field(default_factory=threading.Event)
+    motion_gate: MotionGate | None = None
+    tracker: KeyframeTracker | None = None
+    frames_since_full_frame: int = 0
+    resolution: ResolutionController | None = None
+    frame_imgsz: int | None = None
+    last_frame_id: int | None = None
+    frames: FrameRingBuffer = field(
+        default_factory=lambda: FrameRingBuffer(SERIAL_FRAME_RING)
+    )
+
+
+@dataclass(frozen=True)
+class CapturedFrame:
+    """A frame read by capture, waiting for the detect stage."""
+
+    frame_id: int
+    frame: object
+
+
+@dataclass(frozen=True)
+class DetectedFrame:
+    """A detected frame waiting for the ingest stage."""
+
+    frame_event: FrameEvent
+    detections: Sequence[Detection]
+    inference_ms: float
+
+
+@dataclass(frozen=True)
+class StreamInputs:
+    """Per-mission data loaded from the RPi before capture starts."""
+
+    gt_sequence: Sequence[bool] | None
+    source_filenames: list[str] | None
+
+
+def frame_ring_capacity(pipeline: PipelineConfig | None) -> int:
+    """Frames in flight from detection to ingest, including both ends."""
+    if pipeline is None:
+        return SERIAL_FRAME_RING
+    return pipeline.ingest_queue_size + 2
+
+
+def log_pipeline_started(ctx: LoopContext) -> None:
+    state = ctx.state
+    logger.info(
+        "Detection pipeline started: mission=%s rpi_mission=%s "
+        "backend=%s target_fps=%.1f gt_frames=%s",
+        ctx.mission_id[:8],
+        state.rpi_mission_id,
+        state.capture_backend,
+        state.target_fps,
+        state.gt_sequence_total,
+    )
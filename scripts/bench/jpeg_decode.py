@@ -0,0 +1,81 @@
+"""Benchmark full vs reduced-resolution JPEG decode for detector inputs.
+
+Usage: ``python -m scripts.bench.jpeg_decode [--image frame.jpg] [--imgsz 960]``
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from pathlib import Path
+
+from rescue_ai.infrastructure.frame_decode import decode_jpeg
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark JPEG decode paths")
+    parser.add_argument(
+        "--image",
+        type=Path,
+        default=None,
+        help="JPEG to decode (default: synthetic frame of --width x --height)",
+    )
+    parser.add_argument("--width", type=int, default=3840)
+    parser.add_argument("--height", type=int, default=2160)
+    parser.add_argument("--imgsz", type=int, default=960)
+    parser.add_argument("--repeat", type=int, default=50)
+    return parser.parse_args()
+
+
+def _synthetic_jpeg(width: int, height: int) -> bytes:
+    import cv2
+    import numpy as np
+
+    rng = np.random.default_rng(0)
+    frame = cv2.GaussianBlur(
+        rng.integers(0, 255, (height, width, 3), dtype=np.uint8), (7, 7), 0
+    )
+    ok, encoded = cv2.imencode(".jpg", frame, [cv2.IMWRITE_JPEG_QUALITY, 90])
+    if not ok:
+        raise RuntimeError("Failed to encode synthetic frame")
+    return encoded.tobytes()
+
+
+def _median_ms(data: bytes, target_size: int | None, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        decode_jpeg(data, target_size=target_size)
+        samples.append((time.perf_counter() - t0) * 1000)
+    samples.sort()
+    return samples[len(samples) // 2]
+
+
+def main() -> None:
+    args = parse_args()
+    data = (
+        args.image.read_bytes()
+        if args.image is not None
+        else _synthetic_jpeg(args.width, args.height)
+    )
+    reduced = decode_jpeg(data, target_size=args.imgsz)
+    full_ms = _median_ms(data, None, args.repeat)
+    reduced_ms = _median_ms(data, args.imgsz, args.repeat)
+    print(
+        json.dumps(
+            {
+                "imgsz": args.imgsz,
+                "decoded_shape": list(reduced.image.shape[:2]),
+                "scale": [reduced.scale_x, reduced.scale_y],
+                "full_decode_ms": round(full_ms, 2),
+                "reduced_decode_ms": round(reduced_ms, 2),
+                "saved_ms_per_frame": round(full_ms - reduced_ms, 2),
+            },
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
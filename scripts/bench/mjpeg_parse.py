@@ -0,0 +1,125 @@
+"""Benchmark MJPEG multipart parsing cost per frame.
+
+Builds a synthetic ``multipart/x-mixed-replace`` stream of JPEG frames,
+replays it in 16 KB chunks (the capture's ``iter_bytes`` size) and
+compares the previous append-and-rescan parser with ``MjpegParser``.
+
+Usage: ``python -m scripts.bench.mjpeg_parse [--width 3840 --height 2160]
+[--frames 30] [--no-content-length]``
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+
+from rescue_ai.infrastructure.mjpeg_parser import MjpegParser
+
+_BOUNDARY = b"frame"
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark MJPEG stream parsing")
+    parser.add_argument("--width", type=int, default=3840)
+    parser.add_argument("--height", type=int, default=2160)
+    parser.add_argument("--frames", type=int, default=30)
+    parser.add_argument("--chunk-size", type=int, default=16384)
+    parser.add_argument(
+        "--no-content-length",
+        action="store_true",
+        help="Omit Content-Length part headers (boundary scan only)",
+    )
+    return parser.parse_args()
+
+
+def _synthetic_jpeg(width: int, height: int) -> bytes:
+    import cv2
+    import numpy as np
+
+    rng = np.random.default_rng(0)
+    frame = cv2.GaussianBlur(
+        rng.integers(0, 255, (height, width, 3), dtype=np.uint8), (7, 7), 0
+    )
+    ok, encoded = cv2.imencode(".jpg", frame, [cv2.IMWRITE_JPEG_QUALITY, 90])
+    if not ok:
+        raise RuntimeError("Failed to encode synthetic frame")
+    return encoded.tobytes()
+
+
+def _stream(jpeg: bytes, frames: int, *, content_length: bool) -> bytes:
+    headers = b"Content-Type: image/jpeg\r\n"
+    if content_length:
+        headers += b"Content-Length: %d\r\n" % len(jpeg)
+    part = b"--" + _BOUNDARY + b"\r\n" + headers + b"\r\n" + jpeg + b"\r\n"
+    return part * frames + b"--" + _BOUNDARY + b"--\r\n"
+
+
+def _chunks(data: bytes, size: int) -> list[bytes]:
+    chunks = []
+    for start in range(0, len(data), size):
+        stop = start + size
+        chunks.append(data[start:stop])
+    return chunks
+
+
+def _legacy_parse(chunks: list[bytes]) -> int:
+    """The previous ``_read_mjpeg_frame`` loop: append, rescan, slice."""
+    buffer = b""
+    frames: list[bytes] = []
+    for chunk in chunks:
+        buffer += chunk
+        start = buffer.find(b"\xff\xd8")
+        if start == -1:
+            buffer = buffer[-2:]
+            continue
+        end = buffer.find(b"\xff\xd9", start + 2)
+        if end == -1:
+            continue
+        end_idx = end + 2
+        frames.append(buffer[start:end_idx])
+        buffer = buffer[end_idx:]
+    return len(frames)
+
+
+def _parser_parse(chunks: list[bytes]) -> int:
+    parser = MjpegParser(_BOUNDARY.decode())
+    frames = 0
+    for chunk in chunks:
+        parser.feed(chunk)
+        while parser.next_frame() is not None:
+            frames += 1
+    return frames
+
+
+def main() -> None:
+    args = parse_args()
+    jpeg = _synthetic_jpeg(args.width, args.height)
+    chunks = _chunks(
+        _stream(jpeg, args.frames, content_length=not args.no_content_length),
+        args.chunk_size,
+    )
+    results: dict[str, dict[str, object]] = {}
+    for name, parse in (("legacy", _legacy_parse), ("parser", _parser_parse)):
+        t0 = time.perf_counter()
+        frames = parse(chunks)
+        elapsed_ms = (time.perf_counter() - t0) * 1000
+        results[name] = {
+            "frames": frames,
+            "ms_per_frame": round(elapsed_ms / max(1, frames), 3),
+        }
+    print(
+        json.dumps(
+            {
+                "frame_bytes": len(jpeg),
+                "chunk_size": args.chunk_size,
+                "content_length": not args.no_content_length,
+                **results,
+            },
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
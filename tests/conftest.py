@@ -16,8 +16,10 @@ if TYPE_CHECKING:
 
 def _load_app_schema_sql() -> str:
     root = Path(__file__).resolve().parents[1]
-    schema_path = root / "infra" / "postgres" / "init" / "010-app-schema.sql"
-    return schema_path.read_text(encoding="utf-8")
+    init_dir = root / "infra" / "postgres" / "init"
+    return "\n".join(
+        path.read_text(encoding="utf-8") for path in sorted(init_dir.glob("*.sql"))
+    )
 
 
 @pytest.fixture(scope="session")
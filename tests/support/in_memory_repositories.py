@@ -140,23 +140,29 @@ class InMemoryFrameEventRepository:
 @dataclass
 class InMemoryArtifactStorage:
     stored_frames: dict[tuple[str, int], str] = field(default_factory=dict)
+    stored_content: dict[str, bytes] = field(default_factory=dict)
     _reports: dict[str, dict[str, object]] = field(default_factory=dict)
 
     def store_frame(
-        self, mission_id: str, frame_id: int, source_uri: str, ds: str
+        self, mission_id: str, frame_id: int, source: str | ArtifactBlob, ds: str
     ) -> str:
-        parsed = urlparse(source_uri)
-        filename = Path(parsed.path).name if parsed.scheme == "file" else ""
-        if not filename:
-            filename = Path(source_uri).name or f"{frame_id}.jpg"
+        if isinstance(source, ArtifactBlob):
+            filename = source.filename
+        else:
+            parsed = urlparse(source)
+            filename = Path(parsed.path).name if parsed.scheme == "file" else ""
+            if not filename:
+                filename = Path(source).name or f"{frame_id}.jpg"
         uri = f"memory://missions/{ds}/{mission_id}/frames/{filename}"
         self.stored_frames[(mission_id, frame_id)] = uri
+        if isinstance(source, ArtifactBlob):
+            self.stored_content[uri] = source.content
         return uri
 
     def load_frame(self, image_uri: str) -> ArtifactBlob | None:
         if image_uri in self.stored_frames.values():
             return ArtifactBlob(
-                content=b"",
+                content=self.stored_content.get(image_uri, b""),
                 media_type="image/jpeg",
                 filename=image_uri.split("/")[-1] or "frame.jpg",
             )
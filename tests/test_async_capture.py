@@ -0,0 +1,125 @@
+"""Tests for the shared asyncio capture loop and its frame sources."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+
+import httpx
+
+from rescue_ai.infrastructure.async_capture import (
+    AsyncHttpFrameSource,
+    CaptureHub,
+    ExecutorFrameSource,
+)
+
+_FRAME = b"\xff\xd8pixels\xff\xd9"
+
+
+def _client(handler) -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+async def _read_all(source: AsyncHttpFrameSource, count: int) -> list[bytes | None]:
+    frames = [await source.read_frame() for _ in range(count)]
+    await source.close()
+    return frames
+
+
+def test_http_source_parses_mjpeg_stream() -> None:
+    part = b"--frame\r\nContent-Type: image/jpeg\r\n\r\n" + _FRAME + b"\r\n"
+
+    def _handler(_request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200,
+            headers={"content-type": "multipart/x-mixed-replace; boundary=frame"},
+            content=part * 2 + b"--frame--\r\n",
+        )
+
+    async def _run() -> list[bytes | None]:
+        async with _client(_handler) as client:
+            source = await AsyncHttpFrameSource.open(client, "http://rpi/stream")
+            assert source is not None
+            return await _read_all(source, 3)
+
+    assert asyncio.run(_run()) == [_FRAME, _FRAME, None]
+
+
+def test_http_source_polls_plain_endpoint() -> None:
+    requests: list[str] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request.method)
+        return httpx.Response(
+            200, headers={"content-type": "application/octet-stream"}, content=_FRAME
+        )
+
+    async def _run() -> list[bytes | None]:
+        async with _client(_handler) as client:
+            source = await AsyncHttpFrameSource.open(client, "http://rpi/frame")
+            assert source is not None
+            return await _read_all(source, 2)
+
+    assert asyncio.run(_run()) == [_FRAME, _FRAME]
+    assert requests == ["GET", "GET", "GET"]
+
+
+def test_http_source_open_returns_none_when_unreachable() -> None:
+    def _handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("refused", request=request)
+
+    async def _run() -> AsyncHttpFrameSource | None:
+        async with _client(_handler) as client:
+            return await AsyncHttpFrameSource.open(client, "http://rpi/stream")
+
+    assert asyncio.run(_run()) is None
+
+
+class _BlockingCapture:
+    def __init__(self) -> None:
+        self.threads: list[str] = []
+        self.released = False
+
+    def read_frame(self) -> object | None:
+        self.threads.append(threading.current_thread().name)
+        return b"frame"
+
+    def release(self) -> None:
+        self.released = True
+
+
+def test_executor_source_reads_off_the_loop_thread() -> None:
+    hub = CaptureHub(io_threads=1)
+    hub.start()
+    capture = _BlockingCapture()
+    source = ExecutorFrameSource(capture, hub, "rtsp")
+
+    async def _run() -> list[object | None]:
+        frames = [await source.read_frame(), await source.read_frame()]
+        await source.close()
+        return frames
+
+    try:
+        frames = hub.submit(_run()).result(timeout=2.0)
+    finally:
+        hub.close()
+
+    assert frames == [b"frame", b"frame"]
+    assert capture.released is True
+    assert all(name.startswith("capture-io") for name in capture.threads)
+
+
+def test_close_cancels_running_sessions() -> None:
+    hub = CaptureHub()
+    hub.start()
+    started = threading.Event()
+
+    async def _stalled() -> None:
+        started.set()
+        await asyncio.Event().wait()
+
+    future = hub.submit(_stalled())
+    assert started.wait(timeout=2.0)
+    hub.close()
+
+    assert future.cancelled()
@@ -4,7 +4,8 @@ from __future__ import annotations
 
 from types import SimpleNamespace
 
-from rescue_ai.application.inference_config import InferenceConfig
+from rescue_ai.application.inference_config import InferenceConfig, PrefilterConfig
+from rescue_ai.application.inference_timing import detector_score_histogram
 from rescue_ai.infrastructure.yolo_detector import YoloDetector
 
 np = __import__("pytest").importorskip("numpy")
@@ -50,7 +51,7 @@ def test_yolo_detector_detect(monkeypatch) -> None:
         cls_ids=[0],
         names={0: "person"},
     )
-    monkeypatch.setattr(detector, "_predict_raw", lambda _path: [result])
+    monkeypatch.setattr(detector, "_predict_raw", lambda _path, _imgsz=None: [result])
 
     detections = detector.detect("/tmp/frame.jpg")
 
@@ -59,3 +60,125 @@ def test_yolo_detector_detect(monkeypatch) -> None:
     assert detections[0].model_name == "yolo-v2"
     assert detections[0].score > 0.5
     assert detections[0].bbox == (1.0, 2.0, 3.0, 4.0)
+
+
+def test_yolo_detector_detect_batch_splits_into_micro_batches(monkeypatch) -> None:
+    config = InferenceConfig(
+        model_url="http://example.com/model.pt",
+        device="cpu",
+        imgsz=960,
+        nms_iou=0.75,
+        max_det=1000,
+        confidence_threshold=0.2,
+        batch_size=2,
+    )
+    detector = YoloDetector(config=config)
+    person = _fake_result(
+        bboxes=[[1.0, 2.0, 3.0, 4.0]],
+        scores=[0.9],
+        cls_ids=[0],
+        names={0: "person"},
+    )
+    empty = _fake_result(bboxes=[], scores=[], cls_ids=[], names={0: "person"})
+    calls: list[int] = []
+
+    def _fake_predict_batch(sources):
+        calls.append(len(sources))
+        return [person if item == "hit" else empty for item in sources]
+
+    monkeypatch.setattr(detector, "_predict_raw_batch", _fake_predict_batch)
+
+    results = detector.detect_batch(["hit", "miss", "miss", "hit", "hit"])
+
+    assert calls == [2, 2, 1]
+    assert [len(items) for items in results] == [1, 0, 0, 1, 1]
+
+
+def test_detect_in_batches_falls_back_to_single_frame_detect() -> None:
+    from rescue_ai.application.batch_inference import detect_in_batches
+
+    class _SingleFrameDetector:
+        def __init__(self) -> None:
+            self.calls: list[str] = []
+
+        def detect(self, image_uri: str):
+            self.calls.append(image_uri)
+            return []
+
+        def warmup(self) -> None:
+            return None
+
+        def runtime_name(self) -> str:
+            return "single"
+
+    detector = _SingleFrameDetector()
+    assert detect_in_batches(detector, ["a", "b"]) == [[], []]
+    assert detector.calls == ["a", "b"]
+
+
+def test_yolo_detector_records_stage_timings(monkeypatch) -> None:
+    config = InferenceConfig(
+        model_url="http://example.com/model.pt",
+        device="cpu",
+        imgsz=960,
+        nms_iou=0.75,
+        max_det=1000,
+        confidence_threshold=0.2,
+    )
+    detector = YoloDetector(config=config)
+    result = _fake_result(
+        bboxes=[[1.0, 2.0, 3.0, 4.0]],
+        scores=[0.9],
+        cls_ids=[0],
+        names={0: "person"},
+    )
+    result.speed = {"preprocess": 1.5, "inference": 30.0, "postprocess": 0.8}
+    monkeypatch.setattr(detector, "_predict_raw", lambda _path, _imgsz=None: [result])
+
+    detector.detect("/tmp/frame.jpg")
+    detector.detect("/tmp/frame.jpg")
+    timings = detector.stage_timings()
+
+    assert timings["inference"]["count"] == 2
+    assert timings["inference"]["p50_ms"] == 30.0
+    histogram = timings["inference"]["histogram"]
+    assert isinstance(histogram, dict)
+    assert histogram["le_50"] == 2
+    assert timings["nms"]["max_ms"] == 0.8
+    assert timings["postprocess"]["count"] == 2
+    assert timings["decode"]["count"] == 0
+
+
+def test_yolo_prefilter_bins_scores_between_floor_and_threshold(
+    monkeypatch,
+) -> None:
+    config = InferenceConfig(
+        model_url="http://example.com/model.pt",
+        device="cpu",
+        imgsz=960,
+        nms_iou=0.75,
+        max_det=1000,
+        confidence_threshold=0.2,
+        prefilter=PrefilterConfig(score_floor=0.05, histogram_bins=3),
+    )
+    detector = YoloDetector(config=config)
+    detector._person_classes = [0]
+    result = _fake_result(
+        bboxes=[[1.0, 2.0, 3.0, 4.0]] * 4,
+        scores=[0.9, 0.3, 0.1, 0.06],
+        cls_ids=[0, 2, 0, 0],
+        names={0: "person", 2: "car"},
+    )
+    monkeypatch.setattr(detector, "_predict_raw", lambda _path, _imgsz=None: [result])
+
+    detections = detector.detect("/tmp/frame.jpg")
+
+    kwargs = detector._predict_kwargs()
+    assert kwargs["conf"] == 0.05
+    assert kwargs["classes"] == [0]
+    assert [item.score for item in detections] == [0.9]
+    histogram = detector_score_histogram(detector)
+    assert histogram is not None
+    assert histogram["source"] == "post_nms"
+    assert histogram["counts"] == [2, 0, 0]
+    assert histogram["frames"] == 1
@@ -4,10 +4,16 @@ from __future__ import annotations
 
 import argparse
 import json
+from dataclasses import replace
+from types import SimpleNamespace
+from typing import Any
 
 import pytest
 
+from rescue_ai.application.inference_config import PrefilterConfig
 from rescue_ai.config import get_settings
+from rescue_ai.infrastructure.contract_loader import load_stream_contract
+from rescue_ai.infrastructure.yolo_detector import YoloDetector
 from rescue_ai.interfaces.cli import batch as batch_main
 
 
@@ -401,3 +407,55 @@ def test_main_filters_missions_by_mission_ids_csv(monkeypatch, capsys) -> None:
 
     _ = capsys.readouterr()
     assert executed == ["mission-a", "mission-c"]
+
+
+def test_evaluate_model_reports_low_score_histogram_on_torch(monkeypatch) -> None:
+    np = pytest.importorskip("numpy")
+    contract = load_stream_contract()
+    inference = replace(
+        contract.inference,
+        runtime="torch",
+        cascade=None,
+        worker_pool=None,
+        result_cache=None,
+        roi=None,
+        prefilter=PrefilterConfig(score_floor=0.05, histogram_bins=4),
+    )
+    boxes = SimpleNamespace(
+        cls=SimpleNamespace(
+            cpu=lambda: SimpleNamespace(numpy=lambda: np.array([0, 0]))
+        ),
+        conf=SimpleNamespace(
+            cpu=lambda: SimpleNamespace(numpy=lambda: np.array([0.95, 0.06]))
+        ),
+        xyxy=SimpleNamespace(
+            cpu=lambda: SimpleNamespace(numpy=lambda: np.zeros((2, 4)))
+        ),
+    )
+    result = SimpleNamespace(boxes=boxes, names={0: "person"})
+
+    def _fake_predict_batch(_self, sources):
+        return [result for _ in sources]
+
+    def _fake_evaluate(_store, _paths, *, detector_predict_batch, batch_size):
+        _ = batch_size
+        return {"hits": sum(detector_predict_batch(["a.jpg", "b.jpg"]))}
+
+    monkeypatch.setattr(
+        batch_main,
+        "load_stream_contract",
+        lambda: replace(contract, inference=inference),
+    )
+    monkeypatch.setattr(YoloDetector, "_predict_raw_batch", _fake_predict_batch)
+    monkeypatch.setattr(batch_main, "run_evaluate_model_stage", _fake_evaluate)
+
+    unused: Any = object()
+    payload = batch_main._run_evaluate_model(
+        argparse.Namespace(), settings=None, store=unused, paths=unused
+    )
+
+    assert payload["hits"] == 2
+    histogram: Any = payload["low_score_histogram"]
+    assert histogram["source"] == "post_nms"
+    assert histogram["frames"] == 2
+    assert sum(histogram["counts"]) == 2
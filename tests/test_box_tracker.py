@@ -0,0 +1,141 @@
+"""Tests for keyframe tracking and tracked-duplicate alert suppression."""
+
+from __future__ import annotations
+
+import pytest
+
+from rescue_ai.application.detector_parity import box_iou
+from rescue_ai.application.inference_config import TrackerConfig
+from rescue_ai.domain.alert_policy import MissionAlertState, evaluate_alert
+from rescue_ai.domain.entities import Detection, FrameEvent
+from rescue_ai.domain.value_objects import AlertRuleConfig
+from rescue_ai.infrastructure.box_tracker import KeyframeTracker
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("cv2")
+
+
+def _frame(offset_x: int) -> object:
+    rng = np.random.default_rng(7)
+    frame = np.full((240, 320, 3), 90, dtype=np.uint8)
+    patch = rng.integers(0, 255, size=(60, 40, 3), dtype=np.uint8)
+    left = 50 + offset_x
+    right = left + 40
+    frame[100:160, left:right] = patch
+    return frame
+
+
+def _person(bbox: tuple[float, float, float, float], score: float = 0.9) -> Detection:
+    return Detection(bbox=bbox, score=score, label="person", model_name="yolo8n")
+
+
+def test_boxes_follow_optical_flow_between_keyframes() -> None:
+    tracker = KeyframeTracker(TrackerConfig(keyframe_interval=3, score_decay=0.9))
+    assert tracker.propagate(_frame(0)) is None
+
+    keyframe = tracker.update(_frame(0), [_person((50.0, 100.0, 90.0, 160.0))])
+    first = tracker.propagate(_frame(4))
+    second = tracker.propagate(_frame(8))
+    third = tracker.propagate(_frame(12))
+
+    assert keyframe[0].track_id is not None
+    assert first is not None and len(first) == 1
+    assert first[0].track_id == keyframe[0].track_id
+    assert first[0].bbox[0] > 50.0
+    assert first[0].score == pytest.approx(0.81)
+    assert second is not None
+    assert second[0].bbox[0] > first[0].bbox[0]
+    assert third is None  # keyframe due
+
+
+def test_keyframe_detections_keep_track_ids_by_iou() -> None:
+    tracker = KeyframeTracker(TrackerConfig(max_missed_keyframes=0))
+    frame = _frame(0)
+    first = tracker.update(
+        frame, [_person((0.0, 0.0, 10.0, 10.0)), _person((50.0, 50.0, 70.0, 90.0))]
+    )
+    second = tracker.update(
+        frame, [_person((52.0, 51.0, 72.0, 91.0)), _person((200.0, 0.0, 220.0, 30.0))]
+    )
+
+    base = first[0].track_id
+    assert base is not None
+    assert [item.track_id for item in first] == [base, base + 1]
+    assert [item.track_id for item in second] == [base + 1, base + 2]
+    assert box_iou((0.0, 0.0, 10.0, 10.0), (5.0, 0.0, 15.0, 10.0)) == pytest.approx(
+        1 / 3
+    )
+
+
+def test_restarted_stream_tracker_does_not_reuse_alerted_track_ids() -> None:
+    rules = AlertRuleConfig(
+        score_threshold=0.2,
+        window_sec=1.0,
+        quorum_k=1,
+        cooldown_sec=0.0,
+        gap_end_sec=5.0,
+        gt_gap_end_sec=1.0,
+        match_tolerance_sec=1.0,
+    )
+    state = MissionAlertState()
+    box = (50.0, 100.0, 90.0, 160.0)
+
+    def _alerts(tracker: KeyframeTracker, frame_id: int) -> bool:
+        frame_event = FrameEvent(
+            mission_id="m-1",
+            frame_id=frame_id,
+            ts_sec=float(frame_id),
+            image_uri=f"{frame_id}.jpg",
+            gt_person_present=True,
+            gt_episode_id=None,
+        )
+        detections = tracker.update(_frame(0), [_person(box)])
+        return evaluate_alert(frame_event, detections, state, rules).should_create_alert
+
+    assert _alerts(KeyframeTracker(TrackerConfig()), 0) is True
+    # Stream restart: a fresh tracker sees a new person in the same mission.
+    assert _alerts(KeyframeTracker(TrackerConfig()), 1) is True
+
+
+def test_decayed_score_or_lost_track_forces_detection() -> None:
+    tracker = KeyframeTracker(
+        TrackerConfig(keyframe_interval=10, score_decay=0.5, min_track_score=0.3)
+    )
+    tracker.update(_frame(0), [_person((50.0, 100.0, 90.0, 160.0), score=0.5)])
+    assert tracker.propagate(_frame(2)) is None
+
+    tracker.update(_frame(0), [_person((200.0, 10.0, 240.0, 60.0))])
+    assert tracker.propagate(_frame(2)) is None  # flat area, nothing to follow
+
+
+def test_alert_is_not_repeated_for_an_already_alerted_track() -> None:
+    rules = AlertRuleConfig(
+        score_threshold=0.2,
+        window_sec=1.0,
+        quorum_k=1,
+        cooldown_sec=0.0,
+        gap_end_sec=5.0,
+        gt_gap_end_sec=1.0,
+        match_tolerance_sec=1.0,
+    )
+    state = MissionAlertState()
+
+    def _evaluate(frame_id: int, *track_ids: int) -> bool:
+        frame_event = FrameEvent(
+            mission_id="m-1",
+            frame_id=frame_id,
+            ts_sec=float(frame_id),
+            image_uri=f"{frame_id}.jpg",
+            gt_person_present=True,
+            gt_episode_id=None,
+        )
+        detections = [
+            Detection((0.0, 0.0, 10.0, 10.0), 0.9, "person", "yolo8n", None, track_id)
+            for track_id in track_ids
+        ]
+        return evaluate_alert(frame_event, detections, state, rules).should_create_alert
+
+    assert _evaluate(0, 1) is True
+    assert _evaluate(1, 1) is False
+    assert _evaluate(2, 1, 2) is True
+    assert _evaluate(3, 2) is False
@@ -0,0 +1,131 @@
+"""Tests for the low-res/full-res cascade detector."""
+
+from __future__ import annotations
+
+import pytest
+
+from rescue_ai.application.batch_inference import detect_traced
+from rescue_ai.application.inference_config import CascadeConfig, InferenceConfig
+from rescue_ai.domain.entities import Detection
+from rescue_ai.infrastructure.cascade_detector import (
+    PATH_FIRST,
+    PATH_FULL,
+    PATH_SAFETY,
+    CascadeDetector,
+)
+from rescue_ai.infrastructure.contract_loader import _build_inference_config
+from rescue_ai.infrastructure.detector_factory import build_detector
+
+
+def _det(score: float, model: str) -> Detection:
+    return Detection(
+        bbox=(0.0, 0.0, 1.0, 1.0), score=score, label="person", model_name=model
+    )
+
+
+class _ScriptedDetector:
+    def __init__(self, name: str, scores: dict[str, list[float]]) -> None:
+        self.name = name
+        self.scores = scores
+        self.calls: list[str] = []
+
+    def detect(self, image_uri: str) -> list[Detection]:
+        self.calls.append(image_uri)
+        return [_det(score, self.name) for score in self.scores.get(image_uri, [])]
+
+    def warmup(self) -> None:
+        return None
+
+    def runtime_name(self) -> str:
+        return self.name
+
+
+def _cascade(first_scores, *, safety_interval: int = 0):
+    first = _ScriptedDetector("low", first_scores)
+    full = _ScriptedDetector("full", {"uncertain": [0.7], "safety": [0.3]})
+    cascade = CascadeDetector(
+        first_pass=first,
+        full_pass=full,
+        config=CascadeConfig(
+            first_pass_imgsz=320,
+            uncertain_low=0.05,
+            uncertain_high=0.5,
+            safety_interval_frames=safety_interval,
+        ),
+        confidence_threshold=0.2,
+    )
+    return cascade, first, full
+
+
+def test_empty_and_confident_frames_stay_on_first_pass() -> None:
+    cascade, _first, full = _cascade({"confident": [0.9, 0.01], "empty": []})
+
+    detections, path = cascade.detect_traced("confident")
+    assert path == PATH_FIRST
+    assert [d.score for d in detections] == [0.9]
+    assert cascade.detect_traced("empty") == ([], PATH_FIRST)
+    assert not full.calls
+
+
+def test_uncertain_candidate_escalates_to_full_resolution() -> None:
+    cascade, _first, full = _cascade({"uncertain": [0.9, 0.1]})
+
+    detections, path = cascade.detect_traced("uncertain")
+
+    assert path == PATH_FULL
+    assert [d.model_name for d in detections] == ["full"]
+    assert full.calls == ["uncertain"]
+
+
+def test_safety_interval_forces_full_pass_in_batch() -> None:
+    cascade, first, full = _cascade({}, safety_interval=3)
+
+    traced = cascade.detect_batch_traced(["a", "b", "safety", "c"])
+
+    assert [path for _dets, path in traced] == [
+        PATH_FIRST,
+        PATH_FIRST,
+        PATH_SAFETY,
+        PATH_FIRST,
+    ]
+    assert first.calls == ["a", "b", "c"]
+    assert full.calls == ["safety"]
+    assert cascade.path_counts() == {PATH_FIRST: 3, PATH_FULL: 0, PATH_SAFETY: 1}
+
+
+def test_detect_traced_reports_default_path_for_plain_detector() -> None:
+    plain = _ScriptedDetector("plain", {"x": [0.4]})
+    detections, path = detect_traced(plain, "x")
+    assert path == "full"
+    assert len(detections) == 1
+
+
+def test_contract_builds_cascade_detector() -> None:
+    infer = {"imgsz": 960, "cascade": {"enabled": True, "first_pass_imgsz": 416}}
+    config = _build_inference_config({"infer": infer}, 0.2)
+    assert config.cascade == CascadeConfig(first_pass_imgsz=416)
+    assert isinstance(build_detector(config), CascadeDetector)
+
+    assert _build_inference_config({"infer": {"cascade": {}}}, 0.2).cascade is None
+    with pytest.raises(ValueError, match="uncertain_low"):
+        _build_inference_config(
+            {"infer": {"cascade": {"enabled": True, "uncertain_low": 0.9}}}, 0.2
+        )
+
+
+def test_first_pass_uses_band_floor_as_confidence() -> None:
+    config = InferenceConfig(
+        model_url="https://example.com/model.pt",
+        device="cpu",
+        imgsz=960,
+        nms_iou=0.7,
+        max_det=100,
+        confidence_threshold=0.2,
+        cascade=CascadeConfig(first_pass_imgsz=480, uncertain_low=0.05),
+    )
+    detector = build_detector(config)
+    assert isinstance(detector, CascadeDetector)
+    first_config = detector._first_pass._config  # type: ignore[attr-defined]
+    assert first_config.imgsz == 480
+    assert first_config.confidence_threshold == 0.05
+    assert first_config.cascade is None
@@ -0,0 +1,74 @@
+"""Tests for the array-backed DetectionBatch."""
+
+from __future__ import annotations
+
+from rescue_ai.domain.alert_policy import MissionAlertState, evaluate_alert
+from rescue_ai.domain.entities import Detection, FrameEvent
+from rescue_ai.domain.value_objects import AlertRuleConfig
+from rescue_ai.infrastructure.detection_batch import DetectionBatch
+
+np = __import__("pytest").importorskip("numpy")
+
+
+def _batch() -> DetectionBatch:
+    return DetectionBatch(
+        np.array([[0, 0, 10, 10], [5, 5, 20, 20], [1, 2, 3, 4]]),
+        np.array([0.1, 0.8, 0.4]),
+        model_name="yolo8n",
+    )
+
+
+def test_batch_materializes_detections_on_access() -> None:
+    batch = _batch()
+
+    assert len(batch) == 3
+    assert batch[1] == Detection(
+        bbox=(5.0, 5.0, 20.0, 20.0), score=0.8, label="person", model_name="yolo8n"
+    )
+    assert batch[-1] is batch[2]
+    assert batch.max_score() == 0.8
+    assert [item.score for item in batch[1:]] == [0.8, 0.4]
+    assert not DetectionBatch([], [], model_name="yolo8n")
+    assert batch == list(_batch())
+
+
+def test_select_filters_without_touching_rejected_boxes() -> None:
+    batch = _batch()
+
+    selected = batch.select(min_score=0.3, label="person")
+
+    assert isinstance(selected, DetectionBatch)
+    assert [item.score for item in selected] == [0.8, 0.4]
+    assert not batch._materialized
+    assert len(batch.select(min_score=0.0, label="car")) == 0
+
+
+def test_evaluate_alert_accepts_detection_batch() -> None:
+    rules = AlertRuleConfig(
+        score_threshold=0.5,
+        window_sec=1.0,
+        quorum_k=1,
+        cooldown_sec=1.0,
+        gap_end_sec=1.0,
+        gt_gap_end_sec=1.0,
+        match_tolerance_sec=1.0,
+    )
+    frame_event = FrameEvent(
+        mission_id="m-1",
+        frame_id=0,
+        ts_sec=0.0,
+        image_uri="frame.jpg",
+        gt_person_present=False,
+        gt_episode_id=None,
+    )
+
+    evaluation = evaluate_alert(
+        frame_event=frame_event,
+        detections=_batch(),
+        mission_state=MissionAlertState(),
+        rules=rules,
+    )
+
+    assert evaluation.should_create_alert is True
+    assert evaluation.positives == [_batch()[1]]
+    assert evaluation.people_detected == 1
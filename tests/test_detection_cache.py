@@ -0,0 +1,225 @@
+"""Tests for the content-hash detection result cache."""
+
+from __future__ import annotations
+
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+from rescue_ai.application.inference_config import (
+    InferenceConfig,
+    PrefilterConfig,
+    ResultCacheConfig,
+)
+from rescue_ai.domain.entities import Detection
+from rescue_ai.infrastructure.detection_cache import (
+    PATH_CACHE,
+    CachedDetector,
+    DetectionCache,
+    frame_digest,
+    model_file_sha256,
+    model_fingerprint,
+)
+from rescue_ai.infrastructure.detector_factory import build_detector
+
+_MODEL_SHA256 = "0" * 64
+
+
+class _CountingDetector:
+    def __init__(self) -> None:
+        self.calls: list[object] = []
+
+    def detect(self, image_uri: object) -> list[Detection]:
+        self.calls.append(image_uri)
+        return [
+            Detection(
+                bbox=(1.0, 2.0, 3.0, 4.0),
+                score=0.9,
+                label="person",
+                model_name="fake",
+            )
+        ]
+
+    def warmup(self) -> None:
+        return None
+
+    def runtime_name(self) -> str:
+        return "fake"
+
+
+def _config() -> InferenceConfig:
+    return InferenceConfig(
+        model_url="https://example.com/model.pt",
+        device="cpu",
+        imgsz=960,
+        nms_iou=0.75,
+        max_det=1000,
+        confidence_threshold=0.2,
+    )
+
+
+def _cached(tmp_path: Path, inner: _CountingDetector, **kwargs) -> CachedDetector:
+    cache = DetectionCache(
+        memory_entries=kwargs.get("memory_entries", 8),
+        disk_dir=tmp_path / "cache",
+        disk_max_bytes=kwargs.get("disk_max_bytes", 1024 * 1024),
+    )
+    return CachedDetector(
+        inner,
+        cache=cache,
+        fingerprint=lambda: model_fingerprint(_config(), model_sha256=_MODEL_SHA256),
+    )
+
+
+def test_repeated_frame_is_served_from_memory(tmp_path: Path) -> None:
+    inner = _CountingDetector()
+    detector = _cached(tmp_path, inner)
+
+    first = detector.detect(b"jpeg-a")
+    second, path = detector.detect_traced(b"jpeg-a")
+
+    assert first == second
+    assert path == PATH_CACHE
+    assert len(inner.calls) == 1
+    stats = detector.cache_stats()
+    assert stats["memory_hits"] == 1
+    assert stats["misses"] == 1
+
+
+def test_disk_tier_survives_new_process_and_file_paths_hash_content(
+    tmp_path: Path,
+) -> None:
+    frame_a = tmp_path / "run1" / "frame.jpg"
+    frame_b = tmp_path / "run2" / "frame.jpg"
+    for frame in (frame_a, frame_b):
+        frame.parent.mkdir()
+        frame.write_bytes(b"same-content")
+    _cached(tmp_path, _CountingDetector()).detect_batch([str(frame_a)])
+
+    inner = _CountingDetector()
+    detector = _cached(tmp_path, inner)
+    results = detector.detect_batch([str(frame_b), b"other"])
+
+    assert results[0][0].bbox == (1.0, 2.0, 3.0, 4.0)
+    assert inner.calls == [b"other"]
+    assert detector.cache_stats()["disk_hits"] == 1
+
+
+def test_disk_budget_evicts_oldest_entries(tmp_path: Path) -> None:
+    detector = _cached(tmp_path, _CountingDetector(), disk_max_bytes=400)
+
+    for idx in range(10):
+        detector.detect(f"frame-{idx}".encode())
+
+    sizes = [path.stat().st_size for path in (tmp_path / "cache").glob("*/*.json")]
+    assert 0 < len(sizes) < 10
+    assert sum(sizes) <= 400
+
+
+def test_fingerprint_changes_with_inference_settings() -> None:
+    base = _config()
+
+    def fingerprint(config: InferenceConfig, model_sha256: str = _MODEL_SHA256):
+        return model_fingerprint(config, model_sha256=model_sha256)
+
+    assert fingerprint(base) == fingerprint(_config())
+    assert fingerprint(base) != fingerprint(replace(base, imgsz=640))
+    assert fingerprint(base) != fingerprint(replace(base, confidence_threshold=0.3))
+    assert fingerprint(base) != fingerprint(base, model_sha256="a" * 64)
+    prefiltered = replace(base, prefilter=PrefilterConfig())
+    assert fingerprint(base) != fingerprint(prefiltered)
+    assert fingerprint(prefiltered) != fingerprint(
+        replace(base, prefilter=PrefilterConfig(score_floor=0.1))
+    )
+
+
+def test_model_digest_follows_the_rebuilt_int8_file(
+    tmp_path: Path, monkeypatch
+) -> None:
+    from rescue_ai.infrastructure import onnx_detector
+
+    monkeypatch.setattr(onnx_detector, "MODEL_CACHE_DIR", tmp_path)
+    config = replace(_config(), runtime="onnx", precision="int8")
+    int8_path = tmp_path / "model.int8.onnx"
+
+    with pytest.raises(RuntimeError, match="not found"):
+        model_file_sha256(config)
+    int8_path.write_bytes(b"int8-v1")
+    first = model_file_sha256(config)
+    int8_path.write_bytes(b"int8-v2")
+
+    assert model_file_sha256(config) != first
+
+
+def test_cache_stays_disabled_without_a_model_digest(tmp_path: Path) -> None:
+    inner = _CountingDetector()
+
+    def missing_model() -> str:
+        raise RuntimeError("ONNX model not found")
+
+    detector = CachedDetector(
+        inner,
+        cache=DetectionCache(
+            memory_entries=8, disk_dir=tmp_path / "cache", disk_max_bytes=1024
+        ),
+        fingerprint=missing_model,
+    )
+    detector.detect(b"frame")
+    _, path = detector.detect_traced(b"frame")
+
+    assert len(inner.calls) == 2
+    assert path != PATH_CACHE
+    assert not (tmp_path / "cache").exists()
+
+
+def test_overwritten_entry_is_counted_once(tmp_path: Path) -> None:
+    cache = DetectionCache(
+        memory_entries=0, disk_dir=tmp_path / "cache", disk_max_bytes=1024 * 1024
+    )
+    detections = _CountingDetector().detect(b"frame")
+
+    for _ in range(5):
+        cache.put("ab" + "0" * 62, detections)
+
+    on_disk = sum(path.stat().st_size for path in (tmp_path / "cache").glob("*/*.json"))
+    assert cache.stats()["disk_bytes"] == on_disk
+
+
+def test_unhashable_source_bypasses_cache(tmp_path: Path) -> None:
+    inner = _CountingDetector()
+    detector = _cached(tmp_path, inner)
+
+    assert frame_digest(str(tmp_path / "missing.jpg")) is None
+    detector.detect(str(tmp_path / "missing.jpg"))
+    detector.detect(str(tmp_path / "missing.jpg"))
+
+    assert len(inner.calls) == 2
+
+
+def test_factory_wraps_detector_when_result_cache_enabled(tmp_path: Path) -> None:
+    config = replace(
+        _config(),
+        result_cache=ResultCacheConfig(disk_dir=str(tmp_path), disk_max_mb=1),
+    )
+
+    assert isinstance(build_detector(config), CachedDetector)
+    assert not isinstance(build_detector(_config()), CachedDetector)
+
+
+def test_detector_stats_endpoint_reports_cache_counters(
+    tmp_path: Path, monkeypatch
+) -> None:
+    from rescue_ai.interfaces.api import detector_routes
+    from rescue_ai.interfaces.api.app import app
+
+    detector = _cached(tmp_path, _CountingDetector())
+    detector.detect(b"jpeg")
+    monkeypatch.setattr(detector_routes, "get_detector", lambda: detector)
+
+    response = TestClient(app).get("/detector/stats")
+
+    assert response.status_code == 200
+    assert response.json()["runtime"] == "fake"
+    assert response.json()["result_cache"]["misses"] == 1
@@ -0,0 +1,136 @@
+"""Tests for the multi-process detector pool."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from rescue_ai.application.inference_config import (
+    InferenceConfig,
+    SchedulerConfig,
+    WorkerPoolConfig,
+)
+from rescue_ai.application.inference_scheduler import (
+    PRIORITY_STREAM,
+    InferenceScheduler,
+    ScheduledDetector,
+)
+from rescue_ai.application.model_swap import SwappableDetector
+from rescue_ai.domain.entities import Detection
+from rescue_ai.infrastructure.detection_cache import CachedDetector, DetectionCache
+from rescue_ai.infrastructure.detector_pool import ProcessPoolDetector
+
+np = pytest.importorskip("numpy")
+
+
+class _EchoDetector:
+    """Reports the source size and worker pid; exits once on a crash marker."""
+
+    def detect(self, image_uri: object) -> list[Detection]:
+        if isinstance(image_uri, str) and image_uri.endswith(".crash"):
+            marker = Path(image_uri)
+            if not marker.exists():
+                marker.write_text("crashed", encoding="utf-8")
+                os._exit(1)
+        size = len(image_uri) if isinstance(image_uri, bytes) else 0
+        if isinstance(image_uri, np.ndarray):
+            size = int(image_uri.sum())
+        return [
+            Detection(
+                bbox=(0.0, 0.0, float(size), float(os.getpid())),
+                score=0.9,
+                label="person",
+                model_name=f"threads={os.environ.get('OMP_NUM_THREADS')}",
+            )
+        ]
+
+    def warmup(self) -> None:
+        return None
+
+    def runtime_name(self) -> str:
+        return "echo"
+
+
+def _build_echo(_config: InferenceConfig) -> _EchoDetector:
+    return _EchoDetector()
+
+
+def _pool(workers: int = 2) -> ProcessPoolDetector:
+    config = InferenceConfig(
+        model_url="http://example.com/model.pt",
+        device="cpu",
+        imgsz=960,
+        nms_iou=0.75,
+        max_det=1000,
+        confidence_threshold=0.2,
+        batch_size=2,
+    )
+    return ProcessPoolDetector(
+        config,
+        pool=WorkerPoolConfig(workers=workers, threads_per_worker=3),
+        builder=_build_echo,
+    )
+
+
+def test_pool_transfers_bytes_and_arrays_through_shared_memory() -> None:
+    detector = _pool()
+    try:
+        frames: list[object] = [
+            b"jpeg-bytes",
+            np.ones((4, 5, 3), dtype=np.uint8),
+            b"x",
+            "frame.jpg",
+        ]
+        results = detector.detect_batch(frames)
+        detector.warmup()
+    finally:
+        detector.close()
+
+    assert [items[0].bbox[2] for items in results] == [10.0, 60.0, 1.0, 0.0]
+    assert {items[0].model_name for items in results} == {"threads=3"}
+    assert len({items[0].bbox[3] for items in results}) == 2
+    assert detector.runtime_name() == "pool[2](torch)"
+
+
+def test_crashed_worker_is_restarted_and_batch_resubmitted(tmp_path: Path) -> None:
+    detector = _pool(workers=1)
+    try:
+        first_pid = detector.detect(b"warm")[0].bbox[3]
+        detections, path = detector.detect_traced(str(tmp_path / "frame.crash"))
+        second_pid = detector.detect(b"again")[0].bbox[3]
+    finally:
+        detector.close()
+
+    assert path == "full"
+    assert detections[0].bbox[2] == 0.0
+    assert first_pid != second_pid
+
+
+def test_hot_swap_closes_the_pool_of_a_retired_wrapped_stack() -> None:
+    pools = [_pool(workers=1) for _ in range(3)]
+    stacks = [
+        CachedDetector(
+            pool,
+            cache=DetectionCache(memory_entries=0, disk_dir=None, disk_max_bytes=0),
+            fingerprint=lambda: "test",
+        )
+        for pool in pools
+    ]
+    pools[0].detect(b"start")
+    processes = [worker.process for worker in pools[0]._workers]
+    scheduler = InferenceScheduler(SchedulerConfig())
+    swappable = SwappableDetector(stacks[0], pools[0]._config)
+    scheduled = ScheduledDetector(swappable, scheduler, priority=PRIORITY_STREAM)
+    try:
+        swappable.swap(stacks[1], pools[1]._config)
+        assert all(process.is_alive() for process in processes)
+        # The first stack leaves the rollback slot and is closed.
+        swappable.swap(stacks[2], pools[2]._config)
+
+        assert processes
+        assert not any(process.is_alive() for process in processes)
+    finally:
+        scheduled.close()
+        scheduler.close()
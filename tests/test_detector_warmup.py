@@ -0,0 +1,70 @@
+"""Tests for background detector warmup and readiness tracking."""
+
+from __future__ import annotations
+
+from rescue_ai.application.detector_warmup import (
+    WARMUP_FAILED,
+    WARMUP_READY,
+    WARMUP_UNAVAILABLE,
+    WARMUP_WARMING,
+    DetectorWarmup,
+)
+from rescue_ai.domain.entities import Detection
+
+
+class _FakeDetector:
+    def __init__(self, *, fail: bool = False) -> None:
+        self.calls: list[str] = []
+        self._fail = fail
+
+    def detect(self, image_uri: str) -> list[Detection]:
+        _ = image_uri
+        return []
+
+    def warmup(self) -> None:
+        self.calls.append("warmup")
+        if self._fail:
+            raise RuntimeError("model download failed")
+
+    def warmup_inference(self) -> None:
+        self.calls.append("warmup_inference")
+
+    def runtime_name(self) -> str:
+        return "fake"
+
+
+def test_background_warmup_loads_model_then_runs_dummy_forward() -> None:
+    detector = _FakeDetector()
+    warmup = DetectorWarmup(detector)
+    assert warmup.status == WARMUP_WARMING
+
+    warmup.start()
+
+    assert warmup.wait(timeout=5.0) is True
+    assert detector.calls == ["warmup", "warmup_inference"]
+    metrics = warmup.metrics()
+    assert metrics["status"] == WARMUP_READY
+    assert isinstance(metrics["cold_start_ms"], float)
+    assert isinstance(metrics["model_load_ms"], float)
+    assert isinstance(metrics["first_inference_ms"], float)
+    assert metrics["warming_for_ms"] is None
+
+
+def test_failed_warmup_is_reported_with_error() -> None:
+    warmup = DetectorWarmup(_FakeDetector(fail=True))
+
+    warmup.run()
+
+    metrics = warmup.metrics()
+    assert warmup.ready is False
+    assert metrics["status"] == WARMUP_FAILED
+    assert metrics["error"] == "RuntimeError: model download failed"
+    assert metrics["first_inference_ms"] is None
+
+
+def test_missing_detector_is_unavailable() -> None:
+    warmup = DetectorWarmup(None)
+    warmup.start()
+
+    assert warmup.status == WARMUP_UNAVAILABLE
+    assert warmup.wait(timeout=0.1) is False
@@ -0,0 +1,92 @@
+"""Tests for reduced-resolution JPEG decoding."""
+
+from __future__ import annotations
+
+from dataclasses import replace
+from types import SimpleNamespace
+
+import pytest
+
+from rescue_ai.application.inference_config import InferenceConfig
+from rescue_ai.infrastructure.frame_decode import (
+    decode_jpeg,
+    jpeg_dimensions,
+    reduced_decode_factor,
+)
+from rescue_ai.infrastructure.yolo_detector import YoloDetector
+
+np = pytest.importorskip("numpy")
+cv2 = pytest.importorskip("cv2")
+
+
+def _jpeg(width: int, height: int) -> bytes:
+    frame = np.zeros((height, width, 3), dtype=np.uint8)
+    frame[:, : width // 2] = 200
+    ok, encoded = cv2.imencode(".jpg", frame)
+    assert ok
+    return encoded.tobytes()
+
+
+def test_jpeg_dimensions_reads_sof_header() -> None:
+    assert jpeg_dimensions(_jpeg(3840, 2160)) == (3840, 2160)
+    assert jpeg_dimensions(b"not a jpeg") is None
+
+
+@pytest.mark.parametrize(
+    ("width", "height", "target", "factor"),
+    [(3840, 2160, 960, 4), (3840, 2160, 1280, 2), (1280, 720, 960, 1)],
+)
+def test_reduced_decode_factor_keeps_long_side_above_target(
+    width: int, height: int, target: int, factor: int
+) -> None:
+    assert reduced_decode_factor(width, height, target) == factor
+
+
+def test_decode_jpeg_reports_scale_back_to_source_pixels() -> None:
+    decoded = decode_jpeg(_jpeg(3840, 2160), target_size=960)
+
+    assert decoded.image.shape[:2] == (540, 960)
+    assert (decoded.scale_x, decoded.scale_y) == (4.0, 4.0)
+    assert decoded.reduced
+    assert not decode_jpeg(_jpeg(640, 480), target_size=960).reduced
+
+
+def test_yolo_detector_maps_reduced_decode_boxes_to_source(monkeypatch) -> None:
+    config = InferenceConfig(
+        model_url="http://example.com/model.pt",
+        device="cpu",
+        imgsz=960,
+        nms_iou=0.75,
+        max_det=1000,
+        confidence_threshold=0.2,
+    )
+    detector = YoloDetector(config=replace(config, reduced_decode=True))
+    seen_shapes: list[tuple[int, ...]] = []
+
+    def _fake_predict(source, _imgsz=None):
+        seen_shapes.append(source.shape)
+        return [
+            SimpleNamespace(
+                boxes=SimpleNamespace(
+                    cls=SimpleNamespace(
+                        cpu=lambda: SimpleNamespace(numpy=lambda: np.array([0]))
+                    ),
+                    conf=SimpleNamespace(
+                        cpu=lambda: SimpleNamespace(numpy=lambda: np.array([0.9]))
+                    ),
+                    xyxy=SimpleNamespace(
+                        cpu=lambda: SimpleNamespace(
+                            numpy=lambda: np.array([[10.0, 20.0, 30.0, 40.0]])
+                        )
+                    ),
+                ),
+                names={0: "person"},
+            )
+        ]
+
+    monkeypatch.setattr(detector, "_predict_raw", _fake_predict)
+
+    detections = detector.detect(_jpeg(3840, 2160))
+
+    assert seen_shapes == [(540, 960, 3)]
+    assert detections[0].bbox == (40.0, 80.0, 120.0, 160.0)
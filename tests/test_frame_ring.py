@@ -0,0 +1,45 @@
+"""Tests for the in-memory ring of recent stream frames."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from rescue_ai.infrastructure.frame_decode import decode_jpeg
+from rescue_ai.infrastructure.frame_ring import FrameRingBuffer
+
+
+def test_ring_evicts_oldest_frame() -> None:
+    ring = FrameRingBuffer(capacity=2)
+
+    for frame_id in range(3):
+        ring.put(frame_id, f"frame-{frame_id}".encode())
+
+    assert len(ring) == 2
+    assert ring.get(0) is None
+    assert ring.get(2) == b"frame-2"
+    assert ring.jpeg(0) is None
+
+
+def test_ring_returns_jpeg_bytes_as_captured() -> None:
+    ring = FrameRingBuffer(capacity=1)
+    ring.put(7, b"\xff\xd8\xff\xd9")
+
+    assert ring.jpeg(7) == b"\xff\xd8\xff\xd9"
+
+
+def test_ring_encodes_arrays_on_demand() -> None:
+    ring = FrameRingBuffer(capacity=1)
+    image = np.full((16, 24, 3), 200, dtype=np.uint8)
+    ring.put(0, image)
+
+    assert ring.get(0) is image
+    encoded = ring.jpeg(0)
+
+    assert encoded is not None
+    assert decode_jpeg(encoded).image.shape == (16, 24, 3)
+
+
+def test_ring_capacity_must_be_positive() -> None:
+    with pytest.raises(ValueError, match="capacity"):
+        FrameRingBuffer(capacity=0)
@@ -0,0 +1,162 @@
+"""Tests for the priority scheduler shared by streams and /predict."""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, cast
+
+import pytest
+
+from rescue_ai.application.inference_config import SchedulerConfig
+from rescue_ai.application.inference_scheduler import (
+    PRIORITY_PREDICT,
+    PRIORITY_STREAM,
+    InferenceDropped,
+    InferenceRejected,
+    InferenceScheduler,
+    ScheduledDetector,
+)
+from rescue_ai.domain.entities import Detection
+
+
+def _blocked_scheduler(
+    config: SchedulerConfig,
+) -> tuple[InferenceScheduler, threading.Event]:
+    """Start a one-worker scheduler whose worker is busy until released."""
+    scheduler = InferenceScheduler(config)
+    scheduler.start()
+    release, started = threading.Event(), threading.Event()
+
+    def _busy() -> None:
+        started.set()
+        release.wait(5)
+
+    scheduler.submit(PRIORITY_PREDICT, _busy)
+    assert started.wait(5)
+    return scheduler, release
+
+
+def test_stream_jobs_run_before_queued_predict_jobs() -> None:
+    scheduler, release = _blocked_scheduler(SchedulerConfig())
+    order: list[str] = []
+    predict = scheduler.submit(PRIORITY_PREDICT, lambda: order.append("predict"))
+    stream = scheduler.submit(PRIORITY_STREAM, lambda: order.append("stream"))
+
+    release.set()
+    predict.result(5)
+    stream.result(5)
+    scheduler.close()
+
+    assert order == ["stream", "predict"]
+
+
+def test_full_predict_queue_rejects_new_requests() -> None:
+    scheduler, release = _blocked_scheduler(SchedulerConfig(predict_queue_size=1))
+    scheduler.submit(PRIORITY_PREDICT, lambda: None)
+
+    with pytest.raises(InferenceRejected, match="full"):
+        scheduler.submit(PRIORITY_PREDICT, lambda: None)
+
+    assert _class_stats(scheduler, PRIORITY_PREDICT)["rejected"] == 1
+    assert _class_stats(scheduler, PRIORITY_PREDICT)["queue_depth"] == 1
+    release.set()
+    scheduler.close()
+
+
+def test_stream_overflow_and_deadline_drop_stale_frames() -> None:
+    scheduler, release = _blocked_scheduler(
+        SchedulerConfig(stream_queue_size=2, stream_deadline_ms=50)
+    )
+    oldest = scheduler.submit(PRIORITY_STREAM, lambda: "oldest")
+    middle = scheduler.submit(PRIORITY_STREAM, lambda: "middle")
+    scheduler.submit(PRIORITY_STREAM, lambda: "newest")
+
+    with pytest.raises(InferenceDropped, match="queue full"):
+        oldest.result(1)
+
+    time.sleep(0.1)
+    release.set()
+    with pytest.raises(InferenceDropped, match="deadline"):
+        middle.result(5)
+    fresh = scheduler.submit(PRIORITY_STREAM, lambda: "fresh")
+
+    assert fresh.result(5) == "fresh"
+    stream_stats = _class_stats(scheduler, PRIORITY_STREAM)
+    assert stream_stats["dropped"] == 3
+    assert stream_stats["completed"] == 1
+    scheduler.close()
+
+
+def test_predict_times_out_while_queued_behind_busy_worker() -> None:
+    scheduler, release = _blocked_scheduler(SchedulerConfig())
+    detector = ScheduledDetector(
+        _FakeDetector(), scheduler, priority=PRIORITY_PREDICT, timeout_sec=0.05
+    )
+
+    with pytest.raises(InferenceRejected, match="did not start"):
+        detector.detect("frame.jpg")
+
+    release.set()
+    stream = ScheduledDetector(_FakeDetector(), scheduler, priority=PRIORITY_STREAM)
+    assert stream.detect_traced("frame.jpg")[1] == "full"
+    scheduler.close()
+
+
+def test_scheduled_detector_exposes_roi_pass_only_when_wrapped_has_one() -> None:
+    scheduler = InferenceScheduler(SchedulerConfig())
+    scheduler.start()
+    plain = ScheduledDetector(_FakeDetector(), scheduler, priority=PRIORITY_STREAM)
+    roi = ScheduledDetector(_RoiDetector(), scheduler, priority=PRIORITY_STREAM)
+
+    assert not callable(getattr(plain, "detect_regions", None))
+    detect_regions = roi.detect_regions
+    assert detect_regions is not None
+    assert detect_regions("frame.jpg", [(0.0, 0.0, 1.0, 1.0)]) == ["frame.jpg"]
+    scheduler.close()
+
+
+def test_warmup_runs_on_a_scheduler_worker() -> None:
+    scheduler = InferenceScheduler(SchedulerConfig())
+    scheduler.start()
+    detector = _RoiDetector()
+    scheduled = ScheduledDetector(detector, scheduler, priority=PRIORITY_PREDICT)
+
+    scheduled.warmup()
+    assert scheduled.warmup_inference() is True
+
+    assert len(detector.warmup_threads) == 2
+    assert threading.current_thread().name not in detector.warmup_threads
+    scheduler.close()
+
+
+def _class_stats(scheduler: InferenceScheduler, name: str) -> dict[str, Any]:
+    classes = cast(dict[str, dict[str, Any]], scheduler.stats()["classes"])
+    return classes[name]
+
+
+class _FakeDetector:
+    def detect(self, image_uri: object) -> list[Detection]:
+        _ = image_uri
+        return [Detection((0.0, 0.0, 1.0, 1.0), 0.9, "person", "fake", None)]
+
+    def warmup(self) -> None:
+        return None
+
+    def runtime_name(self) -> str:
+        return "fake"
+
+
+class _RoiDetector(_FakeDetector):
+    def __init__(self) -> None:
+        self.warmup_threads: list[str] = []
+
+    def detect_regions(self, image_uri: object, regions: object) -> list[object]:
+        _ = regions
+        return [image_uri]
+
+    def warmup(self) -> None:
+        self.warmup_threads.append(threading.current_thread().name)
+
+    def warmup_inference(self) -> None:
+        self.warmup_threads.append(threading.current_thread().name)
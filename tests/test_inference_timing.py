@@ -0,0 +1,34 @@
+"""Tests for rolling per-stage inference timings."""
+
+from __future__ import annotations
+
+from rescue_ai.application.inference_timing import StageTimings, detector_stage_timings
+
+
+def test_stage_timings_keep_a_rolling_window() -> None:
+    timings = StageTimings(window=3)
+    for value in (1.0, 100.0, 3.0, 4.0):
+        timings.record("inference", value)
+
+    summary = timings.snapshot()["inference"]
+
+    assert summary["count"] == 3
+    assert summary["max_ms"] == 100.0
+    assert summary["p50_ms"] == 4.0
+    histogram = summary["histogram"]
+    assert isinstance(histogram, dict)
+    assert histogram["le_5"] == 2
+    assert histogram["le_100"] == 1
+    assert timings.snapshot()["decode"] == {
+        "count": 0,
+        "histogram": dict.fromkeys(histogram, 0),
+    }
+
+
+def test_detector_stage_timings_is_optional() -> None:
+    class _Instrumented:
+        def stage_timings(self):
+            return {"inference": {"count": 1}}
+
+    assert detector_stage_timings(object()) is None
+    assert detector_stage_timings(_Instrumented()) == {"inference": {"count": 1}}
@@ -0,0 +1,132 @@
+"""Tests for single-pass COCO parsing and the annotation cache."""
+
+from __future__ import annotations
+
+import pytest
+
+from rescue_ai.infrastructure.mission_annotations import (
+    AnnotationCache,
+    GtBitset,
+    parse_mission_annotations,
+)
+
+
+def test_gt_bitset_packs_positions() -> None:
+    bits = GtBitset(10, [0, 9, 42])
+
+    assert len(bits) == 10
+    assert bits[0] is True and bits[-1] is True
+    assert bits[1:4] == [False, False, False]
+    assert sum(bits) == 2
+    with pytest.raises(IndexError):
+        _ = bits[10]
+
+
+def test_gt_sequence_filters_non_person_annotations() -> None:
+    payload = {
+        "images": [
+            {"id": 2, "file_name": "0002.jpg"},
+            {"id": 1, "file_name": "0001.jpg"},
+        ],
+        "categories": [{"id": 1, "name": "person"}, {"id": 2, "name": "car"}],
+        "annotations": [
+            {"image_id": 2, "category_id": 2},
+            {"image_id": 1, "category_id": 1},
+        ],
+    }
+
+    annotations = parse_mission_annotations(payload)
+
+    assert annotations is not None
+    assert list(annotations.gt_sequence or []) == [True, False]
+
+
+def test_gt_sequence_uses_numeric_filename_gaps_as_negatives() -> None:
+    payload = {
+        "images": [
+            {"id": 1, "file_name": "000002.jpg"},
+            {"id": 2, "file_name": "000007.jpg"},
+            {"id": 3, "file_name": "000011.jpg"},
+        ],
+        "categories": [{"id": 1, "name": "person"}],
+        "annotations": [
+            {"image_id": 1, "category_id": 1},
+            {"image_id": 3, "category_id": 1},
+        ],
+    }
+
+    annotations = parse_mission_annotations(payload)
+
+    # Sequence spans 2..11; only frames 2 and 11 are positive.
+    assert annotations is not None
+    seq = annotations.gt_sequence
+    assert seq is not None
+    assert len(seq) == 10
+    assert seq[0] is True  # frame 2
+    assert seq[9] is True  # frame 11
+    assert sum(1 for item in seq if item) == 2
+
+
+def test_source_filenames_follow_frame_numbers() -> None:
+    payload: dict[str, object] = {
+        "images": [
+            {"id": 2, "file_name": "frames/013203.jpg"},
+            {"id": 1, "file_name": "frames/013202.jpg"},
+        ]
+    }
+
+    annotations = parse_mission_annotations(payload)
+
+    assert annotations is not None
+    assert annotations.source_filenames == ["013202.jpg", "013203.jpg"]
+    assert annotations.gt_sequence is None
+
+
+def test_unnumbered_frames_fall_back_to_file_name_order() -> None:
+    payload = {
+        "images": [
+            {"id": 1, "file_name": "b.jpg"},
+            {"id": 2, "file_name": "a.jpg"},
+        ],
+        "annotations": [{"image_id": 2}],
+    }
+
+    annotations = parse_mission_annotations(payload)
+
+    assert annotations is not None
+    assert list(annotations.gt_sequence or []) == [True, False]
+    assert annotations.source_filenames == ["a.jpg", "b.jpg"]
+
+
+def test_cache_round_trips_through_disk(tmp_path) -> None:
+    payload = {"images": [{"id": 1, "file_name": "0001.jpg"}], "annotations": []}
+    annotations = parse_mission_annotations(payload)
+    assert annotations is not None
+    body = b'{"images": [{"id": 1, "file_name": "0001.jpg"}], "annotations": []}'
+    validators = {"etag": '"v1"', "last_modified": "Tue, 01 Sep 2026 10:00:00 GMT"}
+
+    AnnotationCache(tmp_path).store(
+        "/m/ann.json", body, validators=validators, annotations=annotations
+    )
+    cache = AnnotationCache(tmp_path)
+
+    assert cache.conditional_headers("/m/ann.json") == {
+        "If-None-Match": '"v1"',
+        "If-Modified-Since": "Tue, 01 Sep 2026 10:00:00 GMT",
+    }
+    assert not cache.conditional_headers("/other.json")
+    loaded = cache.load("/m/ann.json")
+    assert loaded is not None
+    assert loaded.payload == payload
+    assert cache.load("/m/ann.json") is loaded
+
+
+def test_cache_skips_responses_without_validators(tmp_path) -> None:
+    annotations = parse_mission_annotations({"images": []})
+    assert annotations is not None
+    cache = AnnotationCache(tmp_path)
+
+    cache.store("/m/ann.json", b"{}", validators={}, annotations=annotations)
+
+    assert not cache.conditional_headers("/m/ann.json")
+    assert not list(tmp_path.iterdir())
@@ -0,0 +1,73 @@
+"""Tests for the incremental MJPEG multipart parser."""
+
+from __future__ import annotations
+
+import pytest
+
+from rescue_ai.infrastructure.mjpeg_parser import MjpegParser
+
+# EXIF-style thumbnail: an inner SOI/EOI pair inside the outer JPEG.
+_FRAME_A = b"\xff\xd8exif\xff\xd8thumb\xff\xd9pixels-a\xff\xd9"
+_FRAME_B = b"\xff\xd8pixels-b\xff\xd9"
+
+
+def _part(frame: bytes, *, sized: bool = True, boundary: bytes = b"frame") -> bytes:
+    headers = b"Content-Type: image/jpeg\r\n"
+    if sized:
+        headers += b"Content-Length: %d\r\n" % len(frame)
+    return b"--" + boundary + b"\r\n" + headers + b"\r\n" + frame + b"\r\n"
+
+
+def _drain(parser: MjpegParser, data: bytes, chunk_size: int) -> list[bytes]:
+    frames: list[bytes] = []
+    for start in range(0, len(data), chunk_size):
+        stop = start + chunk_size
+        parser.feed(data[start:stop])
+        while (frame := parser.next_frame()) is not None:
+            frames.append(frame)
+    return frames
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 4096])
+def test_sized_parts_keep_embedded_eoi(chunk_size: int) -> None:
+    parser = MjpegParser("frame")
+    stream = b"preamble\r\n" + _part(_FRAME_A) + _part(_FRAME_B)
+
+    assert _drain(parser, stream, chunk_size) == [_FRAME_A, _FRAME_B]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 5, 4096])
+def test_parts_without_length_split_on_boundary(chunk_size: int) -> None:
+    parser = MjpegParser("frame")
+    stream = _part(_FRAME_A, sized=False) + _part(_FRAME_B, sized=False)
+    stream += b"--frame\r\n"
+
+    assert _drain(parser, stream, chunk_size) == [_FRAME_A, _FRAME_B]
+
+
+def test_boundary_is_read_from_content_type() -> None:
+    parser = MjpegParser.from_content_type(
+        'multipart/x-mixed-replace; boundary="--spionisto"'
+    )
+    stream = _part(_FRAME_B, boundary=b"--spionisto")
+
+    assert _drain(parser, stream, 64) == [_FRAME_B]
+    assert parser.buffered == 2
+
+
+def test_without_boundary_falls_back_to_jpeg_markers() -> None:
+    parser = MjpegParser.from_content_type("multipart/x-mixed-replace")
+    stream = b"noise\xff" + _FRAME_B + b"junk" + _FRAME_B
+
+    assert _drain(parser, stream, 3) == [_FRAME_B, _FRAME_B]
+    assert parser.buffered == 0
+
+
+def test_oversized_headers_are_dropped_and_parsing_resyncs() -> None:
+    parser = MjpegParser("frame")
+    parser.feed(b"--frame\r\nX-Junk: " + b"x" * 9000)
+
+    with pytest.raises(ValueError, match="headers"):
+        parser.next_frame()
+
+    assert _drain(parser, _part(_FRAME_B), 16) == [_FRAME_B]
@@ -0,0 +1,114 @@
+"""Tests for the streaming, resumable model fetcher."""
+
+from __future__ import annotations
+
+import hashlib
+import io
+from pathlib import Path
+
+import pytest
+
+from rescue_ai.infrastructure import model_cache
+from rescue_ai.infrastructure.model_cache import fetch_model
+
+_PAYLOAD = b"model-weights-" * 1000
+_SHA256 = hashlib.sha256(_PAYLOAD).hexdigest()
+
+
+class _RangeResponse(io.BytesIO):
+    status = 206
+
+
+def _no_hashing(_path: Path) -> str:
+    raise AssertionError("verified model must not be re-hashed")
+
+
+def test_download_is_verified_once_and_trusted_on_restart(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    source = tmp_path / "src" / "yolo.pt"
+    source.parent.mkdir()
+    source.write_bytes(_PAYLOAD)
+    cache_dir = tmp_path / "models"
+
+    first = fetch_model(
+        source.as_uri(),
+        cache_dir=cache_dir,
+        expected_sha256=_SHA256,
+        preload_dir=tmp_path / "absent",
+    )
+    monkeypatch.setattr(model_cache, "file_sha256", _no_hashing)
+    monkeypatch.setattr(model_cache, "urlopen", _no_hashing)
+    second = fetch_model(
+        source.as_uri(),
+        cache_dir=cache_dir,
+        expected_sha256=_SHA256,
+        preload_dir=tmp_path / "absent",
+    )
+
+    assert first == second == cache_dir / "yolo.pt"
+    assert first.read_bytes() == _PAYLOAD
+    assert not (cache_dir / "yolo.pt.part").exists()
+
+
+def test_interrupted_download_resumes_with_range_request(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    cache_dir = tmp_path / "models"
+    cache_dir.mkdir()
+    split = len(_PAYLOAD) // 3
+    (cache_dir / "yolo.pt.part").write_bytes(_PAYLOAD[:split])
+    requested: list[str | None] = []
+
+    def _urlopen(request):
+        requested.append(request.get_header("Range"))
+        return _RangeResponse(_PAYLOAD[split:])
+
+    monkeypatch.setattr(model_cache, "urlopen", _urlopen)
+
+    path = fetch_model(
+        "https://example.com/models/yolo.pt",
+        cache_dir=cache_dir,
+        expected_sha256=_SHA256,
+        preload_dir=tmp_path / "absent",
+    )
+
+    assert requested == [f"bytes={split}-"]
+    assert path.read_bytes() == _PAYLOAD
+
+
+def test_corrupt_download_never_reaches_the_cache(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    cache_dir = tmp_path / "models"
+    monkeypatch.setattr(model_cache, "urlopen", lambda _request: io.BytesIO(b"bad"))
+
+    with pytest.raises(RuntimeError, match="Model checksum mismatch"):
+        fetch_model(
+            "https://example.com/models/yolo.pt",
+            cache_dir=cache_dir,
+            expected_sha256=_SHA256,
+            preload_dir=tmp_path / "absent",
+        )
+
+    assert not (cache_dir / "yolo.pt").exists()
+    assert not (cache_dir / "yolo.pt.part").exists()
+
+
+def test_preloaded_model_dir_is_used_without_network(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    preload_dir = tmp_path / "preloaded"
+    preload_dir.mkdir()
+    (preload_dir / "yolo.pt").write_bytes(_PAYLOAD)
+    monkeypatch.setattr(model_cache, "urlopen", _no_hashing)
+    monkeypatch.setenv("MODEL_PRELOAD_DIR", str(preload_dir))
+
+    path = fetch_model(
+        "https://example.com/models/yolo.pt",
+        cache_dir=tmp_path / "models",
+        expected_sha256=_SHA256,
+    )
+
+    assert path == preload_dir / "yolo.pt"
+    assert (tmp_path / "models" / "yolo.pt.verified.json").is_file()
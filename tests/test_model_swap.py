@@ -0,0 +1,224 @@
+"""Tests for hot model swap, rollback and the contract watcher."""
+
+from __future__ import annotations
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+
+from rescue_ai.application.inference_config import InferenceConfig, SchedulerConfig
+from rescue_ai.application.inference_scheduler import (
+    PRIORITY_STREAM,
+    InferenceScheduler,
+    ScheduledDetector,
+)
+from rescue_ai.application.model_swap import (
+    ModelSwapService,
+    ModelVersion,
+    SwappableDetector,
+)
+from rescue_ai.domain.entities import Detection, FrameEvent
+from rescue_ai.domain.mission_metrics import build_model_version_ranges
+from rescue_ai.infrastructure.model_watcher import ContractModelWatcher
+
+
+class _FakeDetector:
+    def __init__(self, label: str, *, fail: bool = False) -> None:
+        self.label = label
+        self.closed = False
+        self._fail = fail
+
+    def detect(self, image_uri: object) -> list[Detection]:
+        _ = image_uri
+        return [
+            Detection(
+                bbox=(0.0, 0.0, 1.0, 1.0),
+                score=0.9,
+                label="person",
+                model_name=self.label,
+            )
+        ]
+
+    def warmup(self) -> None:
+        if self._fail:
+            raise RuntimeError("checksum mismatch")
+
+    def runtime_name(self) -> str:
+        return self.label
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class _BlockingDetector(_FakeDetector):
+    def __init__(self, label: str) -> None:
+        super().__init__(label)
+        self.started = threading.Event()
+        self.proceed = threading.Event()
+
+    def detect(self, image_uri: object) -> list[Detection]:
+        self.started.set()
+        self.proceed.wait(5.0)
+        return super().detect(image_uri)
+
+
+def _config(model_url: str = "https://models/v1.pt") -> InferenceConfig:
+    return InferenceConfig(
+        model_url=model_url,
+        device="cpu",
+        imgsz=640,
+        nms_iou=0.7,
+        max_det=300,
+        confidence_threshold=0.25,
+    )
+
+
+def test_swap_applies_at_frame_boundary_and_rolls_back() -> None:
+    first, second, third = (_FakeDetector(name) for name in ("v1", "v2", "v3"))
+    detector = SwappableDetector(first, _config())
+
+    snapshot, version = detector.snapshot()
+    detector.swap(second, _config("https://models/v2.pt"))
+
+    # A frame that already snapshotted v1 finishes on v1.
+    assert snapshot.detect("frame.jpg")[0].model_name == "v1"
+    assert version == ModelVersion("https://models/v1.pt")
+    assert detector.detect("frame.jpg")[0].model_name == "v2"
+    assert detector.rollback() == ModelVersion("https://models/v1.pt")
+    assert detector.runtime_name() == "v1"
+
+    detector.swap(third, _config("https://models/v3.pt"))
+    assert second.closed is True
+    assert first.closed is False
+    assert detector.versions() == {
+        "active": {"model_url": "https://models/v3.pt"},
+        "previous": {"model_url": "https://models/v1.pt"},
+    }
+
+
+def test_retired_version_is_closed_after_its_pinned_call_returns() -> None:
+    first = _BlockingDetector("v1")
+    swappable = SwappableDetector(first, _config())
+    scheduler = InferenceScheduler(SchedulerConfig())
+    scheduler.start()
+    scheduled = ScheduledDetector(swappable, scheduler, priority=PRIORITY_STREAM)
+    try:
+        pinned, _ = scheduled.snapshot()
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            running = pool.submit(pinned.detect, "frame.jpg")
+            assert first.started.wait(5.0)
+            swappable.swap(_FakeDetector("v2"), _config("https://models/v2.pt"))
+            swappable.swap(_FakeDetector("v3"), _config("https://models/v3.pt"))
+
+            assert first.closed is False
+            first.proceed.set()
+            assert running.result(timeout=5.0)[0].model_name == "v1"
+
+        assert first.closed is True
+        with pytest.raises(RuntimeError, match="retired"):
+            pinned.detect("frame.jpg")
+    finally:
+        first.proceed.set()
+        scheduler.close()
+
+
+def test_service_warms_new_version_before_installing_it() -> None:
+    detector = SwappableDetector(_FakeDetector("v1"), _config())
+    swapped: list[ModelVersion] = []
+    service = ModelSwapService(
+        detector,
+        builder=lambda config: _FakeDetector(config.model_url),
+        on_swap=swapped.append,
+    )
+
+    assert service.request_model("https://models/v1.pt", None) is False
+    assert service.request_model("https://models/v2.pt", "ab" * 32) is True
+    service.wait(timeout=5.0)
+
+    assert detector.runtime_name() == "https://models/v2.pt"
+    assert detector.active_config.imgsz == 640
+    assert swapped == [ModelVersion("https://models/v2.pt", "ab" * 32)]
+    status = service.status()
+    assert status["loading"] is None
+    assert status["last_error"] is None
+    assert status["previous"] == {"model_url": "https://models/v1.pt"}
+
+
+def test_failed_swap_keeps_serving_the_active_version() -> None:
+    detector = SwappableDetector(_FakeDetector("v1"), _config())
+    candidates: list[_FakeDetector] = []
+
+    def build(config: InferenceConfig) -> _FakeDetector:
+        candidates.append(_FakeDetector(config.model_url, fail=True))
+        return candidates[-1]
+
+    service = ModelSwapService(detector, builder=build)
+    service.request_swap(_config("https://models/broken.pt"))
+    service.wait(timeout=5.0)
+
+    assert detector.runtime_name() == "v1"
+    assert candidates[0].closed is True
+    assert service.status()["last_error"] == "RuntimeError: checksum mismatch"
+
+
+def test_model_version_ranges_group_consecutive_frames() -> None:
+    frames = [
+        FrameEvent(
+            mission_id="m-1",
+            frame_id=frame_id,
+            ts_sec=float(frame_id),
+            image_uri=f"frame-{frame_id}.jpg",
+            gt_person_present=False,
+            gt_episode_id=None,
+            model_url=model_url,
+        )
+        for frame_id, model_url in [(1, "v1"), (2, "v1"), (3, "v2"), (4, "v2")]
+    ]
+
+    assert build_model_version_ranges(frames) == [
+        {
+            "model_url": "v1",
+            "model_sha256": None,
+            "first_frame_id": 1,
+            "last_frame_id": 2,
+            "frames": 2,
+        },
+        {
+            "model_url": "v2",
+            "model_sha256": None,
+            "first_frame_id": 3,
+            "last_frame_id": 4,
+            "frames": 2,
+        },
+    ]
+
+
+def test_contract_watcher_requests_swap_only_after_a_change(tmp_path: Path) -> None:
+    contract_path = tmp_path / "contract.yaml"
+    contract_path.write_text("v1", encoding="utf-8")
+    requested: list[InferenceConfig] = []
+
+    def on_change(config: InferenceConfig) -> bool:
+        requested.append(config)
+        return True
+
+    watcher = ContractModelWatcher(
+        contract_path=contract_path,
+        load_inference=lambda: replace(
+            _config(), model_url=contract_path.read_text(encoding="utf-8")
+        ),
+        on_change=on_change,
+    )
+    assert watcher.poll_once() is False
+
+    contract_path.write_text("v2", encoding="utf-8")
+    stat = contract_path.stat()
+    os.utime(contract_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert watcher.poll_once() is True
+    assert watcher.poll_once() is False
+    assert [config.model_url for config in requested] == ["v2"]
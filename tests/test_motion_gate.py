@@ -0,0 +1,59 @@
+"""Tests for the motion gate that skips near-duplicate stream frames."""
+
+from __future__ import annotations
+
+import pytest
+
+from rescue_ai.application.inference_config import MotionGateConfig
+from rescue_ai.domain.entities import Detection
+from rescue_ai.infrastructure.motion_gate import MotionGate, frame_thumbnail
+
+np = pytest.importorskip("numpy")
+cv2 = pytest.importorskip("cv2")
+
+_DETECTIONS = [Detection((1.0, 2.0, 30.0, 40.0), 0.8, "person", "yolo8n")]
+
+
+def _frame(value: int) -> object:
+    frame = np.full((120, 160, 3), value, dtype=np.uint8)
+    frame[40:80, 60:100] = 255 - value
+    return frame
+
+
+def test_static_frames_reuse_detections_up_to_the_skip_bound() -> None:
+    gate = MotionGate(MotionGateConfig(max_consecutive_skips=2))
+    frame = _frame(40)
+
+    assert gate.reuse(frame) is None
+    gate.record(_DETECTIONS)
+
+    assert gate.reuse(frame) == _DETECTIONS
+    assert gate.reuse(frame) == _DETECTIONS
+    assert gate.reuse(frame) is None
+    gate.record(_DETECTIONS)
+    assert gate.reuse(frame) == _DETECTIONS
+
+
+def test_changed_frame_goes_to_the_detector() -> None:
+    gate = MotionGate(MotionGateConfig(diff_threshold=0.01))
+    assert gate.reuse(_frame(40)) is None
+    gate.record(_DETECTIONS)
+
+    assert gate.reuse(_frame(120)) is None
+    assert gate.last_diff is not None and gate.last_diff > 0.01
+
+
+def test_reset_forces_detection_and_jpeg_thumbnails_are_grayscale() -> None:
+    gate = MotionGate(MotionGateConfig())
+    ok, encoded = cv2.imencode(".jpg", _frame(40))
+    assert ok
+    jpeg = encoded.tobytes()
+    assert gate.reuse(jpeg) is None
+    gate.record(_DETECTIONS)
+    gate.reset()
+
+    assert gate.reuse(jpeg) is None
+    thumbnail = frame_thumbnail(jpeg, 32)
+    assert thumbnail is not None
+    assert thumbnail.shape == (32, 32)
+    assert frame_thumbnail("frame.jpg", 32) is None
@@ -2,7 +2,12 @@
 
 from __future__ import annotations
 
+import time
+
+import pytest
+
 from rescue_ai.config import Settings
+from rescue_ai.domain.entities import Detection
 from rescue_ai.interfaces.cli.online import DetectionStreamController
 
 
@@ -76,7 +81,13 @@ def test_detection_stream_controller_lifecycle(monkeypatch) -> None:
     assert started.running is True
     assert started.session_id == "s-rpi-1"
 
+    # Stats arrive from the background session monitor, not the status call.
+    deadline = time.monotonic() + 2.0
     payload = controller.as_payload("m1")
+    while payload is not None and payload["last_stats"] is None:
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+        payload = controller.as_payload("m1")
     assert payload is not None
     assert payload["running"] is True
     assert payload["last_stats"] == {"processed": 7}
@@ -88,3 +99,98 @@ def test_detection_stream_controller_lifecycle(monkeypatch) -> None:
     assert controller.check_rpi_health()["status"] == "ok"
     assert controller.list_rpi_missions() == [{"mission_id": "m-demo", "name": "Demo"}]
     assert controller.stop("missing") is None
+
+
+def test_controller_reuses_one_rpi_client_until_closed(monkeypatch) -> None:
+    from rescue_ai.interfaces.cli import online as online_main
+
+    created: list[_FakeRpiClient] = []
+    closed: list[bool] = []
+
+    class _PooledRpiClient(_FakeRpiClient):
+        def __init__(self, _settings) -> None:
+            super().__init__(_settings)
+            created.append(self)
+
+        def close(self) -> None:
+            closed.append(True)
+
+    monkeypatch.setattr(online_main, "RpiClient", _PooledRpiClient)
+    controller = DetectionStreamController(_settings())
+
+    controller.check_rpi_health()
+    controller.list_rpi_missions()
+    controller.start(mission_id="m1", rpi_mission_id="rpi-1", target_fps=6.0)
+    controller.as_payload("m1")
+    controller.close()
+
+    assert len(created) == 1
+    assert closed == [True]
+
+
+def test_status_polls_read_cached_session_stats(monkeypatch) -> None:
+    from rescue_ai.interfaces.cli import online as online_main
+
+    stats_calls: list[str] = []
+
+    class _CountingRpiClient(_FakeRpiClient):
+        def session_stats(self, session_id: str, timeout_sec: float):
+            stats_calls.append(session_id)
+            return super().session_stats(session_id, timeout_sec)
+
+        def close(self) -> None:
+            return None
+
+    monkeypatch.setattr(online_main, "RpiClient", _CountingRpiClient)
+    controller = DetectionStreamController(_settings())
+    controller.start(mission_id="m1", rpi_mission_id="rpi-1", target_fps=6.0)
+
+    deadline = time.monotonic() + 2.0
+    state = controller.get_state("m1")
+    while state is not None and state.stats_updated_at is None:
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+        state = controller.get_state("m1")
+    calls = len(stats_calls)
+    for _ in range(50):
+        controller.as_payload("m1")
+
+    assert len(stats_calls) == calls
+    controller.close()
+
+
+def test_controller_close_stops_scheduler_and_detector_stack() -> None:
+    from rescue_ai.application.inference_config import SchedulerConfig
+    from rescue_ai.application.inference_scheduler import (
+        PRIORITY_STREAM,
+        InferenceRejected,
+        InferenceScheduler,
+        ScheduledDetector,
+    )
+
+    closed: list[bool] = []
+
+    class _PooledDetector:
+        def detect(self, image_uri: str) -> list[Detection]:
+            _ = image_uri
+            return []
+
+        def warmup(self) -> None:
+            return None
+
+        def runtime_name(self) -> str:
+            return "pool"
+
+        def close(self) -> None:
+            closed.append(True)
+
+    scheduler = InferenceScheduler(SchedulerConfig())
+    scheduler.start()
+    detector = ScheduledDetector(_PooledDetector(), scheduler, priority=PRIORITY_STREAM)
+    controller = DetectionStreamController(_settings(), detector=detector)
+
+    controller.close()
+
+    assert closed == [True]
+    with pytest.raises(InferenceRejected, match="closed"):
+        scheduler.submit(PRIORITY_STREAM, lambda: None)
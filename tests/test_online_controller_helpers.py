@@ -2,15 +2,26 @@
 
 from __future__ import annotations
 
+import asyncio
 import sys
 import threading
+import time
 from pathlib import Path
 from typing import cast
 
+import httpx
 import numpy as np
 import pytest
 
+from rescue_ai.application.inference_config import (
+    AdaptiveImgszConfig,
+    InferenceConfig,
+    MotionGateConfig,
+    PipelineConfig,
+    RoiConfig,
+)
 from rescue_ai.application.pilot_service import PilotService
+from rescue_ai.application.session_monitor import SessionMonitor
 from rescue_ai.config import (
     ApiSettings,
     AppSettings,
@@ -20,9 +31,18 @@ from rescue_ai.config import (
     Settings,
     StorageSettings,
 )
-from rescue_ai.domain.entities import Detection
+from rescue_ai.domain.entities import Detection, FrameEvent
 from rescue_ai.domain.value_objects import AlertRuleConfig
+from rescue_ai.infrastructure.rpi_client import RpiStreamSession
 from rescue_ai.interfaces.cli import online as online_main
+from rescue_ai.interfaces.cli import stream_pipeline
+from rescue_ai.interfaces.cli.frame_capture import (
+    FrameCapture,
+    HttpFrameCapture,
+    RtspFrameCapture,
+)
+from rescue_ai.interfaces.cli.stream_pipeline import FrameStages
+from rescue_ai.interfaces.cli.stream_state import GtTracker, LoopContext, StreamInputs
 from tests.support.in_memory_repositories import (
     InMemoryAlertRepository,
     InMemoryArtifactStorage,
@@ -32,7 +52,7 @@ from tests.support.in_memory_repositories import (
 )
 
 
-class _FakeCapture(online_main._FrameCapture):
+class _FakeCapture(FrameCapture):
     def __init__(self, frames: list[object | None]) -> None:
         self._frames = frames
         self.released = False
@@ -53,8 +73,8 @@ class _FakePilotService:
     def __init__(self) -> None:
         self.raise_on_ingest = False
 
-    def ingest_frame_event(self, frame_event, detections):
-        _ = frame_event
+    def ingest_frame_event(self, frame_event, detections, frame_content=None):
+        _ = (frame_event, frame_content)
         if self.raise_on_ingest:
             raise RuntimeError("ingest failed")
         return detections
@@ -157,7 +177,7 @@ def _pilot_service() -> PilotService:
 
 
 def test_gt_tracker_splits_episodes() -> None:
-    tracker = online_main._GtTracker(sequence=[False, True, True, False, True])
+    tracker = GtTracker(sequence=[False, True, True, False, True])
     assert tracker.evaluate(0) == (False, None)
     assert tracker.evaluate(1) == (True, "ep-1")
     assert tracker.evaluate(2) == (True, "ep-1")
@@ -172,7 +192,7 @@ def test_build_loop_context_returns_none_when_capture_unavailable(monkeypatch) -
         detector=_FakeDetector(),
     )
     state = _state()
-    monkeypatch.setattr(controller, "_load_gt_sequence", lambda _mid: [True, False])
+    monkeypatch.setattr(controller, "_load_mission_annotations", lambda _mid: None)
     monkeypatch.setattr(controller, "_open_capture", lambda _state: None)
 
     ctx = controller._build_loop_context(
@@ -187,6 +207,31 @@ def test_build_loop_context_returns_none_when_capture_unavailable(monkeypatch) -
     assert state.error is not None
 
 
+def test_capture_open_failure_stops_polling_the_session(monkeypatch) -> None:
+    controller = online_main.DetectionStreamController(
+        _settings(),
+        pilot_service=_pilot_service(),
+        detector=_FakeDetector(),
+    )
+    monitor = SessionMonitor(lambda _sid: {}, interval_sec=60.0)
+    controller._monitor = monitor
+    state = _state()
+    monitor.watch(state.session_id)
+    monkeypatch.setattr(controller, "_load_mission_annotations", lambda _mid: None)
+    monkeypatch.setattr(controller, "_open_capture", lambda _state: None)
+
+    ctx = controller._build_loop_context(
+        mission_id="m1",
+        state=state,
+        stop_event=threading.Event(),
+        target_fps=2.0,
+    )
+
+    assert ctx is None
+    assert monitor.snapshot(state.session_id) is None
+    monitor.close()
+
+
 def test_read_frame_with_recovery_stops_when_source_finished(monkeypatch) -> None:
     controller = online_main.DetectionStreamController(
         _settings(),
@@ -194,13 +239,13 @@ def test_read_frame_with_recovery_stops_when_source_finished(monkeypatch) -> Non
         detector=_FakeDetector(),
     )
     state = _state()
-    ctx = online_main._LoopContext(
+    ctx = LoopContext(
         mission_id="m1",
         state=state,
         stop_event=threading.Event(),
         target_fps=2.0,
         frame_interval=0.5,
-        gt_tracker=online_main._GtTracker(sequence=[True]),
+        gt_tracker=GtTracker(sequence=[True]),
         source_filenames=None,
         capture=_FakeCapture([None]),
         tmp_dir=Path("."),
@@ -223,21 +268,24 @@ def test_process_frame_updates_counters(monkeypatch, tmp_path) -> None:
         detector=_FakeDetector(),
     )
     state = _state()
-    ctx = online_main._LoopContext(
+    ctx = LoopContext(
         mission_id="m1",
         state=state,
         stop_event=threading.Event(),
         target_fps=2.0,
         frame_interval=0.5,
-        gt_tracker=online_main._GtTracker(sequence=[True]),
+        gt_tracker=GtTracker(sequence=[True]),
         source_filenames=None,
         capture=_FakeCapture([b"jpeg"]),
         tmp_dir=tmp_path,
     )
     monkeypatch.setattr(
-        controller,
+        controller._stages,
         "_detect_frame_or_empty",
-        lambda **kwargs: [Detection((1.0, 2.0, 3.0, 4.0), 0.9, "person", "yolo", None)],
+        lambda **kwargs: (
+            [Detection((1.0, 2.0, 3.0, 4.0), 0.9, "person", "yolo", None)],
+            "full",
+        ),
     )
 
     controller._process_frame(ctx, b"\xff\xd8\xff\xd9")
@@ -245,6 +293,57 @@ def test_process_frame_updates_counters(monkeypatch, tmp_path) -> None:
     assert ctx.frame_id == 1
     assert state.processed_frames == 1
     assert state.alerts_created == 1
+    assert state.inference_paths == {"full": 1}
+
+
+def test_process_frame_keeps_frames_in_memory(tmp_path) -> None:
+    class _AlertingPilot(_FakePilotService):
+        def __init__(self) -> None:
+            super().__init__()
+            self.uploaded: list[bytes | None] = []
+
+        def ingest_frame_event(self, frame_event, detections, frame_content=None):
+            if detections and frame_content is not None:
+                self.uploaded.append(frame_content())
+            return super().ingest_frame_event(frame_event, detections)
+
+    class _NthFrameDetector(_FakeDetector):
+        def __init__(self) -> None:
+            self.calls = 0
+
+        def detect(self, image_uri: str) -> list[Detection]:
+            _ = image_uri
+            self.calls += 1
+            if self.calls < 3:
+                return []
+            return [Detection((1.0, 2.0, 3.0, 4.0), 0.9, "person", "yolo", None)]
+
+    pilot = _AlertingPilot()
+    controller = online_main.DetectionStreamController(
+        _settings(),
+        pilot_service=cast(PilotService, pilot),
+        detector=_NthFrameDetector(),
+    )
+    ctx = LoopContext(
+        mission_id="m1",
+        state=_state(),
+        stop_event=threading.Event(),
+        target_fps=2.0,
+        frame_interval=0.5,
+        gt_tracker=GtTracker(sequence=None),
+        source_filenames=None,
+        capture=_FakeCapture([]),
+        tmp_dir=tmp_path,
+    )
+
+    for value in (0, 100, 200):
+        controller._process_frame(ctx, np.full((16, 16, 3), value, dtype=np.uint8))
+
+    assert not list(tmp_path.iterdir())
+    assert len(ctx.frames) == 2
+    assert len(pilot.uploaded) == 1
+    uploaded = pilot.uploaded[0]
+    assert uploaded is not None and uploaded.startswith(b"\xff\xd8")
 
 
 def test_ingest_event_updates_error_on_failure() -> None:
@@ -256,18 +355,18 @@ def test_ingest_event_updates_error_on_failure() -> None:
         detector=_FakeDetector(),
     )
     state = _state()
-    ctx = online_main._LoopContext(
+    ctx = LoopContext(
         mission_id="m1",
         state=state,
         stop_event=threading.Event(),
         target_fps=2.0,
         frame_interval=0.5,
-        gt_tracker=online_main._GtTracker(sequence=[True]),
+        gt_tracker=GtTracker(sequence=[True]),
         source_filenames=None,
         capture=_FakeCapture([]),
         tmp_dir=Path("."),
     )
-    frame_event = online_main.FrameEvent(
+    frame_event = FrameEvent(
         mission_id="m1",
         frame_id=0,
         ts_sec=0.0,
@@ -276,7 +375,7 @@ def test_ingest_event_updates_error_on_failure() -> None:
         gt_episode_id="ep-1",
     )
 
-    controller._ingest_event(ctx=ctx, frame_event=frame_event, detections=[])
+    controller._stages._ingest_event(ctx=ctx, frame_event=frame_event, detections=[])
 
     assert state.ingest_failures == 1
     assert state.error is not None
@@ -289,13 +388,13 @@ def test_read_frame_with_recovery_success_resets_failures() -> None:
         detector=_FakeDetector(),
     )
     state = _state()
-    ctx = online_main._LoopContext(
+    ctx = LoopContext(
         mission_id="m1",
         state=state,
         stop_event=threading.Event(),
         target_fps=2.0,
         frame_interval=0.5,
-        gt_tracker=online_main._GtTracker(sequence=[True]),
+        gt_tracker=GtTracker(sequence=[True]),
         source_filenames=None,
         capture=_FakeCapture([b"frame"]),
         tmp_dir=Path("."),
@@ -317,13 +416,13 @@ def test_read_frame_with_recovery_switches_to_http(monkeypatch) -> None:
         detector=_FakeDetector(),
     )
     state = _state()
-    ctx = online_main._LoopContext(
+    ctx = LoopContext(
         mission_id="m1",
         state=state,
         stop_event=threading.Event(),
         target_fps=2.0,
         frame_interval=0.5,
-        gt_tracker=online_main._GtTracker(sequence=[True]),
+        gt_tracker=GtTracker(sequence=[True]),
         source_filenames=None,
         capture=_FakeCapture([None]),
         tmp_dir=Path("."),
@@ -345,13 +444,13 @@ def test_detection_loop_handles_exception_and_finalizes(monkeypatch, tmp_path) -
     )
     state = _state()
     capture = _FakeCapture([])
-    ctx = online_main._LoopContext(
+    ctx = LoopContext(
         mission_id="m1",
         state=state,
         stop_event=threading.Event(),
         target_fps=2.0,
         frame_interval=0.5,
-        gt_tracker=online_main._GtTracker(sequence=[True]),
+        gt_tracker=GtTracker(sequence=[True]),
         source_filenames=None,
         capture=capture,
         tmp_dir=tmp_path,
@@ -370,33 +469,183 @@ def test_detection_loop_handles_exception_and_finalizes(monkeypatch, tmp_path) -
     assert capture.released is True
 
 
+class _FakeSource:
+    backend = "http"
+
+    def __init__(self, frames: list[object | None]) -> None:
+        self._frames = frames
+        self.closed = False
+
+    async def read_frame(self) -> object | None:
+        if not self._frames:
+            return None
+        return self._frames.pop(0)
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+def _pipelined_controller(
+    pilot: _FakePilotService, detector: _FakeDetector
+) -> online_main.DetectionStreamController:
+    return online_main.DetectionStreamController(
+        _settings(),
+        pilot_service=cast(PilotService, pilot),
+        detector=detector,
+        inference=InferenceConfig(
+            model_url="https://example/model.pt",
+            device="cpu",
+            imgsz=960,
+            nms_iou=0.7,
+            max_det=100,
+            confidence_threshold=0.2,
+            pipeline=PipelineConfig(
+                frame_queue_size=1, ingest_queue_size=2, workers=2, capture_threads=1
+            ),
+        ),
+    )
+
+
+def test_shared_pipeline_keeps_latest_frame_when_detection_lags(monkeypatch) -> None:
+    detecting = threading.Event()
+    state = _state()
+    state.target_fps = 1000.0
+    state.source_frames_total = 5
+
+    class _GatedSource(_FakeSource):
+        async def read_frame(self) -> object | None:
+            if len(self._frames) == 4:
+                # Frame 0 is in the detector; the rest pile up behind it.
+                while not detecting.is_set():
+                    await asyncio.sleep(0.001)
+            return await super().read_frame()
+
+    class _SlowDetector(_FakeDetector):
+        def detect(self, image_uri: str) -> list[Detection]:
+            detecting.set()
+            deadline = time.monotonic() + 2.0
+            while time.monotonic() < deadline:
+                if state.stage_queues["detect"]["enqueued"] == 5:
+                    break
+                time.sleep(0.005)
+            return super().detect(image_uri)
+
+    class _RecordingPilot(_FakePilotService):
+        def __init__(self) -> None:
+            super().__init__()
+            self.frame_ids: list[int] = []
+
+        def ingest_frame_event(self, frame_event, detections, frame_content=None):
+            self.frame_ids.append(frame_event.frame_id)
+            return super().ingest_frame_event(frame_event, detections, frame_content)
+
+    pilot = _RecordingPilot()
+    controller = _pipelined_controller(pilot, _SlowDetector())
+    source = _GatedSource([b"\xff\xd8\xff\xd9"] * 5)
+
+    async def _open_source(_hub, _state):
+        return source
+
+    monkeypatch.setattr(
+        controller,
+        "_load_stream_inputs",
+        lambda _mission_id, _state: StreamInputs(None, None),
+    )
+    monkeypatch.setattr(stream_pipeline, "_open_source", _open_source)
+    monkeypatch.setattr(controller, "_stream_finished_on_rpi", lambda _state: False)
+    pipeline = controller._shared_pipeline(PipelineConfig(workers=2))
+    try:
+        pipeline.start(state, threading.Event()).result(timeout=5.0)
+    finally:
+        controller.close()
+
+    assert pilot.frame_ids == [0, 4]
+    assert state.captured_frames == 5
+    assert state.processed_frames == 2
+    assert state.running is False
+    assert state.end_reason == "source_finished"
+    assert state.stage_queues["detect"]["dropped"] == 3
+    assert state.stage_queues["detect"]["depth"] == 0
+    assert state.stage_queues["ingest"]["dropped"] == 0
+    assert source.closed is True
+
+
+def test_stop_cancels_capture_blocked_on_read(monkeypatch) -> None:
+    class _RpiClient:
+        def __init__(self, _settings) -> None:
+            self.stopped: list[str] = []
+
+        def start_stream(self, mission_id: str, target_fps: float, timeout_sec: float):
+            _ = (mission_id, target_fps, timeout_sec)
+            return RpiStreamSession(
+                session_id="s-1", rtsp_url="", stream_url="http://rpi/stream"
+            )
+
+        def stop_stream(self, session_id: str, timeout_sec: float):
+            _ = (session_id, timeout_sec)
+            return {"stopped": True}
+
+        def session_stats(self, session_id: str, timeout_sec: float):
+            _ = (session_id, timeout_sec)
+            return {"stop": False}
+
+        def close(self) -> None:
+            return None
+
+    class _StalledSource(_FakeSource):
+        async def read_frame(self) -> object | None:
+            await asyncio.Event().wait()
+            return None
+
+    source = _StalledSource([])
+
+    async def _open_source(_hub, _state):
+        return source
+
+    monkeypatch.setattr(online_main, "RpiClient", _RpiClient)
+    controller = _pipelined_controller(_FakePilotService(), _FakeDetector())
+    monkeypatch.setattr(
+        controller,
+        "_load_stream_inputs",
+        lambda _mission_id, _state: StreamInputs(None, None),
+    )
+    monkeypatch.setattr(stream_pipeline, "_open_source", _open_source)
+    try:
+        controller.start(mission_id="m1", rpi_mission_id="rpi-1", target_fps=2.0)
+        pipeline = controller._pipeline
+        assert pipeline is not None
+        deadline = time.monotonic() + 2.0
+        while "m1" not in pipeline._capture_tasks and time.monotonic() < deadline:
+            time.sleep(0.005)
+
+        state = controller.stop("m1")
+    finally:
+        controller.close()
+
+    assert state is not None
+    assert state.running is False
+    assert state.end_reason == "stop_requested"
+    assert state.captured_frames == 0
+    assert source.closed is True
+
+
 def test_detect_frame_falls_back_to_path_on_type_error(tmp_path) -> None:
     controller = online_main.DetectionStreamController(
         _settings(),
         pilot_service=_pilot_service(),
         detector=_TypeErrorDetector(),
     )
-    detections = controller._detect_frame(
+    detections, path, _imgsz = controller._stages._detect_frame_at(
         frame=b"bytes-frame",
         fallback_path=tmp_path / "frame.jpg",
     )
     assert detections == []
+    assert path == "full"
 
 
 def test_save_frame_raises_for_unsupported_type(tmp_path) -> None:
     with pytest.raises(TypeError, match="Unexpected frame type"):
-        online_main.DetectionStreamController._save_frame(object(), tmp_path / "x.jpg")
-
-
-def test_extract_source_filenames_from_annotations_payload() -> None:
-    payload: dict[str, object] = {
-        "images": [
-            {"id": 2, "file_name": "frames/013203.jpg"},
-            {"id": 1, "file_name": "frames/013202.jpg"},
-        ]
-    }
-    filenames = online_main.DetectionStreamController._extract_source_filenames(payload)
-    assert filenames == ["013202.jpg", "013203.jpg"]
+        FrameStages._save_frame(object(), tmp_path / "x.jpg")
 
 
 def test_process_frame_uses_source_filename_from_annotations(
@@ -408,25 +657,27 @@ def test_process_frame_uses_source_filename_from_annotations(
         detector=_FakeDetector(),
     )
     state = _state()
-    ctx = online_main._LoopContext(
+    ctx = LoopContext(
         mission_id="m1",
         state=state,
         stop_event=threading.Event(),
         target_fps=2.0,
         frame_interval=0.5,
-        gt_tracker=online_main._GtTracker(sequence=[True]),
+        gt_tracker=GtTracker(sequence=[True]),
         source_filenames=["013202.jpg"],
         capture=_FakeCapture([b"jpeg"]),
         tmp_dir=tmp_path,
     )
-    monkeypatch.setattr(controller, "_detect_frame_or_empty", lambda **kwargs: [])
+    monkeypatch.setattr(
+        controller._stages, "_detect_frame_or_empty", lambda **kwargs: ([], "full")
+    )
     ingested: dict[str, str] = {}
 
     def _capture_ingest(*, ctx, frame_event, detections):
         _ = (ctx, detections)
         ingested["image_uri"] = frame_event.image_uri
 
-    monkeypatch.setattr(controller, "_ingest_event", _capture_ingest)
+    monkeypatch.setattr(controller._stages, "_ingest_event", _capture_ingest)
 
     controller._process_frame(ctx, b"\xff\xd8\xff\xd9")
 
@@ -440,6 +691,12 @@ def test_build_api_runtime_and_main(monkeypatch) -> None:
     class _Inference:
         model_url = "https://example/model.pt"
         model_sha256 = "abc123"
+        motion_gate = None
+        tracker = None
+        roi = None
+        adaptive_imgsz = None
+        scheduler = None
+        pipeline = None
 
     class _Contract:
         config_name = "test"
@@ -555,8 +812,8 @@ def test_http_frame_capture_handles_mjpeg_and_single_frame(monkeypatch) -> None:
                 chunks=[b"noise", b"\xff\xd8abc\xff\xd9tail"],
             )
 
-    monkeypatch.setattr(online_main.httpx, "Client", _MjpegClient)
-    capture = online_main._HttpFrameCapture("http://cam/stream")
+    monkeypatch.setattr(httpx, "Client", _MjpegClient)
+    capture = HttpFrameCapture("http://cam/stream")
     assert capture.is_open() is True
     assert capture.read_frame() == b"\xff\xd8abc\xff\xd9"
     capture.release()
@@ -566,8 +823,8 @@ def test_http_frame_capture_handles_mjpeg_and_single_frame(monkeypatch) -> None:
             super().__init__(timeout=timeout)
             self._resp = _FakeHttpResponse(content_type="text/plain")
 
-    monkeypatch.setattr(online_main.httpx, "Client", _SingleClient)
-    capture = online_main._HttpFrameCapture("http://cam/frame")
+    monkeypatch.setattr(httpx, "Client", _SingleClient)
+    capture = HttpFrameCapture("http://cam/frame")
     assert capture.is_open() is True
     assert capture.read_frame() == b"frame"
     capture.release()
@@ -577,10 +834,10 @@ def test_http_frame_capture_handles_connect_error(monkeypatch) -> None:
     class _BrokenClient(_FakeHttpClient):
         def send(self, request, stream: bool = False):
             _ = (request, stream)
-            raise online_main.httpx.HTTPError("connection failed")
+            raise httpx.HTTPError("connection failed")
 
-    monkeypatch.setattr(online_main.httpx, "Client", _BrokenClient)
-    capture = online_main._HttpFrameCapture("http://cam/stream")
+    monkeypatch.setattr(httpx, "Client", _BrokenClient)
+    capture = HttpFrameCapture("http://cam/stream")
     assert capture.is_open() is False
 
 
@@ -612,7 +869,7 @@ def test_rtsp_capture_uses_cv2_and_reads_frame(monkeypatch) -> None:
             return _Cap(opened=self.calls > 1)
 
     monkeypatch.setitem(sys.modules, "cv2", _Cv2())
-    cap = online_main._RtspFrameCapture("rtsp://example/stream")
+    cap = RtspFrameCapture("rtsp://example/stream")
     assert cap.is_open() is True
     assert cap.read_frame() == "frame"
     cap.release()
@@ -627,7 +884,7 @@ def test_detect_frame_without_detector_and_save_frame_numpy(
         detector=None,
     )
     with pytest.raises(RuntimeError, match="Detector is not configured"):
-        controller._detect_frame(frame="x", fallback_path=tmp_path / "x.jpg")
+        controller._stages._detect_frame_at(frame="x", fallback_path=tmp_path / "x.jpg")
 
     class _Cv2:
         @staticmethod
@@ -636,8 +893,8 @@ def test_detect_frame_without_detector_and_save_frame_numpy(
             _ = frame
             return True
 
-    monkeypatch.setattr(online_main, "import_module", lambda _name: _Cv2)
-    online_main.DetectionStreamController._save_frame(
+    monkeypatch.setattr(stream_pipeline, "import_module", lambda _name: _Cv2)
+    FrameStages._save_frame(
         np.zeros((2, 2, 3), dtype=np.uint8),
         tmp_path / "frame.jpg",
     )
@@ -656,3 +913,148 @@ def test_build_detector_and_build_repositories_error_paths(monkeypatch) -> None:
     settings.database.dsn = "   "
     with pytest.raises(ValueError, match="DB_DSN is required"):
         online_main._build_repositories(settings=settings)
+
+
+def test_process_frame_skips_detection_on_static_frames(tmp_path) -> None:
+    calls: list[object] = []
+
+    class _CountingDetector(_FakeDetector):
+        def detect(self, image_uri: str) -> list[Detection]:
+            calls.append(image_uri)
+            return [Detection((1.0, 2.0, 3.0, 4.0), 0.9, "person", "yolo", None)]
+
+    controller = online_main.DetectionStreamController(
+        _settings(),
+        pilot_service=_pilot_service(),
+        detector=_CountingDetector(),
+    )
+    state = _state()
+    ctx = LoopContext(
+        mission_id="m1",
+        state=state,
+        stop_event=threading.Event(),
+        target_fps=2.0,
+        frame_interval=0.5,
+        gt_tracker=GtTracker(sequence=None),
+        source_filenames=None,
+        capture=_FakeCapture([]),
+        tmp_dir=tmp_path,
+        motion_gate=online_main.MotionGate(MotionGateConfig(max_consecutive_skips=2)),
+    )
+    frame = np.zeros((48, 64, 3), dtype=np.uint8)
+
+    for _ in range(4):
+        controller._process_frame(ctx, frame)
+
+    assert len(calls) == 2
+    assert state.processed_frames == 4
+    assert state.motion_skipped_frames == 2
+    assert state.inference_paths == {"full": 2, "motion_skip": 2}
+
+
+def test_process_frame_inspects_recent_positives_with_roi(tmp_path) -> None:
+    class _RecentBoxesPilot(_FakePilotService):
+        def __init__(self) -> None:
+            super().__init__()
+            self.boxes: list[tuple[float, float, float, float]] = []
+
+        def recent_detection_boxes(self, mission_id: str):
+            _ = mission_id
+            return self.boxes
+
+    class _RoiDetector(_FakeDetector):
+        def detect_regions(self, image_uri: object, regions) -> list[Detection]:
+            _ = image_uri
+            return [Detection(regions[0], 0.9, "person", "yolo", None)]
+
+    pilot = _RecentBoxesPilot()
+    controller = online_main.DetectionStreamController(
+        _settings(),
+        pilot_service=cast(PilotService, pilot),
+        detector=_RoiDetector(),
+        inference=InferenceConfig(
+            model_url="https://example/model.pt",
+            device="cpu",
+            imgsz=960,
+            nms_iou=0.7,
+            max_det=100,
+            confidence_threshold=0.2,
+            roi=RoiConfig(full_frame_interval=3),
+        ),
+    )
+    state = _state()
+    ctx = LoopContext(
+        mission_id="m1",
+        state=state,
+        stop_event=threading.Event(),
+        target_fps=2.0,
+        frame_interval=0.5,
+        gt_tracker=GtTracker(sequence=None),
+        source_filenames=None,
+        capture=_FakeCapture([]),
+        tmp_dir=tmp_path,
+    )
+    frame = np.zeros((48, 64, 3), dtype=np.uint8)
+
+    controller._process_frame(ctx, frame)
+    pilot.boxes = [(1.0, 2.0, 3.0, 4.0)]
+    for _ in range(4):
+        controller._process_frame(ctx, frame)
+
+    assert state.inference_paths == {"full": 2, "roi": 3}
+    assert state.roi_frames == 3
+
+
+def test_process_frame_records_adaptive_imgsz(tmp_path) -> None:
+    class _RecordingPilot(_FakePilotService):
+        def __init__(self) -> None:
+            super().__init__()
+            self.imgsz: list[int | None] = []
+
+        def ingest_frame_event(self, frame_event, detections, frame_content=None):
+            self.imgsz.append(frame_event.imgsz)
+            return super().ingest_frame_event(frame_event, detections, frame_content)
+
+    class _SizedDetector(_FakeDetector):
+        def detect_traced_at(self, image_uri: object, imgsz: int):
+            _ = image_uri
+            return [], "full", imgsz
+
+    pilot = _RecordingPilot()
+    inference = InferenceConfig(
+        model_url="https://example/model.pt",
+        device="cpu",
+        imgsz=960,
+        nms_iou=0.7,
+        max_det=100,
+        confidence_threshold=0.2,
+        adaptive_imgsz=AdaptiveImgszConfig(patience=1, smoothing=1.0),
+    )
+    controller = online_main.DetectionStreamController(
+        _settings(),
+        pilot_service=cast(PilotService, pilot),
+        detector=_SizedDetector(),
+        inference=inference,
+    )
+    state = _state()
+    ctx = LoopContext(
+        mission_id="m1",
+        state=state,
+        stop_event=threading.Event(),
+        target_fps=2.0,
+        frame_interval=0.5,
+        gt_tracker=GtTracker(sequence=None),
+        source_filenames=None,
+        capture=_FakeCapture([]),
+        tmp_dir=tmp_path,
+        resolution=controller._build_resolution_controller(state),
+    )
+    frame = np.zeros((48, 64, 3), dtype=np.uint8)
+
+    controller._process_frame(ctx, frame)
+    FrameStages.adapt_resolution(ctx, processing_sec=0.6)
+    controller._process_frame(ctx, frame)
+
+    assert pilot.imgsz == [960, 800]
+    assert state.imgsz == 800
+    assert state.imgsz_steps == 1
@@ -0,0 +1,210 @@
+"""Tests for the ONNX Runtime detector backend and runtime selection."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from rescue_ai.application.detector_parity import ParityReport
+from rescue_ai.application.inference_config import InferenceConfig, PrefilterConfig
+from rescue_ai.domain.entities import Detection
+from rescue_ai.infrastructure import onnx_detector
+from rescue_ai.infrastructure.contract_loader import _build_inference_config
+from rescue_ai.infrastructure.detector_factory import build_detector
+from rescue_ai.infrastructure.model_cache import file_sha256, write_model_manifest
+from rescue_ai.infrastructure.onnx_detector import OnnxDetector, _nms
+from rescue_ai.infrastructure.onnx_quantizer import FrameCalibrationReader
+from rescue_ai.infrastructure.yolo_detector import YoloDetector
+
+
+def _config(**overrides) -> InferenceConfig:
+    values: dict[str, object] = {
+        "model_url": "https://example.com/model.pt",
+        "device": "cpu",
+        "imgsz": 64,
+        "nms_iou": 0.5,
+        "max_det": 10,
+        "confidence_threshold": 0.25,
+        "batch_size": 4,
+        "runtime": "onnx",
+    }
+    values.update(overrides)
+    return InferenceConfig(**values)  # type: ignore[arg-type]
+
+
+class _FakeSession:
+    def __init__(self, prediction: np.ndarray) -> None:
+        self.prediction = prediction
+        self.batches: list[int] = []
+
+    def get_inputs(self):
+        return [SimpleNamespace(name="images", shape=["batch", 3, 64, 64])]
+
+    def get_modelmeta(self):
+        return SimpleNamespace(custom_metadata_map={"names": "{0: 'person', 1: 'car'}"})
+
+    def run(self, _outputs, feeds):
+        batch = feeds["images"]
+        self.batches.append(batch.shape[0])
+        return [np.repeat(self.prediction[None], batch.shape[0], axis=0)]
+
+
+def _install_session(monkeypatch, tmp_path: Path, session: _FakeSession) -> None:
+    model_file = tmp_path / "model.onnx"
+    model_file.write_bytes(b"onnx-bytes")
+    monkeypatch.setattr(onnx_detector, "MODEL_CACHE_DIR", tmp_path)
+    monkeypatch.setattr(
+        onnx_detector,
+        "_load_onnxruntime",
+        lambda: SimpleNamespace(
+            InferenceSession=lambda *_a, **_k: session,
+            SessionOptions=SimpleNamespace,
+        ),
+    )
+
+
+def test_contract_runtime_is_validated() -> None:
+    assert _build_inference_config({}, 0.2).runtime == "torch"
+    assert _build_inference_config({"runtime": " ONNX "}, 0.2).runtime == "onnx"
+    with pytest.raises(ValueError, match="Unsupported inference runtime"):
+        _build_inference_config({"runtime": "tensorrt"}, 0.2)
+    with pytest.raises(ValueError, match="requires runtime onnx"):
+        _build_inference_config({"precision": "int8"}, 0.2)
+    int8 = _build_inference_config({"runtime": "onnx", "precision": "int8"}, 0.2)
+    assert int8.precision == "int8"
+
+
+def test_build_detector_selects_runtime() -> None:
+    assert isinstance(build_detector(_config(runtime="torch")), YoloDetector)
+    assert isinstance(build_detector(_config(runtime="onnx")), OnnxDetector)
+    with pytest.raises(ValueError):
+        build_detector(_config(runtime="openvino"))
+
+
+def test_nms_suppresses_overlapping_boxes() -> None:
+    boxes = np.array(
+        [[0, 0, 10, 10], [1, 1, 10, 10], [20, 20, 30, 30]], dtype=np.float32
+    )
+    scores = np.array([0.9, 0.8, 0.7], dtype=np.float32)
+    assert _nms(boxes, scores, iou_threshold=0.5).tolist() == [0, 2]
+
+
+def test_onnx_detector_postprocesses_batches(monkeypatch, tmp_path: Path) -> None:
+    pytest.importorskip("cv2")
+    # Columns: (cx, cy, w, h, person, car) for three candidate anchors.
+    prediction = np.array(
+        [
+            [16.0, 17.0, 48.0],
+            [32.0, 33.0, 32.0],
+            [8.0, 8.0, 8.0],
+            [8.0, 8.0, 8.0],
+            [0.9, 0.8, 0.1],
+            [0.0, 0.0, 0.95],
+        ],
+        dtype=np.float32,
+    )
+    session = _FakeSession(prediction)
+    _install_session(monkeypatch, tmp_path, session)
+    detector = OnnxDetector(_config(batch_size=2))
+
+    frames = [np.zeros((32, 64, 3), dtype=np.uint8) for _ in range(3)]
+    outputs = detector.detect_batch(frames)
+
+    assert session.batches == [2, 1]
+    assert len(outputs) == 3
+    for detections in outputs:
+        assert len(detections) == 1
+        det = detections[0]
+        assert det.label == "person"
+        assert det.score == pytest.approx(0.9)
+        # Letterbox pads 16 px on top; boxes map back to the 64x32 frame.
+        assert det.bbox == pytest.approx((12.0, 12.0, 20.0, 20.0))
+
+
+def test_onnx_prefilter_counts_raw_person_candidates(
+    monkeypatch, tmp_path: Path
+) -> None:
+    pytest.importorskip("cv2")
+    # Columns: (cx, cy, w, h, person, car); the car and the 0.9 person are
+    # not counted, the two low person candidates are.
+    prediction = np.array(
+        [
+            [16.0, 17.0, 48.0, 40.0],
+            [32.0, 33.0, 32.0, 20.0],
+            [8.0, 8.0, 8.0, 8.0],
+            [8.0, 8.0, 8.0, 8.0],
+            [0.9, 0.2, 0.1, 0.01],
+            [0.0, 0.0, 0.95, 0.0],
+        ],
+        dtype=np.float32,
+    )
+    _install_session(monkeypatch, tmp_path, _FakeSession(prediction))
+    detector = OnnxDetector(
+        _config(prefilter=PrefilterConfig(score_floor=0.05, histogram_bins=4))
+    )
+
+    detections = detector.detect(np.zeros((32, 64, 3), dtype=np.uint8))
+
+    assert [item.score for item in detections] == [pytest.approx(0.9)]
+    histogram = detector.score_histogram()
+    assert histogram is not None
+    assert histogram["source"] == "pre_nms"
+    assert histogram["bin_edges"] == [0.05, 0.1, 0.15, 0.2, 0.25]
+    assert histogram["counts"] == [0, 0, 0, 1]
+
+
+def test_onnx_detector_requires_exported_model(monkeypatch, tmp_path: Path) -> None:
+    monkeypatch.setattr(onnx_detector, "MODEL_CACHE_DIR", tmp_path)
+    with pytest.raises(RuntimeError, match="Export it first"):
+        onnx_detector.resolve_onnx_model_path(_config())
+
+    model_file = tmp_path / "model.onnx"
+    model_file.write_bytes(b"onnx-bytes")
+    write_model_manifest(model_file, {"sha256": file_sha256(model_file)})
+    assert onnx_detector.resolve_onnx_model_path(_config()) == model_file
+
+    model_file.write_bytes(b"tampered")
+    with pytest.raises(RuntimeError, match="export manifest"):
+        onnx_detector.resolve_onnx_model_path(_config())
+
+    with pytest.raises(RuntimeError, match="cli.quantize"):
+        onnx_detector.resolve_onnx_model_path(_config(precision="int8"))
+    int8_file = tmp_path / "model.int8.onnx"
+    int8_file.write_bytes(b"int8-bytes")
+    assert onnx_detector.resolve_onnx_model_path(_config(precision="int8")) == (
+        int8_file
+    )
+
+
+def test_calibration_reader_yields_letterboxed_frames(tmp_path: Path) -> None:
+    cv2 = pytest.importorskip("cv2")
+    frame_path = tmp_path / "frame_0001.jpg"
+    cv2.imwrite(str(frame_path), np.zeros((32, 64, 3), dtype=np.uint8))
+    reader = FrameCalibrationReader([frame_path], input_name="images", input_size=64)
+
+    feed = reader.get_next()
+    assert feed is not None
+    assert feed["images"].shape == (1, 3, 64, 64)
+    assert reader.get_next() is None
+    reader.rewind()
+    assert reader.get_next() is not None
+
+
+def test_parity_report_matches_boxes() -> None:
+    report = ParityReport(iou_threshold=0.5)
+    ref = [Detection(bbox=(0, 0, 10, 10), score=0.9, label="person", model_name="m")]
+    cand = [Detection(bbox=(0, 0, 10, 9), score=0.85, label="person", model_name="m")]
+    report.add_frame("f1", ref, cand)
+    report.add_frame("f2", ref, [])
+    report.add_frame("f3", [], [])
+
+    summary = report.as_dict()
+    assert summary["frames"] == 3
+    assert summary["matched_boxes"] == 1
+    assert summary["reference_only"] == 1
+    assert summary["mismatched_frames"] == ["f2"]
+    assert report.presence_agreement == pytest.approx(2 / 3)
+    assert report.max_score_delta == pytest.approx(0.05)
@@ -115,6 +115,42 @@ def test_ingest_frame_event_without_alert_skips_frame_upload() -> None:
     assert db.mission_frames[mission.mission_id][0].image_uri == "file:///tmp/frame.jpg"
 
 
+def test_ingest_frame_event_uploads_in_memory_frame_only_for_alerts() -> None:
+    artifacts = InMemoryArtifactStorage()
+    service, _ = _build_pilot_service(artifact_storage=artifacts)
+    mission = service.create_mission(source_name="pilot", total_frames=2, fps=2.0)
+    service.start_mission(mission.mission_id)
+    requested: list[int] = []
+
+    def _content(frame_id: int):
+        def _encode() -> bytes:
+            requested.append(frame_id)
+            return b"jpeg-bytes"
+
+        return _encode
+
+    for frame_id, score in ((0, 0.01), (1, 0.99)):
+        service.ingest_frame_event(
+            frame_event=FrameEvent(
+                mission_id=mission.mission_id,
+                frame_id=frame_id,
+                ts_sec=frame_id * 0.5,
+                image_uri=f"/tmp/rescue_frames_x/01320{frame_id}.jpg",
+                gt_person_present=False,
+                gt_episode_id=None,
+            ),
+            detections=[
+                Detection((10.0, 20.0, 30.0, 40.0), score, "person", "yolo8n", None)
+            ],
+            frame_content=_content(frame_id),
+        )
+
+    stored_uri = artifacts.stored_frames[(mission.mission_id, 1)]
+    assert requested == [1]
+    assert stored_uri.endswith("/frames/013201.jpg")
+    assert artifacts.stored_content[stored_uri] == b"jpeg-bytes"
+
+
 def test_review_alert_cannot_be_applied_twice() -> None:
     service, _ = _build_pilot_service()
     mission = service.create_mission(source_name="pilot", total_frames=1, fps=2.0)
@@ -8,7 +8,9 @@ import pytest
 
 from rescue_ai.application.batch_dtos import FrameRecord, MissionInput
 from rescue_ai.application.pipeline_stages import (
+    CandidateModel,
     PipelinePaths,
+    run_candidate_comparison,
     run_evaluate_model_stage,
     run_prepare_dataset_stage,
     run_publish_metrics_stage,
@@ -191,6 +193,56 @@ class TestEvaluateModelStage:
         assert payload["tp"] == 0
         assert payload["fn"] == 1
 
+    def test_batched_predictor_receives_chunks(self, store, paths) -> None:
+        run_prepare_dataset_stage(store, paths, mission_loader=_mission_loader_extra)
+        chunks: list[list[str]] = []
+
+        def _predict_batch(image_uris: list[str]) -> list[bool]:
+            chunks.append(list(image_uris))
+            return [_predict_only_f1(uri) for uri in image_uris]
+
+        run_evaluate_model_stage(
+            store,
+            paths,
+            detector_predict_batch=_predict_batch,
+            batch_size=2,
+        )
+        payload = store.read_json(paths.evaluation_key)
+        assert [len(chunk) for chunk in chunks] == [2, 1]
+        assert payload["tp"] == 1
+        assert payload["fn"] == 1
+        assert payload["tn"] == 1
+
+    def test_candidate_scored_side_by_side(self, store, paths) -> None:
+        run_prepare_dataset_stage(store, paths, mission_loader=_mission_loader_extra)
+        candidate = CandidateModel(
+            label="onnx-int8",
+            predict_batch=lambda uris: [True for _ in uris],
+            max_recall_drop=0.02,
+        )
+        run_evaluate_model_stage(store, paths, detector_predict=_predict_only_f1)
+        result = run_candidate_comparison(store, paths, candidate=candidate)
+        payload = store.read_json(paths.evaluation_key)
+        assert payload["recall"] == 0.5
+        assert payload["candidate"]["recall"] == 1.0
+        assert payload["candidate"]["fp"] == 1
+        assert payload["candidate"]["promotion_allowed"] is True
+        assert result["candidate"] == payload["candidate"]
+
+    def test_candidate_recall_drop_refuses_promotion(self, store, paths) -> None:
+        run_prepare_dataset_stage(store, paths, mission_loader=_mission_loader_extra)
+        candidate = CandidateModel(
+            label="onnx-int8",
+            predict_batch=lambda uris: [False for _ in uris],
+            max_recall_drop=0.02,
+        )
+        run_evaluate_model_stage(store, paths, detector_predict=_predict_only_f1)
+        with pytest.raises(RuntimeError, match="candidate onnx-int8 rejected"):
+            run_candidate_comparison(store, paths, candidate=candidate)
+        payload = store.read_json(paths.evaluation_key)
+        assert payload["candidate"]["recall_drop"] == 0.5
+        assert payload["candidate"]["promotion_allowed"] is False
+
 
 # ── publish_metrics ─────────────────────────────────────────────
 
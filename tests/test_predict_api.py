@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from typing import Any, cast
+
 from fastapi.testclient import TestClient
 
 from rescue_ai.domain.entities import Detection
@@ -331,3 +333,41 @@ def test_predict_endpoint_detector_failure_returns_502(monkeypatch) -> None:
 
     assert response.status_code == 502
     assert "Detection failed" in response.json()["detail"]
+
+
+def test_predict_endpoint_overloaded_scheduler_returns_429(monkeypatch) -> None:
+    from rescue_ai.application.inference_scheduler import InferenceRejected
+    from rescue_ai.interfaces.api import routes
+
+    class _OverloadedDetector:
+        def detect(self, image_uri: str):
+            _ = image_uri
+            raise InferenceRejected("Inference queue 'predict' is full (2 jobs)")
+
+    monkeypatch.setattr(routes, "get_detector", _OverloadedDetector)
+    response = client.post("/predict", json={"image_uri": "file:///tmp/image.jpg"})
+
+    assert response.status_code == 429
+    assert response.headers["retry-after"] == "1"
+
+
+def test_start_mission_refused_while_detector_warming(monkeypatch) -> None:
+    from rescue_ai.application.detector_warmup import DetectorWarmup
+    from rescue_ai.interfaces.api import routes
+
+    pilot = _FakePilotService()
+    warmup = DetectorWarmup(cast(Any, object()))
+
+    monkeypatch.setattr(routes, "get_pilot_service", lambda: pilot)
+    monkeypatch.setattr(routes, "get_stream_controller", _FakeStreamController)
+    monkeypatch.setattr(routes, "get_detector", object)
+    monkeypatch.setattr(routes, "get_detector_warmup", lambda: warmup)
+
+    response = client.post(
+        "/missions/start", json={"rpi_mission_id": "demo-rpi-mission"}
+    )
+
+    assert response.status_code == 503
+    assert "warming" in response.json()["detail"]
+    assert response.headers["retry-after"] == "5"
+    assert pilot.get_active_mission() is None
@@ -0,0 +1,91 @@
+"""Tests for the latency-driven adaptive input resolution controller."""
+
+from __future__ import annotations
+
+import pytest
+
+from rescue_ai.application.inference_config import AdaptiveImgszConfig
+from rescue_ai.application.resolution_control import ResolutionController
+from rescue_ai.domain.entities import FrameEvent
+from rescue_ai.domain.mission_metrics import build_imgsz_histogram
+from rescue_ai.infrastructure.contract_loader import _build_adaptive_imgsz_config
+
+_CONFIG = AdaptiveImgszConfig(
+    min_imgsz=640,
+    max_imgsz=1280,
+    step=160,
+    high_load=0.9,
+    low_load=0.6,
+    patience=3,
+    smoothing=1.0,
+)
+
+
+def _observe(controller: ResolutionController, load: float, frames: int) -> None:
+    for _ in range(frames):
+        controller.observe(processing_sec=load * 0.5, frame_interval_sec=0.5)
+
+
+def test_steps_down_only_after_patience_overloaded_frames() -> None:
+    controller = ResolutionController(_CONFIG, initial_imgsz=960)
+
+    _observe(controller, 1.2, 2)
+    assert controller.imgsz == 960
+
+    _observe(controller, 1.2, 1)
+    assert controller.imgsz == 800
+    assert controller.steps_down == 1
+
+
+def test_steps_up_with_headroom_and_clamps_to_bounds() -> None:
+    controller = ResolutionController(_CONFIG, initial_imgsz=960)
+
+    _observe(controller, 0.2, 30)
+
+    assert controller.imgsz == 1280
+    assert controller.steps_up == 2
+
+    _observe(controller, 2.0, 30)
+
+    assert controller.imgsz == 640
+
+
+def test_load_between_thresholds_keeps_size() -> None:
+    controller = ResolutionController(_CONFIG, initial_imgsz=960)
+
+    # Alternating spikes never build a patience streak.
+    for load in (1.2, 0.7, 1.2, 0.7, 1.2, 0.7, 0.5, 0.75):
+        _observe(controller, load, 1)
+
+    assert controller.imgsz == 960
+    assert controller.steps_down == controller.steps_up == 0
+
+
+def test_initial_imgsz_is_clamped_to_stride_and_bounds() -> None:
+    assert ResolutionController(_CONFIG, initial_imgsz=2000).imgsz == 1280
+    assert ResolutionController(_CONFIG, initial_imgsz=700).imgsz == 672
+
+
+def test_imgsz_histogram_counts_frames_per_size() -> None:
+    frames = [
+        FrameEvent(
+            mission_id="m-1",
+            frame_id=frame_id,
+            ts_sec=float(frame_id),
+            image_uri=f"frame-{frame_id}.jpg",
+            gt_person_present=False,
+            gt_episode_id=None,
+            imgsz=imgsz,
+        )
+        for frame_id, imgsz in enumerate([960, 960, 800, None, 1120])
+    ]
+
+    assert build_imgsz_histogram(frames) == {"800": 1, "960": 2, "1120": 1}
+
+
+def test_contract_rejects_inverted_load_thresholds() -> None:
+    assert _build_adaptive_imgsz_config({}) is None
+    with pytest.raises(ValueError, match="low_load < high_load"):
+        _build_adaptive_imgsz_config(
+            {"adaptive_imgsz": {"enabled": True, "low_load": 0.9, "high_load": 0.6}}
+        )
@@ -0,0 +1,88 @@
+"""Tests for region-of-interest inference around recent detections."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import pytest
+
+from rescue_ai.application.inference_config import RoiConfig
+from rescue_ai.domain.entities import Detection
+from rescue_ai.infrastructure.roi_detector import (
+    RoiDetector,
+    crop_windows,
+    merge_overlapping,
+)
+
+np = pytest.importorskip("numpy")
+
+
+class _CropDetector:
+    def __init__(self) -> None:
+        self.shapes: list[tuple[int, ...]] = []
+
+    def detect(self, image_uri: object) -> Sequence[Detection]:
+        return self.detect_batch([image_uri])[0]
+
+    def detect_batch(self, image_uris: Sequence[object]) -> list[Sequence[Detection]]:
+        self.shapes.extend(getattr(item, "shape") for item in image_uris)
+        return [
+            [Detection((10.0, 20.0, 30.0, 60.0), 0.7, "person", "yolo8n")]
+            for _ in image_uris
+        ]
+
+    def warmup(self) -> None:
+        return None
+
+    def runtime_name(self) -> str:
+        return "crops"
+
+
+def _person(bbox: tuple[float, float, float, float], score: float) -> Detection:
+    return Detection(bbox=bbox, score=score, label="person", model_name="yolo8n")
+
+
+def test_crop_windows_are_padded_clamped_and_deduplicated() -> None:
+    config = RoiConfig(crop_size=200, padding=0.5, max_regions=2)
+
+    windows = crop_windows(
+        [
+            (920.0, 520.0, 940.0, 560.0),
+            (900.0, 500.0, 1100.0, 900.0),
+            (10.0, 10.0, 30.0, 50.0),
+        ],
+        frame_size=(1280, 960),
+        config=config,
+    )
+
+    # Most recent first; the oldest box lies inside the large box's window.
+    assert windows == [(0, 0, 200, 200), (800, 160, 1200, 960)]
+
+
+def test_detect_regions_maps_crop_boxes_back_to_frame_pixels() -> None:
+    crops = _CropDetector()
+    detector = RoiDetector(
+        full_frame=_CropDetector(),
+        crops=crops,
+        config=RoiConfig(crop_size=320),
+    )
+    frame = np.zeros((1080, 1920, 3), dtype=np.uint8)
+
+    detections = detector.detect_regions(frame, [(1000.0, 500.0, 1040.0, 580.0)])
+
+    assert crops.shapes == [(320, 320, 3)]
+    assert [item.bbox for item in detections] == [(870.0, 400.0, 890.0, 440.0)]
+    assert detector.runtime_name() == "roi(crops)"
+
+
+def test_duplicates_from_overlapping_crops_keep_the_best_score() -> None:
+    merged = merge_overlapping(
+        [
+            _person((0.0, 0.0, 10.0, 10.0), 0.5),
+            _person((1.0, 0.0, 11.0, 10.0), 0.9),
+            _person((50.0, 50.0, 60.0, 60.0), 0.4),
+        ],
+        iou_threshold=0.5,
+    )
+
+    assert [item.score for item in merged] == [0.9, 0.4]
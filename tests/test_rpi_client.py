@@ -2,66 +2,83 @@
 
 from __future__ import annotations
 
+import json
+
+import httpx
+import pytest
+
 from rescue_ai.config import RpiSettings
-from rescue_ai.infrastructure.rpi_client import RpiClient, _build_gt_sequence_from_coco
-
-
-class _Response:
-    def __init__(self, payload: dict[str, object], status_code: int = 200) -> None:
-        self._payload = payload
-        self.status_code = status_code
-
-    def raise_for_status(self) -> None:
-        return None
-
-    def json(self) -> dict[str, object]:
-        return self._payload
-
-
-def test_rpi_client_health_catalog_and_session_calls(monkeypatch) -> None:
-    calls: list[tuple[str, str, dict[str, object] | None, float]] = []
-
-    def _fake_get(url: str, timeout: float):
-        calls.append(("GET", url, None, timeout))
-        if url.endswith("/health"):
-            return _Response({"status": "ok"})
-        if url.endswith("/mission/catalog"):
-            return _Response(
-                {
-                    "missions": [
-                        {
-                            "id": "m1",
-                            "name": "Mission 1",
-                            "images_dir": "/missions/m1/images",
-                            "annotations_json": "/missions/m1/ann.json",
-                        }
-                    ]
-                }
-            )
-        if "/source/session/" in url:
-            return _Response({"processed": 10})
-        raise AssertionError(f"Unexpected URL: {url}")
-
-    def _fake_post(url: str, json=None, timeout: float = 0):
-        calls.append(("POST", url, json, timeout))
-        if url.endswith("/source/start"):
-            return _Response({"session_id": "sess-1"})
-        if "/source/stop/" in url:
-            return _Response({"stopped": True})
-        raise AssertionError(f"Unexpected URL: {url}")
-
-    monkeypatch.setattr("rescue_ai.infrastructure.rpi_client.httpx.get", _fake_get)
-    monkeypatch.setattr("rescue_ai.infrastructure.rpi_client.httpx.post", _fake_post)
-
-    client = RpiClient(
+from rescue_ai.infrastructure.rpi_client import RpiClient
+
+_CATALOG = {
+    "missions": [
+        {
+            "id": "m1",
+            "name": "Mission 1",
+            "images_dir": "/missions/m1/images",
+            "annotations_json": "/missions/m1/ann.json",
+        }
+    ]
+}
+
+
+_ANNOTATIONS = {
+    "images": [
+        {"id": 1, "file_name": "0001.jpg"},
+        {"id": 2, "file_name": "0002.jpg"},
+        {"id": 3, "file_name": "0003.jpg"},
+    ],
+    "categories": [{"id": 1, "name": "person"}],
+    "annotations": [
+        {"id": 10, "image_id": 1, "category_id": 1},
+        {"id": 11, "image_id": 3, "category_id": 1},
+    ],
+}
+
+
+def _client(handler, max_retries: int = 2, cache_dir: str = "") -> RpiClient:
+    return RpiClient(
         RpiSettings(
             RPI_BASE_URL="http://rpi.local:9100",
             RPI_MISSIONS_DIR="/home/ykvnkm/Documents/missions",
             RPI_RTSP_PORT=8554,
             RPI_RTSP_PATH_PREFIX="live",
-        )
+            RPI_RETRY_BACKOFF_SEC=0.0,
+            RPI_MAX_RETRIES=max_retries,
+            RPI_ANNOTATIONS_CACHE_DIR=cache_dir,
+        ),
+        transport=httpx.MockTransport(handler),
     )
 
+
+def test_rpi_client_health_catalog_and_session_calls() -> None:
+    calls: list[tuple[str, str, dict[str, object] | None, float | None]] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content) if request.content else None
+        calls.append(
+            (
+                request.method,
+                str(request.url),
+                body,
+                request.extensions["timeout"]["read"],
+            )
+        )
+        path = request.url.path
+        if path == "/health":
+            return httpx.Response(200, json={"status": "ok"})
+        if path == "/mission/catalog":
+            return httpx.Response(200, json=_CATALOG)
+        if path.startswith("/source/session/"):
+            return httpx.Response(200, json={"processed": 10})
+        if path == "/source/start":
+            return httpx.Response(200, json={"session_id": "sess-1"})
+        if path.startswith("/source/stop/"):
+            return httpx.Response(200, json={"stopped": True})
+        raise AssertionError(f"Unexpected URL: {request.url}")
+
+    client = _client(_handler)
+
     health = client.health(timeout_sec=1.0)
     assert health["status"] == "ok"
 
@@ -79,95 +96,89 @@ def test_rpi_client_health_catalog_and_session_calls(monkeypatch) -> None:
     stats = client.session_stats("sess-1", timeout_sec=5.0)
     assert stats["processed"] == 10
     assert client.base_url == "http://rpi.local:9100"
+    client.close()
 
+    assert [call[3] for call in calls] == [1.0, 2.0, 3.0, 4.0, 5.0]
     start_call = [item for item in calls if item[1].endswith("/source/start")][0]
     assert start_call[2] is not None
     assert start_call[2]["source"] == "/home/ykvnkm/Documents/missions/m1"
     assert start_call[2]["loop"] is False
 
 
-def test_load_gt_sequence_from_raw_file(monkeypatch) -> None:
-    def _fake_get(url: str, timeout: float, params=None):
-        _ = timeout
-        if url.endswith("/mission/catalog"):
-            return _Response(
-                {
-                    "missions": [
-                        {
-                            "id": "m1",
-                            "name": "Mission 1",
-                            "images_dir": "/missions/m1/images",
-                            "annotations_json": "/missions/m1/ann.json",
-                        }
-                    ]
-                }
-            )
-        if url.endswith("/source/raw_file"):
-            assert params == {"path": "/missions/m1/ann.json"}
-            return _Response(
-                {
-                    "images": [
-                        {"id": 1, "file_name": "0001.jpg"},
-                        {"id": 2, "file_name": "0002.jpg"},
-                        {"id": 3, "file_name": "0003.jpg"},
-                    ],
-                    "categories": [{"id": 1, "name": "person"}],
-                    "annotations": [
-                        {"id": 10, "image_id": 1, "category_id": 1},
-                        {"id": 11, "image_id": 3, "category_id": 1},
-                    ],
-                }
-            )
-        raise AssertionError(f"Unexpected URL: {url}")
+def test_load_mission_annotations_from_raw_file() -> None:
+    paths: list[str] = []
 
-    monkeypatch.setattr("rescue_ai.infrastructure.rpi_client.httpx.get", _fake_get)
-    client = RpiClient(
-        RpiSettings(
-            RPI_BASE_URL="http://rpi.local:9100",
-            RPI_MISSIONS_DIR="/home/ykvnkm/Documents/missions",
-            RPI_RTSP_PORT=8554,
-            RPI_RTSP_PATH_PREFIX="live",
-        )
-    )
+    def _handler(request: httpx.Request) -> httpx.Response:
+        paths.append(request.url.path)
+        if request.url.path == "/mission/catalog":
+            return httpx.Response(200, json=_CATALOG)
+        if request.url.path == "/source/raw_file":
+            assert dict(request.url.params) == {"path": "/missions/m1/ann.json"}
+            return httpx.Response(200, json=_ANNOTATIONS)
+        raise AssertionError(f"Unexpected URL: {request.url}")
+
+    annotations = _client(_handler).load_mission_annotations("m1", timeout_sec=2.0)
+
+    assert annotations is not None
+    assert annotations.payload == _ANNOTATIONS
+    assert annotations.gt_sequence is not None
+    assert list(annotations.gt_sequence) == [True, False, True]
+    assert annotations.source_filenames == ["0001.jpg", "0002.jpg", "0003.jpg"]
+    assert paths == ["/mission/catalog", "/source/raw_file"]
+
+
+def test_annotations_are_revalidated_with_conditional_get(tmp_path) -> None:
+    conditional: list[str | None] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/mission/catalog":
+            return httpx.Response(200, json=_CATALOG)
+        etag = request.headers.get("if-none-match")
+        conditional.append(etag)
+        if etag == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, json=_ANNOTATIONS, headers={"ETag": '"v1"'})
+
+    first = _client(_handler, cache_dir=str(tmp_path)).load_mission_annotations("m1")
+    # A fresh client (process restart) revalidates against the disk copy.
+    second = _client(_handler, cache_dir=str(tmp_path)).load_mission_annotations("m1")
+
+    assert conditional == [None, '"v1"']
+    assert first is not None and second is not None
+    assert second.payload == first.payload
+    assert second.source_filenames == first.source_filenames
+
+
+def test_get_requests_are_retried_on_transport_and_gateway_errors() -> None:
+    responses: list[httpx.Response | None] = [
+        None,
+        httpx.Response(503),
+        httpx.Response(200, json={"processed": 3}),
+    ]
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        response = responses.pop(0)
+        if response is None:
+            raise httpx.ReadError("link dropped", request=request)
+        return response
+
+    stats = _client(_handler).session_stats("sess-1", timeout_sec=1.0)
+
+    assert stats == {"processed": 3}
+    assert not responses
+
+
+def test_post_is_retried_only_when_never_sent() -> None:
+    attempts: list[str] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        attempts.append(request.url.path)
+        if len(attempts) == 1:
+            raise httpx.ConnectError("no route", request=request)
+        raise httpx.ReadTimeout("no reply", request=request)
+
+    client = _client(_handler, max_retries=3)
 
-    gt = client.load_gt_sequence("m1", timeout_sec=2.0)
-    assert gt == [True, False, True]
-
-
-def test_build_gt_sequence_filters_non_person_annotations() -> None:
-    payload = {
-        "images": [
-            {"id": 2, "file_name": "0002.jpg"},
-            {"id": 1, "file_name": "0001.jpg"},
-        ],
-        "categories": [{"id": 1, "name": "person"}, {"id": 2, "name": "car"}],
-        "annotations": [
-            {"image_id": 2, "category_id": 2},
-            {"image_id": 1, "category_id": 1},
-        ],
-    }
-
-    assert _build_gt_sequence_from_coco(payload) == [True, False]
-
-
-def test_build_gt_sequence_uses_numeric_filename_gaps_as_negatives() -> None:
-    payload = {
-        "images": [
-            {"id": 1, "file_name": "000002.jpg"},
-            {"id": 2, "file_name": "000007.jpg"},
-            {"id": 3, "file_name": "000011.jpg"},
-        ],
-        "categories": [{"id": 1, "name": "person"}],
-        "annotations": [
-            {"image_id": 1, "category_id": 1},
-            {"image_id": 3, "category_id": 1},
-        ],
-    }
-
-    # Sequence spans 2..11; only frames 2 and 11 are positive.
-    seq = _build_gt_sequence_from_coco(payload)
-    assert seq is not None
-    assert len(seq) == 10
-    assert seq[0] is True  # frame 2
-    assert seq[9] is True  # frame 11
-    assert sum(1 for item in seq if item) == 2
+    with pytest.raises(httpx.ReadTimeout):
+        client.stop_stream("sess-1", timeout_sec=1.0)
+    assert attempts == ["/source/stop/sess-1", "/source/stop/sess-1"]
@@ -0,0 +1,77 @@
+"""Tests for background polling of RPi session stats."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+from rescue_ai.application.session_monitor import SessionMonitor, SessionSnapshot
+
+
+def _wait_for(monitor: SessionMonitor, session_id: str, ready) -> SessionSnapshot:
+    deadline = time.monotonic() + 2.0
+    while True:
+        snapshot = monitor.snapshot(session_id)
+        if snapshot is not None and ready(snapshot):
+            return snapshot
+        assert time.monotonic() < deadline
+        time.sleep(0.005)
+
+
+def test_monitor_caches_stats_and_signals_end_of_stream() -> None:
+    replies: list[dict[str, object]] = [
+        {"processed": 1},
+        {"processed": 2, "stop": True},
+    ]
+    monitor = SessionMonitor(
+        lambda _sid: replies.pop(0) if len(replies) > 1 else replies[0],
+        interval_sec=0.01,
+    )
+
+    finished = monitor.watch("s1")
+    assert finished.wait(timeout=2.0)
+
+    snapshot = _wait_for(monitor, "s1", lambda snap: snap.finished)
+    assert snapshot.stats == {"processed": 2, "stop": True}
+    assert snapshot.updated_at is not None
+    monitor.close()
+
+
+def test_failed_poll_keeps_last_stats_and_reports_error() -> None:
+    calls: list[str] = []
+
+    def fetch(session_id: str) -> dict[str, object]:
+        calls.append(session_id)
+        if len(calls) > 1:
+            raise RuntimeError("pi unreachable")
+        return {"processed": 3}
+
+    monitor = SessionMonitor(fetch, interval_sec=0.01)
+    monitor.watch("s1")
+
+    snapshot = _wait_for(monitor, "s1", lambda snap: snap.error is not None)
+    assert snapshot.stats == {"processed": 3}
+    assert snapshot.error == "RuntimeError: pi unreachable"
+    assert not snapshot.finished
+    monitor.close()
+
+
+def test_slow_pi_never_blocks_readers() -> None:
+    release = threading.Event()
+
+    def fetch(_session_id: str) -> dict[str, object]:
+        release.wait(timeout=2.0)
+        return {"processed": 1}
+
+    monitor = SessionMonitor(fetch, interval_sec=60.0)
+    monitor.watch("s1")
+
+    t0 = time.perf_counter()
+    assert monitor.snapshot("s1") == SessionSnapshot()
+    assert time.perf_counter() - t0 < 0.1
+
+    release.set()
+    _wait_for(monitor, "s1", lambda snap: snap.stats is not None)
+    monitor.unwatch("s1")
+    assert monitor.snapshot("s1") is None
+    monitor.close()
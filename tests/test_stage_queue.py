@@ -0,0 +1,79 @@
+"""Tests for the bounded hand-off queue of the online stream pipeline."""
+
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from rescue_ai.application.stage_queue import StageQueue
+
+
+def test_drop_oldest_queue_keeps_latest_items() -> None:
+    queue: StageQueue[int] = StageQueue("detect", capacity=2, drop_oldest=True)
+
+    for item in range(5):
+        assert queue.put(item) is True
+
+    assert queue.stats() == {
+        "depth": 2,
+        "capacity": 2,
+        "max_depth": 2,
+        "enqueued": 5,
+        "dropped": 3,
+    }
+    assert [queue.get(), queue.get()] == [3, 4]
+
+
+def test_blocking_queue_waits_for_consumer() -> None:
+    queue: StageQueue[int] = StageQueue("ingest", capacity=1, drop_oldest=False)
+    queue.put(1)
+    done = threading.Event()
+
+    def _produce() -> None:
+        queue.put(2)
+        done.set()
+
+    producer = threading.Thread(target=_produce)
+    producer.start()
+    assert done.wait(timeout=0.1) is False
+
+    assert queue.get() == 1
+    producer.join(timeout=2.0)
+
+    assert done.is_set()
+    assert queue.get() == 2
+    assert queue.stats()["dropped"] == 0
+
+
+def test_close_drains_then_refuses_and_wakes_producers() -> None:
+    queue: StageQueue[int] = StageQueue("ingest", capacity=1, drop_oldest=False)
+    queue.put(1)
+    results: list[bool] = []
+    producer = threading.Thread(target=lambda: results.append(queue.put(2)))
+    producer.start()
+
+    queue.close()
+    producer.join(timeout=2.0)
+
+    assert results == [False]
+    assert queue.get() == 1
+    assert queue.get() is None
+    assert queue.put(3) is False
+
+
+def test_poll_never_waits_and_drains_after_close() -> None:
+    queue: StageQueue[int] = StageQueue("detect", capacity=2, drop_oldest=True)
+
+    assert queue.poll() is None
+    queue.put(1)
+    queue.close()
+
+    assert len(queue) == 1
+    assert queue.poll() == 1
+    assert queue.poll() is None
+
+
+def test_capacity_must_be_positive() -> None:
+    with pytest.raises(ValueError, match="capacity"):
+        StageQueue("detect", capacity=0, drop_oldest=True)
@@ -0,0 +1,124 @@
+"""Tests for the detection and ingest workers shared by live streams."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+from rescue_ai.application.inference_config import PipelineConfig
+from rescue_ai.application.stream_workers import LaneStages, StreamWorkerPool
+
+
+def _stages(
+    ingested: list[int], errors: list[Exception], gate: threading.Event | None = None
+) -> LaneStages[int, int]:
+    def _ingest(event: int) -> None:
+        if gate is not None:
+            gate.wait(timeout=2.0)
+        ingested.append(event)
+
+    return LaneStages(
+        detect=lambda frame: frame * 10, ingest=_ingest, on_error=errors.append
+    )
+
+
+def test_lane_keeps_frame_order_across_workers() -> None:
+    pool = StreamWorkerPool(
+        PipelineConfig(frame_queue_size=20, ingest_queue_size=2, workers=3)
+    )
+    pool.start()
+    ingested: list[int] = []
+    lane = pool.open_lane("m1", _stages(ingested, []))
+
+    for frame in range(20):
+        assert lane.submit(frame) is True
+    lane.close()
+    lane.done.result(timeout=2.0)
+    pool.close()
+
+    assert ingested == [frame * 10 for frame in range(20)]
+    assert lane.submit(99) is False
+    assert lane.stats()["detect"]["dropped"] == 0
+
+
+def test_full_ingest_queue_stalls_detection_of_that_lane() -> None:
+    pool = StreamWorkerPool(
+        PipelineConfig(frame_queue_size=8, ingest_queue_size=1, workers=2)
+    )
+    pool.start()
+    gate = threading.Event()
+    ingested: list[int] = []
+    lane = pool.open_lane("m1", _stages(ingested, [], gate))
+
+    for frame in range(4):
+        lane.submit(frame)
+    lane.close()
+    # Frame 0 is stuck in ingest and frame 1 fills the ingest queue.
+    deadline = time.monotonic() + 2.0
+    while lane.stats()["detect"]["depth"] > 2 and time.monotonic() < deadline:
+        time.sleep(0.005)
+    time.sleep(0.05)
+    stats = lane.stats()
+    finished_early = lane.done.done()
+    gate.set()
+    lane.done.result(timeout=2.0)
+    pool.close()
+
+    assert finished_early is False
+    assert stats["detect"]["depth"] == 2
+    assert stats["ingest"]["depth"] == 1
+    assert ingested == [0, 10, 20, 30]
+
+
+def test_workers_alternate_between_lanes() -> None:
+    pool = StreamWorkerPool(
+        PipelineConfig(frame_queue_size=4, ingest_queue_size=4, workers=1)
+    )
+    detected: list[str] = []
+    errors: list[Exception] = []
+
+    def _lane_stages(name: str) -> LaneStages[int, int]:
+        def _detect(frame: int) -> int:
+            detected.append(name)
+            return frame
+
+        return LaneStages(
+            detect=_detect, ingest=lambda _event: None, on_error=errors.append
+        )
+
+    lanes = [pool.open_lane(name, _lane_stages(name)) for name in ("a", "b")]
+    for lane in lanes:
+        for frame in range(3):
+            lane.submit(frame)
+        lane.close()
+    pool.start()
+    for lane in lanes:
+        lane.done.result(timeout=2.0)
+    pool.close()
+
+    assert detected[:4] == ["a", "b", "a", "b"]
+    assert not errors
+
+
+def test_stage_failure_closes_the_lane() -> None:
+    pool = StreamWorkerPool(
+        PipelineConfig(frame_queue_size=4, ingest_queue_size=4, workers=2)
+    )
+    pool.start()
+    errors: list[Exception] = []
+
+    def _detect(frame: int) -> int:
+        if frame == 1:
+            raise RuntimeError("detector crashed")
+        return frame
+
+    lane = pool.open_lane(
+        "m1",
+        LaneStages(detect=_detect, ingest=lambda _event: None, on_error=errors.append),
+    )
+    lane.submit(1)
+    lane.done.result(timeout=2.0)
+    pool.close()
+
+    assert [str(error) for error in errors] == ["detector crashed"]
+    assert lane.submit(2) is False